@@ -110,6 +110,7 @@ class ZipController:
         
         # Compression level
         settings.compression_level = self.settings.get('ZIP_COMPRESSION_LEVEL', zipfile.ZIP_STORED)
+        settings.hash_manifest = self.settings.zip_hash_manifest
         
         # Archive method from settings
         archive_method_str = self.settings.archive_method
@@ -6,7 +6,7 @@ Follows SOA/DI pattern for Calculate Hashes tab
 
 from pathlib import Path
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from controllers.base_controller import BaseController
@@ -27,6 +27,17 @@ class HashCalculationSettings:
     max_workers_override: Optional[int] = None
     generate_csv: bool = True
     include_metadata: bool = True
+    use_hash_cache: bool = False
+    force_reread: bool = False
+    additional_algorithms: List[str] = field(default_factory=list)  # Calculated in the same read
+    include_patterns: List[str] = field(default_factory=list)  # Globs, e.g. '*.mp4' (empty = all files)
+    exclude_patterns: List[str] = field(default_factory=list)  # Globs, e.g. '*.tmp', 'Thumbs.db'
+    tree_hash: bool = False  # Chunked parallel tree digest instead of whole-file digest
+
+    @property
+    def algorithms(self) -> List[str]:
+        """Primary algorithm followed by any additional algorithms"""
+        return [self.algorithm] + [alg for alg in self.additional_algorithms if alg != self.algorithm]
 
 
 class HashCalculationController(BaseController):
@@ -101,27 +112,34 @@ class HashCalculationController(BaseController):
         try:
             self._log_operation(
                 "start_hash_calculation_workflow",
-                f"Starting hash calculation for {len(paths)} items with {settings.algorithm.upper()}"
+                f"Starting hash calculation for {len(paths)} items with "
+                f"{'+'.join(alg.upper() for alg in settings.algorithms)}"
             )
 
-            # Step 1: Validate through service
-            validation_result = self.hash_service.validate_hash_operation(
-                paths=paths,
-                algorithm=settings.algorithm
-            )
+            # Step 1: Validate through service (every requested algorithm)
+            for algorithm in settings.algorithms:
+                validation_result = self.hash_service.validate_hash_operation(
+                    paths=paths,
+                    algorithm=algorithm
+                )
 
-            if not validation_result.success:
-                self._handle_error(validation_result.error)
-                return Result.error(validation_result.error)
+                if not validation_result.success:
+                    self._handle_error(validation_result.error)
+                    return Result.error(validation_result.error)
 
             logger.info("Hash operation validation passed")
 
             # Step 2: Create worker with settings
             worker = HashWorker(
                 paths=paths,
-                algorithm=settings.algorithm,
+                algorithm=settings.algorithms,
                 enable_parallel=settings.enable_parallel,
-                max_workers_override=settings.max_workers_override
+                max_workers_override=settings.max_workers_override,
+                use_hash_cache=settings.use_hash_cache,
+                force_reread=settings.force_reread,
+                include_patterns=settings.include_patterns,
+                exclude_patterns=settings.exclude_patterns,
+                tree_hash=settings.tree_hash
             )
 
             # Store reference
@@ -6,7 +6,7 @@ Follows SOA/DI pattern for Verify Hashes tab
 
 from pathlib import Path
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from controllers.base_controller import BaseController
@@ -27,6 +27,20 @@ class HashVerificationSettings:
     max_workers_override: Optional[int] = None
     generate_csv: bool = True
     include_metadata: bool = True
+    use_hash_cache: bool = False
+    force_reread: bool = False
+    additional_algorithms: List[str] = field(default_factory=list)  # Calculated in the same read
+    include_patterns: List[str] = field(default_factory=list)  # Globs, e.g. '*.mp4' (empty = all files)
+    exclude_patterns: List[str] = field(default_factory=list)  # Globs, e.g. '*.tmp', 'Thumbs.db'
+    tree_hash: bool = False  # Chunked parallel tree digest instead of whole-file digest
+    source_manifest: Optional[str] = None  # Stored hash report CSV/JSON used instead of hashing the source
+    size_triage: bool = False  # Stat-only pre-pass: report missing files before hashing
+    hash_size_mismatches: bool = True  # False = report size-mismatched pairs without hashing them
+
+    @property
+    def algorithms(self) -> List[str]:
+        """Primary algorithm followed by any additional algorithms"""
+        return [self.algorithm] + [alg for alg in self.additional_algorithms if alg != self.algorithm]
 
 
 class HashVerificationController(BaseController):
@@ -103,19 +117,35 @@ class HashVerificationController(BaseController):
         try:
             self._log_operation(
                 "start_verification_workflow",
-                f"Starting verification for {len(source_paths)} source items and {len(target_paths)} target items with {settings.algorithm.upper()}"
-            )
-
-            # Step 1: Validate through service
-            validation_result = self.hash_service.validate_verification_operation(
-                source_paths=source_paths,
-                target_paths=target_paths,
-                algorithm=settings.algorithm
+                f"Starting verification for {len(source_paths)} source items and {len(target_paths)} target items with "
+                f"{'+'.join(alg.upper() for alg in settings.algorithms)}"
             )
 
-            if not validation_result.success:
-                self._handle_error(validation_result.error)
-                return Result.error(validation_result.error)
+            # Step 1: Validate through service (every requested algorithm)
+            if settings.source_manifest:
+                # Manifest mode: the source side is a stored hash report, only the target is read
+                if not Path(settings.source_manifest).is_file():
+                    error = ValidationError(
+                        f"Hash manifest not found: {settings.source_manifest}",
+                        user_message="The selected hash manifest file does not exist."
+                    )
+                    self._handle_error(error)
+                    return Result.error(error)
+                validation_result = self.hash_service.validate_hash_operation(target_paths, settings.algorithm)
+                if not validation_result.success:
+                    self._handle_error(validation_result.error)
+                    return Result.error(validation_result.error)
+            else:
+                for algorithm in settings.algorithms:
+                    validation_result = self.hash_service.validate_verification_operation(
+                        source_paths=source_paths,
+                        target_paths=target_paths,
+                        algorithm=algorithm
+                    )
+
+                    if not validation_result.success:
+                        self._handle_error(validation_result.error)
+                        return Result.error(validation_result.error)
 
             logger.info("Verification operation validation passed")
 
@@ -125,7 +155,15 @@ class HashVerificationController(BaseController):
             worker = VerifyWorker(
                 source_paths=source_paths,
                 target_paths=target_paths,
-                algorithm=settings.algorithm
+                algorithm=settings.algorithms,
+                use_hash_cache=settings.use_hash_cache,
+                force_reread=settings.force_reread,
+                include_patterns=settings.include_patterns,
+                exclude_patterns=settings.exclude_patterns,
+                tree_hash=settings.tree_hash,
+                source_manifest=settings.source_manifest,
+                size_triage=settings.size_triage,
+                hash_size_mismatches=settings.hash_size_mismatches
             )
 
             # Store reference
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Hash Cache - Persistent on-disk digest cache for UnifiedHashCalculator
+
+Evidence shares are hashed repeatedly by the Calculate Hashes tab, the Verify tab
+and batch jobs. This cache stores digests per algorithm in a SQLite database next to
+the application settings directory so that files which have not changed since they
+were last hashed can be resolved with a single stat() call instead of a full re-read.
+
+Cache entries are keyed by absolute path and algorithm, and are only honoured when the
+stored stat fingerprint (device, inode, size, mtime, ctime) still matches the file on
+disk. Any change invalidates the entry.
+
+Eviction is size-based (see SQLiteLRUCache): when the database grows past the
+configured limit, the least recently used entries are deleted and the freed pages are
+returned to the filesystem.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from core.sqlite_lru_cache import SQLiteLRUCache
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Stat-derived identity of a file used to validate cache entries"""
+    device: int
+    inode: int
+    size: int
+    mtime_ns: int
+    ctime_ns: int
+
+    @classmethod
+    def from_stat(cls, stat_result: os.stat_result) -> 'FileFingerprint':
+        """Build fingerprint from an os.stat_result"""
+        return cls(
+            device=stat_result.st_dev,
+            inode=stat_result.st_ino,
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            ctime_ns=stat_result.st_ctime_ns
+        )
+
+
+class HashCache(SQLiteLRUCache):
+    """
+    SQLite-backed persistent hash cache
+
+    Thread-safe: a single connection is shared between worker threads and guarded
+    by a lock, so one instance can serve a whole parallel hashing pool.
+    """
+
+    NAME = "Hash cache"
+    TABLE = "file_hashes"
+    KEY_COLUMNS = ("path", "algorithm")
+    DB_FILENAME = "hash_cache.sqlite3"
+    MAX_SIZE_SETTING = "hash_cache_max_size_mb"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS file_hashes (
+            path TEXT NOT NULL,
+            algorithm TEXT NOT NULL,
+            device INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            ctime_ns INTEGER NOT NULL,
+            hash_value TEXT NOT NULL,
+            last_used REAL NOT NULL,
+            PRIMARY KEY (path, algorithm)
+        );
+        CREATE INDEX IF NOT EXISTS idx_file_hashes_last_used ON file_hashes(last_used);
+    """
+
+    def lookup(self, file_path: Path, algorithm: str,
+               stat_result: os.stat_result) -> Optional[str]:
+        """
+        Return the cached digest if the file is unchanged since it was hashed
+
+        Args:
+            file_path: File being hashed
+            algorithm: Hash algorithm name
+            stat_result: Current stat() of the file
+
+        Returns:
+            Cached hex digest, or None on miss / stale entry
+        """
+        key = self.key(file_path)
+        fingerprint = FileFingerprint.from_stat(stat_result)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT device, inode, size, mtime_ns, ctime_ns, hash_value "
+                "FROM file_hashes WHERE path = ? AND algorithm = ?",
+                (key, algorithm)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            if FileFingerprint(*row[:5]) != fingerprint:
+                # File changed since it was cached - entry is stale
+                self._conn.execute(
+                    "DELETE FROM file_hashes WHERE path = ? AND algorithm = ?",
+                    (key, algorithm)
+                )
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._touch_locked(key, algorithm)
+            self.hits += 1
+            return row[5]
+
+    def store(self, file_path: Path, algorithm: str,
+              stat_result: os.stat_result, hash_value: str):
+        """
+        Record a freshly computed digest
+
+        Args:
+            file_path: File that was hashed
+            algorithm: Hash algorithm name
+            stat_result: stat() of the file taken before it was read
+            hash_value: Hex digest
+        """
+        fp = FileFingerprint.from_stat(stat_result)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO file_hashes "
+                "(path, algorithm, device, inode, size, mtime_ns, ctime_ns, hash_value, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.key(file_path), algorithm, fp.device, fp.inode, fp.size,
+                 fp.mtime_ns, fp.ctime_ns, hash_value, time.time())
+            )
+            self._conn.commit()
+            self._stored_locked()
+
+
+def get_hash_cache() -> Optional[HashCache]:
+    """
+    Get the process-wide hash cache, opening it on first use
+
+    The size limit is read from SettingsManager ('performance.hash_cache_max_mb').
+
+    Returns:
+        Shared HashCache, or None if the database could not be opened
+    """
+    return HashCache.get_shared()
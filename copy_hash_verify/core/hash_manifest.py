@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Hash Manifest - Stored hash reports as the source side of a verification
+
+The original evidence drive is often gone (returned to its owner) or slow by the
+time a working copy has to be re-verified. A hash report written earlier holds
+everything the source side of a verification needs, so only the target has to
+be read again.
+
+Accepted formats:
+- HashReportGenerator.generate_single_hash_csv() output ('File Path',
+  'Relative Path', 'File Size (bytes)', 'Hash (SHA256)', ...)
+- Verification and forensic-compatible CSVs - the 'Source ...' columns are used
+- JSON: a list of objects (or {"files": [...]}) with 'file_path' or
+  'relative_path', and 'hashes' or 'algorithm' + 'hash_value'
+
+CSV manifests are parsed row by row; '#' metadata lines written before the
+header are skipped. Tree-mode reports ('Hash (SHA256-TREE)') are paired with
+the chunk manifests saved next to them (see tree_hash.chunk_manifest_path).
+"""
+
+import csv
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from .tree_hash import ChunkManifest, chunk_manifest_path, load_chunk_manifests
+
+
+# 'Hash (SHA256)', 'Source Hash (MD5)', 'Destination Hash (SHA1)', ...
+_HASH_COLUMN = re.compile(r'^(?:(Source|Target|Destination)\s+)?Hash \(([\w-]+)\)$', re.IGNORECASE)
+
+# Path columns in order of preference - the first non-empty one identifies the file
+_PATH_COLUMNS = ('File Path', 'Source File Path', 'Source Path', 'Relative Path', 'Source Relative Path', 'Filename')
+_SIZE_COLUMNS = ('File Size (bytes)', 'Source File Size (bytes)')
+
+
+@dataclass
+class ManifestEntry:
+    """One file recorded in a hash manifest"""
+    file_path: str  # Path as recorded (normalized to '/' separators)
+    hashes: Dict[str, str] = field(default_factory=dict)
+    file_size: int = 0
+
+
+def _normalize_path(path: str) -> str:
+    """Use '/' separators so Windows manifests join correctly on any platform"""
+    return path.replace('\\', '/') if os.sep == '/' else path
+
+
+def _parse_size(value: Optional[str]) -> int:
+    try:
+        return int(value) if value else 0
+    except ValueError:
+        return 0
+
+
+class HashManifest:
+    """Streaming reader for stored hash reports"""
+
+    def __init__(self, manifest_path: Path):
+        """
+        Args:
+            manifest_path: CSV or JSON hash report
+        """
+        self.manifest_path = Path(manifest_path)
+        self.algorithms: List[str] = []  # Algorithms found, in column order
+        self.skipped_rows = 0  # Failed or hash-less rows
+
+    def iter_entries(self) -> Iterator[ManifestEntry]:
+        """
+        Yield manifest entries one at a time
+
+        Raises:
+            ValueError: If the file is not a recognizable hash manifest
+            OSError: If the file cannot be read
+        """
+        if self.manifest_path.suffix.lower() == '.json':
+            yield from self._iter_json()
+        else:
+            yield from self._iter_csv()
+
+    def chunk_manifests(self) -> Dict[str, ChunkManifest]:
+        """
+        Chunk manifests stored next to a tree-mode report, keyed like ManifestEntry.file_path
+
+        Returns:
+            Dict of manifests, empty if the report has no chunk manifest file
+
+        Raises:
+            ValueError, KeyError, TypeError: If the chunk manifest file is malformed
+            OSError: If it exists but cannot be read
+        """
+        path = chunk_manifest_path(self.manifest_path)
+        if not path.is_file():
+            return {}
+        return {_normalize_path(manifest.file_path): manifest for manifest in load_chunk_manifests(path)}
+
+    def _iter_csv(self) -> Iterator[ManifestEntry]:
+        """Parse a CSV hash report row by row"""
+        with open(self.manifest_path, 'r', newline='', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+
+            header = None
+            for row in reader:
+                if not row or not ''.join(row).strip() or row[0].startswith('#'):
+                    continue
+                header = row
+                break
+            if header is None:
+                raise ValueError(f"No header row found in {self.manifest_path}")
+
+            hash_columns = self._select_hash_columns(header)
+            path_column = next((c for c in _PATH_COLUMNS if c in header), None)
+            if not hash_columns or path_column is None:
+                raise ValueError(f"{self.manifest_path} has no recognizable path and hash columns")
+            self.algorithms = list(hash_columns.values())
+
+            index = {name: i for i, name in enumerate(header)}
+            size_column = next((c for c in _SIZE_COLUMNS if c in header), None)
+
+            for row in reader:
+                if not row:
+                    continue
+                values = {name: row[i] for name, i in index.items() if i < len(row)}
+                if values.get('Status', 'SUCCESS').upper() == 'FAILED':
+                    self.skipped_rows += 1
+                    continue
+
+                path = next((values[c] for c in _PATH_COLUMNS if values.get(c)), '')
+                hashes = {alg: values[column].strip().lower()
+                          for column, alg in hash_columns.items() if values.get(column, '').strip()}
+                if not path or not hashes:
+                    self.skipped_rows += 1
+                    continue
+
+                yield ManifestEntry(
+                    file_path=_normalize_path(path),
+                    hashes=hashes,
+                    file_size=_parse_size(values.get(size_column)) if size_column else 0
+                )
+
+    @staticmethod
+    def _select_hash_columns(header: List[str]) -> Dict[str, str]:
+        """Map hash column names to algorithms, preferring the source side"""
+        by_side: Dict[str, Dict[str, str]] = {}
+        for column in header:
+            match = _HASH_COLUMN.match(column.strip())
+            if match:
+                side = (match.group(1) or '').lower()
+                by_side.setdefault(side, {})[column] = match.group(2).lower()
+        return by_side.get('') or by_side.get('source') or {}
+
+    def _iter_json(self) -> Iterator[ManifestEntry]:
+        """Parse a JSON hash manifest"""
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        records = data.get('files', []) if isinstance(data, dict) else data
+        if not isinstance(records, list):
+            raise ValueError(f"{self.manifest_path} is not a hash manifest")
+
+        for record in records:
+            path = record.get('file_path') or record.get('relative_path') or ''
+            hashes = record.get('hashes') or (
+                {record['algorithm']: record['hash_value']}
+                if record.get('algorithm') and record.get('hash_value') else {}
+            )
+            hashes = {alg.lower(): digest.lower() for alg, digest in hashes.items() if digest}
+            if not path or not hashes or record.get('error'):
+                self.skipped_rows += 1
+                continue
+            for alg in hashes:
+                if alg not in self.algorithms:
+                    self.algorithms.append(alg)
+
+            yield ManifestEntry(
+                file_path=_normalize_path(path),
+                hashes=hashes,
+                file_size=_parse_size(str(record.get('file_size') or ''))
+            )
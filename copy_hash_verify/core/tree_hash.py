@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Tree Hash - Chunked parallel digests for very large evidence images
+
+A multi-hundred-GB E01/DD image or DVR dump hashed as one stream is limited to
+single-core hash speed, however fast the storage is. Tree mode splits the file
+into fixed-size chunks, hashes the chunks in parallel and combines them:
+
+    chunk_i = H(bytes[i * chunk_size : (i + 1) * chunk_size])
+    root    = H(chunk_0 || chunk_1 || ... || chunk_n-1)    (raw digest bytes)
+
+The root digest is NOT the whole-file digest and is always labelled with its
+own algorithm name (e.g. 'sha256-tree') so it can never be mistaken for the
+court-standard whole-file SHA-256. The chunk digests are kept in a
+ChunkManifest, which can be saved as JSON and compared against a later
+manifest to find exactly which byte ranges differ. A tree-mode hash report
+(hashes.csv) has its chunk manifests stored next to it (hashes.chunks.json).
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from core.logger import logger
+
+
+TREE_SUFFIX = '-tree'
+DEFAULT_TREE_CHUNK_SIZE = 64 * 1024 * 1024  # 64MB chunks
+TREE_READ_SIZE = 4 * 1024 * 1024            # Read granularity inside a chunk
+CHUNK_MANIFEST_SUFFIX = '.chunks.json'      # Chunk manifests stored next to a hash report
+
+
+def tree_algorithm_name(algorithm: str) -> str:
+    """Algorithm label for a tree root digest, e.g. 'sha256' -> 'sha256-tree'"""
+    return f"{algorithm}{TREE_SUFFIX}"
+
+
+def combine_chunk_digests(algorithm: str, chunk_digests: List[str]) -> str:
+    """
+    Combine hex chunk digests into the tree root digest
+
+    Args:
+        algorithm: Base hash algorithm
+        chunk_digests: Hex digests in chunk order
+
+    Returns:
+        Hex root digest
+    """
+    root = hashlib.new(algorithm)
+    for digest in chunk_digests:
+        root.update(bytes.fromhex(digest))
+    return root.hexdigest()
+
+
+@dataclass
+class ChunkManifest:
+    """Chunk digests and root digest of one file hashed in tree mode"""
+    algorithm: str  # Base algorithm, e.g. 'sha256'
+    chunk_size: int
+    file_size: int
+    chunk_digests: List[str]
+    root_digest: str
+    file_path: str = ""
+    created: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def label(self) -> str:
+        """Algorithm label of the root digest"""
+        return tree_algorithm_name(self.algorithm)
+
+    def chunk_range(self, index: int) -> Tuple[int, int]:
+        """Byte range [start, end) covered by a chunk"""
+        start = index * self.chunk_size
+        return start, min(start + self.chunk_size, self.file_size)
+
+    def differing_ranges(self, other: 'ChunkManifest') -> List[Tuple[int, int]]:
+        """
+        Find the byte ranges whose chunk digests differ
+
+        Adjacent differing chunks are merged into one range. Chunks that only
+        exist in the longer file count as differing.
+
+        Args:
+            other: Manifest of the file to compare against
+
+        Returns:
+            List of [start, end) byte ranges, empty if the files match
+
+        Raises:
+            ValueError: If the manifests use a different algorithm or chunk size
+        """
+        if self.algorithm != other.algorithm or self.chunk_size != other.chunk_size:
+            raise ValueError(
+                f"Manifests are not comparable: {self.label}/{self.chunk_size} vs "
+                f"{other.label}/{other.chunk_size}"
+            )
+
+        file_size = max(self.file_size, other.file_size)
+        chunk_count = max(len(self.chunk_digests), len(other.chunk_digests))
+        ranges: List[Tuple[int, int]] = []
+
+        for index in range(chunk_count):
+            ours = self.chunk_digests[index] if index < len(self.chunk_digests) else None
+            theirs = other.chunk_digests[index] if index < len(other.chunk_digests) else None
+            if ours is not None and theirs is not None and ours.lower() == theirs.lower():
+                continue
+
+            start = index * self.chunk_size
+            end = min(start + self.chunk_size, file_size)
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+
+        return ranges
+
+    def to_dict(self) -> Dict:
+        """Convert to a JSON-serializable dictionary"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ChunkManifest':
+        """Create a manifest from a dictionary produced by to_dict()"""
+        return cls(**data)
+
+    def save(self, path: Path):
+        """Write the manifest as JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: Path) -> 'ChunkManifest':
+        """Read a manifest written by save()"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+class TreeHasher:
+    """
+    Hash one file as fixed-size chunks on a thread pool
+
+    hashlib and file reads release the GIL, so chunks are hashed on all cores.
+    Each worker streams its chunk through a TREE_READ_SIZE buffer, keeping memory
+    at max_workers * TREE_READ_SIZE regardless of chunk size.
+    """
+
+    def __init__(self, algorithm: str = 'sha256', chunk_size: int = DEFAULT_TREE_CHUNK_SIZE,
+                 max_workers: Optional[int] = None,
+                 cancelled_check: Optional[Callable[[], bool]] = None,
+                 bytes_callback: Optional[Callable[[int], None]] = None):
+        """
+        Initialize tree hasher
+
+        Args:
+            algorithm: Base hash algorithm for chunks and root
+            chunk_size: Bytes per chunk (part of the digest definition - both sides
+                of a verification must use the same value)
+            max_workers: Worker threads (None = CPU count)
+            cancelled_check: Function that returns True if hashing should stop
+            bytes_callback: Receives the size of every block read (progress)
+        """
+        if chunk_size <= 0:
+            raise ValueError("Tree hash chunk size must be positive")
+
+        self.algorithm = algorithm
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.cancelled_check = cancelled_check
+        self.bytes_callback = bytes_callback
+
+    def hash_file(self, file_path: Path) -> ChunkManifest:
+        """
+        Calculate the chunk manifest of a file
+
+        Args:
+            file_path: File to hash
+
+        Returns:
+            ChunkManifest with chunk digests and root digest
+
+        Raises:
+            InterruptedError: If cancelled
+            OSError: If the file cannot be read
+        """
+        file_size = file_path.stat().st_size
+        chunk_count = max(1, -(-file_size // self.chunk_size))
+        workers = min(self.max_workers, chunk_count)
+
+        logger.debug(f"Tree hashing {file_path.name}: {chunk_count} chunks of "
+                     f"{self.chunk_size // (1024 * 1024)}MB on {workers} threads")
+
+        if workers == 1:
+            chunk_digests = [self._hash_chunk(file_path, index, file_size) for index in range(chunk_count)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="TreeHash") as executor:
+                chunk_digests = list(executor.map(
+                    lambda index: self._hash_chunk(file_path, index, file_size),
+                    range(chunk_count)
+                ))
+
+        return ChunkManifest(
+            algorithm=self.algorithm,
+            chunk_size=self.chunk_size,
+            file_size=file_size,
+            chunk_digests=chunk_digests,
+            root_digest=combine_chunk_digests(self.algorithm, chunk_digests),
+            file_path=str(file_path)
+        )
+
+    def _hash_chunk(self, file_path: Path, index: int, file_size: int) -> str:
+        """Hash one chunk with its own file handle"""
+        start = index * self.chunk_size
+        remaining = max(min(self.chunk_size, file_size - start), 0)
+        hash_obj = hashlib.new(self.algorithm)
+        buffer = bytearray(min(TREE_READ_SIZE, max(remaining, 1)))
+        view = memoryview(buffer)
+
+        with open(file_path, 'rb', buffering=0) as f:
+            f.seek(start)
+            while remaining > 0:
+                if self.cancelled_check and self.cancelled_check():
+                    raise InterruptedError("Tree hash cancelled")
+
+                bytes_read = f.readinto(view[:min(len(buffer), remaining)])
+                if not bytes_read:
+                    break  # File shrank while hashing - the digest reflects what was read
+
+                hash_obj.update(view[:bytes_read])
+                remaining -= bytes_read
+                if self.bytes_callback:
+                    self.bytes_callback(bytes_read)
+
+        return hash_obj.hexdigest()
+
+
+def load_manifest(manifest: Union[ChunkManifest, Path, str]) -> ChunkManifest:
+    """Accept a manifest object or a path to a saved manifest"""
+    if isinstance(manifest, ChunkManifest):
+        return manifest
+    return ChunkManifest.load(Path(manifest))
+
+
+def chunk_manifest_path(report_path: Path) -> Path:
+    """Chunk manifest file of a hash report, e.g. hashes.csv -> hashes.chunks.json"""
+    report_path = Path(report_path)
+    return report_path.with_name(report_path.stem + CHUNK_MANIFEST_SUFFIX)
+
+
+def save_chunk_manifests(manifests: Iterable[ChunkManifest], path: Path) -> int:
+    """
+    Write the chunk manifests of a tree-mode run as one JSON file
+
+    Args:
+        manifests: Manifests of the hashed files
+        path: Output file (see chunk_manifest_path)
+
+    Returns:
+        Number of manifests written
+    """
+    records = [manifest.to_dict() for manifest in manifests]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'files': records}, f, indent=2)
+    logger.info(f"Saved {len(records)} chunk manifest(s): {path}")
+    return len(records)
+
+
+def load_chunk_manifests(path: Path) -> List[ChunkManifest]:
+    """Read chunk manifests written by save_chunk_manifests()"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [ChunkManifest.from_dict(record) for record in data.get('files', [])]
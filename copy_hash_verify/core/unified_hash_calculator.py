@@ -7,9 +7,10 @@ Combines:
 - Algorithm flexibility (SHA-256, SHA-1, MD5) from HashOperations
 - 2-read optimization for copy+hash workflows
 - Bidirectional verification from HashOperations
+- Verification against a stored hash report (target-only re-hash)
 - Parallel hashing support (hashwise library)
 - Storage-aware adaptive parallelism (NEW)
-- Memory-safe chunked processing (NEW)
+- Memory-safe bounded, largest-first scheduling within a lookahead window (NEW)
 - Result-based error handling
 
 This is the single hash engine used by all copy_hash_verify operations.
@@ -21,19 +22,28 @@ NEW in Parallel Processing Update:
 - Conservative fallback to sequential processing
 """
 
+import csv
 import hashlib
+import json
 import time
 import os
+import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Callable, Optional
+import heapq
+from itertools import chain, count, islice
+from typing import List, Dict, Tuple, Callable, Optional, Union, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from threading import Event
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+from threading import Event, Lock
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from core.logger import logger
 from core.result_types import Result
 from core.exceptions import HashCalculationError, HashVerificationError
+from core.hash_operations import normalize_algorithms, compare_digests
+from core.file_discovery import FileDiscovery, DiscoveredFile
+from .tree_hash import TreeHasher, ChunkManifest, DEFAULT_TREE_CHUNK_SIZE, TREE_SUFFIX, load_manifest
+from .hash_manifest import HashManifest, ManifestEntry
 
 # NEW: Import storage detection, thread calculation, and progress throttling
 try:
@@ -57,6 +67,13 @@ except ImportError:
     logger.warning("ThrottledProgressReporter not available, using direct callbacks")
     THROTTLED_PROGRESS_AVAILABLE = False
 
+try:
+    from .hash_cache import HashCache, FileFingerprint
+    HASH_CACHE_AVAILABLE = True
+except ImportError:
+    logger.warning("HashCache not available, persistent hash caching disabled")
+    HASH_CACHE_AVAILABLE = False
+
 # Try to import hashwise for accelerated parallel hashing
 try:
     from hashwise import ParallelHasher
@@ -75,6 +92,14 @@ class HashResult:
     file_size: int
     duration: float
     error: Optional[str] = None
+    from_cache: bool = False  # True when served from HashCache without reading the file
+    hashes: Dict[str, str] = field(default_factory=dict)  # All digests by algorithm
+    tree_manifest: Optional[ChunkManifest] = None  # Chunk digests when hashed in tree mode
+
+    def __post_init__(self):
+        """Single-algorithm results expose their digest in hashes too"""
+        if not self.hashes and self.hash_value:
+            self.hashes = {self.algorithm: self.hash_value}
 
     @property
     def success(self) -> bool:
@@ -97,6 +122,7 @@ class VerificationResult:
     match: bool
     comparison_type: str  # 'exact_match', 'hash_mismatch', 'missing_target', 'missing_source'
     notes: str = ""
+    differing_ranges: List[Tuple[int, int]] = field(default_factory=list)  # Byte ranges (tree mode)
 
     @property
     def source_name(self) -> str:
@@ -120,6 +146,8 @@ class HashOperationMetrics:
     total_bytes: int = 0
     processed_bytes: int = 0
     current_file: str = ""
+    cache_hits: int = 0
+    discovery_complete: bool = True  # False while totals are still growing (streaming discovery)
 
     @property
     def duration(self) -> float:
@@ -142,6 +170,21 @@ class HashOperationMetrics:
             return (self.processed_bytes / (1024 * 1024)) / self.duration
         return 0.0
 
+    @property
+    def byte_progress_percent(self) -> int:
+        """Progress percentage based on bytes hashed against bytes discovered so far"""
+        if self.total_bytes > 0:
+            return min(int((self.processed_bytes / self.total_bytes) * 100), 100)
+        return self.progress_percent
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds remaining for the bytes discovered so far (None = unknown)"""
+        if self.processed_bytes <= 0 or self.duration <= 0:
+            return None
+        bytes_per_second = self.processed_bytes / self.duration
+        return max(self.total_bytes - self.processed_bytes, 0) / bytes_per_second
+
 
 class _VerificationProgressAggregator:
     """
@@ -226,16 +269,22 @@ class _VerificationCoordinator:
     Handles error propagation and thread lifecycle explicitly.
     Storage detection is performed once before creating coordinator to avoid redundancy.
     """
-    def __init__(self, algorithm: str, source_paths: List[Path], target_paths: List[Path],
+    def __init__(self, algorithm: Union[str, List[str]], source_paths: List[Path], target_paths: List[Path],
                  source_threads: int, target_threads: int,
                  progress_aggregator: _VerificationProgressAggregator,
                  cancelled_check: Optional[Callable[[], bool]],
-                 enable_parallel: bool = True):
+                 enable_parallel: bool = True,
+                 hash_cache: Optional['HashCache'] = None,
+                 force_reread: bool = False,
+                 include_patterns: Optional[Sequence[str]] = None,
+                 exclude_patterns: Optional[Sequence[str]] = None,
+                 tree_hash: bool = False,
+                 tree_chunk_size: int = DEFAULT_TREE_CHUNK_SIZE):
         """
         Initialize verification coordinator
 
         Args:
-            algorithm: Hash algorithm to use
+            algorithm: Hash algorithm (or list of algorithms) to use
             source_paths: Source file paths
             target_paths: Target file paths
             source_threads: Optimal threads for source storage
@@ -243,6 +292,12 @@ class _VerificationCoordinator:
             progress_aggregator: Progress aggregation handler
             cancelled_check: Cancellation check function
             enable_parallel: Enable parallel processing (overrides threads to force optimization)
+            hash_cache: Persistent hash cache shared by both sides (None = disabled)
+            force_reread: Ignore cached digests and re-read every file
+            include_patterns: Only hash files matching these globs (None = all files)
+            exclude_patterns: Skip files and folders matching these globs
+            tree_hash: Hash both sides as chunked tree digests
+            tree_chunk_size: Tree chunk size (must match on both sides)
         """
         from threading import Thread
 
@@ -254,6 +309,12 @@ class _VerificationCoordinator:
         self.progress_aggregator = progress_aggregator
         self.cancelled_check = cancelled_check
         self.enable_parallel = enable_parallel
+        self.hash_cache = hash_cache
+        self.force_reread = force_reread
+        self.include_patterns = include_patterns
+        self.exclude_patterns = exclude_patterns
+        self.tree_hash = tree_hash
+        self.tree_chunk_size = tree_chunk_size
 
         # Results
         self.source_result = None
@@ -274,7 +335,13 @@ class _VerificationCoordinator:
                 progress_callback=lambda pct, msg: self.progress_aggregator.update_source_progress(pct, msg),
                 cancelled_check=self.cancelled_check,
                 enable_parallel=self.enable_parallel,
-                max_workers_override=self.source_threads  # Pre-detected optimal threads
+                max_workers_override=self.source_threads,  # Pre-detected optimal threads
+                hash_cache=self.hash_cache,
+                force_reread=self.force_reread,
+                include_patterns=self.include_patterns,
+                exclude_patterns=self.exclude_patterns,
+                tree_hash=self.tree_hash,
+                tree_chunk_size=self.tree_chunk_size
             )
 
             self.source_result = source_calculator.hash_files(self.source_paths)
@@ -297,7 +364,13 @@ class _VerificationCoordinator:
                 progress_callback=lambda pct, msg: self.progress_aggregator.update_target_progress(pct, msg),
                 cancelled_check=self.cancelled_check,
                 enable_parallel=self.enable_parallel,
-                max_workers_override=self.target_threads  # Pre-detected optimal threads
+                max_workers_override=self.target_threads,  # Pre-detected optimal threads
+                hash_cache=self.hash_cache,
+                force_reread=self.force_reread,
+                include_patterns=self.include_patterns,
+                exclude_patterns=self.exclude_patterns,
+                tree_hash=self.tree_hash,
+                tree_chunk_size=self.tree_chunk_size
             )
 
             self.target_result = target_calculator.hash_files(self.target_paths)
@@ -361,30 +434,59 @@ class UnifiedHashCalculator:
     MEDIUM_FILE_THRESHOLD = 100_000_000   # 100MB - use 2MB buffer
     # Large files (>100MB) - use 10MB buffer
 
+    # Parallel scheduler: files held in the largest-first window, and how often the
+    # scheduler wakes up to check cancellation and report in-file byte progress
+    SCHEDULER_LOOKAHEAD = 4096
+    SCHEDULER_POLL_INTERVAL = 0.25
+
     def __init__(
         self,
-        algorithm: str = 'sha256',
+        algorithm: Union[str, List[str]] = 'sha256',
         progress_callback: Optional[Callable[[int, str], None]] = None,
         cancelled_check: Optional[Callable[[], bool]] = None,
         pause_check: Optional[Callable[[], None]] = None,
         enable_parallel: bool = True,
-        max_workers_override: Optional[int] = None
+        max_workers_override: Optional[int] = None,
+        hash_cache: Optional['HashCache'] = None,
+        force_reread: bool = False,
+        include_patterns: Optional[Sequence[str]] = None,
+        exclude_patterns: Optional[Sequence[str]] = None,
+        tree_hash: bool = False,
+        tree_chunk_size: int = DEFAULT_TREE_CHUNK_SIZE,
+        tree_workers: Optional[int] = None,
+        size_triage: bool = False,
+        hash_size_mismatches: bool = True
     ):
         """
         Initialize the unified hash calculator
 
         Args:
-            algorithm: Hash algorithm ('sha256', 'sha1', 'md5')
+            algorithm: Hash algorithm ('sha256', 'sha1', 'md5'), or a list of algorithms
+                calculated from a single read of each file (first one is primary)
             progress_callback: Function that receives (progress_pct, status_message)
             cancelled_check: Function that returns True if operation should be cancelled
             pause_check: Function that checks and waits if operation should be paused
             enable_parallel: Enable parallel processing when beneficial (default: True)
             max_workers_override: Override thread count (None = auto-detect)
+            hash_cache: Persistent hash cache for unchanged files (None = disabled)
+            force_reread: Always read file content even when a valid cache entry exists
+                (forensic policy mode); fresh digests still refresh the cache
+            include_patterns: Only hash files matching these globs, e.g. ['*.mp4'] (None = all files)
+            exclude_patterns: Skip files and folders matching these globs, e.g. ['*.tmp', 'Thumbs.db']
+            tree_hash: Hash each file as parallel fixed-size chunks and report the tree
+                root digest (labelled '<algorithm>-tree', primary algorithm only) with
+                its chunk manifest instead of the whole-file digest. Files are then
+                processed one at a time, each using tree_workers threads. The hash
+                cache is not used in this mode.
+            tree_chunk_size: Chunk size for tree mode (part of the digest definition)
+            tree_workers: Threads per file in tree mode (None = CPU count)
+            size_triage: Before verifying, pair both trees by relative path from a
+                stat-only scan. Missing files are reported without being hashed.
+            hash_size_mismatches: With size_triage, still hash pairs whose sizes
+                differ (False = report them as 'size_mismatch' without reading them)
         """
-        if algorithm not in self.SUPPORTED_ALGORITHMS:
-            raise ValueError(f"Unsupported algorithm: {algorithm}. Supported: {self.SUPPORTED_ALGORITHMS}")
-
-        self.algorithm = algorithm
+        self.algorithms = normalize_algorithms(algorithm, self.SUPPORTED_ALGORITHMS)
+        self.algorithm = self.algorithms[0]  # Primary algorithm (HashResult.hash_value)
         self.progress_callback = progress_callback
         self.cancelled_check = cancelled_check
         self.pause_check = pause_check
@@ -392,12 +494,35 @@ class UnifiedHashCalculator:
         self.cancel_event = Event()
         self.metrics = HashOperationMetrics()
 
+        # Bytes read so far by all workers (byte-weighted progress inside large files)
+        self._bytes_hashed = 0
+        self._bytes_lock = Lock()
+
         # NEW: Parallel processing configuration
         self.enable_parallel = enable_parallel and STORAGE_DETECTION_AVAILABLE
         self.max_workers_override = max_workers_override
         self.storage_detector = StorageDetector() if STORAGE_DETECTION_AVAILABLE else None
 
-        logger.debug(f"UnifiedHashCalculator initialized: algorithm={algorithm}, parallel={self.enable_parallel}")
+        # Persistent hash cache (stat-only hashing for unchanged files)
+        self.hash_cache = hash_cache if HASH_CACHE_AVAILABLE else None
+        self.force_reread = force_reread
+
+        # Discovery filters
+        self.include_patterns = list(include_patterns or [])
+        self.exclude_patterns = list(exclude_patterns or [])
+
+        # Tree digest mode (intra-file parallel hashing)
+        self.tree_hash = tree_hash
+        self.tree_chunk_size = tree_chunk_size
+        self.tree_workers = tree_workers
+
+        # Stat-only pre-pass for verification
+        self.size_triage = size_triage
+        self.hash_size_mismatches = hash_size_mismatches
+        self.triage_summary: Optional[Dict[str, int]] = None
+
+        logger.debug(f"UnifiedHashCalculator initialized: algorithms={self.algorithms}, parallel={self.enable_parallel}, "
+                     f"cache={'on' if self.hash_cache else 'off'}, force_reread={force_reread}")
 
     def _get_adaptive_buffer_size(self, file_size: int) -> int:
         """
@@ -420,6 +545,9 @@ class UnifiedHashCalculator:
         """
         Calculate hash for a single file with adaptive buffering
 
+        When a hash cache is configured and force_reread is off, files whose stat
+        fingerprint matches a cached entry are resolved without being read.
+
         Args:
             file_path: Path to file
             relative_path: Relative path for result (optional)
@@ -435,19 +563,40 @@ class UnifiedHashCalculator:
             )
             return Result.error(error)
 
+        if self.tree_hash:
+            return self._calculate_tree_hash(file_path, relative_path)
+
         try:
-            file_size = file_path.stat().st_size
+            stat_result = file_path.stat()
+            file_size = stat_result.st_size
+
+            # Stat-only path: unchanged file already hashed with every requested algorithm
+            if self.hash_cache and not self.force_reread:
+                cached_hashes = {}
+                for algorithm in self.algorithms:
+                    cached_hash = self._lookup_cache(file_path, stat_result, algorithm)
+                    if not cached_hash:
+                        break
+                    cached_hashes[algorithm] = cached_hash
+                else:
+                    self._add_hashed_bytes(file_size)
+                    return Result.success(HashResult(
+                        file_path=file_path,
+                        relative_path=relative_path or file_path,
+                        algorithm=self.algorithm,
+                        hash_value=cached_hashes[self.algorithm],
+                        file_size=file_size,
+                        duration=0.0,
+                        from_cache=True,
+                        hashes=cached_hashes
+                    ))
+
             buffer_size = self._get_adaptive_buffer_size(file_size)
 
             start_time = time.time()
 
-            # Create hash object
-            if self.algorithm == 'sha256':
-                hash_obj = hashlib.sha256()
-            elif self.algorithm == 'sha1':
-                hash_obj = hashlib.sha1()
-            else:  # md5
-                hash_obj = hashlib.md5()
+            # One hash object per algorithm - every chunk feeds all of them
+            hash_objs = {algorithm: hashlib.new(algorithm) for algorithm in self.algorithms}
 
             # Stream file and calculate hash
             with open(file_path, 'rb') as f:
@@ -469,18 +618,24 @@ class UnifiedHashCalculator:
                     if not chunk:
                         break
 
-                    hash_obj.update(chunk)
+                    for hash_obj in hash_objs.values():
+                        hash_obj.update(chunk)
+                    self._add_hashed_bytes(len(chunk))
 
-            hash_value = hash_obj.hexdigest()
+            hashes = {algorithm: hash_obj.hexdigest() for algorithm, hash_obj in hash_objs.items()}
             duration = time.time() - start_time
 
+            if self.hash_cache:
+                self._update_cache(file_path, stat_result, hashes)
+
             result = HashResult(
                 file_path=file_path,
                 relative_path=relative_path or file_path,
                 algorithm=self.algorithm,
-                hash_value=hash_value,
+                hash_value=hashes[self.algorithm],
                 file_size=file_size,
-                duration=duration
+                duration=duration,
+                hashes=hashes
             )
 
             return Result.success(result)
@@ -501,6 +656,188 @@ class UnifiedHashCalculator:
             )
             return Result.error(error)
 
+    def _calculate_tree_hash(self, file_path: Path,
+                             relative_path: Optional[Path] = None) -> Result[HashResult]:
+        """
+        Calculate the chunked tree digest of a file on tree_workers threads
+
+        Args:
+            file_path: Path to file
+            relative_path: Relative path for result (optional)
+
+        Returns:
+            Result[HashResult] whose hash_value is the tree root digest and whose
+            tree_manifest holds the chunk digests
+        """
+        try:
+            start_time = time.time()
+            manifest = self._create_tree_hasher().hash_file(file_path)
+
+            return Result.success(HashResult(
+                file_path=file_path,
+                relative_path=relative_path or file_path,
+                algorithm=manifest.label,
+                hash_value=manifest.root_digest,
+                file_size=manifest.file_size,
+                duration=time.time() - start_time,
+                tree_manifest=manifest
+            ))
+
+        except InterruptedError:
+            error = HashCalculationError(
+                "Hash calculation cancelled by user",
+                user_message="Operation cancelled.",
+                file_path=str(file_path)
+            )
+            return Result.error(error)
+
+        except PermissionError as e:
+            error = HashCalculationError(
+                f"Permission denied accessing {file_path}: {e}",
+                user_message="Cannot access file due to permission restrictions.",
+                file_path=str(file_path)
+            )
+            return Result.error(error)
+
+        except Exception as e:
+            error = HashCalculationError(
+                f"Failed to calculate tree hash for {file_path}: {e}",
+                user_message="An error occurred while calculating file hash.",
+                file_path=str(file_path)
+            )
+            return Result.error(error)
+
+    def _create_tree_hasher(self, algorithm: Optional[str] = None,
+                            chunk_size: Optional[int] = None) -> TreeHasher:
+        """Create a TreeHasher wired to this calculator's cancellation and progress"""
+        return TreeHasher(
+            algorithm=algorithm or self.algorithm,
+            chunk_size=chunk_size or self.tree_chunk_size,
+            max_workers=self.tree_workers,
+            cancelled_check=self._is_cancelled,
+            bytes_callback=self._add_hashed_bytes
+        )
+
+    def verify_against_manifest(self, file_path: Path,
+                                manifest: Union[ChunkManifest, Path, str]) -> Result[VerificationResult]:
+        """
+        Re-hash a file in tree mode and compare it with a stored chunk manifest
+
+        The manifest's algorithm and chunk size are used, so a manifest saved during
+        acquisition can be checked later and any mismatch narrowed to byte ranges.
+
+        Args:
+            file_path: File to verify
+            manifest: ChunkManifest or path to a manifest saved with ChunkManifest.save()
+
+        Returns:
+            Result[VerificationResult] with differing_ranges filled on mismatch
+        """
+        try:
+            expected = load_manifest(manifest)
+        except Exception as e:
+            error = HashVerificationError(
+                f"Cannot load chunk manifest {manifest}: {e}",
+                user_message="The chunk manifest could not be read.",
+                file_path=str(file_path)
+            )
+            return Result.error(error)
+
+        try:
+            start_time = time.time()
+            actual = self._create_tree_hasher(expected.algorithm, expected.chunk_size).hash_file(file_path)
+        except InterruptedError:
+            error = HashCalculationError(
+                "Hash calculation cancelled by user",
+                user_message="Operation cancelled.",
+                file_path=str(file_path)
+            )
+            return Result.error(error)
+        except Exception as e:
+            error = HashCalculationError(
+                f"Failed to calculate tree hash for {file_path}: {e}",
+                user_message="An error occurred while calculating file hash.",
+                file_path=str(file_path)
+            )
+            return Result.error(error)
+
+        source_result = HashResult(
+            file_path=Path(expected.file_path or file_path),
+            relative_path=Path(expected.file_path or file_path),
+            algorithm=expected.label,
+            hash_value=expected.root_digest,
+            file_size=expected.file_size,
+            duration=0.0,
+            tree_manifest=expected
+        )
+        target_result = HashResult(
+            file_path=file_path,
+            relative_path=file_path,
+            algorithm=actual.label,
+            hash_value=actual.root_digest,
+            file_size=actual.file_size,
+            duration=time.time() - start_time,
+            tree_manifest=actual
+        )
+
+        differing_ranges = expected.differing_ranges(actual)
+        match = not differing_ranges and expected.root_digest.lower() == actual.root_digest.lower()
+
+        return Result.success(VerificationResult(
+            source_result=source_result,
+            target_result=target_result,
+            match=match,
+            comparison_type='exact_match' if match else 'hash_mismatch',
+            notes="" if match else self._describe_ranges(differing_ranges),
+            differing_ranges=differing_ranges
+        ))
+
+    @staticmethod
+    def _describe_ranges(ranges: List[Tuple[int, int]]) -> str:
+        """Human-readable summary of differing byte ranges"""
+        differing_bytes = sum(end - start for start, end in ranges)
+        shown = ', '.join(f"{start:,}-{end:,}" for start, end in ranges[:3])
+        more = f" (+{len(ranges) - 3} more)" if len(ranges) > 3 else ""
+        return f"{differing_bytes:,} bytes differ in {len(ranges)} range(s): {shown}{more}"
+
+    def _lookup_cache(self, file_path: Path, stat_result: os.stat_result,
+                      algorithm: str) -> Optional[str]:
+        """
+        Look up a cached digest, treating any cache failure as a miss
+
+        Args:
+            file_path: File being hashed
+            stat_result: Current stat() of the file
+            algorithm: Hash algorithm name
+
+        Returns:
+            Cached hex digest or None
+        """
+        try:
+            return self.hash_cache.lookup(file_path, algorithm, stat_result)
+        except Exception as e:
+            logger.warning(f"Hash cache lookup failed for {file_path}: {e}")
+            return None
+
+    def _update_cache(self, file_path: Path, stat_result: os.stat_result, hashes: Dict[str, str]):
+        """
+        Store freshly computed digests, but only if the file did not change while being read
+
+        Args:
+            file_path: File that was hashed
+            stat_result: stat() taken before reading
+            hashes: Computed hex digests by algorithm
+        """
+        try:
+            if FileFingerprint.from_stat(os.stat(file_path)) != FileFingerprint.from_stat(stat_result):
+                logger.warning(f"File changed while hashing, not caching: {file_path}")
+                return
+            for algorithm, hash_value in hashes.items():
+                self.hash_cache.store(file_path, algorithm, stat_result, hash_value)
+        except Exception as e:
+            # Cache failures must never fail the hash operation itself
+            logger.warning(f"Hash cache update failed for {file_path}: {e}")
+
     def discover_files(self, paths: List[Path]) -> List[Path]:
         """
         Discover all files from a list of paths (files and folders)
@@ -509,20 +846,39 @@ class UnifiedHashCalculator:
             paths: List of file and/or folder paths
 
         Returns:
-            List of all file paths (folders expanded recursively)
+            List of all file paths (folders expanded recursively, include/exclude
+            patterns applied)
         """
-        discovered_files = []
+        return [found.path for found in self._create_discovery().iter_files(paths)]
+
+    def _create_discovery(self) -> FileDiscovery:
+        """Create a scandir discovery walker with this calculator's filters"""
+        return FileDiscovery(
+            include_patterns=self.include_patterns,
+            exclude_patterns=self.exclude_patterns,
+            cancelled_check=self._is_cancelled
+        )
 
-        for path in paths:
-            if path.is_file():
-                discovered_files.append(path)
-            elif path.is_dir():
-                # Recursively discover files in directory
-                for item in path.rglob('*'):
-                    if item.is_file():
-                        discovered_files.append(item)
+    def _track_discovery(self, discovery: FileDiscovery,
+                         discovered: Iterable[DiscoveredFile]) -> Iterator[DiscoveredFile]:
+        """
+        Feed discovered files to the hashing loop while keeping metrics totals current
 
-        return discovered_files
+        Args:
+            discovery: Walker whose running totals are copied into the metrics
+            discovered: Files as they are found
+
+        Yields:
+            Discovered files (path + size) in discovery order
+        """
+        for found in discovered:
+            self.metrics.total_files = discovery.files_found
+            self.metrics.total_bytes = discovery.bytes_found
+            yield found
+
+        self.metrics.total_files = discovery.files_found
+        self.metrics.total_bytes = discovery.bytes_found
+        self.metrics.discovery_complete = discovery.complete
 
     def hash_files(self, paths: List[Path]) -> Result[Dict[str, HashResult]]:
         """
@@ -531,31 +887,48 @@ class UnifiedHashCalculator:
         Automatically uses parallel processing when beneficial based on storage type.
         Falls back to sequential processing for HDDs or when parallel is disabled.
 
+        Files are streamed from a scandir walk: hashing starts as soon as the first
+        files are found, and metrics.total_files/total_bytes grow as discovery
+        proceeds (metrics.discovery_complete is set once the walk has finished).
+
         Args:
             paths: List of file and/or folder paths
 
         Returns:
             Result[Dict] mapping file paths to HashResult objects
         """
-        # Discover all files
-        files = self.discover_files(paths)
+        # Start streaming discovery - only the first two files are needed up front
+        # (to pick a strategy and detect storage)
+        discovery = self._create_discovery()
+        discovered = discovery.iter_files(paths)
+        head = list(islice(discovered, 2))
 
-        if not files:
+        if not head:
             error = HashCalculationError(
                 "No files found to hash",
                 user_message="No valid files found in the selected paths."
             )
             return Result.error(error)
 
-        # Initialize metrics
+        # Initialize metrics (totals are updated as discovery continues)
         self.metrics = HashOperationMetrics(
             start_time=time.time(),
-            total_files=len(files),
-            total_bytes=sum(f.stat().st_size for f in files if f.exists())
+            total_files=discovery.files_found,
+            total_bytes=discovery.bytes_found,
+            discovery_complete=False
         )
+        self._bytes_hashed = 0
+        found_files = self._track_discovery(discovery, chain(head, discovered))
+        files = (found.path for found in found_files)
+
+        # Tree mode parallelizes inside each file, so files are taken one at a time
+        if self.tree_hash:
+            logger.info(f"Tree hash mode: {self.tree_chunk_size // (1024 * 1024)}MB chunks, "
+                        f"{self.tree_workers or os.cpu_count()} threads per file")
+            return self._sequential_hash_files(files)
 
         # NEW: Storage-aware processing decision with ThreadCalculator
-        if self.enable_parallel and len(files) > 1:
+        if self.enable_parallel and len(head) > 1:
             # Determine optimal thread count
             if self.max_workers_override:
                 # Thread count pre-determined - skip redundant storage detection
@@ -564,12 +937,12 @@ class UnifiedHashCalculator:
                 logger.info(f"Using manual thread override: {optimal_threads} threads (skipping storage detection)")
             elif self.storage_detector and THREAD_CALCULATOR_AVAILABLE:
                 # Perform storage detection and use ThreadCalculator
-                storage_info = self.storage_detector.analyze_path(files[0])
+                storage_info = self.storage_detector.analyze_path(head[0].path)
                 calculator = ThreadCalculator()
                 optimal_threads = calculator.calculate_optimal_threads(
                     source_info=storage_info,
                     dest_info=None,  # Hash-only operation
-                    file_count=len(files),
+                    file_count=self.metrics.total_files,
                     operation_type="hash"
                 )
                 logger.info(f"Storage detected: {storage_info}")
@@ -582,14 +955,14 @@ class UnifiedHashCalculator:
             # Use parallel processing if beneficial
             if optimal_threads > 1:
                 logger.info(f"Using parallel processing with {optimal_threads} threads")
-                return self._parallel_hash_files(files, optimal_threads, storage_info)
+                return self._parallel_hash_files(found_files, optimal_threads, storage_info)
             else:
                 logger.info(f"Using sequential processing (storage: {storage_info.drive_type.value if storage_info else 'unknown'})")
 
         # Sequential processing (original implementation)
         return self._sequential_hash_files(files)
 
-    def _sequential_hash_files(self, files: List[Path]) -> Result[Dict[str, HashResult]]:
+    def _sequential_hash_files(self, files: Iterable[Path]) -> Result[Dict[str, HashResult]]:
         """
         Sequential hash calculation (original implementation)
 
@@ -600,17 +973,18 @@ class UnifiedHashCalculator:
         - Fallback when parallel processing fails
 
         Args:
-            files: List of files to hash
+            files: Files to hash (list or streaming discovery iterator)
 
         Returns:
             Result[Dict] mapping file paths to HashResult objects
         """
         results = {}
         failed_files = []
+        processed_count = 0
 
-        for idx, file_path in enumerate(files):
+        for file_path in files:
             # Check for cancellation
-            if self.cancelled or (self.cancelled_check and self.cancelled_check()):
+            if self._is_cancelled():
                 error = HashCalculationError(
                     "Hash operation cancelled by user",
                     user_message="Operation cancelled."
@@ -619,32 +993,42 @@ class UnifiedHashCalculator:
 
             # Update progress
             self.metrics.current_file = file_path.name
-            self.metrics.processed_files = idx
+            self.metrics.processed_files = processed_count
 
             if self.progress_callback:
-                progress_pct = int((idx / len(files)) * 100) if files else 0
-                self.progress_callback(progress_pct, f"Hashing {file_path.name}")
+                self.progress_callback(self.metrics.byte_progress_percent, f"Hashing {file_path.name}")
 
             # Calculate hash
             hash_result = self.calculate_hash(file_path, file_path)
+            processed_count += 1
 
             if hash_result.success:
                 results[str(file_path)] = hash_result.value
                 self.metrics.processed_bytes += hash_result.value.file_size
+                if hash_result.value.from_cache:
+                    self.metrics.cache_hits += 1
             else:
                 failed_files.append((file_path, hash_result.error))
                 self.metrics.failed_files += 1
 
+        # Discovery stops early when cancelled
+        if self._is_cancelled():
+            error = HashCalculationError(
+                "Hash operation cancelled by user",
+                user_message="Operation cancelled."
+            )
+            return Result.error(error)
+
         # Finalize metrics
         self.metrics.end_time = time.time()
-        self.metrics.processed_files = len(files) - len(failed_files)
+        self.metrics.processed_files = processed_count - len(failed_files)
 
         # Report completion
         if self.progress_callback:
             self.progress_callback(100, f"Hashing complete: {self.metrics.processed_files} files")
 
         # Check if we had any failures
-        if failed_files and len(failed_files) == len(files):
+        if failed_files and len(failed_files) == processed_count:
             # All files failed
             error = HashCalculationError(
                 "All hash operations failed",
@@ -654,16 +1038,25 @@ class UnifiedHashCalculator:
 
         return Result.success(results, metrics=self.metrics)
 
-    def _parallel_hash_files(self, files: List[Path], max_workers: int,
+    def _parallel_hash_files(self, files: Iterable[Union[DiscoveredFile, Path]], max_workers: int,
                             storage_info: Optional['StorageInfo']) -> Result[Dict[str, HashResult]]:
         """
-        Memory-safe parallel hash calculation using ThreadPoolExecutor
+        Size-aware parallel hash calculation using ThreadPoolExecutor
 
-        Uses chunked submission to prevent memory explosion on large file lists.
-        Implements throttled progress reporting to prevent UI flooding.
+        Work is scheduled largest-first within a 4096-file lookahead window
+        (SCHEDULER_LOOKAHEAD): discovered files wait in a size-ordered window and a
+        new file is submitted as soon as any worker finishes, so one very large file
+        never holds up the rest of the batch and every worker stays busy until the
+        end. At most max_workers * 2 hashes are in flight, which bounds memory on
+        huge file lists. A large file discovered after the window has filled waits
+        until it enters the window, so the order is only approximately largest-first.
+
+        Progress is byte-weighted (bytes hashed vs. bytes discovered) and reported
+        through a throttled reporter to prevent UI flooding.
 
         Args:
-            files: List of files to hash
+            files: Files to hash - DiscoveredFile stream (sizes from the directory
+                walk) or plain paths (sizes are stat()ed)
             max_workers: Number of parallel worker threads
             storage_info: Storage characteristics (for logging), None if skipped
 
@@ -673,10 +1066,12 @@ class UnifiedHashCalculator:
         results = {}
         failed_files = []
         processed_count = 0
-        total_files = len(files)
-
-        # Chunk size: 3x workers to keep threads busy without memory issues
-        chunk_size = min(max_workers * 3, 100)
+        file_iter = iter(files)
+        window = []        # Heap of (-size, sequence, path) waiting to be submitted
+        in_flight = {}     # Future -> path
+        sequence = count()
+        discovery_exhausted = False
+        max_in_flight = max_workers * 2
 
         # Create throttled progress reporter (10 updates/sec max)
         if THROTTLED_PROGRESS_AVAILABLE and self.progress_callback:
@@ -687,69 +1082,80 @@ class UnifiedHashCalculator:
         else:
             progress_reporter = None
 
-        logger.info(f"Starting parallel hash operation: {total_files} files, "
-                   f"{max_workers} workers, chunk_size={chunk_size}")
+        def fill_window():
+            """Pull discovered files into the size-ordered window"""
+            nonlocal discovery_exhausted
+            while not discovery_exhausted and len(window) < self.SCHEDULER_LOOKAHEAD:
+                item = next(file_iter, None)
+                if item is None:
+                    discovery_exhausted = True
+                elif isinstance(item, DiscoveredFile):
+                    heapq.heappush(window, (-item.size, next(sequence), item.path))
+                else:
+                    try:
+                        size = item.stat().st_size
+                    except OSError:
+                        size = 0  # calculate_hash reports the error
+                    heapq.heappush(window, (-size, next(sequence), item))
+
+        def report_progress():
+            total_label = (f"{self.metrics.total_files}" if self.metrics.discovery_complete
+                           else f"{self.metrics.total_files}+")
+            progress_message = f"Hashed {processed_count}/{total_label} files"
+            progress_pct = self._live_progress_percent()
+
+            if progress_reporter:
+                progress_reporter.report_progress(progress_pct, progress_message)
+            elif self.progress_callback:
+                # Direct callback if throttled reporter unavailable
+                self.progress_callback(progress_pct, progress_message)
+
+        logger.info(f"Starting parallel hash operation: {self.metrics.total_files}"
+                   f"{'' if self.metrics.discovery_complete else '+'} files, "
+                   f"{max_workers} workers, largest-first scheduling")
 
         try:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Process files in memory-safe chunks
-                for chunk_idx, chunk in enumerate(self._chunk_files(files, chunk_size)):
-                    # Check cancellation before starting chunk
-                    if self.cancelled or (self.cancelled_check and self.cancelled_check()):
-                        logger.info("Parallel hashing cancelled by user")
+                fill_window()
+
+                while window or in_flight:
+                    # Check cancellation before submitting more work
+                    if self._is_cancelled():
+                        logger.info("Parallel hashing cancelled by user, cancelling remaining futures")
+                        for future in in_flight:
+                            future.cancel()
                         error = HashCalculationError(
                             "Hash operation cancelled by user",
                             user_message="Operation cancelled."
                         )
                         return Result.error(error)
 
-                    # Submit chunk (bounded queue size)
-                    chunk_futures = {
-                        executor.submit(self.calculate_hash, file_path, file_path): file_path
-                        for file_path in chunk
-                    }
-
-                    logger.debug(f"Processing chunk {chunk_idx + 1}: {len(chunk_futures)} files")
-
-                    # Process results as they complete
-                    for future in as_completed(chunk_futures):
-                        # Check cancellation during processing
-                        if self.cancelled or (self.cancelled_check and self.cancelled_check()):
-                            logger.info("Cancelling remaining futures")
-                            # Cancel remaining futures
-                            for f in chunk_futures:
-                                if not f.done():
-                                    f.cancel()
-                            error = HashCalculationError(
-                                "Hash operation cancelled by user",
-                                user_message="Operation cancelled."
-                            )
-                            return Result.error(error)
+                    # Keep the pool saturated, largest waiting file first
+                    while window and len(in_flight) < max_in_flight:
+                        _, _, file_path = heapq.heappop(window)
+                        in_flight[executor.submit(self.calculate_hash, file_path, file_path)] = file_path
+                        fill_window()
+
+                    # Wake up periodically for cancellation and in-file byte progress
+                    done, _ = wait(in_flight, timeout=self.SCHEDULER_POLL_INTERVAL,
+                                   return_when=FIRST_COMPLETED)
 
-                        file_path = chunk_futures[future]
+                    for future in done:
+                        file_path = in_flight.pop(future)
 
                         try:
-                            # Timeout prevents hanging on problematic files (5 minutes)
-                            hash_result = future.result(timeout=300)
+                            hash_result = future.result()
 
                             if hash_result.success:
                                 results[str(file_path)] = hash_result.value
                                 self.metrics.processed_bytes += hash_result.value.file_size
+                                if hash_result.value.from_cache:
+                                    self.metrics.cache_hits += 1
                             else:
                                 failed_files.append((file_path, hash_result.error))
                                 self.metrics.failed_files += 1
                                 logger.warning(f"Hash failed for {file_path}: {hash_result.error}")
 
-                        except TimeoutError:
-                            error = HashCalculationError(
-                                f"Hash calculation timed out: {file_path}",
-                                user_message="File took too long to hash (>5 minutes)",
-                                file_path=str(file_path)
-                            )
-                            failed_files.append((file_path, error))
-                            self.metrics.failed_files += 1
-                            logger.error(f"Timeout hashing {file_path}")
-
                         except Exception as e:
                             error = HashCalculationError(
                                 f"Unexpected error hashing {file_path}: {e}",
@@ -760,19 +1166,18 @@ class UnifiedHashCalculator:
                             self.metrics.failed_files += 1
                             logger.error(f"Exception hashing {file_path}: {e}", exc_info=True)
 
-                        # Update progress (throttled)
                         processed_count += 1
                         self.metrics.processed_files = processed_count
-                        progress_pct = int((processed_count / total_files) * 100)
 
-                        if progress_reporter:
-                            progress_reporter.report_progress(
-                                progress_pct,
-                                f"Hashed {processed_count}/{total_files} files"
-                            )
-                        elif self.progress_callback:
-                            # Direct callback if throttled reporter unavailable
-                            self.progress_callback(progress_pct, f"Hashed {processed_count}/{total_files} files")
+                    report_progress()
+
+            # Discovery stops early when cancelled
+            if self._is_cancelled():
+                error = HashCalculationError(
+                    "Hash operation cancelled by user",
+                    user_message="Operation cancelled."
+                )
+                return Result.error(error)
 
             # Finalize metrics
             self.metrics.end_time = time.time()
@@ -792,7 +1197,7 @@ class UnifiedHashCalculator:
                 self.progress_callback(100, f"Hashing complete: {self.metrics.processed_files} files")
 
             # Check if we had any failures
-            if failed_files and len(failed_files) == len(files):
+            if failed_files and len(failed_files) == processed_count:
                 # All files failed
                 error = HashCalculationError(
                     "All hash operations failed",
@@ -808,23 +1213,32 @@ class UnifiedHashCalculator:
                 f"Parallel hashing failed: {e}",
                 user_message="An error occurred during parallel hash calculation. Falling back to sequential."
             )
-            # Fallback to sequential on any threading error
+            # Fallback to sequential on any threading error: redo unfinished work
+            # and the rest of the stream, keeping files already hashed
             logger.info("Falling back to sequential hashing after parallel failure")
-            return self._sequential_hash_files(files)
-
-    def _chunk_files(self, files: List[Path], chunk_size: int) -> List[List[Path]]:
+            unfinished = list(in_flight.values()) + [file_path for _, _, file_path in sorted(window)]
+            remaining = (item.path if isinstance(item, DiscoveredFile) else item for item in file_iter)
+            fallback_result = self._sequential_hash_files(chain(unfinished, remaining))
+            if fallback_result.success and results:
+                results.update(fallback_result.value)
+                return Result.success(results, metrics=self.metrics)
+            return fallback_result
+
+    def _add_hashed_bytes(self, byte_count: int):
+        """Count bytes hashed so far (called from worker threads)"""
+        with self._bytes_lock:
+            self._bytes_hashed += byte_count
+
+    def _live_progress_percent(self) -> int:
         """
-        Split file list into chunks for bounded memory management
-
-        Args:
-            files: List of files to chunk
-            chunk_size: Maximum files per chunk
+        Byte-weighted progress including partially hashed files
 
-        Yields:
-            Chunks of files
+        Returns:
+            Percentage of discovered bytes hashed so far (capped at 99 until completion)
         """
-        for i in range(0, len(files), chunk_size):
-            yield files[i:i + chunk_size]
+        if self.metrics.total_bytes > 0:
+            return min(int((self._bytes_hashed / self.metrics.total_bytes) * 100), 99)
+        return min(self.metrics.progress_percent, 99)
 
     def _is_cancelled(self) -> bool:
         """
@@ -846,6 +1260,10 @@ class UnifiedHashCalculator:
         Automatically uses parallel processing when beneficial based on storage type.
         Falls back to sequential for safety if parallel processing fails.
 
+        With size_triage, a stat-only pass reports missing files (and size
+        mismatches when hash_size_mismatches is off) first, and only the
+        remaining pairs are hashed.
+
         Args:
             source_paths: List of source file/folder paths
             target_paths: List of target file/folder paths
@@ -853,6 +1271,30 @@ class UnifiedHashCalculator:
         Returns:
             Result[Dict] mapping file paths to VerificationResult objects
         """
+        if not self.size_triage:
+            return self._run_verification(source_paths, target_paths)
+
+        triage_result = self._size_triage(source_paths, target_paths)
+        if not triage_result.success:
+            return triage_result
+        source_candidates, target_candidates, triage_results = triage_result.value
+
+        if not source_candidates:
+            # Nothing left to hash - the triage is the whole answer
+            return Result.success(triage_results, triage=self.triage_summary, execution_mode='triage')
+
+        result = self._run_verification(source_candidates, target_candidates)
+        if not result.success:
+            return result
+        return Result.success({**result.value, **triage_results},
+                              **{**(result.metadata or {}), 'triage': self.triage_summary})
+
+    def _run_verification(
+        self,
+        source_paths: List[Path],
+        target_paths: List[Path]
+    ) -> Result[Dict[str, VerificationResult]]:
+        """Hash both sides (parallel when possible) and compare"""
         # Try parallel verification first if enabled
         if self.enable_parallel and self.storage_detector:
             try:
@@ -863,6 +1305,110 @@ class UnifiedHashCalculator:
         # Sequential implementation (safety net) - call extracted method
         return self._verify_hashes_sequential(source_paths, target_paths)
 
+    def _size_triage(
+        self,
+        source_paths: List[Path],
+        target_paths: List[Path]
+    ) -> Result[Tuple[List[Path], List[Path], Dict[str, VerificationResult]]]:
+        """
+        Pair source and target files by relative path and size without reading them
+
+        Args:
+            source_paths: List of source file/folder paths
+            target_paths: List of target file/folder paths
+
+        Returns:
+            Result with (source files to hash, target files to hash, results already
+            decided). The candidate lists are in matching order.
+        """
+        start_time = time.time()
+        try:
+            source_files = {str(f.path): f.size for f in self._create_discovery().iter_files(source_paths)}
+            target_files = {str(f.path): f.size for f in self._create_discovery().iter_files(target_paths)}
+        except OSError as e:
+            error = HashVerificationError(
+                f"Pre-verification scan failed: {e}",
+                user_message="Could not scan the source or target files."
+            )
+            return Result.error(error)
+
+        if self._is_cancelled():
+            error = HashCalculationError(
+                "Hash calculation cancelled by user",
+                user_message="Operation cancelled."
+            )
+            return Result.error(error)
+
+        target_by_relpath = {
+            rel_path: target_path
+            for target_path, rel_path in self._relative_keys(target_files, self._common_root_key(target_files))
+        }
+
+        def unhashed(path: str, size: int) -> HashResult:
+            return HashResult(file_path=Path(path), relative_path=Path(path), algorithm=self.algorithm,
+                              hash_value='', file_size=size, duration=0.0)
+
+        source_candidates: List[Path] = []
+        target_candidates: List[Path] = []
+        decided: Dict[str, VerificationResult] = {}
+        size_mismatches = 0
+
+        for source_path, source_rel in self._relative_keys(source_files, self._common_root_key(source_files)):
+            source_size = source_files[source_path]
+            target_path = target_by_relpath.pop(source_rel, None)
+
+            if target_path is None:
+                decided[source_path] = VerificationResult(
+                    source_result=unhashed(source_path, source_size),
+                    target_result=None,
+                    match=False,
+                    comparison_type='missing_target',
+                    notes=f"File with relative path '{source_rel}' not found in target"
+                )
+                continue
+
+            target_size = target_files[target_path]
+            if source_size != target_size:
+                size_mismatches += 1
+                if not self.hash_size_mismatches:
+                    decided[source_path] = VerificationResult(
+                        source_result=unhashed(source_path, source_size),
+                        target_result=unhashed(target_path, target_size),
+                        match=False,
+                        comparison_type='size_mismatch',
+                        notes=f"Size differs: {source_size:,} vs {target_size:,} bytes (not hashed)"
+                    )
+                    continue
+
+            source_candidates.append(Path(source_path))
+            target_candidates.append(Path(target_path))
+
+        for rel_path, target_path in target_by_relpath.items():
+            decided[target_path] = VerificationResult(
+                source_result=None,
+                target_result=unhashed(target_path, target_files[target_path]),
+                match=False,
+                comparison_type='missing_source',
+                notes=f"File with relative path '{rel_path}' not found in source"
+            )
+
+        self.triage_summary = {
+            'source_files': len(source_files),
+            'target_files': len(target_files),
+            'missing_target': sum(1 for v in decided.values() if v.comparison_type == 'missing_target'),
+            'missing_source': len(target_by_relpath),
+            'size_mismatch': size_mismatches,
+            'pairs_to_hash': len(source_candidates)
+        }
+        message = (f"Triage: {self.triage_summary['missing_target']} missing in target, "
+                   f"{self.triage_summary['missing_source']} missing in source, "
+                   f"{size_mismatches} size mismatches - hashing {len(source_candidates)} pairs")
+        logger.info(f"{message} ({time.time() - start_time:.1f}s)")
+        if self.progress_callback:
+            self.progress_callback(0, message)
+
+        return Result.success((source_candidates, target_candidates, decided))
+
     def _verify_hashes_sequential(
         self,
         source_paths: List[Path],
@@ -985,14 +1531,20 @@ class UnifiedHashCalculator:
 
             # Step 5: Create coordinator and run parallel hashing
             coordinator = _VerificationCoordinator(
-                algorithm=self.algorithm,
+                algorithm=self.algorithms,
                 source_paths=source_paths,
                 target_paths=target_paths,
                 source_threads=source_threads,
                 target_threads=target_threads,
                 progress_aggregator=progress_aggregator,
                 cancelled_check=self.cancelled_check,
-                enable_parallel=self.enable_parallel  # Pass parallel flag to prevent nested detection
+                enable_parallel=self.enable_parallel,  # Pass parallel flag to prevent nested detection
+                hash_cache=self.hash_cache,
+                force_reread=self.force_reread,
+                include_patterns=self.include_patterns,
+                exclude_patterns=self.exclude_patterns,
+                tree_hash=self.tree_hash,
+                tree_chunk_size=self.tree_chunk_size
             )
 
             source_result, target_result = coordinator.run_parallel()
@@ -1038,6 +1590,144 @@ class UnifiedHashCalculator:
             logger.info("Falling back to sequential verification")
             return self._verify_hashes_sequential(source_paths, target_paths)
 
+    def verify_against_hash_manifest(
+        self,
+        manifest_path: Path,
+        target_paths: List[Path]
+    ) -> Result[Dict[str, VerificationResult]]:
+        """
+        Verify a target against a stored hash report without re-reading the source
+
+        The manifest (CSV written by HashReportGenerator, or JSON - see hash_manifest)
+        stands in for the source side: only the target is hashed, using the
+        algorithms recorded in the manifest, and files are joined on their path
+        relative to each side's common root exactly like verify_hashes().
+        Include/exclude patterns filter the manifest entries as well as the target.
+
+        Tree-mode reports are verified by tree-hashing the target. The chunk size
+        comes from the report's chunk manifest file, which also narrows each
+        mismatch down to byte ranges.
+
+        Args:
+            manifest_path: Stored CSV/JSON hash report of the source
+            target_paths: List of target file/folder paths
+
+        Returns:
+            Result[Dict] mapping file paths to VerificationResult objects
+        """
+        manifest = HashManifest(manifest_path)
+        source_hashes: Dict[str, ManifestEntry] = {}
+        chunk_manifests: Dict[str, ChunkManifest] = {}
+        filtered = 0
+        try:
+            for entry in manifest.iter_entries():
+                source_hashes[sys.intern(entry.file_path)] = entry
+            if any(alg.endswith(TREE_SUFFIX) for alg in manifest.algorithms):
+                chunk_manifests = manifest.chunk_manifests()
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, csv.Error, json.JSONDecodeError) as e:
+            error = HashVerificationError(
+                f"Cannot read hash manifest {manifest_path}: {e}",
+                user_message="The hash manifest could not be read. Please select a hash report CSV or JSON file."
+            )
+            return Result.error(error)
+
+        # The target is filtered during discovery, so apply the same filters to the manifest
+        if self.include_patterns or self.exclude_patterns:
+            total = len(source_hashes)
+            source_hashes = self._filter_manifest_entries(source_hashes)
+            filtered = total - len(source_hashes)
+
+        # Whole-file digests are preferred; tree roots are used when nothing else is recorded
+        algorithms = [alg for alg in manifest.algorithms if alg in self.SUPPORTED_ALGORITHMS]
+        tree_mode = not algorithms
+        if tree_mode:
+            algorithms = [alg[:-len(TREE_SUFFIX)] for alg in manifest.algorithms
+                          if alg.endswith(TREE_SUFFIX) and alg[:-len(TREE_SUFFIX)] in self.SUPPORTED_ALGORITHMS][:1]
+        if not source_hashes or not algorithms:
+            error = HashVerificationError(
+                f"No verifiable entries in hash manifest {manifest_path} "
+                f"(algorithms: {', '.join(manifest.algorithms) or 'none'})",
+                user_message="The hash manifest contains no SHA-256, SHA-1 or MD5 hashes to verify against."
+            )
+            return Result.error(error)
+
+        chunk_size = next(iter(chunk_manifests.values())).chunk_size if chunk_manifests else DEFAULT_TREE_CHUNK_SIZE
+        logger.info(f"Verifying {len(target_paths)} target path(s) against manifest {manifest_path.name}: "
+                    f"{len(source_hashes)} entries, {'+'.join(alg.upper() for alg in algorithms)}"
+                    + (f" tree digest ({chunk_size // (1024 * 1024)}MB chunks, "
+                       f"{len(chunk_manifests)} chunk manifests)" if tree_mode else "")
+                    + (f", {manifest.skipped_rows} rows without hashes skipped" if manifest.skipped_rows else "")
+                    + (f", {filtered} entries excluded by file filters" if filtered else ""))
+
+        # Hash the target with the manifest's algorithms
+        saved = self.algorithms, self.tree_hash, self.tree_chunk_size
+        self.algorithms, self.algorithm, self.tree_hash = algorithms, algorithms[0], tree_mode
+        self.tree_chunk_size = chunk_size
+        try:
+            target_result = self.hash_files(target_paths)
+        finally:
+            self.algorithms, self.tree_hash, self.tree_chunk_size = saved
+            self.algorithm = self.algorithms[0]
+
+        if not target_result.success:
+            return Result.error(target_result.error)
+
+        verification_results = self._compare_hashes(
+            source_hashes, target_result.value,
+            lambda file_path, entry: self._manifest_source_result(file_path, entry,
+                                                                  chunk_manifests.get(file_path))
+        )
+        return Result.success(
+            verification_results,
+            manifest_path=str(manifest_path),
+            manifest_entries=len(source_hashes),
+            target_metrics=target_result.metadata.get('metrics') if target_result.metadata else None,
+            execution_mode='manifest'
+        )
+
+    def _filter_manifest_entries(self, entries: Dict[str, ManifestEntry]) -> Dict[str, ManifestEntry]:
+        """
+        Apply the include/exclude patterns to manifest entries the way discovery does
+
+        Entries are made relative to the manifest's common root (the selected
+        folder when the report was written), an entry is dropped when any of its
+        parent folders matches an exclude pattern (discovery does not descend
+        into those), and the remaining file is checked with is_selected() on its
+        '/'-separated relative path.
+        """
+        discovery = self._create_discovery()
+        selected = {}
+        for file_path, relative in self._relative_keys(entries, self._common_root_key(entries)):
+            parts = relative.replace(os.sep, '/').split('/')
+            if any(discovery.is_folder_excluded(parts[depth - 1], '/'.join(parts[:depth]))
+                   for depth in range(1, len(parts))):
+                continue
+            if discovery.is_selected(parts[-1], '/'.join(parts)):
+                selected[file_path] = entries[file_path]
+        return selected
+
+    @staticmethod
+    def _manifest_source_result(file_path: str, entry: ManifestEntry,
+                                tree_manifest: Optional[ChunkManifest] = None) -> HashResult:
+        """Source-side HashResult for a manifest entry, built only for the verification result"""
+        path = Path(file_path)
+        algorithm, hash_value = next(iter(entry.hashes.items()))
+        return HashResult(
+            file_path=path,
+            relative_path=path,
+            algorithm=algorithm,
+            hash_value=hash_value,
+            file_size=entry.file_size,
+            duration=0.0,
+            hashes=entry.hashes,
+            tree_manifest=tree_manifest
+        )
+
+    @staticmethod
+    def _path_key(path: str) -> str:
+        """Path string with a single separator style (hash result keys are str(Path))"""
+        return path.replace(os.altsep, os.sep) if os.altsep else path
+
     def _find_common_root(self, paths: List[str]) -> Path:
         """
         Find the deepest common directory among a list of file paths
@@ -1046,6 +1736,11 @@ class UnifiedHashCalculator:
         - Input: ["C:/Test 1/Folder/File1.txt", "C:/Test 1/Folder/File2.txt"]
         - Output: Path("C:/Test 1/Folder")
 
+        Works on plain strings: one pass that shortens the candidate root with
+        os.path.dirname whenever a path is not below it. No Path objects are built
+        per entry, so millions of results are matched in seconds. If nothing is
+        shared (e.g. different drives) the first path's filesystem root is returned.
+
         Args:
             paths: List of file path strings
 
@@ -1054,28 +1749,47 @@ class UnifiedHashCalculator:
         """
         if not paths:
             return Path(".")
+        return Path(self._common_root_key(paths) or ".")
 
-        path_objs = [Path(p).parent for p in paths]
-
-        # Start with first path's parent directory
-        common = path_objs[0]
-
-        # Find common ancestor by checking if all paths are relative to it
-        while common != common.parent:  # Not at filesystem root
-            try:
-                if all(p.is_relative_to(common) for p in path_objs):
-                    return common
-            except (ValueError, AttributeError):
-                # is_relative_to not available or paths don't match
-                pass
-            common = common.parent
+    def _common_root_key(self, paths: Iterable[str]) -> str:
+        """Common parent directory of file paths as a string ('' = relative paths)"""
+        common = None
+        prefix = ""
+        for path in paths:
+            parent = os.path.normcase(os.path.dirname(self._path_key(path)))
+            if common is None:
+                common = parent
+                prefix = common if common.endswith(os.sep) else common + os.sep
+                continue
+            while common and parent != common and not parent.startswith(prefix):
+                shorter = os.path.dirname(common)
+                if shorter == common:
+                    return common  # Filesystem root - nothing more to share
+                common = shorter
+                prefix = common if common.endswith(os.sep) else common + os.sep
+        return common or ""
+
+    def _relative_keys(self, paths: Iterable[str], root: str) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (path, relative key) pairs for paths below a common root
 
-        return common
+        Paths outside the root (only possible across drives) fall back to the
+        file name, matching the previous Path.relative_to() behaviour.
+        """
+        prefix = root if not root or root.endswith(os.sep) else root + os.sep
+        prefix_length = len(prefix)
+        for path in paths:
+            key = self._path_key(path)
+            if os.path.normcase(key[:prefix_length]) == prefix and len(key) > prefix_length:
+                yield path, sys.intern(key[prefix_length:])
+            else:
+                yield path, os.path.basename(key)
 
     def _compare_hashes(
         self,
         source_hashes: Dict[str, HashResult],
-        target_hashes: Dict[str, HashResult]
+        target_hashes: Dict[str, HashResult],
+        source_result_factory: Optional[Callable[[str, ManifestEntry], HashResult]] = None
     ) -> Dict[str, VerificationResult]:
         """
         Compare source and target hash results by relative path structure
@@ -1085,9 +1799,15 @@ class UnifiedHashCalculator:
         This ensures files with duplicate names are matched correctly by structure.
         Also detects files that exist in target but not in source.
 
+        Relative keys are plain (interned) strings computed once per entry, so the
+        join is a single dict lookup per source file.
+
         Args:
             source_hashes: Dict mapping source file paths to HashResult objects
+                (or to ManifestEntry objects when source_result_factory is given)
             target_hashes: Dict mapping target file paths to HashResult objects
+            source_result_factory: Builds the source HashResult from a path and
+                ManifestEntry (manifest verification)
 
         Returns:
             Dict mapping file paths to VerificationResult objects
@@ -1095,45 +1815,61 @@ class UnifiedHashCalculator:
         verification_results = {}
 
         # Find common roots for relative path calculation
-        source_root = self._find_common_root(list(source_hashes.keys()))
-        target_root = self._find_common_root(list(target_hashes.keys()))
+        source_root = self._common_root_key(source_hashes)
+        target_root = self._common_root_key(target_hashes)
 
-        logger.debug(f"Source common root: {source_root}")
-        logger.debug(f"Target common root: {target_root}")
+        logger.debug(f"Source common root: {source_root or '.'}")
+        logger.debug(f"Target common root: {target_root or '.'}")
 
         # Build target lookup by relative path (not just filename)
         target_by_relpath = {}
-        for target_path, target_hr in target_hashes.items():
-            try:
-                rel_path = Path(target_path).relative_to(target_root)
-                target_by_relpath[str(rel_path)] = (target_path, target_hr)
-            except ValueError:
-                # Path not relative to common root - use as-is
-                target_by_relpath[Path(target_path).name] = (target_path, target_hr)
+        for target_path, rel_path in self._relative_keys(target_hashes, target_root):
+            target_by_relpath[rel_path] = (target_path, target_hashes[target_path])
 
         matched_relpaths = set()
 
         # First pass: Match source files by relative path
-        for source_path, source_hash_result in source_hashes.items():
-            try:
-                source_rel = str(Path(source_path).relative_to(source_root))
-            except ValueError:
-                # Path not relative to common root - use filename
-                source_rel = Path(source_path).name
+        for source_path, source_rel in self._relative_keys(source_hashes, source_root):
+            source_hash_result = source_hashes[source_path]
+            if source_result_factory:
+                source_hash_result = source_result_factory(source_path, source_hash_result)
 
             if source_rel in target_by_relpath:
                 # Found matching file with same relative path
                 target_path, target_hash_result = target_by_relpath[source_rel]
                 matched_relpaths.add(source_rel)
 
-                # Compare hashes
-                match = source_hash_result.hash_value == target_hash_result.hash_value
+                # Compare hashes on every algorithm both sides share
+                match, shared_algorithms = compare_digests(source_hash_result.hashes,
+                                                           target_hash_result.hashes)
+                if match:
+                    notes = ""
+                elif not shared_algorithms:
+                    notes = (f"No common hash algorithm: {', '.join(source_hash_result.hashes) or 'none'} "
+                             f"vs {', '.join(target_hash_result.hashes) or 'none'}")
+                else:
+                    algorithm = next(alg for alg in shared_algorithms
+                                     if source_hash_result.hashes[alg].lower() != target_hash_result.hashes[alg].lower())
+                    notes = (f"Hash mismatch ({algorithm.upper()}): {source_hash_result.hashes[algorithm][:8]}... "
+                             f"!= {target_hash_result.hashes[algorithm][:8]}...")
+
+                # Tree mode: narrow the mismatch down to byte ranges
+                differing_ranges = []
+                if not match and source_hash_result.tree_manifest and target_hash_result.tree_manifest:
+                    try:
+                        differing_ranges = source_hash_result.tree_manifest.differing_ranges(
+                            target_hash_result.tree_manifest)
+                        notes = f"{notes} - {self._describe_ranges(differing_ranges)}"
+                    except ValueError as e:
+                        logger.warning(f"Cannot compare chunk manifests for {source_path}: {e}")
+
                 verification_results[source_path] = VerificationResult(
                     source_result=source_hash_result,
                     target_result=target_hash_result,
                     match=match,
                     comparison_type='exact_match' if match else 'hash_mismatch',
-                    notes="" if match else f"Hash mismatch: {source_hash_result.hash_value[:8]}... != {target_hash_result.hash_value[:8]}..."
+                    notes=notes,
+                    differing_ranges=differing_ranges
                 )
             else:
                 # Missing from target
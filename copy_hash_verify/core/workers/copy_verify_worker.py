@@ -7,16 +7,15 @@ BufferedFileOperations for optimal performance.
 """
 
 from pathlib import Path
-from typing import List, Dict
-from threading import Lock
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List
 
 from PySide6.QtCore import QThread, Signal
 
 from core.buffered_file_ops import BufferedFileOperations
-from core.result_types import Result, FileOperationResult
+from core.copy_journal import CopyJournal
+from core.result_types import Result
 from core.logger import logger
-from copy_hash_verify.core.storage_detector import StorageDetector
+from copy_hash_verify.core.storage_detector import StorageDetector, DriveType
 from copy_hash_verify.utils.thread_calculator import ThreadCalculator
 
 
@@ -63,13 +62,6 @@ class CopyVerifyWorker(QThread):
                 f"CopyVerifyWorker starting: {len(self.source_paths)} items to {self.destination}"
             )
 
-            # Create file operations handler with callbacks
-            self.file_ops = BufferedFileOperations(
-                progress_callback=self._on_progress,
-                cancelled_check=self._check_cancelled,
-                pause_check=self._check_paused
-            )
-
             # Discover all files to copy with structure information
             # Build list of (type, path, relative_path) tuples for structure preservation
             all_items = []
@@ -183,19 +175,46 @@ class CopyVerifyWorker(QThread):
                 operation_type="copy"
             )
 
-            # Execute copy with selected strategy
-            if threads > 1 and len(all_items) > 1:
-                # Parallel copying for SSD/NVMe with multiple files
-                logger.info(f"Using parallel copy strategy with {threads} threads")
-                result = self._copy_files_parallel(all_items, threads)
-            else:
-                # Sequential copying (HDD, single file, or fallback)
-                logger.info("Using sequential copy strategy")
+            # Create file operations handler with callbacks and the detected thread count.
+            # BufferedFileOperations runs a bounded worker pool when threads > 1
+            # (SSD/NVMe with multiple files) and copies sequentially otherwise.
+            # Sequential copies hand destination re-hashes to a background verifier
+            # when the destination is solid state (re-reads don't cost seeks there)
+            deferred_verification = dest_info.drive_type in (
+                DriveType.SSD, DriveType.NVME, DriveType.EXTERNAL_SSD
+            )
+
+            # Checkpoint journal: re-running an interrupted copy skips files that were
+            # already verified and resumes very large files from their last checkpoint
+            journal = None
+            try:
+                journal = CopyJournal.for_destination(self.destination)
+            except OSError as e:
+                logger.warning(f"Copy journal unavailable, copying without checkpoints: {e}")
+
+            self.file_ops = BufferedFileOperations(
+                progress_callback=self._on_progress,
+                cancelled_check=self._check_cancelled,
+                pause_check=self._check_paused,
+                max_workers_override=threads,
+                deferred_verification=deferred_verification,
+                journal=journal
+            )
+
+            logger.info(f"Using {'parallel' if threads > 1 else 'sequential'} copy strategy "
+                        f"with {threads} thread(s)")
+            try:
                 result = self.file_ops._copy_files_internal(
                     all_items,
                     self.destination,
                     calculate_hash=True
                 )
+            finally:
+                if journal:
+                    journal.close()
+
+            if journal and result.success and not self._is_cancelled:
+                journal.discard()
 
             # Convert FileOperationResult to Result for unified interface
             if result.success:
@@ -220,189 +239,6 @@ class CopyVerifyWorker(QThread):
             )
             self.result_ready.emit(Result.error(error))
 
-    def _copy_files_parallel(self, all_items: List, threads: int) -> FileOperationResult:
-        """
-        Copy files in parallel using ThreadPoolExecutor.
-
-        Args:
-            all_items: List of (type, source_path, relative_path) tuples
-            threads: Number of parallel worker threads
-
-        Returns:
-            FileOperationResult with aggregated results
-        """
-        import time
-
-        start_time = time.time()
-        total_files = len(all_items)
-        total_bytes = sum(item[1].stat().st_size for item in all_items if item[1].exists())
-
-        # Thread-safe progress tracking
-        completed_files = 0
-        completed_bytes = 0
-        progress_lock = Lock()
-        results_dict = {}
-
-        def update_progress(bytes_delta: int, file_completed: bool):
-            """Thread-safe progress update"""
-            nonlocal completed_files, completed_bytes
-
-            with progress_lock:
-                completed_bytes += bytes_delta
-                if file_completed:
-                    completed_files += 1
-
-                # Calculate progress percentage
-                if total_bytes > 0:
-                    percentage = int((completed_bytes / total_bytes) * 100)
-                else:
-                    percentage = int((completed_files / total_files) * 100)
-
-                # Emit progress update
-                self._on_progress(
-                    percentage,
-                    f"Copied {completed_files}/{total_files} files"
-                )
-
-        # Execute parallel copying
-        with ThreadPoolExecutor(max_workers=threads) as executor:
-            # Submit all copy tasks
-            futures = {}
-            for item_type, source_path, relative_path in all_items:
-                if self._is_cancelled:
-                    break
-
-                future = executor.submit(
-                    self._copy_single_file,
-                    source_path,
-                    relative_path,
-                    update_progress
-                )
-                futures[future] = (source_path, relative_path)
-
-            # Process completed tasks
-            for future in as_completed(futures):
-                if self._is_cancelled:
-                    logger.info("Parallel copy cancelled by user")
-                    break
-
-                source_path, relative_path = futures[future]
-
-                try:
-                    result = future.result()
-                    key = str(relative_path) if relative_path else source_path.name
-                    results_dict[key] = result
-
-                except Exception as e:
-                    logger.error(f"Failed to copy {source_path.name}: {e}")
-                    key = str(relative_path) if relative_path else source_path.name
-                    results_dict[key] = {'error': str(e), 'success': False}
-
-        # Calculate final metrics
-        duration = time.time() - start_time
-        speed_mbps = (completed_bytes / (1024 * 1024)) / duration if duration > 0 else 0
-
-        logger.info(
-            f"Parallel copy completed: {completed_files}/{total_files} files, "
-            f"{completed_bytes / (1024*1024):.1f} MB in {duration:.1f}s ({speed_mbps:.1f} MB/s)"
-        )
-
-        # Create FileOperationResult using factory method
-        from core.exceptions import FileOperationError
-
-        success = completed_files == total_files and not self._is_cancelled
-
-        if success:
-            # Add performance stats to results_dict (matches BufferedFileOperations pattern)
-            results_dict['_performance_stats'] = {
-                'total_time': duration,
-                'average_speed_mbps': speed_mbps,
-                'start_time': start_time,
-                'end_time': time.time()
-            }
-
-            # Success path - use factory method
-            return FileOperationResult.create(
-                results_dict,
-                files_processed=completed_files,
-                bytes_processed=completed_bytes
-            )
-        else:
-            # Error path - create appropriate error
-            if self._is_cancelled:
-                error = FileOperationError(
-                    "Copy operation cancelled by user",
-                    user_message="Operation was cancelled."
-                )
-            else:
-                error = FileOperationError(
-                    f"Some files failed to copy: {completed_files}/{total_files} succeeded",
-                    user_message=f"Only {completed_files} of {total_files} files were copied successfully."
-                )
-            return FileOperationResult.error(error)
-
-    def _copy_single_file(self, source_path: Path, relative_path, progress_callback) -> Dict:
-        """
-        Copy a single file (runs in worker thread).
-
-        Args:
-            source_path: Source file path
-            relative_path: Relative path for destination (or None for flat copy)
-            progress_callback: Callback to update progress (bytes_delta, file_completed)
-
-        Returns:
-            Dictionary with copy results
-        """
-        try:
-            # Calculate destination path
-            if relative_path:
-                dest_path = self.destination / relative_path
-            else:
-                dest_path = self.destination / source_path.name
-
-            # Create parent directory if needed
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Get file size for progress tracking
-            file_size = source_path.stat().st_size
-
-            # Create BufferedFileOperations for this thread
-            file_ops = BufferedFileOperations(
-                progress_callback=None,  # No per-file progress in parallel mode
-                cancelled_check=self._check_cancelled,
-                pause_check=None  # Pause not supported in parallel mode
-            )
-
-            # Copy file with hash verification
-            copy_result = file_ops.copy_file_buffered(
-                source_path,
-                dest_path,
-                calculate_hash=True
-            )
-
-            # Update progress
-            progress_callback(file_size, True)
-
-            if copy_result.success:
-                return copy_result.value
-            else:
-                logger.error(f"Copy failed for {source_path.name}: {copy_result.error}")
-                return {
-                    'error': str(copy_result.error),
-                    'success': False,
-                    'source_path': str(source_path),
-                    'dest_path': str(dest_path)
-                }
-
-        except Exception as e:
-            logger.error(f"Exception copying {source_path}: {e}", exc_info=True)
-            progress_callback(0, True)  # Mark file as attempted
-            return {
-                'error': str(e),
-                'success': False,
-                'source_path': str(source_path)
-            }
-
     def _on_progress(self, percentage: int, message: str):
         """
         Progress callback from file operations
@@ -7,11 +7,12 @@ Emits progress updates and final Result object via Qt signals.
 """
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Union, Optional
 
 from PySide6.QtCore import QThread, Signal
 
 from ..unified_hash_calculator import UnifiedHashCalculator, HashResult
+from ..hash_cache import get_hash_cache
 from core.result_types import Result
 from core.logger import logger
 
@@ -29,17 +30,26 @@ class HashWorker(QThread):
     result_ready = Signal(Result)
     progress_update = Signal(int, str)
 
-    def __init__(self, paths: List[Path], algorithm: str = 'sha256',
+    def __init__(self, paths: List[Path], algorithm: Union[str, List[str]] = 'sha256',
                  enable_parallel: bool = True, max_workers_override: int = None,
-                 parent=None):
+                 use_hash_cache: bool = False, force_reread: bool = False,
+                 include_patterns: Optional[List[str]] = None,
+                 exclude_patterns: Optional[List[str]] = None,
+                 tree_hash: bool = False, parent=None):
         """
         Initialize hash worker
 
         Args:
             paths: List of file/folder paths to hash
-            algorithm: Hash algorithm ('sha256', 'sha1', 'md5')
+            algorithm: Hash algorithm ('sha256', 'sha1', 'md5') or list of algorithms
+                calculated in one read of each file
             enable_parallel: Enable parallel processing when beneficial (default: True)
             max_workers_override: Override thread count (None = auto-detect)
+            use_hash_cache: Serve unchanged files from the persistent hash cache
+            force_reread: Re-read every file even if cached (cache is still refreshed)
+            include_patterns: Only hash files matching these globs (None = all files)
+            exclude_patterns: Skip files and folders matching these globs
+            tree_hash: Hash files as parallel chunks (tree root digest + chunk manifest)
             parent: Parent QObject
         """
         super().__init__(parent)
@@ -48,6 +58,11 @@ class HashWorker(QThread):
         self.algorithm = algorithm
         self.enable_parallel = enable_parallel
         self.max_workers_override = max_workers_override
+        self.use_hash_cache = use_hash_cache
+        self.force_reread = force_reread
+        self.include_patterns = include_patterns
+        self.exclude_patterns = exclude_patterns
+        self.tree_hash = tree_hash
         self.calculator = None
         self._is_cancelled = False
 
@@ -63,7 +78,12 @@ class HashWorker(QThread):
                 progress_callback=self._on_progress,
                 cancelled_check=self._check_cancelled,
                 enable_parallel=self.enable_parallel,
-                max_workers_override=self.max_workers_override
+                max_workers_override=self.max_workers_override,
+                hash_cache=get_hash_cache() if self.use_hash_cache else None,
+                force_reread=self.force_reread,
+                include_patterns=self.include_patterns,
+                exclude_patterns=self.exclude_patterns,
+                tree_hash=self.tree_hash
             )
 
             # Calculate hashes (automatically uses parallel processing when beneficial)
@@ -76,7 +96,9 @@ class HashWorker(QThread):
                 files_hashed = len(result.value)
                 duration = self.calculator.metrics.duration
                 speed = self.calculator.metrics.average_speed_mbps
-                logger.info(f"HashWorker completed: {files_hashed} files hashed in {duration:.1f}s ({speed:.1f} MB/s)")
+                cache_hits = self.calculator.metrics.cache_hits
+                logger.info(f"HashWorker completed: {files_hashed} files hashed in {duration:.1f}s ({speed:.1f} MB/s, "
+                           f"{cache_hits} from cache)")
             else:
                 logger.warning(f"HashWorker completed with error: {result.error}")
 
@@ -89,6 +111,13 @@ class HashWorker(QThread):
                 user_message="An unexpected error occurred during hash calculation."
             )
             self.result_ready.emit(Result.error(error))
+        finally:
+            # Cache hits only record last_used in memory - write them before the run ends
+            if self.calculator and self.calculator.hash_cache:
+                try:
+                    self.calculator.hash_cache.flush()
+                except Exception as e:
+                    logger.warning(f"Could not update hash cache usage: {e}")
 
     def _on_progress(self, percentage: int, message: str):
         """
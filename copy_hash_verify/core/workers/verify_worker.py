@@ -6,11 +6,12 @@ Performs bidirectional hash verification between source and target files.
 """
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Union, Optional
 
 from PySide6.QtCore import QThread, Signal
 
 from ..unified_hash_calculator import UnifiedHashCalculator, VerificationResult
+from ..hash_cache import get_hash_cache
 from core.result_types import Result
 from core.logger import logger
 
@@ -29,14 +30,28 @@ class VerifyWorker(QThread):
     progress_update = Signal(int, str)
 
     def __init__(self, source_paths: List[Path], target_paths: List[Path],
-                 algorithm: str = 'sha256', parent=None):
+                 algorithm: Union[str, List[str]] = 'sha256', use_hash_cache: bool = False,
+                 force_reread: bool = False, include_patterns: Optional[List[str]] = None,
+                 exclude_patterns: Optional[List[str]] = None, tree_hash: bool = False,
+                 source_manifest: Optional[Path] = None, size_triage: bool = False,
+                 hash_size_mismatches: bool = True, parent=None):
         """
         Initialize verify worker
 
         Args:
             source_paths: List of source file/folder paths
             target_paths: List of target file/folder paths
-            algorithm: Hash algorithm ('sha256', 'sha1', 'md5')
+            algorithm: Hash algorithm ('sha256', 'sha1', 'md5') or list of algorithms
+                calculated in one read; files match on every algorithm both sides share
+            use_hash_cache: Serve unchanged files from the persistent hash cache
+            force_reread: Re-read every file even if cached (cache is still refreshed)
+            include_patterns: Only verify files matching these globs (None = all files)
+            exclude_patterns: Skip files and folders matching these globs
+            tree_hash: Compare chunked tree digests so mismatches report byte ranges
+            source_manifest: Stored hash report used as the source side instead of
+                re-hashing source_paths (only the target is read)
+            size_triage: Report missing files from a stat-only pass before hashing
+            hash_size_mismatches: Still hash pairs whose sizes differ (with size_triage)
             parent: Parent QObject
         """
         super().__init__(parent)
@@ -44,6 +59,14 @@ class VerifyWorker(QThread):
         self.source_paths = source_paths
         self.target_paths = target_paths
         self.algorithm = algorithm
+        self.use_hash_cache = use_hash_cache
+        self.force_reread = force_reread
+        self.include_patterns = include_patterns
+        self.exclude_patterns = exclude_patterns
+        self.tree_hash = tree_hash
+        self.source_manifest = Path(source_manifest) if source_manifest else None
+        self.size_triage = size_triage
+        self.hash_size_mismatches = hash_size_mismatches
         self.calculator = None
         self._is_cancelled = False
 
@@ -59,11 +82,21 @@ class VerifyWorker(QThread):
             self.calculator = UnifiedHashCalculator(
                 algorithm=self.algorithm,
                 progress_callback=self._on_progress,
-                cancelled_check=self._check_cancelled
+                cancelled_check=self._check_cancelled,
+                hash_cache=get_hash_cache() if self.use_hash_cache else None,
+                force_reread=self.force_reread,
+                include_patterns=self.include_patterns,
+                exclude_patterns=self.exclude_patterns,
+                tree_hash=self.tree_hash,
+                size_triage=self.size_triage,
+                hash_size_mismatches=self.hash_size_mismatches
             )
 
-            # Verify hashes
-            result = self.calculator.verify_hashes(self.source_paths, self.target_paths)
+            # Verify hashes (against the stored manifest when one is given)
+            if self.source_manifest:
+                result = self.calculator.verify_against_hash_manifest(self.source_manifest, self.target_paths)
+            else:
+                result = self.calculator.verify_hashes(self.source_paths, self.target_paths)
 
             # Emit result
             self.result_ready.emit(result)
@@ -85,6 +118,13 @@ class VerifyWorker(QThread):
                 user_message="An unexpected error occurred during hash verification."
             )
             self.result_ready.emit(Result.error(error))
+        finally:
+            # Cache hits only record last_used in memory - write them before the run ends
+            if self.calculator and self.calculator.hash_cache:
+                try:
+                    self.calculator.hash_cache.flush()
+                except Exception as e:
+                    logger.warning(f"Could not update hash cache usage: {e}")
 
     def _on_progress(self, percentage: int, message: str):
         """
@@ -8,15 +8,17 @@ Provides consistent splitter-based layout following media_analysis patterns:
 - Shared logger console at bottom
 - Progress indicators
 - Statistics display
+- File filter (include/exclude glob) fields
 """
 
-from typing import Optional, Tuple
+import re
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QGroupBox,
-    QLabel, QProgressBar, QGridLayout, QPushButton, QSizePolicy
+    QLabel, QProgressBar, QGridLayout, QPushButton, QSizePolicy, QLineEdit
 )
 from PySide6.QtGui import QFont
 
@@ -32,6 +34,7 @@ class BaseOperationTab(QWidget):
     - Shared logger instance
     - Progress bar component
     - Statistics display component
+    - File filter component
     - Consistent styling
     """
 
@@ -66,6 +69,8 @@ class BaseOperationTab(QWidget):
         self.progress_bar = None
         self.progress_label = None
         self.stats_group = None
+        self.include_patterns_edit = None
+        self.exclude_patterns_edit = None
 
     def create_base_layout(self) -> Tuple[QWidget, QWidget]:
         """
@@ -119,6 +124,51 @@ class BaseOperationTab(QWidget):
         self.progress_label.setObjectName("mutedText")
         parent_layout.addWidget(self.progress_label)
 
+    def create_file_filter_section(self) -> QGroupBox:
+        """
+        Create include/exclude glob pattern fields
+
+        Returns:
+            QGroupBox containing the pattern fields
+        """
+        group = QGroupBox("File Filters")
+        layout = QGridLayout(group)
+
+        layout.addWidget(QLabel("Include:"), 0, 0)
+        self.include_patterns_edit = QLineEdit()
+        self.include_patterns_edit.setPlaceholderText("*.mp4; *.mov  (empty = all files)")
+        self.include_patterns_edit.setToolTip(
+            "Only process files whose name matches one of these patterns.\n"
+            "Separate patterns with ';' or ','. Wildcards: * ? [abc]"
+        )
+        layout.addWidget(self.include_patterns_edit, 0, 1)
+
+        layout.addWidget(QLabel("Exclude:"), 1, 0)
+        self.exclude_patterns_edit = QLineEdit()
+        self.exclude_patterns_edit.setPlaceholderText("*.tmp; Thumbs.db")
+        self.exclude_patterns_edit.setToolTip(
+            "Skip files whose name matches any of these patterns.\n"
+            "Separate patterns with ';' or ','. Wildcards: * ? [abc]"
+        )
+        layout.addWidget(self.exclude_patterns_edit, 1, 1)
+
+        return group
+
+    @staticmethod
+    def parse_patterns(text: str) -> List[str]:
+        """Split a ';' or ',' separated pattern field into glob patterns"""
+        return [pattern.strip() for pattern in re.split(r'[;,]', text or "") if pattern.strip()]
+
+    def get_file_filter_patterns(self) -> Tuple[List[str], List[str]]:
+        """
+        Get the patterns entered in the file filter section
+
+        Returns:
+            Tuple of (include_patterns, exclude_patterns)
+        """
+        return (self.parse_patterns(self.include_patterns_edit.text()),
+                self.parse_patterns(self.exclude_patterns_edit.text()))
+
     def create_stats_section(self) -> QGroupBox:
         """
         Create statistics display section (hidden by default)
@@ -7,6 +7,7 @@ Features:
 - Full viewport scrollable settings panel
 - Multiple algorithm support
 - CSV report generation
+- Tree hash mode for very large images (chunk manifests saved with the report)
 - Performance tuning options
 - Large statistics display
 """
@@ -26,6 +27,7 @@ from ..components.base_operation_tab import BaseOperationTab
 from ..components.operation_log_console import OperationLogConsole
 from ...controllers.hash_calculation_controller import HashCalculationController, HashCalculationSettings
 from ...services.success_message_builder import SuccessMessageBuilder
+from ...core.tree_hash import tree_algorithm_name, chunk_manifest_path, save_chunk_manifests
 from core.result_types import Result
 from core.logger import logger
 from core.hash_reports import HashReportGenerator
@@ -153,11 +155,25 @@ class CalculateHashesTab(BaseOperationTab):
         self.algo_button_group.addButton(self.md5_radio, 2)
         algo_layout.addWidget(self.md5_radio)
 
+        # Additional algorithms calculated from the same read of each file
+        algo_layout.addWidget(QLabel("Also calculate (same read, one report column each):"))
+        extra_algo_layout = QHBoxLayout()
+        self.extra_algo_checks = {}
+        for algorithm, label in (('sha256', "SHA-256"), ('sha1', "SHA-1"), ('md5', "MD5")):
+            check = QCheckBox(label)
+            self.extra_algo_checks[algorithm] = check
+            extra_algo_layout.addWidget(check)
+        extra_algo_layout.addStretch()
+        algo_layout.addLayout(extra_algo_layout)
+
         # Connect algorithm change signal
         self.algo_button_group.buttonClicked.connect(self._on_algorithm_changed)
 
         settings_layout.addWidget(algo_group)
 
+        # Include/exclude globs
+        settings_layout.addWidget(self.create_file_filter_section())
+
         # Output options
         output_group = QGroupBox("Output Options")
         output_layout = QVBoxLayout(output_group)
@@ -214,6 +230,37 @@ class CalculateHashesTab(BaseOperationTab):
         workers_layout.addStretch()
         perf_layout.addLayout(workers_layout)
 
+        # Persistent hash cache
+        self.use_hash_cache_check = QCheckBox("Use persistent hash cache (skip unchanged files)")
+        self.use_hash_cache_check.setChecked(False)
+        self.use_hash_cache_check.setToolTip(
+            "Files whose size, modification and change times are unchanged since they were\n"
+            "last hashed are resolved from the on-disk cache without being read."
+        )
+        self.use_hash_cache_check.stateChanged.connect(self._on_hash_cache_toggled)
+        perf_layout.addWidget(self.use_hash_cache_check)
+
+        self.force_reread_check = QCheckBox("Force re-read (ignore cached hashes)")
+        self.force_reread_check.setChecked(False)
+        self.force_reread_check.setEnabled(False)
+        self.force_reread_check.setToolTip(
+            "Read every file in full even when a cached hash exists.\n"
+            "Use when forensic policy requires a fresh read; the cache is refreshed."
+        )
+        perf_layout.addWidget(self.force_reread_check)
+
+        # Tree digest mode (intra-file parallel hashing)
+        self.tree_hash_check = QCheckBox("Tree hash mode for very large images (parallel chunks)")
+        self.tree_hash_check.setChecked(False)
+        self.tree_hash_check.setToolTip(
+            "Hash each file as 64MB chunks on all cores. The report holds the tree root digest\n"
+            "(e.g. SHA256-TREE), which is NOT the whole-file hash used in court reports.\n"
+            "Chunk digests are saved next to the report (<report>.chunks.json) so a later\n"
+            "verification can show which byte ranges differ. Primary algorithm only."
+        )
+        self.tree_hash_check.stateChanged.connect(self._on_tree_hash_toggled)
+        perf_layout.addWidget(self.tree_hash_check)
+
         # Storage detection info (display only)
         self.storage_info_label = QLabel("Storage: Not detected yet")
         self.storage_info_label.setObjectName("mutedText")
@@ -280,6 +327,11 @@ class CalculateHashesTab(BaseOperationTab):
         else:
             self.md5_radio.setChecked(True)
 
+        additional = settings.value("additional_algorithms", "")
+        for algorithm, check in self.extra_algo_checks.items():
+            check.setChecked(algorithm in str(additional).split(','))
+        self._update_extra_algorithm_checks()
+
         # Load options
         self.generate_csv_check.setChecked(settings.value("generate_csv", True, type=bool))
         self.include_metadata_check.setChecked(settings.value("include_metadata", True, type=bool))
@@ -289,6 +341,19 @@ class CalculateHashesTab(BaseOperationTab):
         thread_override = settings.value("thread_override", 0, type=int)
         self.workers_spin.setValue(thread_override)
 
+        # Load hash cache settings
+        self.use_hash_cache_check.setChecked(settings.value("use_hash_cache", False, type=bool))
+        self.force_reread_check.setChecked(settings.value("force_reread", False, type=bool))
+        self.force_reread_check.setEnabled(self.use_hash_cache_check.isChecked())
+
+        # Load tree hash mode
+        self.tree_hash_check.setChecked(settings.value("tree_hash", False, type=bool))
+        self._update_extra_algorithm_checks()
+
+        # Load file filters
+        self.include_patterns_edit.setText(settings.value("include_patterns", ""))
+        self.exclude_patterns_edit.setText(settings.value("exclude_patterns", ""))
+
         settings.endGroup()
 
     def _save_settings(self):
@@ -303,6 +368,7 @@ class CalculateHashesTab(BaseOperationTab):
             settings.setValue("algorithm", "sha1")
         else:
             settings.setValue("algorithm", "md5")
+        settings.setValue("additional_algorithms", ','.join(self._get_selected_algorithms()[1:]))
 
         # Save options
         settings.setValue("generate_csv", self.generate_csv_check.isChecked())
@@ -312,13 +378,46 @@ class CalculateHashesTab(BaseOperationTab):
         settings.setValue("enable_parallel", self.enable_parallel_check.isChecked())
         settings.setValue("thread_override", self.workers_spin.value())
 
+        # Save hash cache settings
+        settings.setValue("use_hash_cache", self.use_hash_cache_check.isChecked())
+        settings.setValue("force_reread", self.force_reread_check.isChecked())
+
+        # Save tree hash mode
+        settings.setValue("tree_hash", self.tree_hash_check.isChecked())
+
+        # Save file filters
+        settings.setValue("include_patterns", self.include_patterns_edit.text())
+        settings.setValue("exclude_patterns", self.exclude_patterns_edit.text())
+
         settings.endGroup()
 
     def _on_algorithm_changed(self, button):
         """Handle algorithm radio button change"""
         algorithm = self._get_selected_algorithm()
+        self._update_extra_algorithm_checks()
         self.info(f"Hash algorithm set to {algorithm.upper()}")
 
+    def _update_extra_algorithm_checks(self):
+        """Disable the additional-algorithm checkbox matching the primary algorithm (all in tree mode)"""
+        primary = self._get_selected_algorithm()
+        tree_hash = self.tree_hash_check.isChecked()
+        for algorithm, check in self.extra_algo_checks.items():
+            check.setEnabled(algorithm != primary and not tree_hash)
+
+    def _on_hash_cache_toggled(self, state):
+        """Handle hash cache toggle"""
+        enabled = state == Qt.Checked
+        self.force_reread_check.setEnabled(enabled)
+        if enabled:
+            self.info("Persistent hash cache enabled (unchanged files will not be re-read)")
+
+    def _on_tree_hash_toggled(self, state):
+        """Handle tree hash mode toggle"""
+        enabled = state == Qt.Checked
+        self._update_extra_algorithm_checks()
+        if enabled:
+            self.info("Tree hash mode enabled (root digest + chunk manifest, not the whole-file hash)")
+
     def _on_parallel_toggled(self, state):
         """Handle parallel processing toggle"""
         enabled = state == Qt.Checked
@@ -550,39 +649,65 @@ class CalculateHashesTab(BaseOperationTab):
         else:
             return 'md5'
 
+    def _get_selected_algorithms(self) -> List[str]:
+        """Get primary algorithm followed by checked additional algorithms"""
+        primary = self._get_selected_algorithm()
+        return [primary] + [
+            algorithm for algorithm, check in self.extra_algo_checks.items()
+            if check.isChecked() and algorithm != primary
+        ]
+
     def _start_calculation(self):
         """Start hash calculation in background thread"""
         if not self.selected_paths:
             self.error("No files selected")
             return
 
-        # Get algorithm
-        algorithm = self._get_selected_algorithm()
+        # Get algorithms (primary first; tree digests use the primary algorithm only)
+        tree_hash = self.tree_hash_check.isChecked()
+        algorithms = self._get_selected_algorithms()
+        if tree_hash:
+            algorithms = algorithms[:1]
+        algorithm = algorithms[0]
+        algorithms_label = (tree_algorithm_name(algorithm).upper() if tree_hash
+                            else '+'.join(alg.upper() for alg in algorithms))
 
         # Get parallel processing settings
         enable_parallel = self.enable_parallel_check.isChecked()
         thread_override = self.workers_spin.value() if self.workers_spin.value() > 0 else None
 
+        # Get file filters
+        include_patterns, exclude_patterns = self.get_file_filter_patterns()
+
         # Save settings
         self._save_settings()
 
         # Create settings object
         settings = HashCalculationSettings(
             algorithm=algorithm,
+            additional_algorithms=algorithms[1:],
             enable_parallel=enable_parallel,
             max_workers_override=thread_override,
             generate_csv=self.generate_csv_check.isChecked(),
-            include_metadata=self.include_metadata_check.isChecked()
+            include_metadata=self.include_metadata_check.isChecked(),
+            use_hash_cache=self.use_hash_cache_check.isChecked(),
+            force_reread=self.force_reread_check.isChecked(),
+            tree_hash=tree_hash,
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns
         )
 
         # Log configuration
         if enable_parallel:
             if thread_override:
-                self.info(f"Starting hash calculation with {algorithm.upper()} ({thread_override} threads)")
+                self.info(f"Starting hash calculation with {algorithms_label} ({thread_override} threads)")
             else:
-                self.info(f"Starting hash calculation with {algorithm.upper()} (auto-detect threads)")
+                self.info(f"Starting hash calculation with {algorithms_label} (auto-detect threads)")
         else:
-            self.info(f"Starting hash calculation with {algorithm.upper()} (sequential mode)")
+            self.info(f"Starting hash calculation with {algorithms_label} (sequential mode)")
+        if include_patterns or exclude_patterns:
+            self.info(f"File filters: include {', '.join(include_patterns) or 'all'}"
+                      f" | exclude {', '.join(exclude_patterns) or 'none'}")
 
         self.set_operation_active(True)
 
@@ -650,9 +775,11 @@ class CalculateHashesTab(BaseOperationTab):
             )
 
             self.success(f"Hash calculation complete: {hash_count} files processed")
+            if metrics and metrics.cache_hits:
+                self.info(f"{metrics.cache_hits} unchanged files served from hash cache")
 
-            # Offer to export CSV
-            if self.generate_csv_check.isChecked():
+            # Offer to export CSV (always in tree mode - the chunk manifests are saved with it)
+            if self.generate_csv_check.isChecked() or any(hr.tree_manifest for hr in result.value.values()):
                 self._export_csv()
 
         else:
@@ -671,8 +798,13 @@ class CalculateHashesTab(BaseOperationTab):
             self.error("No results to export")
             return
 
-        algorithm = self._get_selected_algorithm()
-        default_filename = f"hash_report_{algorithm}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        # Convert dict to list of HashResult objects
+        hash_results_list = list(self.last_results.values())
+
+        # Tree mode reports the root digest column and saves the chunk manifests alongside
+        tree_manifests = [hr.tree_manifest for hr in hash_results_list if hr.tree_manifest]
+        algorithms = [tree_manifests[0].label] if tree_manifests else self._get_selected_algorithms()
+        default_filename = f"hash_report_{'_'.join(algorithms)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
         filename, _ = QFileDialog.getSaveFileName(
             self,
@@ -683,9 +815,6 @@ class CalculateHashesTab(BaseOperationTab):
 
         if filename:
             try:
-                # Convert dict to list of HashResult objects
-                hash_results_list = list(self.last_results.values())
-
                 # Use professional report generator
                 report_gen = HashReportGenerator()
                 include_metadata = self.include_metadata_check.isChecked()
@@ -693,13 +822,17 @@ class CalculateHashesTab(BaseOperationTab):
                 success = report_gen.generate_single_hash_csv(
                     results=hash_results_list,
                     output_path=Path(filename),
-                    algorithm=algorithm,
+                    algorithm=algorithms,
                     include_metadata=include_metadata
                 )
 
                 if success:
                     self.success(f"CSV report exported: {Path(filename).name}")
                     self.info(f"Report location: {filename}")
+                    if tree_manifests:
+                        manifest_path = chunk_manifest_path(Path(filename))
+                        save_chunk_manifests(tree_manifests, manifest_path)
+                        self.info(f"Chunk manifests saved: {manifest_path.name}")
                 else:
                     self.error("Failed to generate CSV report")
 
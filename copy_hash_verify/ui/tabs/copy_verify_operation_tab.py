@@ -578,8 +578,8 @@ class CopyVerifyOperationTab(BaseOperationTab):
             perf_stats = hash_results.get('_performance_stats', {})
             total_files = perf_stats.get('files_copied', len(hash_results) - 1)  # -1 for _performance_stats key
             total_size = perf_stats.get('total_bytes', 0)
-            duration = perf_stats.get('total_time', 0)
-            avg_speed = perf_stats.get('avg_speed_mb_s', 0)
+            duration = perf_stats.get('total_time', perf_stats.get('total_time_seconds', 0))
+            avg_speed = perf_stats.get('avg_speed_mb_s', perf_stats.get('average_speed_mbps', 0))
             threads_used = perf_stats.get('threads_used', 1)
 
             # Update stats display
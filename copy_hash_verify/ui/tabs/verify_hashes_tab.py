@@ -7,6 +7,7 @@ Features:
 - Full viewport scrollable settings
 - Bidirectional verification
 - Mismatch detection and reporting
+- Verification against a stored hash report (source not re-read)
 - Large statistics display
 """
 
@@ -50,6 +51,7 @@ class VerifyHashesTab(BaseOperationTab):
         # State
         self.source_paths: List[Path] = []
         self.target_paths: List[Path] = []
+        self.source_manifest: Optional[Path] = None  # Stored hash report replacing the source
         self.current_worker = None
         self.last_results = None
 
@@ -128,6 +130,24 @@ class VerifyHashesTab(BaseOperationTab):
         button_layout.addStretch()
         layout.addLayout(button_layout)
 
+        # Stored hash report instead of source files
+        manifest_layout = QHBoxLayout()
+
+        self.source_manifest_btn = QPushButton("📋 Verify against hash report…")
+        self.source_manifest_btn.setToolTip(
+            "Use a previously saved hash report (CSV or JSON) as the source side.\n"
+            "Only the target is read, so the original evidence drive is not needed."
+        )
+        self.source_manifest_btn.clicked.connect(self._select_source_manifest)
+        manifest_layout.addWidget(self.source_manifest_btn)
+
+        self.source_manifest_label = QLabel("")
+        self.source_manifest_label.setObjectName("mutedText")
+        manifest_layout.addWidget(self.source_manifest_label)
+
+        manifest_layout.addStretch()
+        layout.addLayout(manifest_layout)
+
         # Tree
         self.source_tree = QTreeWidget()
         self.source_tree.setHeaderLabels(["Source Files"])
@@ -215,6 +235,9 @@ class VerifyHashesTab(BaseOperationTab):
 
         settings_layout.addWidget(algo_group)
 
+        # Include/exclude globs
+        settings_layout.addWidget(self.create_file_filter_section())
+
         # Verification options
         verify_group = QGroupBox("Verification Options")
         verify_layout = QVBoxLayout(verify_group)
@@ -232,6 +255,41 @@ class VerifyHashesTab(BaseOperationTab):
         self.show_matches_check.setChecked(True)
         verify_layout.addWidget(self.show_matches_check)
 
+        self.use_hash_cache_check = QCheckBox("Use persistent hash cache (skip unchanged files)")
+        self.use_hash_cache_check.setChecked(False)
+        self.use_hash_cache_check.setToolTip(
+            "Files whose size, modification and change times are unchanged since they were\n"
+            "last hashed are resolved from the on-disk cache without being read."
+        )
+        self.use_hash_cache_check.stateChanged.connect(self._on_hash_cache_toggled)
+        verify_layout.addWidget(self.use_hash_cache_check)
+
+        self.force_reread_check = QCheckBox("Force re-read (ignore cached hashes)")
+        self.force_reread_check.setChecked(False)
+        self.force_reread_check.setEnabled(False)
+        self.force_reread_check.setToolTip(
+            "Read every file in full even when a cached hash exists.\n"
+            "Use when forensic policy requires a fresh read; the cache is refreshed."
+        )
+        verify_layout.addWidget(self.force_reread_check)
+
+        self.skip_size_mismatch_check = QCheckBox("Quick triage (don't hash files whose sizes differ)")
+        self.skip_size_mismatch_check.setChecked(False)
+        self.skip_size_mismatch_check.setToolTip(
+            "Compare paths and sizes first. Missing files and size mismatches are\n"
+            "reported within seconds; only same-size pairs are hashed."
+        )
+        verify_layout.addWidget(self.skip_size_mismatch_check)
+
+        self.tree_hash_check = QCheckBox("Tree hash mode (report differing byte ranges)")
+        self.tree_hash_check.setChecked(False)
+        self.tree_hash_check.setToolTip(
+            "Hash both sides as 64MB chunks on all cores. A mismatch then lists the byte\n"
+            "ranges that differ instead of only the digest. Tree-mode hash reports are\n"
+            "always verified this way, using the chunk manifests saved with the report."
+        )
+        verify_layout.addWidget(self.tree_hash_check)
+
         settings_layout.addWidget(verify_group)
 
         # Report options
@@ -348,6 +406,15 @@ class VerifyHashesTab(BaseOperationTab):
         # Load options
         self.bidirectional_check.setChecked(settings.value("bidirectional", True, type=bool))
         self.generate_csv_check.setChecked(settings.value("generate_csv", True, type=bool))
+        self.use_hash_cache_check.setChecked(settings.value("use_hash_cache", False, type=bool))
+        self.force_reread_check.setChecked(settings.value("force_reread", False, type=bool))
+        self.force_reread_check.setEnabled(self.use_hash_cache_check.isChecked())
+        self.skip_size_mismatch_check.setChecked(settings.value("skip_size_mismatch", False, type=bool))
+        self.tree_hash_check.setChecked(settings.value("tree_hash", False, type=bool))
+
+        # Load file filters
+        self.include_patterns_edit.setText(settings.value("include_patterns", ""))
+        self.exclude_patterns_edit.setText(settings.value("exclude_patterns", ""))
 
         settings.endGroup()
 
@@ -367,6 +434,14 @@ class VerifyHashesTab(BaseOperationTab):
         # Save options
         settings.setValue("bidirectional", self.bidirectional_check.isChecked())
         settings.setValue("generate_csv", self.generate_csv_check.isChecked())
+        settings.setValue("use_hash_cache", self.use_hash_cache_check.isChecked())
+        settings.setValue("force_reread", self.force_reread_check.isChecked())
+        settings.setValue("skip_size_mismatch", self.skip_size_mismatch_check.isChecked())
+        settings.setValue("tree_hash", self.tree_hash_check.isChecked())
+
+        # Save file filters
+        settings.setValue("include_patterns", self.include_patterns_edit.text())
+        settings.setValue("exclude_patterns", self.exclude_patterns_edit.text())
 
         settings.endGroup()
 
@@ -375,6 +450,36 @@ class VerifyHashesTab(BaseOperationTab):
         algorithm = self._get_selected_algorithm()
         self.info(f"Verification algorithm set to {algorithm.upper()}")
 
+    def _on_hash_cache_toggled(self, state):
+        """Handle hash cache toggle"""
+        enabled = state == Qt.Checked
+        self.force_reread_check.setEnabled(enabled)
+        if enabled:
+            self.info("Persistent hash cache enabled (unchanged files will not be re-read)")
+
+    def _select_source_manifest(self):
+        """Select a stored hash report to verify the target against"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select Hash Report",
+            "",
+            "Hash Reports (*.csv *.json);;All Files (*.*)"
+        )
+
+        if file_path:
+            # The report replaces the source files
+            self.source_tree.clear()
+            self.source_paths.clear()
+            self._set_source_manifest(Path(file_path))
+            self._update_ui_state()
+            self.info(f"Source: hash report {Path(file_path).name} (source files will not be read)")
+
+    def _set_source_manifest(self, manifest: Optional[Path]):
+        """Set or clear the stored hash report used as the source side"""
+        self.source_manifest = manifest
+        self.source_manifest_label.setText(manifest.name if manifest else "")
+        self.source_manifest_label.setToolTip(str(manifest) if manifest else "")
+
     def _add_files(self, panel_type: str):
         """Add files to source or target"""
         file_paths, _ = QFileDialog.getOpenFileNames(
@@ -385,6 +490,8 @@ class VerifyHashesTab(BaseOperationTab):
         )
 
         if file_paths:
+            if panel_type == 'source':
+                self._set_source_manifest(None)
             target_list = self.source_paths if panel_type == 'source' else self.target_paths
             for file_path in file_paths:
                 path = Path(file_path)
@@ -403,6 +510,8 @@ class VerifyHashesTab(BaseOperationTab):
         )
 
         if folder_path:
+            if panel_type == 'source':
+                self._set_source_manifest(None)
             folder = Path(folder_path)
             target_list = self.source_paths if panel_type == 'source' else self.target_paths
 
@@ -425,6 +534,7 @@ class VerifyHashesTab(BaseOperationTab):
         if panel_type == 'source':
             self.source_tree.clear()
             self.source_paths.clear()
+            self._set_source_manifest(None)
         else:
             self.target_tree.clear()
             self.target_paths.clear()
@@ -504,12 +614,14 @@ class VerifyHashesTab(BaseOperationTab):
 
     def _update_ui_state(self):
         """Update UI state"""
-        has_source = len(self.source_paths) > 0
+        has_source = len(self.source_paths) > 0 or self.source_manifest is not None
         has_target = len(self.target_paths) > 0
 
         # Update labels
+        source_text = (f"hash report {self.source_manifest.name}" if self.source_manifest
+                       else f"{len(self.source_paths)} items")
         self.count_label.setText(
-            f"Source: {len(self.source_paths)} items | Target: {len(self.target_paths)} items"
+            f"Source: {source_text} | Target: {len(self.target_paths)} items"
         )
 
         # Update buttons
@@ -518,7 +630,10 @@ class VerifyHashesTab(BaseOperationTab):
         self.verify_btn.setEnabled(has_source and has_target and not self.operation_active)
 
         # Update storage detection
-        if has_source:
+        if self.source_manifest:
+            self.source_storage_label.setText("Hash report (not read)")
+            self.source_storage_label.setStyleSheet("")
+        elif has_source:
             self._update_source_storage_detection()
         else:
             self.source_storage_label.setText("Not detected")
@@ -649,13 +764,16 @@ class VerifyHashesTab(BaseOperationTab):
 
     def _start_verification(self):
         """Start hash verification in background thread"""
-        if not self.source_paths or not self.target_paths:
-            self.error("Both source and target files must be selected")
+        if (not self.source_paths and not self.source_manifest) or not self.target_paths:
+            self.error("Both source (files or a hash report) and target files must be selected")
             return
 
         # Get algorithm
         algorithm = self._get_selected_algorithm()
 
+        # Get file filters
+        include_patterns, exclude_patterns = self.get_file_filter_patterns()
+
         # Save settings
         self._save_settings()
 
@@ -665,10 +783,27 @@ class VerifyHashesTab(BaseOperationTab):
             enable_parallel=True,  # Always enabled
             max_workers_override=None,  # Auto-detect
             generate_csv=self.generate_csv_check.isChecked(),
-            include_metadata=True
+            include_metadata=True,
+            use_hash_cache=self.use_hash_cache_check.isChecked(),
+            force_reread=self.force_reread_check.isChecked(),
+            tree_hash=self.tree_hash_check.isChecked(),
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns,
+            source_manifest=str(self.source_manifest) if self.source_manifest else None,
+            size_triage=self.skip_size_mismatch_check.isChecked(),
+            hash_size_mismatches=not self.skip_size_mismatch_check.isChecked()
         )
 
-        self.info(f"Starting hash verification with {algorithm.upper()}")
+        if self.source_manifest:
+            self.info(f"Starting hash verification against {self.source_manifest.name} "
+                      f"(algorithms recorded in the report are used)")
+        elif settings.tree_hash:
+            self.info(f"Starting hash verification with {algorithm.upper()} tree digests")
+        else:
+            self.info(f"Starting hash verification with {algorithm.upper()}")
+        if include_patterns or exclude_patterns:
+            self.info(f"File filters: include {', '.join(include_patterns) or 'all'}"
+                      f" | exclude {', '.join(exclude_patterns) or 'none'}")
         self.set_operation_active(True)
 
         # Update UI
@@ -716,6 +851,7 @@ class VerifyHashesTab(BaseOperationTab):
             mismatches = sum(1 for vr in result.value.values() if vr.comparison_type == 'hash_mismatch')
             missing_target = sum(1 for vr in result.value.values() if vr.comparison_type == 'missing_target')
             missing_source = sum(1 for vr in result.value.values() if vr.comparison_type == 'missing_source')
+            size_mismatches = sum(1 for vr in result.value.values() if vr.comparison_type == 'size_mismatch')
 
             # Extract metrics from Result metadata (NEW: parallel verification includes metrics)
             combined_speed = 0
@@ -752,7 +888,7 @@ class VerifyHashesTab(BaseOperationTab):
             self.update_stats(
                 total=total,
                 success=matches,
-                failed=mismatches + missing_target + missing_source,  # All non-matches are "failures"
+                failed=mismatches + missing_target + missing_source + size_mismatches,  # All non-matches are "failures"
                 speed=combined_speed
             )
 
@@ -763,6 +899,10 @@ class VerifyHashesTab(BaseOperationTab):
             self.success(f"Matched:              {matches:>4}")
             if mismatches > 0:
                 self.warning(f"Mismatched:           {mismatches:>4}  (Hash differs)")
+                # Tree mode: show where the first mismatched files differ
+                ranged = [vr for vr in result.value.values() if vr.differing_ranges]
+                for vr in ranged[:10]:
+                    self.warning(f"  {vr.source_name or vr.target_name}: {vr.notes}")
             else:
                 self.success(f"Mismatched:           {mismatches:>4}")
 
@@ -776,6 +916,9 @@ class VerifyHashesTab(BaseOperationTab):
             else:
                 self.success(f"Missing from Source:  {missing_source:>4}")
 
+            if size_mismatches > 0:
+                self.warning(f"Size Mismatch:        {size_mismatches:>4}  (Not hashed)")
+
             self.success(f"{'─' * 60}")
             self.success(f"Total Files:          {total:>4}")
 
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hash manifests written alongside ZIP archives
+
+An archive manifest records the SHA-256 of the finished archive and of every
+member's uncompressed bytes. It is saved next to the archive as
+"<archive>.sha256.json" in the {"files": [...]} layout that
+copy_hash_verify.core.hash_manifest.HashManifest reads, so an extracted
+archive can later be verified against it without the original source.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from core.logger import logger
+
+
+MANIFEST_SUFFIX = '.sha256.json'
+
+# Member name -> (SHA-256 hex digest, uncompressed size)
+MemberHashes = Dict[str, Tuple[str, int]]
+
+
+class HashingWriter:
+    """
+    Write-only archive output that hashes every byte as it is written
+
+    The wrapper deliberately has no seek(): zipfile then treats the output as
+    unseekable and writes data descriptors after each member instead of going
+    back to patch local headers. Every byte is therefore written exactly once,
+    in order, and the digest is that of the final archive.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, 'wb')
+        self._hash = hashlib.sha256()
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._hash.update(data)
+        self._position += len(data)
+        return self._file.write(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.flush()
+            try:
+                os.fsync(self._file.fileno())
+            except OSError:
+                pass  # Not all file systems support fsync
+            self._file.close()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    @property
+    def size(self) -> int:
+        return self._position
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def manifest_path_for(archive_path: Path) -> Path:
+    """Location of the manifest that belongs to an archive"""
+    return archive_path.with_name(archive_path.name + MANIFEST_SUFFIX)
+
+
+def write_archive_manifest(archive_path: Path, archive_sha256: str, archive_size: int,
+                           members: MemberHashes, method: Optional[str] = None) -> Path:
+    """
+    Save the manifest for a finished archive
+
+    Args:
+        archive_path: The archive the hashes belong to
+        archive_sha256: SHA-256 of the archive file
+        archive_size: Archive size in bytes
+        members: Member name -> (SHA-256, uncompressed size)
+        method: Archive method that produced it, for the record
+
+    Returns:
+        Path of the manifest file
+    """
+    manifest = {
+        'archive': {
+            'file_name': archive_path.name,
+            'sha256': archive_sha256,
+            'size': archive_size,
+        },
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'method': method,
+        'algorithm': 'sha256',
+        'files': [
+            {'file_path': name, 'hashes': {'sha256': digest}, 'file_size': size}
+            for name, (digest, size) in sorted(members.items())
+        ],
+    }
+
+    manifest_path = manifest_path_for(archive_path)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    logger.info(f"Archive manifest written: {manifest_path.name} ({len(members)} members)")
+    return manifest_path
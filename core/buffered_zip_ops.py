@@ -6,9 +6,11 @@ Designed to match BufferedFileOperations performance and architecture
 """
 
 import zipfile
+import hashlib
 import time
 import os
 import logging
+from contextlib import ExitStack
 from pathlib import Path
 from typing import List, Dict, Callable, Optional, Tuple
 from dataclasses import dataclass, field
@@ -19,6 +21,8 @@ from core.settings_manager import SettingsManager
 from core.logger import logger
 from core.result_types import Result, ArchiveOperationResult
 from core.exceptions import ArchiveError, FileOperationError
+from core.parallel_deflate import ParallelDeflateWriter, zipfile_internals_available
+from core.archive_manifest import HashingWriter, MemberHashes, write_archive_manifest
 
 
 @dataclass
@@ -75,7 +79,8 @@ class BufferedZipOperations:
     
     def __init__(self, progress_callback: Optional[Callable[[int, str], None]] = None,
                  metrics_callback: Optional[Callable[[ZipPerformanceMetrics], None]] = None,
-                 cancelled_check: Optional[Callable[[], bool]] = None):
+                 cancelled_check: Optional[Callable[[], bool]] = None,
+                 compression_workers: Optional[int] = None):
         """
         Initialize with optional callbacks
         
@@ -83,14 +88,17 @@ class BufferedZipOperations:
             progress_callback: Function that receives (progress_pct, status_message)
             metrics_callback: Function that receives ZipPerformanceMetrics updates
             cancelled_check: Function that returns True if operation should be cancelled
+            compression_workers: Threads for ZIP_DEFLATED archives (None = CPU count, 1 = zipfile on one core)
         """
         self.progress_callback = progress_callback
         self.metrics_callback = metrics_callback
         self.cancelled_check = cancelled_check
+        self.compression_workers = compression_workers or os.cpu_count() or 1
         self.cancelled = False
         self.cancel_event = Event()
         self.settings = SettingsManager()
         self.metrics = ZipPerformanceMetrics()
+        self._member_hashes: Optional[MemberHashes] = None  # Set while an archive manifest is being built
         
     def get_optimal_buffer_size(self, file_size: int) -> int:
         """
@@ -160,8 +168,18 @@ class BufferedZipOperations:
                         arcname: str, file_size: int) -> Result[int]:
         """Add small file using legacy method (fast for small files)"""
         try:
-            # Use the standard zipfile.write() for small files
-            zf.write(file_path, arcname)
+            if self._member_hashes is not None:
+                # Read once so the member hash comes from the bytes being archived
+                with open(file_path, 'rb') as source_file:
+                    data = source_file.read()
+                zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                zinfo.compress_type = zf.compression
+                zf.writestr(zinfo, data)
+                self._member_hashes[zinfo.filename] = (hashlib.sha256(data).hexdigest(), len(data))
+                file_size = len(data)
+            else:
+                # Use the standard zipfile.write() for small files
+                zf.write(file_path, arcname)
             
             self.metrics.bytes_processed += file_size
             self.metrics.buffer_size_used = 0  # No buffering used
@@ -193,6 +211,7 @@ class BufferedZipOperations:
             last_progress_bytes = 0
             
             self.metrics.buffer_size_used = buffer_size
+            hasher = hashlib.sha256() if self._member_hashes is not None else None
             
             # Stream file to ZIP with buffering
             with zf.open(arcname, 'w') as zf_file:
@@ -209,6 +228,8 @@ class BufferedZipOperations:
                             
                         # Write to ZIP
                         zf_file.write(chunk)
+                        if hasher:
+                            hasher.update(chunk)
                         bytes_processed += len(chunk)
                         self.metrics.bytes_processed += len(chunk)
                         
@@ -237,6 +258,9 @@ class BufferedZipOperations:
                             if self.metrics_callback:
                                 self.metrics_callback(self.metrics)
             
+            if hasher:
+                self._member_hashes[zipfile.ZipInfo(arcname).filename] = (hasher.hexdigest(), bytes_processed)
+            
             # Ensure file data is written to disk (forensic integrity)
             if hasattr(zf, '_file') and hasattr(zf._file, 'fileno'):
                 try:
@@ -274,7 +298,8 @@ class BufferedZipOperations:
             return Result.error(error)
     
     def create_archive_buffered(self, source_path: Path, output_path: Path, 
-                               compression_level: int = zipfile.ZIP_STORED) -> Result[ArchiveOperationResult]:
+                               compression_level: int = zipfile.ZIP_STORED,
+                               hash_manifest: bool = False) -> Result[ArchiveOperationResult]:
         """
         Create ZIP archive using high-performance buffered streaming
         
@@ -282,12 +307,16 @@ class BufferedZipOperations:
             source_path: Directory or file to compress
             output_path: Where to save the ZIP file
             compression_level: ZIP compression level (default: ZIP_STORED for speed)
+            hash_manifest: Hash the archive and every member while writing and save
+                a manifest next to the archive (see core.archive_manifest)
             
         Returns:
             Result containing ArchiveOperationResult with performance metrics
         """
         self.metrics = ZipPerformanceMetrics()  # Reset metrics
         self.metrics.start_time = time.time()
+        self._member_hashes = {} if hash_manifest else None
+        archive_writer = None
         
         try:
             # Get all files to compress
@@ -311,43 +340,52 @@ class BufferedZipOperations:
             
             self._report_progress(0, f"Starting buffered ZIP creation: {len(files)} files")
             
-            # Create ZIP file with buffered streaming
-            with zipfile.ZipFile(output_path, 'w', compression=compression_level, 
+            # Create ZIP file with buffered streaming (through a hashing writer for manifests)
+            archive_writer = HashingWriter(output_path) if hash_manifest else None
+            with zipfile.ZipFile(archive_writer or output_path, 'w', compression=compression_level, 
                                compresslevel=None, allowZip64=True) as zf:
                 
-                for i, file_path in enumerate(files):
-                    # Check cancellation
-                    if self.cancelled or (self.cancelled_check and self.cancelled_check()):
-                        self._report_progress(0, "ZIP operation cancelled")
-                        return Result.error(ArchiveError("ZIP operation cancelled by user"))
+                if self._use_parallel_deflate(compression_level, zf):
+                    self._add_files_parallel_deflate(zf, files, source_path)
+                else:
+                    for i, file_path in enumerate(files):
+                        # Check cancellation
+                        if self.cancelled or (self.cancelled_check and self.cancelled_check()):
+                            self._report_progress(0, "ZIP operation cancelled")
+                            return Result.error(ArchiveError("ZIP operation cancelled by user"))
                     
-                    # Calculate archive name
-                    if source_path.is_dir():
-                        try:
-                            arcname = file_path.relative_to(source_path)
-                        except ValueError:
-                            # Fallback if file is not under source_path
+                        # Calculate archive name
+                        if source_path.is_dir():
+                            try:
+                                arcname = file_path.relative_to(source_path)
+                            except ValueError:
+                                # Fallback if file is not under source_path
+                                arcname = file_path.name
+                        else:
                             arcname = file_path.name
-                    else:
-                        arcname = file_path.name
                     
-                    # Add file using optimized method (legacy for small, buffered for large)
-                    result = self.add_file_optimized(zf, file_path, str(arcname))
+                        # Add file using optimized method (legacy for small, buffered for large)
+                        result = self.add_file_optimized(zf, file_path, str(arcname))
                     
-                    if not result.success:
-                        # Continue with other files even if one fails (forensic robustness)
-                        logger.warning(f"Failed to add file {file_path}: {result.error}")
-                        self.metrics.errors.append(f"Failed to add {file_path.name}: {result.error}")
-                        continue
+                        if not result.success:
+                            # Continue with other files even if one fails (forensic robustness)
+                            logger.warning(f"Failed to add file {file_path}: {result.error}")
+                            self.metrics.errors.append(f"Failed to add {file_path.name}: {result.error}")
+                            continue
                     
-                    self.metrics.files_processed += 1
+                        self.metrics.files_processed += 1
                     
-                    # Overall progress reporting
-                    overall_progress = int((i + 1) / len(files) * 100)
-                    self._report_progress(
-                        overall_progress,
-                        f"Processed {i + 1}/{len(files)} files"
-                    )
+                        # Overall progress reporting
+                        overall_progress = int((i + 1) / len(files) * 100)
+                        self._report_progress(
+                            overall_progress,
+                            f"Processed {i + 1}/{len(files)} files"
+                        )
+            
+            manifest_fields = {}
+            if archive_writer:
+                archive_writer.close()
+                manifest_fields = self._write_manifests({output_path: (archive_writer, self._member_hashes)})
             
             # Final metrics calculation
             self.metrics.end_time = time.time()
@@ -361,6 +399,7 @@ class BufferedZipOperations:
             archive_result = ArchiveOperationResult.create_successful(
                 created_archives=[output_path],
                 compression_level=compression_level,
+                **manifest_fields,
                 metadata={
                     'total_files': self.metrics.total_files,
                     'files_processed': self.metrics.files_processed,
@@ -386,6 +425,10 @@ class BufferedZipOperations:
             
             return archive_result
             
+        except ArchiveError as e:
+            self._report_progress(0, e.user_message)
+            return Result.error(e)
+            
         except PermissionError as e:
             error = ArchiveError(
                 f"Permission denied creating archive: {e}",
@@ -409,6 +452,397 @@ class BufferedZipOperations:
                 user_message="Archive creation failed due to an unexpected error."
             )
             return Result.error(error)
+            
+        finally:
+            if archive_writer:
+                archive_writer.close()
+            self._member_hashes = None
+    
+    def _use_parallel_deflate(self, compression_level: int, zf: Optional[zipfile.ZipFile] = None) -> bool:
+        """Whether DEFLATE should be spread across compression_workers threads"""
+        if compression_level != zipfile.ZIP_DEFLATED or self.compression_workers <= 1:
+            return False
+        if not zipfile_internals_available(zf):
+            logger.warning("zipfile internals differ in this Python version, compressing on one core")
+            return False
+        return True
+    
+    def _add_files_parallel_deflate(self, zf: zipfile.ZipFile, files: List[Path], source_path: Path):
+        """
+        Add files with chunked multi-core DEFLATE (see core.parallel_deflate)
+        
+        Members are written in the same order and under the same names as the
+        sequential loop. Progress is reported by bytes read.
+        
+        Raises:
+            ArchiveError: If cancelled or a file fails part-way through
+        """
+        def members():
+            for file_path in files:
+                try:
+                    self._categorize_file_by_size(file_path.stat().st_size)
+                except OSError:
+                    pass  # Reported by the writer when it tries to open the file
+                if source_path.is_dir():
+                    try:
+                        arcname = file_path.relative_to(source_path)
+                    except ValueError:
+                        arcname = file_path.name
+                else:
+                    arcname = file_path.name
+                yield file_path, str(arcname)
+        
+        last_time = time.time()
+        last_bytes = 0
+        
+        def on_bytes(count: int):
+            nonlocal last_time, last_bytes
+            self.metrics.bytes_processed += count
+            current_time = time.time()
+            if current_time - last_time >= 0.1:  # Update every 100ms max
+                speed_mbps = ((self.metrics.bytes_processed - last_bytes) / (1024 * 1024)) / (current_time - last_time)
+                self.metrics.current_speed_mbps = speed_mbps
+                self.metrics.add_speed_sample(speed_mbps)
+                progress_pct = int(self.metrics.bytes_processed / self.metrics.total_bytes * 100) \
+                    if self.metrics.total_bytes else 100
+                self._report_progress(min(progress_pct, 100), f"Compressing ({speed_mbps:.1f} MB/s)")
+                last_time, last_bytes = current_time, self.metrics.bytes_processed
+                if self.metrics_callback:
+                    self.metrics_callback(self.metrics)
+        
+        writer = ParallelDeflateWriter(
+            zf,
+            max_workers=self.compression_workers,
+            cancelled_check=lambda: self.cancelled or bool(self.cancelled_check and self.cancelled_check()),
+            bytes_callback=on_bytes,
+            hash_members=self._member_hashes is not None
+        )
+        added, errors = writer.add_files(members())
+        if self._member_hashes is not None:
+            self._member_hashes.update(writer.member_hashes)
+        self.metrics.files_processed += added
+        self.metrics.errors.extend(errors)
+        self.metrics.buffer_size_used = ParallelDeflateWriter.CHUNK_SIZE
+        self._report_progress(100, f"Processed {added}/{len(files)} files")
+    
+    def _add_files_parallel_deflate_fan_out(
+            self, files: List[Path],
+            targets_for: Callable[[Path], List[Tuple[zipfile.ZipFile, str, Path]]],
+            member_hashes: Optional[Dict[Path, MemberHashes]] = None):
+        """
+        Single-pass counterpart of _add_files_parallel_deflate
+        
+        Each file is read and deflated once on the thread pool and the compressed
+        chunks are written to every archive targets_for() returns for it. Chunk
+        output does not depend on the archive, so every archive gets the same
+        bytes it would get from _add_files_parallel_deflate.
+        
+        Raises:
+            ArchiveError: If cancelled or a file fails part-way through
+        """
+        outputs: Dict[zipfile.ZipFile, Path] = {}
+        
+        def members():
+            for file_path in files:
+                try:
+                    self._categorize_file_by_size(file_path.stat().st_size)
+                except OSError:
+                    pass  # Reported by the writer when it tries to open the file
+                targets = targets_for(file_path)
+                for zf, _, output_path in targets:
+                    outputs[zf] = output_path
+                yield file_path, [(zf, arcname) for zf, arcname, _ in targets]
+        
+        last_time = time.time()
+        
+        def on_bytes(count: int):
+            nonlocal last_time
+            self.metrics.bytes_processed += count
+            current_time = time.time()
+            if current_time - last_time >= 0.1:  # Update every 100ms max
+                progress_pct = int(self.metrics.bytes_processed / self.metrics.total_bytes * 100) \
+                    if self.metrics.total_bytes else 100
+                self._report_progress(min(progress_pct, 100), f"Compressing into {len(outputs)} archives")
+                last_time = current_time
+                if self.metrics_callback:
+                    self.metrics_callback(self.metrics)
+        
+        writer = ParallelDeflateWriter(
+            None,
+            max_workers=self.compression_workers,
+            cancelled_check=self.is_cancelled,
+            bytes_callback=on_bytes,
+            hash_members=member_hashes is not None
+        )
+        added, errors = writer.add_files_fan_out(members())
+        if member_hashes is not None:
+            for zf, hashes in writer.archive_member_hashes.items():
+                member_hashes[outputs[zf]].update(hashes)
+        self.metrics.files_processed += added
+        self.metrics.errors.extend(errors)
+        self.metrics.buffer_size_used = ParallelDeflateWriter.CHUNK_SIZE
+        self._report_progress(100, f"Processed {added}/{len(files)} files")
+    
+    def _write_manifests(self, archives: Dict[Path, Tuple[HashingWriter, MemberHashes]]) -> Dict[str, dict]:
+        """
+        Save a manifest next to each finished archive
+        
+        Args:
+            archives: Archive path -> (its closed HashingWriter, member hashes)
+            
+        Returns:
+            ArchiveOperationResult fields: archive_hashes, member_hashes, manifest_paths
+        """
+        fields = {'archive_hashes': {}, 'member_hashes': {}, 'manifest_paths': []}
+        for output_path, (writer, members) in archives.items():
+            fields['manifest_paths'].append(write_archive_manifest(
+                output_path, writer.hexdigest(), writer.size, members, method='buffered_python'))
+            fields['archive_hashes'][str(output_path)] = writer.hexdigest()
+            fields['member_hashes'][str(output_path)] = {name: digest for name, (digest, _) in members.items()}
+        return fields
+    
+    def create_archives_single_pass(self, jobs: List[Tuple[Path, Path]],
+                                    compression_level: int = zipfile.ZIP_STORED,
+                                    hash_manifest: bool = False) -> Result[ArchiveOperationResult]:
+        """
+        Create several archives of nested folders while reading every file once
+        
+        Multi-level archiving (root, location and datetime folders) puts the same
+        evidence file in up to three archives. Here the distinct source files are
+        walked once and each chunk read is written to every archive whose folder
+        contains the file, so a job is read from disk once instead of once per level.
+        ZIP_DEFLATED members are also compressed once, on compression_workers
+        threads, and the same compressed bytes are written to every archive.
+        
+        Args:
+            jobs: (source folder, archive path) pairs. If two jobs target the same
+                archive path, the later one wins, as with sequential creation.
+            compression_level: ZIP compression level (default: ZIP_STORED for speed)
+            hash_manifest: Hash every archive and member while writing and save a
+                manifest next to each archive (source files are still read once)
+            
+        Returns:
+            Result containing ArchiveOperationResult; value lists the archives that
+            received at least one file, in job order
+        """
+        self.metrics = ZipPerformanceMetrics()  # Reset metrics
+        self.metrics.start_time = time.time()
+        
+        # Later jobs for the same output replace earlier ones
+        jobs_by_output = {}
+        for source_path, output_path in jobs:
+            jobs_by_output[output_path] = source_path
+        archive_jobs = [(source, output) for output, source in jobs_by_output.items()]
+        
+        # Walk each outermost source folder once; nested jobs share its files
+        roots = sorted({source for source, _ in archive_jobs}, key=lambda p: len(p.parts))
+        walk_roots = []
+        for root in roots:
+            if not any(root == other or root.is_relative_to(other) for other in walk_roots):
+                walk_roots.append(root)
+        
+        zip_files: Dict[Path, zipfile.ZipFile] = {}
+        members_written: Dict[Path, int] = {output: 0 for _, output in archive_jobs}
+        archive_writers: Dict[Path, HashingWriter] = {}
+        member_hashes: Optional[Dict[Path, MemberHashes]] = \
+            {output: {} for _, output in archive_jobs} if hash_manifest else None
+        
+        try:
+            files = []
+            for root in walk_roots:
+                if root.is_dir():
+                    files.extend(f for f in root.rglob('*') if f.is_file())
+                elif root.is_file():
+                    files.append(root)
+            
+            if not files:
+                self._report_progress(100, "No files to compress")
+                error = ArchiveError(
+                    "No files found to compress",
+                    archive_path=str(walk_roots[0]) if walk_roots else "",
+                    user_message="No files were found in the specified location."
+                )
+                return Result.error(error)
+            
+            self.metrics.total_files = len(files)
+            self.metrics.total_bytes = sum(f.stat().st_size for f in files)
+            self._report_progress(0, f"Starting single-pass ZIP creation: {len(files)} files "
+                                     f"into {len(archive_jobs)} archives")
+            
+            with ExitStack() as archives:
+                def targets_for(file_path: Path) -> List[Tuple[zipfile.ZipFile, str, Path]]:
+                    """Every archive whose folder contains this file, with its member name"""
+                    targets = []
+                    for source_path, output_path in archive_jobs:
+                        if source_path.is_dir():
+                            if not file_path.is_relative_to(source_path):
+                                continue
+                            arcname = str(file_path.relative_to(source_path))
+                        elif file_path == source_path:
+                            arcname = file_path.name
+                        else:
+                            continue
+                        if output_path not in zip_files:
+                            output = output_path
+                            if hash_manifest:
+                                output = archive_writers[output_path] = archives.enter_context(
+                                    HashingWriter(output_path))
+                            zip_files[output_path] = archives.enter_context(zipfile.ZipFile(
+                                output, 'w', compression=compression_level, allowZip64=True))
+                        targets.append((zip_files[output_path], arcname, output_path))
+                    return targets
+                
+                if self._use_parallel_deflate(compression_level):
+                    # Each chunk is deflated once and the same bytes go to every archive
+                    self._add_files_parallel_deflate_fan_out(files, targets_for, member_hashes)
+                    for output_path, zf in zip_files.items():
+                        members_written[output_path] = len(zf.filelist)
+                else:
+                    for i, file_path in enumerate(files):
+                        if self.is_cancelled():
+                            self._report_progress(0, "ZIP operation cancelled")
+                            return Result.error(ArchiveError("ZIP operation cancelled by user"))
+                        
+                        targets = targets_for(file_path)
+                        result = self._add_file_fan_out(targets, file_path, compression_level, member_hashes)
+                        if not result.success:
+                            # Continue with other files even if one fails (forensic robustness)
+                            logger.warning(f"Failed to add file {file_path}: {result.error}")
+                            self.metrics.errors.append(f"Failed to add {file_path.name}: {result.error}")
+                            continue
+                        
+                        for _, _, output_path in targets:
+                            members_written[output_path] += 1
+                        self.metrics.files_processed += 1
+                        self._report_progress(
+                            int((i + 1) / len(files) * 100),
+                            f"Processed {i + 1}/{len(files)} files"
+                        )
+            
+            created_archives = [output for _, output in archive_jobs if members_written[output]]
+            manifest_fields = {}
+            if hash_manifest:
+                manifest_fields = self._write_manifests({
+                    output: (archive_writers[output], member_hashes[output]) for output in created_archives})
+            
+            self.metrics.end_time = time.time()
+            self.metrics.archive_size = sum(p.stat().st_size for p in created_archives if p.exists())
+            self.metrics.calculate_summary()
+            
+            archive_result = ArchiveOperationResult.create_successful(
+                created_archives=created_archives,
+                compression_level=compression_level,
+                **manifest_fields,
+                metadata={
+                    'total_files': self.metrics.total_files,
+                    'files_processed': self.metrics.files_processed,
+                    'total_bytes': self.metrics.total_bytes,
+                    'bytes_processed': self.metrics.bytes_processed,
+                    'archive_size': self.metrics.archive_size,
+                    'archives': len(created_archives),
+                    'members_written': sum(members_written.values()),
+                    'average_speed_mbps': self.metrics.average_speed_mbps,
+                    'operation_duration': self.metrics.end_time - self.metrics.start_time,
+                    'errors': self.metrics.errors
+                }
+            )
+            
+            self._report_progress(100, f"Created {len(created_archives)} archives in one pass "
+                                       f"({self.metrics.average_speed_mbps:.1f} MB/s avg)")
+            if self.metrics_callback:
+                self.metrics_callback(self.metrics)
+            
+            return archive_result
+            
+        except ArchiveError as e:
+            self._report_progress(0, e.user_message)
+            return Result.error(e)
+            
+        except PermissionError as e:
+            error = ArchiveError(
+                f"Permission denied creating archive: {e}",
+                archive_path=str(next(iter(jobs_by_output), '')),
+                user_message="Cannot create archive. Check folder permissions and available disk space."
+            )
+            return Result.error(error)
+            
+        except OSError as e:
+            error = ArchiveError(
+                f"File system error creating archive: {e}",
+                archive_path=str(next(iter(jobs_by_output), '')),
+                user_message="Cannot create archive due to file system error. Check available disk space."
+            )
+            return Result.error(error)
+            
+        except Exception as e:
+            error = ArchiveError(
+                f"Unexpected error creating archive: {e}",
+                archive_path=str(next(iter(jobs_by_output), '')),
+                user_message="Archive creation failed due to an unexpected error."
+            )
+            return Result.error(error)
+    
+    def _add_file_fan_out(self, targets: List[Tuple[zipfile.ZipFile, str, Path]], file_path: Path,
+                          compression_level: int,
+                          member_hashes: Optional[Dict[Path, MemberHashes]] = None) -> Result[int]:
+        """
+        Stream one source file into several open archives with a single read
+        
+        Args:
+            targets: (open ZipFile, member name, archive path) for every archive
+            file_path: Source file
+            compression_level: ZIP compression method for the members
+            member_hashes: If given, the file's SHA-256 is recorded under each target archive
+            
+        Returns:
+            Result containing bytes read or error
+        """
+        try:
+            file_size = file_path.stat().st_size
+            buffer_size = self.get_optimal_buffer_size(file_size)
+            self._categorize_file_by_size(file_size)
+            self.metrics.buffer_size_used = buffer_size
+            
+            hasher = hashlib.sha256() if member_hashes is not None else None
+            member_names = []
+            with ExitStack() as members, open(file_path, 'rb') as source_file:
+                streams = []
+                for zf, arcname, _ in targets:
+                    # Keep the file's timestamp and permissions like ZipFile.write()
+                    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                    zinfo.compress_type = compression_level
+                    member_names.append(zinfo.filename)
+                    streams.append(members.enter_context(zf.open(zinfo, 'w')))
+                
+                bytes_read = 0
+                while True:
+                    if self.is_cancelled():
+                        return Result.error(ArchiveError("Operation cancelled by user"))
+                    
+                    chunk = source_file.read(buffer_size)
+                    if not chunk:
+                        break
+                    for stream in streams:
+                        stream.write(chunk)
+                    if hasher:
+                        hasher.update(chunk)
+                    bytes_read += len(chunk)
+                    self.metrics.bytes_processed += len(chunk)
+            
+            if hasher:
+                for (_, _, output_path), name in zip(targets, member_names):
+                    member_hashes[output_path][name] = (hasher.hexdigest(), bytes_read)
+            
+            return Result.success(bytes_read)
+            
+        except OSError as e:
+            error = ArchiveError(
+                f"File system error processing {file_path}: {e}",
+                archive_path=str(file_path),
+                user_message=f"Error reading file {file_path.name}. File may be corrupted or unavailable."
+            )
+            self.metrics.errors.append(str(error))
+            return Result.error(error)
     
     def _report_progress(self, percentage: int, message: str):
         """Report progress if callback is available"""
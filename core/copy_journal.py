@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File-level checkpoint journal for resumable copy + verify operations
+
+BatchRecoveryManager restores interrupted batches at job granularity; this
+journal works one level down. Every verified file is appended to a JSON Lines
+journal together with its hashes and the fingerprint (size + mtime) of source
+and destination. Very large files also get periodic partial checkpoints with
+the byte offset that has been fsynced to the destination.
+
+On resume a file is skipped when both fingerprints still match the completed
+entry, and a large file continues from its last checkpoint. Python's hashlib
+state cannot be serialized, so the source hash of a resumed file is rebuilt by
+re-reading (not re-writing) the already-copied prefix of the source.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from core.logger import logger
+
+
+def _fingerprint(path: Path) -> Optional[Tuple[int, int]]:
+    """(size, mtime_ns) of a file, or None if it cannot be stat()ed"""
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_size, stat_result.st_mtime_ns
+
+
+class CopyJournal:
+    """Append-only journal of completed and partially copied files"""
+
+    VERSION = 1
+
+    def __init__(self, journal_path: Path):
+        """
+        Open (and replay) a journal file
+
+        Args:
+            journal_path: JSON Lines journal file, created on first write
+        """
+        self.journal_path = Path(journal_path)
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self._entries: Dict[Tuple[str, str], Dict] = {}
+        self._lock = Lock()
+        self._file = None
+        self._load()
+
+    @classmethod
+    def for_destination(cls, destination: Path) -> 'CopyJournal':
+        """
+        Journal for operations into a destination folder
+
+        Journals live next to the batch recovery files rather than in the
+        destination, so evidence output folders are never polluted.
+
+        Args:
+            destination: Destination folder of the copy operation
+
+        Returns:
+            CopyJournal keyed by the resolved destination path
+        """
+        key = hashlib.sha1(str(Path(destination).resolve()).encode('utf-8')).hexdigest()[:16]
+        journal_dir = Path.home() / '.folder_structure_utility' / 'copy_journals'
+        return cls(journal_dir / f"{key}.jsonl")
+
+    @property
+    def completed_count(self) -> int:
+        """Number of files recorded as completed"""
+        return sum(1 for entry in self._entries.values() if entry['type'] == 'complete')
+
+    def _load(self):
+        """Replay journal records - the last record for a file wins"""
+        if not self.journal_path.exists():
+            return
+
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn last line from a crash mid-write
+                        continue
+                    if record.get('version') != self.VERSION:
+                        continue
+                    self._entries[(record['source'], record['dest'])] = record
+        except OSError as e:
+            logger.warning(f"Cannot read copy journal {self.journal_path}: {e}")
+            return
+
+        if self._entries:
+            logger.info(f"Copy journal loaded: {self.completed_count} completed, "
+                        f"{len(self._entries) - self.completed_count} partial files")
+
+    def _append(self, record: Dict):
+        """Append one record and force it to disk"""
+        record['version'] = self.VERSION
+        record['recorded_at'] = datetime.now().isoformat()
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.journal_path, 'a', encoding='utf-8')
+            self._file.write(json.dumps(record) + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._entries[(record['source'], record['dest'])] = record
+
+    def completed_entry(self, source: Path, dest: Path) -> Optional[Dict]:
+        """
+        Completed entry for a file whose source and destination are unchanged
+
+        Args:
+            source: Source file path
+            dest: Destination file path
+
+        Returns:
+            Journal record with 'source_hash'/'dest_hash', or None if the file
+            must be copied again
+        """
+        entry = self._entries.get((str(source), str(dest)))
+        if not entry or entry['type'] != 'complete':
+            return None
+        if _fingerprint(source) != tuple(entry['source_fingerprint']):
+            return None
+        if _fingerprint(dest) != tuple(entry['dest_fingerprint']):
+            return None
+        return entry
+
+    def partial_offset(self, source: Path, dest: Path) -> int:
+        """
+        Checkpointed byte offset of a partially copied file
+
+        Args:
+            source: Source file path
+            dest: Destination file path
+
+        Returns:
+            Number of leading bytes already fsynced to dest (0 = start over)
+        """
+        entry = self._entries.get((str(source), str(dest)))
+        if not entry or entry['type'] != 'partial':
+            return 0
+        if _fingerprint(source) != tuple(entry['source_fingerprint']):
+            return 0
+        dest_fingerprint = _fingerprint(dest)
+        if dest_fingerprint is None or dest_fingerprint[0] < entry['offset']:
+            return 0
+        return entry['offset']
+
+    def record_partial(self, source: Path, dest: Path, offset: int):
+        """Record that the first offset bytes of dest are fsynced"""
+        source_fingerprint = _fingerprint(source)
+        if source_fingerprint is None:
+            return
+        self._append({
+            'type': 'partial',
+            'source': str(source),
+            'dest': str(dest),
+            'source_fingerprint': source_fingerprint,
+            'offset': offset
+        })
+
+    def record_complete(self, source: Path, dest: Path, source_hash: Optional[str],
+                        dest_hash: Optional[str]):
+        """Record a copied (and, with hashes, verified) file"""
+        source_fingerprint = _fingerprint(source)
+        dest_fingerprint = _fingerprint(dest)
+        if source_fingerprint is None or dest_fingerprint is None:
+            return
+        self._append({
+            'type': 'complete',
+            'source': str(source),
+            'dest': str(dest),
+            'source_fingerprint': source_fingerprint,
+            'dest_fingerprint': dest_fingerprint,
+            'source_hash': source_hash or '',
+            'dest_hash': dest_hash or ''
+        })
+
+    def close(self):
+        """Close the journal file (entries stay on disk for resume)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def discard(self):
+        """Delete the journal once the operation has completed successfully"""
+        self.close()
+        self._entries.clear()
+        try:
+            self.journal_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Cannot remove copy journal {self.journal_path}: {e}")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming file discovery built on os.scandir
+
+Walks selected files and folders lazily and yields each file as soon as it is
+found, together with the stat result of its directory entry. Running file and
+byte totals are kept while the walk is in progress so callers can report
+progress and ETA before discovery has finished.
+"""
+
+import fnmatch
+import os
+import stat
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from core.logger import logger
+
+
+@dataclass
+class DiscoveredFile:
+    """A regular file found during discovery"""
+    path: Path
+    relative_path: Path  # Relative to the parent of the selected file/folder
+    size: int
+    stat_result: os.stat_result
+
+
+class FileDiscovery:
+    """
+    Generator-based file discovery with include/exclude glob filtering
+
+    Patterns are matched with fnmatch against both the file name and the path
+    relative to the selected folder (using '/' separators), so '*.mp4' and
+    'DCIM/*' both work. Folders matching an exclude pattern are not descended.
+    Like Path.rglob(), symlinked files are included but symlinked folders are
+    not followed.
+    """
+
+    def __init__(self, include_patterns: Optional[Sequence[str]] = None,
+                 exclude_patterns: Optional[Sequence[str]] = None,
+                 cancelled_check: Optional[Callable[[], bool]] = None):
+        """
+        Initialize discovery
+
+        Args:
+            include_patterns: Only yield files matching one of these globs (None = all files)
+            exclude_patterns: Skip files and folders matching any of these globs
+            cancelled_check: Function that returns True if the walk should stop
+        """
+        self.include_patterns = list(include_patterns or [])
+        self.exclude_patterns = list(exclude_patterns or [])
+        self.cancelled_check = cancelled_check
+
+        # Running totals, updated as files are yielded
+        self.files_found = 0
+        self.bytes_found = 0
+        self.directories_scanned = 0
+        self.errors: List[str] = []
+        self.complete = False
+
+    def iter_files(self, paths: Iterable[Path]) -> Iterator[DiscoveredFile]:
+        """
+        Lazily yield every selected file (folders expanded recursively)
+
+        Args:
+            paths: Selected file and/or folder paths
+
+        Yields:
+            DiscoveredFile for each regular file, in walk order
+        """
+        self.complete = False
+
+        for path in paths:
+            if self._is_cancelled():
+                return
+
+            path = Path(path)
+            try:
+                path_stat = path.stat()
+            except OSError:
+                logger.warning(f"Path does not exist: {path}")
+                continue
+
+            if stat.S_ISDIR(path_stat.st_mode):
+                yield from self._walk(path)
+            elif stat.S_ISREG(path_stat.st_mode) and self.is_selected(path.name, path.name):
+                yield self._found(path, Path(path.name), path_stat)
+
+        self.complete = True
+
+    def _walk(self, root: Path) -> Iterator[DiscoveredFile]:
+        """Depth-first scandir walk of one selected folder"""
+        stack: List[Tuple[str, str]] = [(str(root), "")]
+
+        while stack:
+            if self._is_cancelled():
+                return
+
+            directory, relative_dir = stack.pop()
+            subdirectories = []
+
+            try:
+                with os.scandir(directory) as entries:
+                    self.directories_scanned += 1
+                    for entry in entries:
+                        relative = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if not self.is_folder_excluded(entry.name, relative):
+                                    subdirectories.append((entry.path, relative))
+                            elif entry.is_file() and self.is_selected(entry.name, relative):
+                                yield self._found(Path(entry.path), Path(root.name, relative), entry.stat())
+                        except OSError as e:
+                            self.errors.append(f"{entry.path}: {e}")
+                            logger.warning(f"Cannot access {entry.path}: {e}")
+            except OSError as e:
+                self.errors.append(f"{directory}: {e}")
+                logger.error(f"Error discovering files in {directory}: {e}")
+                continue
+
+            # Reversed so sub-folders are visited in scan order
+            stack.extend(reversed(subdirectories))
+
+    def _found(self, path: Path, relative_path: Path, stat_result: os.stat_result) -> DiscoveredFile:
+        """Update running totals and build the DiscoveredFile"""
+        self.files_found += 1
+        self.bytes_found += stat_result.st_size
+        return DiscoveredFile(path, relative_path, stat_result.st_size, stat_result)
+
+    def is_selected(self, name: str, relative: str) -> bool:
+        """Apply include/exclude patterns to a file name and its '/'-separated relative path"""
+        if self.include_patterns and not self._matches(name, relative, self.include_patterns):
+            return False
+        return not self._matches(name, relative, self.exclude_patterns)
+
+    def is_folder_excluded(self, name: str, relative: str) -> bool:
+        """Check whether a folder (and everything below it) is excluded from the walk"""
+        return self._matches(name, relative, self.exclude_patterns)
+
+    @staticmethod
+    def _matches(name: str, relative: str, patterns: List[str]) -> bool:
+        """Check a name/relative path against glob patterns"""
+        return any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative, pattern)
+                   for pattern in patterns)
+
+    def _is_cancelled(self) -> bool:
+        return bool(self.cancelled_check and self.cancelled_check())
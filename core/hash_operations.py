@@ -7,11 +7,61 @@ Core hash operations - business logic for file hashing and verification
 import hashlib
 import time
 from pathlib import Path
-from typing import List, Dict, Tuple, Callable, Optional, Any
+from typing import List, Dict, Tuple, Callable, Optional, Any, Sequence, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from core.logger import logger
+from core.file_discovery import FileDiscovery
+
+
+def normalize_algorithms(algorithm: Union[str, Sequence[str]],
+                         supported: Sequence[str]) -> List[str]:
+    """Normalize one algorithm name or a list of names
+    
+    Args:
+        algorithm: Algorithm name (e.g. 'sha256') or list of names
+        supported: Algorithm names accepted by the caller
+        
+    Returns:
+        Lower-case, de-duplicated algorithm names in the given order
+        
+    Raises:
+        ValueError: If the list is empty or contains an unsupported algorithm
+    """
+    names = [algorithm] if isinstance(algorithm, str) else list(algorithm)
+    
+    algorithms = []
+    for name in names:
+        name = name.lower()
+        if name not in supported:
+            raise ValueError(f"Unsupported algorithm: {name}. Must be one of {list(supported)}")
+        if name not in algorithms:
+            algorithms.append(name)
+    
+    if not algorithms:
+        raise ValueError("At least one hash algorithm is required")
+    return algorithms
+
+
+def compare_digests(source_hashes: Dict[str, str],
+                    target_hashes: Dict[str, str]) -> Tuple[bool, List[str]]:
+    """Compare two sets of digests on every algorithm both sides have
+    
+    Args:
+        source_hashes: Algorithm name -> hex digest for the source file
+        target_hashes: Algorithm name -> hex digest for the target file
+        
+    Returns:
+        Tuple of (match, shared_algorithms). match is False when the sides
+        share no algorithm or any shared digest differs.
+    """
+    shared = [alg for alg, digest in source_hashes.items()
+              if digest and target_hashes.get(alg)]
+    match = bool(shared) and all(
+        source_hashes[alg].lower() == target_hashes[alg].lower() for alg in shared
+    )
+    return match, shared
 
 
 @dataclass
@@ -24,6 +74,12 @@ class HashResult:
     file_size: int
     duration: float
     error: Optional[str] = None
+    hashes: Dict[str, str] = field(default_factory=dict)  # All digests by algorithm
+    
+    def __post_init__(self):
+        """Single-algorithm results expose their digest in hashes too"""
+        if not self.hashes and self.hash_value:
+            self.hashes = {self.algorithm: self.hash_value}
     
     @property
     def success(self) -> bool:
@@ -98,15 +154,22 @@ class HashOperations:
     SUPPORTED_ALGORITHMS = ['sha256', 'md5']
     BUFFER_SIZE = 64 * 1024  # 64KB buffer for hash calculation
     
-    def __init__(self, algorithm: str = 'sha256'):
+    def __init__(self, algorithm: Union[str, List[str]] = 'sha256',
+                 include_patterns: Optional[Sequence[str]] = None,
+                 exclude_patterns: Optional[Sequence[str]] = None):
         """Initialize hash operations
         
         Args:
-            algorithm: Hash algorithm to use ('sha256' or 'md5')
+            algorithm: Hash algorithm to use ('sha256' or 'md5'), or a list of
+                algorithms to calculate in a single read (first one is primary)
+            include_patterns: Only hash files matching these globs (None = all files)
+            exclude_patterns: Skip files and folders matching these globs
         """
-        self.algorithm = algorithm.lower()
-        if self.algorithm not in self.SUPPORTED_ALGORITHMS:
-            raise ValueError(f"Unsupported algorithm: {algorithm}. Must be one of {self.SUPPORTED_ALGORITHMS}")
+        self.algorithms = normalize_algorithms(algorithm, self.SUPPORTED_ALGORITHMS)
+        self.algorithm = self.algorithms[0]
+        self.include_patterns = list(include_patterns or [])
+        self.exclude_patterns = list(exclude_patterns or [])
+        self.discovered_bytes = 0  # Total size of the last discover_files() result
         
         self.cancelled = False
         self.progress_callback: Optional[Callable[[int, str], None]] = None
@@ -181,34 +244,24 @@ class HashOperations:
         else:
             common_base = Path(".")
         
-        for path in paths:
-            if not path.exists():
-                logger.warning(f"Path does not exist: {path}")
-                continue
-                
-            if path.is_file():
-                # Single file - use consistent relative path from common base
-                try:
-                    relative_path = path.relative_to(common_base)
-                    discovered_files.append((path, relative_path))
-                except ValueError:
-                    # Fallback: use parent name + filename
-                    parent_name = path.parent.name
-                    if parent_name and parent_name not in [".", "/"]:
-                        relative_path = Path(parent_name) / path.name
-                    else:
-                        relative_path = Path(path.name)
-                    discovered_files.append((path, relative_path))
-            elif path.is_dir():
-                # Recursive folder discovery - use same common base
-                try:
-                    for file_path in path.rglob('*'):
-                        if file_path.is_file():
-                            relative_path = file_path.relative_to(common_base)
-                            discovered_files.append((file_path, relative_path))
-                except Exception as e:
-                    logger.error(f"Error discovering files in {path}: {e}")
-                    
+        # Streaming scandir walk - sizes come from the directory entries, so no
+        # per-file stat() is needed later for the byte total
+        discovery = FileDiscovery(self.include_patterns, self.exclude_patterns,
+                                  cancelled_check=lambda: self.cancelled)
+        for found in discovery.iter_files(paths):
+            try:
+                # Consistent relative path from common base
+                relative_path = found.path.relative_to(common_base)
+            except ValueError:
+                # Fallback: use parent name + filename
+                parent_name = found.path.parent.name
+                if parent_name and parent_name not in [".", "/"]:
+                    relative_path = Path(parent_name) / found.path.name
+                else:
+                    relative_path = Path(found.path.name)
+            discovered_files.append((found.path, relative_path))
+        
+        self.discovered_bytes = discovery.bytes_found
         return discovered_files
     
     def hash_file(self, file_path: Path, relative_path: Path) -> HashResult:
@@ -227,13 +280,8 @@ class HashOperations:
             # Get file size
             file_size = file_path.stat().st_size
             
-            # Create hash object
-            if self.algorithm == 'sha256':
-                hash_obj = hashlib.sha256()
-            elif self.algorithm == 'md5':
-                hash_obj = hashlib.md5()
-            else:
-                raise ValueError(f"Unsupported algorithm: {self.algorithm}")
+            # Create one hash object per algorithm - all are fed from the same read
+            hash_objs = {algorithm: hashlib.new(algorithm) for algorithm in self.algorithms}
             
             # Calculate hash with progress reporting
             processed_bytes = 0
@@ -243,7 +291,8 @@ class HashOperations:
                     if not chunk:
                         break
                     
-                    hash_obj.update(chunk)
+                    for hash_obj in hash_objs.values():
+                        hash_obj.update(chunk)
                     processed_bytes += len(chunk)
                     
                     # Report progress for large files (every 1MB)
@@ -263,17 +312,18 @@ class HashOperations:
                     error="Operation cancelled"
                 )
             
-            # Get final hash
-            hash_value = hash_obj.hexdigest()
+            # Get final hashes
+            hashes = {algorithm: hash_obj.hexdigest() for algorithm, hash_obj in hash_objs.items()}
             duration = time.time() - start_time
             
             return HashResult(
                 file_path=file_path,
                 relative_path=relative_path,
                 algorithm=self.algorithm,
-                hash_value=hash_value,
+                hash_value=hashes[self.algorithm],
                 file_size=file_size,
-                duration=duration
+                duration=duration,
+                hashes=hashes
             )
             
         except Exception as e:
@@ -304,13 +354,14 @@ class HashOperations:
         metrics = HashOperationMetrics(
             start_time=time.time(),
             total_files=len(discovered_files),
-            total_bytes=sum(f[0].stat().st_size for f in discovered_files if f[0].exists())
+            total_bytes=self.discovered_bytes
         )
         
         results = []
         
         if self.status_callback:
-            self.status_callback(f"Starting {self.algorithm.upper()} hash calculation for {len(discovered_files)} files")
+            algorithms_label = '+'.join(algorithm.upper() for algorithm in self.algorithms)
+            self.status_callback(f"Starting {algorithms_label} hash calculation for {len(discovered_files)} files")
         
         for i, (file_path, relative_path) in enumerate(discovered_files):
             if self.cancelled:
@@ -585,9 +636,17 @@ class HashOperations:
                 comparison_type = "error"
                 notes = f"Hash calculation failed - Source: {source_result.error or 'OK'}, Target: {target_result.error or 'OK'}"
             else:
-                match = source_result.hash_value == target_result.hash_value
-                if not match:
-                    notes = f"Hash mismatch - Source: {source_result.hash_value[:16]}..., Target: {target_result.hash_value[:16]}..."
+                # Compare on every algorithm both sides were hashed with
+                match, shared_algorithms = compare_digests(source_result.hashes, target_result.hashes)
+                if not shared_algorithms:
+                    notes = (f"No common hash algorithm - Source: {', '.join(source_result.hashes)}, "
+                             f"Target: {', '.join(target_result.hashes)}")
+                    logger.warning(f"No common hash algorithm: '{source_path_str}' -> '{target_result.relative_path}'")
+                elif not match:
+                    algorithm = next(alg for alg in shared_algorithms
+                                     if source_result.hashes[alg].lower() != target_result.hashes[alg].lower())
+                    notes = (f"Hash mismatch ({algorithm.upper()}) - Source: {source_result.hashes[algorithm][:16]}..., "
+                             f"Target: {target_result.hashes[algorithm][:16]}...")
                     # Log detailed mismatch info for debugging
                     logger.info(f"Hash mismatch: '{source_path_str}' -> '{target_result.relative_path}' ({comparison_type})")
                     logger.debug(f"  Source hash: {source_result.hash_value}")
@@ -7,7 +7,7 @@ Hash report generation - CSV exports for hash and verification results
 import csv
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union, Iterable
 
 from core.hash_operations import HashResult, VerificationResult
 from core.logger import logger
@@ -19,11 +19,49 @@ class HashReportGenerator:
     def __init__(self):
         """Initialize the report generator"""
         pass
+    
+    @staticmethod
+    def _result_hashes(result) -> Dict[str, str]:
+        """Get all digests of a successful hash result keyed by algorithm"""
+        if result is None or not result.success:
+            return {}
+        hashes = getattr(result, 'hashes', None)
+        if hashes:
+            return hashes
+        return {result.algorithm: result.hash_value} if result.hash_value else {}
+    
+    @staticmethod
+    def _report_algorithms(algorithm: Union[str, List[str]],
+                           hash_sets: Iterable[Dict[str, str]]) -> List[str]:
+        """Get the algorithms to report, one column (pair) each
+        
+        Args:
+            algorithm: Requested algorithm or list of algorithms
+            hash_sets: Digest dictionaries found in the results
+            
+        Returns:
+            Requested algorithms first, followed by any others present in the results
+        """
+        names = [algorithm] if isinstance(algorithm, str) else list(algorithm)
+        algorithms = []
+        for name in names:
+            if name.lower() not in algorithms:
+                algorithms.append(name.lower())
+        for hashes in hash_sets:
+            for name in hashes:
+                if name.lower() not in algorithms:
+                    algorithms.append(name.lower())
+        return algorithms
+    
+    @staticmethod
+    def _algorithms_label(algorithms: List[str]) -> str:
+        """Metadata label such as 'SHA256, MD5'"""
+        return ', '.join(alg.upper() for alg in algorithms)
         
     def generate_single_hash_csv_from_dict(self,
                                       results_dict: dict,
                                       output_path: Path,
-                                      algorithm: str,
+                                      algorithm: Union[str, List[str]],
                                       include_metadata: bool = True) -> bool:
         """Generate CSV report from dictionary format (Result-based architecture support)
         
@@ -48,7 +86,8 @@ class HashReportGenerator:
                     algorithm=data.get('algorithm', algorithm),
                     file_size=data.get('file_size', 0),
                     duration=data.get('duration', 0),
-                    error=data.get('error', None) if not data.get('success', True) else None
+                    error=data.get('error', None) if not data.get('success', True) else None,
+                    hashes=data.get('hashes') or {}
                 )
                 hash_results.append(result)
         
@@ -58,26 +97,31 @@ class HashReportGenerator:
     def generate_single_hash_csv(self, 
                                 results: List[HashResult], 
                                 output_path: Path, 
-                                algorithm: str,
+                                algorithm: Union[str, List[str]],
                                 include_metadata: bool = True) -> bool:
         """Generate CSV report for single hash operation results
         
+        One hash column is written per algorithm. Algorithms present in the results
+        but not requested (multi-algorithm runs) get their own columns as well.
+        
         Args:
             results: List of HashResult objects
             output_path: Path where CSV should be saved
-            algorithm: Hash algorithm used
+            algorithm: Hash algorithm used, or list of algorithms
             include_metadata: Whether to include metadata header
             
         Returns:
             True if successful, False otherwise
         """
         try:
+            algorithms = self._report_algorithms(algorithm, (self._result_hashes(r) for r in results))
+            
             with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = [
                     'File Path',
                     'Relative Path', 
                     'File Size (bytes)',
-                    f'Hash ({algorithm.upper()})',
+                    *[f'Hash ({alg.upper()})' for alg in algorithms],
                     'Processing Time (s)',
                     'Speed (MB/s)',
                     'Status',
@@ -91,7 +135,7 @@ class HashReportGenerator:
                     metadata_writer = csv.writer(csvfile)
                     metadata_writer.writerow(['# Hash Report Metadata'])
                     metadata_writer.writerow([f'# Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'])
-                    metadata_writer.writerow([f'# Algorithm: {algorithm.upper()}'])
+                    metadata_writer.writerow([f'# Algorithm: {self._algorithms_label(algorithms)}'])
                     metadata_writer.writerow([f'# Total Files: {len(results)}'])
                     successful_files = len([r for r in results if r.success])
                     metadata_writer.writerow([f'# Successful: {successful_files}'])
@@ -103,11 +147,12 @@ class HashReportGenerator:
                 
                 # Write data rows
                 for result in results:
+                    hashes = self._result_hashes(result)
                     writer.writerow({
                         'File Path': str(result.file_path),
                         'Relative Path': str(result.relative_path),
                         'File Size (bytes)': result.file_size,
-                        f'Hash ({algorithm.upper()})': result.hash_value if result.success else '',
+                        **{f'Hash ({alg.upper()})': hashes.get(alg, '') for alg in algorithms},
                         'Processing Time (s)': f"{result.duration:.3f}",
                         'Speed (MB/s)': f"{result.speed_mbps:.2f}" if result.success else '',
                         'Status': 'SUCCESS' if result.success else 'FAILED',
@@ -124,20 +169,25 @@ class HashReportGenerator:
     def generate_verification_csv(self, 
                                 verification_results: List[VerificationResult], 
                                 output_path: Path, 
-                                algorithm: str,
+                                algorithm: Union[str, List[str]],
                                 include_metadata: bool = True) -> bool:
         """Generate CSV report for verification operation results
         
         Args:
             verification_results: List of VerificationResult objects
             output_path: Path where CSV should be saved
-            algorithm: Hash algorithm used
+            algorithm: Hash algorithm used, or list of algorithms (one column pair each)
             include_metadata: Whether to include metadata header
             
         Returns:
             True if successful, False otherwise
         """
         try:
+            algorithms = self._report_algorithms(
+                algorithm,
+                (self._result_hashes(r) for v in verification_results for r in (v.source_result, v.target_result))
+            )
+            
             with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = [
                     'Source File Path',
@@ -146,8 +196,7 @@ class HashReportGenerator:
                     'Target Relative Path',
                     'Source File Size (bytes)',
                     'Target File Size (bytes)',
-                    f'Source Hash ({algorithm.upper()})',
-                    f'Target Hash ({algorithm.upper()})',
+                    *[f'{side} Hash ({alg.upper()})' for alg in algorithms for side in ('Source', 'Target')],
                     'Verification Status',
                     'Match Type',
                     'Notes'
@@ -160,7 +209,7 @@ class HashReportGenerator:
                     metadata_writer = csv.writer(csvfile)
                     metadata_writer.writerow(['# Hash Verification Report Metadata'])
                     metadata_writer.writerow([f'# Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'])
-                    metadata_writer.writerow([f'# Algorithm: {algorithm.upper()}'])
+                    metadata_writer.writerow([f'# Algorithm: {self._algorithms_label(algorithms)}'])
                     metadata_writer.writerow([f'# Total Comparisons: {len(verification_results)}'])
                     matches = len([v for v in verification_results if v.match])
                     metadata_writer.writerow([f'# Matches: {matches}'])
@@ -176,23 +225,27 @@ class HashReportGenerator:
                     source_path = str(result.source_result.file_path) if result.source_result else ''
                     source_relative = str(result.source_result.relative_path) if result.source_result else ''
                     source_size = result.source_result.file_size if result.source_result else 0
-                    source_hash = result.source_result.hash_value if result.source_result and result.source_result.success else ''
+                    source_hashes = self._result_hashes(result.source_result)
                     
                     # Target information
                     target_path = str(result.target_result.file_path) if result.target_result else ''
                     target_relative = str(result.target_result.relative_path) if result.target_result else ''
                     target_size = result.target_result.file_size if result.target_result else 0
-                    target_hash = result.target_result.hash_value if result.target_result and result.target_result.success else ''
+                    target_hashes = self._result_hashes(result.target_result)
                     
-                    writer.writerow({
+                    row = {
                         'Source File Path': source_path,
                         'Target File Path': target_path,
                         'Source Relative Path': source_relative,
                         'Target Relative Path': target_relative,
                         'Source File Size (bytes)': source_size,
                         'Target File Size (bytes)': target_size,
-                        f'Source Hash ({algorithm.upper()})': source_hash,
-                        f'Target Hash ({algorithm.upper()})': target_hash,
+                    }
+                    for alg in algorithms:
+                        row[f'Source Hash ({alg.upper()})'] = source_hashes.get(alg, '')
+                        row[f'Target Hash ({alg.upper()})'] = target_hashes.get(alg, '')
+                    writer.writerow({
+                        **row,
                         'Verification Status': 'MATCH' if result.match else 'MISMATCH',
                         'Match Type': result.comparison_type,
                         'Notes': result.notes
@@ -208,7 +261,7 @@ class HashReportGenerator:
     def generate_forensic_compatible_csv(self,
                                        verification_results: List[VerificationResult],
                                        output_path: Path,
-                                       algorithm: str) -> bool:
+                                       algorithm: Union[str, List[str]]) -> bool:
         """Generate CSV report compatible with existing forensic hash format
         
         This generates a CSV in the same format as the existing hash verification
@@ -217,20 +270,24 @@ class HashReportGenerator:
         Args:
             verification_results: List of VerificationResult objects
             output_path: Path where CSV should be saved
-            algorithm: Hash algorithm used
+            algorithm: Hash algorithm used, or list of algorithms (one column pair each)
             
         Returns:
             True if successful, False otherwise
         """
         try:
+            algorithms = self._report_algorithms(
+                algorithm,
+                (self._result_hashes(r) for v in verification_results for r in (v.source_result, v.target_result))
+            )
+            
             with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
                 # Use the same fieldnames as the existing forensic CSV
                 fieldnames = [
                     'Filename', 
                     'Source Path', 
                     'Destination Path',
-                    f'Source Hash ({algorithm.upper()})', 
-                    f'Destination Hash ({algorithm.upper()})', 
+                    *[f'{side} Hash ({alg.upper()})' for alg in algorithms for side in ('Source', 'Destination')],
                     'Verification Status'
                 ]
                 
@@ -243,17 +300,19 @@ class HashReportGenerator:
                     filename = result.source_name if result.source_result else ''
                     source_path = str(result.source_result.file_path) if result.source_result else ''
                     target_path = str(result.target_result.file_path) if result.target_result else ''
-                    source_hash = result.source_result.hash_value if result.source_result and result.source_result.success else ''
-                    target_hash = result.target_result.hash_value if result.target_result and result.target_result.success else ''
+                    source_hashes = self._result_hashes(result.source_result)
+                    target_hashes = self._result_hashes(result.target_result)
                     
-                    writer.writerow({
+                    row = {
                         'Filename': filename,
                         'Source Path': source_path,
                         'Destination Path': target_path,
-                        f'Source Hash ({algorithm.upper()})': source_hash,
-                        f'Destination Hash ({algorithm.upper()})': target_hash,
-                        'Verification Status': 'PASSED' if result.match else 'FAILED'
-                    })
+                    }
+                    for alg in algorithms:
+                        row[f'Source Hash ({alg.upper()})'] = source_hashes.get(alg, '')
+                        row[f'Destination Hash ({alg.upper()})'] = target_hashes.get(alg, '')
+                    row['Verification Status'] = 'PASSED' if result.match else 'FAILED'
+                    writer.writerow(row)
             
             logger.info(f"Generated forensic-compatible CSV report: {output_path}")
             return True
@@ -265,28 +324,42 @@ class HashReportGenerator:
     def generate_verification_csv_from_dict(self, 
                                            verification_dict: Dict[str, Dict], 
                                            output_path: Path, 
-                                           algorithm: str,
+                                           algorithm: Union[str, List[str]],
                                            include_metadata: bool = True) -> bool:
         """Generate CSV report for verification operation results from nuclear migration dictionary format
         
         Args:
             verification_dict: Dictionary of verification results from nuclear migration
             output_path: Path where CSV should be saved
-            algorithm: Hash algorithm used
+            algorithm: Hash algorithm used, or list of algorithms. Entries may carry
+                'source_hashes'/'target_hashes' dicts for multi-algorithm runs.
             include_metadata: Whether to include metadata header
             
         Returns:
             True if successful, False otherwise
         """
         try:
+            primary = algorithm if isinstance(algorithm, str) else list(algorithm)[0]
+            
+            def entry_hashes(data: Dict, side: str) -> Dict[str, str]:
+                hashes = data.get(f'{side}_hashes')
+                if hashes:
+                    return hashes
+                digest = data.get(f'{side}_hash', '')
+                return {primary.lower(): digest} if digest else {}
+            
+            algorithms = self._report_algorithms(
+                algorithm,
+                (entry_hashes(v, side) for v in verification_dict.values() for side in ('source', 'target'))
+            )
+            
             with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
                 fieldnames = [
                     'Source File Path',
                     'Source Relative Path', 
                     'Target File Path',
                     'Target Relative Path',
-                    f'Source Hash ({algorithm.upper()})',
-                    f'Target Hash ({algorithm.upper()})',
+                    *[f'{side} Hash ({alg.upper()})' for alg in algorithms for side in ('Source', 'Target')],
                     'Verification Status',
                     'Comparison Type',
                     'Source Status',
@@ -309,7 +382,7 @@ class HashReportGenerator:
                     metadata_writer = csv.writer(csvfile)
                     metadata_writer.writerow(['# Hash Verification Report Metadata'])
                     metadata_writer.writerow([f'# Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'])
-                    metadata_writer.writerow([f'# Algorithm: {algorithm.upper()}'])
+                    metadata_writer.writerow([f'# Algorithm: {self._algorithms_label(algorithms)}'])
                     metadata_writer.writerow([f'# Total Verification Entries: {len(verification_dict)}'])
                     metadata_writer.writerow([f'# Successful Matches: {successful_comparisons}'])
                     metadata_writer.writerow([f'# Hash Mismatches: {hash_mismatches}'])
@@ -336,13 +409,19 @@ class HashReportGenerator:
                         else:
                             verification_status = 'MISMATCH'
                     
-                    writer.writerow({
+                    source_hashes = entry_hashes(verification_data, 'source')
+                    target_hashes = entry_hashes(verification_data, 'target')
+                    row = {
                         'Source File Path': verification_data.get('source_path', ''),
                         'Source Relative Path': verification_data.get('source_relative_path', ''),
                         'Target File Path': verification_data.get('target_path', ''),
                         'Target Relative Path': verification_data.get('target_relative_path', ''),
-                        f'Source Hash ({algorithm.upper()})': verification_data.get('source_hash', ''),
-                        f'Target Hash ({algorithm.upper()})': verification_data.get('target_hash', ''),
+                    }
+                    for alg in algorithms:
+                        row[f'Source Hash ({alg.upper()})'] = source_hashes.get(alg, '')
+                        row[f'Target Hash ({alg.upper()})'] = target_hashes.get(alg, '')
+                    writer.writerow({
+                        **row,
                         'Verification Status': verification_status,
                         'Comparison Type': verification_data.get('comparison_type', 'unknown'),
                         'Source Status': 'SUCCESS' if verification_data.get('source_success', False) else 'FAILED',
@@ -358,17 +437,19 @@ class HashReportGenerator:
             logger.error(f"Failed to generate verification CSV from dict: {e}")
             return False
 
-    def get_default_filename(self, operation_type: str, algorithm: str) -> str:
+    def get_default_filename(self, operation_type: str, algorithm: Union[str, List[str]]) -> str:
         """Get default filename for report
         
         Args:
             operation_type: 'hash' or 'verification'
-            algorithm: Hash algorithm used
+            algorithm: Hash algorithm used, or list of algorithms
             
         Returns:
             Default filename string
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if not isinstance(algorithm, str):
+            algorithm = '_'.join(algorithm)
         
         if operation_type == 'hash':
             return f"hash_report_{algorithm}_{timestamp}.csv"
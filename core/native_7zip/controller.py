@@ -6,17 +6,19 @@ Manages subprocess execution with progress monitoring and Result-based error han
 """
 
 import subprocess
+import hashlib
 import time
 import re
 import os
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Tuple
 import threading
 from dataclasses import dataclass, field
 
 from .binary_manager import Native7ZipBinaryManager
 from .command_builder import ForensicCommandBuilder
 from core.result_types import Result, ArchiveOperationResult
+from core.archive_manifest import MemberHashes, write_archive_manifest
 from core.exceptions import ArchiveError, ValidationError
 from core.logger import logger
 
@@ -69,6 +71,10 @@ class Native7ZipController:
         self._monitor_thread: Optional[threading.Thread] = None
         self._stop_monitoring = threading.Event()
         
+        # Source hashing for archive manifests (alongside 7za on solid-state sources)
+        self._hash_thread: Optional[threading.Thread] = None
+        self._stop_hashing = threading.Event()
+        
         # Log availability on init
         if self.is_available():
             logger.info("Native 7zip controller initialized successfully")
@@ -82,14 +88,23 @@ class Native7ZipController:
         return self.binary_manager.is_available()
     
     def create_archive(self, source_path: Path, output_path: Path, 
-                      compression_mode: str = "store") -> Result[ArchiveOperationResult]:
+                      compression_mode: str = "store",
+                      hash_manifest: bool = False) -> Result[ArchiveOperationResult]:
         """
         Create archive using native 7zip with performance monitoring
         
+        7za reads the sources and writes the archive itself, so with hash_manifest
+        the member hashes take an extra read of the sources. On SSD/NVMe sources
+        that pass runs while 7za is archiving; on spinning, USB and unknown
+        storage it runs after 7za has finished, so two sequential readers do not
+        compete for the disk. The archive is hashed once 7za has written it.
+        
         Args:
             source_path: Directory or file to archive
             output_path: Output archive path  
             compression_mode: "store" (fastest), "fast", "normal", "max"
+            hash_manifest: Save a SHA-256 manifest of the archive and its members
+                next to the archive (see core.archive_manifest)
             
         Returns:
             Result containing ArchiveOperationResult with performance metrics
@@ -124,7 +139,10 @@ class Native7ZipController:
         self.metrics.command_used = cmd
         
         # Execute with monitoring
+        member_hashes = self._start_source_hashing(source_path) if hash_manifest else None
         result = self._execute_with_monitoring(cmd, source_path, output_path)
+        if member_hashes is not None:
+            result = self._finish_manifest(result, source_path, output_path, member_hashes)
         
         # Finalize metrics
         self.metrics.end_time = time.time()
@@ -132,6 +150,106 @@ class Native7ZipController:
         
         return result
     
+    def _start_source_hashing(self, source_path: Path) -> MemberHashes:
+        """
+        Hash the source files on a background thread while 7za archives them
+        
+        Only solid-state sources are hashed concurrently. Otherwise the dict is
+        returned empty and _finish_manifest() hashes the sources after 7za exits.
+        
+        Returns:
+            Dict filled with member name -> (SHA-256, size)
+        """
+        member_hashes: MemberHashes = {}
+        self._stop_hashing.clear()
+        
+        if self._hash_sources_concurrently(source_path):
+            self._hash_thread = threading.Thread(
+                target=self._hash_sources, args=(source_path, member_hashes), daemon=True)
+            self._hash_thread.start()
+        return member_hashes
+    
+    def _hash_sources_concurrently(self, source_path: Path) -> bool:
+        """
+        Whether sources can be re-read while 7za is reading them
+        
+        SSD/NVMe serve two readers without seeking. On HDD, USB and unknown
+        storage a second sequential reader slows 7za down.
+        """
+        try:
+            # Imported lazily: copy_hash_verify depends on core, not the other way round
+            from copy_hash_verify.core.storage_detector import StorageDetector, DriveType
+        except ImportError:
+            return False
+        
+        try:
+            source_info = StorageDetector().analyze_path(source_path)
+        except Exception as e:
+            logger.debug(f"Storage detection failed, hashing sources after archiving: {e}")
+            return False
+        return source_info.drive_type in (DriveType.SSD, DriveType.NVME)
+    
+    def _hash_sources(self, source_path: Path, member_hashes: MemberHashes):
+        """SHA-256 every source file under its member name"""
+        files = sorted(f for f in source_path.rglob('*') if f.is_file()) if source_path.is_dir() else [source_path]
+        for file_path in files:
+            if self._stop_hashing.is_set():
+                return
+            name = file_path.relative_to(source_path).as_posix() if source_path.is_dir() else file_path.name
+            try:
+                member_hashes[name] = self._sha256_file(file_path)
+            except OSError as e:
+                logger.warning(f"Could not hash {file_path} for archive manifest: {e}")
+    
+    def _finish_manifest(self, result: Result[ArchiveOperationResult], source_path: Path,
+                         output_path: Path, member_hashes: MemberHashes) -> Result[ArchiveOperationResult]:
+        """Wait for (or run) source hashing, hash the finished archive and save the manifest"""
+        if not result.success:
+            self._stop_hashing.set()
+        if self._hash_thread:
+            self._hash_thread.join()
+            self._hash_thread = None
+        elif result.success:
+            self._report_progress(100, f"Hashing source files for manifest: {output_path.name}")
+            self._hash_sources(source_path, member_hashes)
+            if self._stop_hashing.is_set():
+                return Result.error(ArchiveError(
+                    "Archive manifest cancelled", archive_path=str(output_path),
+                    user_message="The archive was created, but its hash manifest was cancelled."))
+        if not result.success:
+            return result
+        
+        try:
+            self._report_progress(100, f"Hashing archive: {output_path.name}")
+            archive_sha256, archive_size = self._sha256_file(output_path)
+            manifest_path = write_archive_manifest(
+                output_path, archive_sha256, archive_size, member_hashes, method='native_7zip')
+        except OSError as e:
+            return Result.error(ArchiveError(
+                f"Archive created but manifest could not be written: {e}",
+                archive_path=str(output_path),
+                user_message="The archive was created, but its hash manifest could not be saved."
+            ))
+        
+        result.archive_hashes[str(output_path)] = archive_sha256
+        result.member_hashes[str(output_path)] = {name: digest for name, (digest, _) in member_hashes.items()}
+        result.manifest_paths.append(manifest_path)
+        return result
+    
+    @staticmethod
+    def _sha256_file(file_path: Path) -> Tuple[str, int]:
+        """SHA-256 and size of a file"""
+        hasher = hashlib.sha256()
+        size = 0
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(4 * 1024 * 1024)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                size += len(chunk)
+        return hasher.hexdigest(), size
+    
     def _validate_inputs(self, source_path: Path, output_path: Path) -> Result[None]:
         """Validate input parameters"""
         try:
@@ -392,6 +510,7 @@ class Native7ZipController:
     def cancel(self):
         """Cancel current operation"""
         self.cancelled = True
+        self._stop_hashing.set()
         if self.current_process:
             try:
                 self.current_process.terminate()
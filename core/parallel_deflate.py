@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Multi-core DEFLATE for ZIP archives written with zipfile
+
+zipfile compresses each member on the calling thread, so DEFLATED archives run
+at single-core speed. ParallelDeflateWriter splits every member into fixed-size
+chunks and deflates them on a thread pool (zlib releases the GIL), pigz style:
+
+- each chunk is compressed with the previous 32KB of input as preset
+  dictionary and ends with a sync flush, so the concatenated chunks form one
+  valid deflate stream
+- the CRC-32 is computed on the reading thread in file order
+- compressed chunks are written in member/chunk order; the final CRC and
+  sizes go into the patched local header (seekable output) or a trailing data
+  descriptor (unseekable output), exactly as zipfile does
+
+Chunk boundaries depend only on CHUNK_SIZE, never on the number of workers or
+on scheduling, so the same input gives a byte-identical archive on every run.
+The same property lets add_files_fan_out() compress a file once and write the
+identical compressed chunks to several archives (multi-level archiving).
+
+Members are written through private zipfile internals. Callers check
+zipfile_internals_available() first and fall back to ZipFile.write when
+the running Python does not have them.
+"""
+
+import hashlib
+import os
+import struct
+import zlib
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from core.exceptions import ArchiveError
+from core.logger import logger
+
+
+DEFLATE_WINDOW = 32 * 1024  # Maximum back-reference distance of deflate
+
+# Private zipfile names used by _begin_member/_end_member (they mirror
+# ZipFile._open_to_write and _ZipWriteFile.close). Tested on CPython 3.11.
+_ZIPFILE_MODULE_NAMES = ('_MASK_USE_DATA_DESCRIPTOR', '_DD_SIGNATURE', 'ZIP64_LIMIT')
+_ZIPFILE_INSTANCE_NAMES = ('_seekable', '_writecheck', '_didModify', 'start_dir', '_allowZip64',
+                           'fp', 'filelist', 'NameToInfo')
+
+
+def zipfile_internals_available(zf: Optional[zipfile.ZipFile] = None) -> bool:
+    """
+    Whether this Python's zipfile has the internals ParallelDeflateWriter uses
+
+    Args:
+        zf: Open ZipFile to check as well (None = module-level names only)
+
+    Returns:
+        False if any name is missing, in which case ZipFile.write must be used
+    """
+    if not all(hasattr(zipfile, name) for name in _ZIPFILE_MODULE_NAMES):
+        return False
+    if not hasattr(zipfile.ZipInfo, 'FileHeader'):
+        return False
+    return zf is None or all(hasattr(zf, name) for name in _ZIPFILE_INSTANCE_NAMES)
+
+
+def _deflate_chunk(data: bytes, zdict: bytes, level: int, last: bool) -> bytes:
+    """Raw-deflate one chunk, primed with the preceding input"""
+    if zdict:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL,
+                                      zlib.Z_DEFAULT_STRATEGY, zdict)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+@dataclass
+class _MemberTarget:
+    """One archive a member is written to"""
+    zf: zipfile.ZipFile
+    zinfo: zipfile.ZipInfo
+    zip64: bool = False
+
+
+@dataclass
+class _MemberState:
+    """Bookkeeping for one member while its chunks are in flight"""
+    targets: List[_MemberTarget]
+    crc: int = 0
+    file_size: int = 0
+    compress_size: int = 0
+    hasher: Any = None
+
+
+class ParallelDeflateWriter:
+    """Add files to open ZipFiles with DEFLATE on several cores"""
+
+    CHUNK_SIZE = 1024 * 1024  # Part of the output format - changing it changes archive bytes
+
+    def __init__(self, zf: Optional[zipfile.ZipFile], max_workers: Optional[int] = None,
+                 compress_level: int = zlib.Z_DEFAULT_COMPRESSION,
+                 cancelled_check: Optional[Callable[[], bool]] = None,
+                 bytes_callback: Optional[Callable[[int], None]] = None,
+                 hash_members: bool = False):
+        """
+        Args:
+            zf: ZipFile opened for writing (None when only add_files_fan_out is used)
+            max_workers: Compression threads (None = CPU count)
+            compress_level: zlib level (default matches zipfile's ZIP_DEFLATED default)
+            cancelled_check: Function that returns True if writing should stop
+            bytes_callback: Receives the size of every chunk read (progress)
+            hash_members: SHA-256 each member's bytes as they are read (see member_hashes
+                and archive_member_hashes)
+        """
+        self.zf = zf
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.compress_level = compress_level
+        self.cancelled_check = cancelled_check
+        self.bytes_callback = bytes_callback
+        self.max_in_flight = self.max_workers * 2
+        self.hash_members = hash_members
+        self.member_hashes: Dict[str, Tuple[str, int]] = {}
+        # Members of archives other than zf (fan-out), per archive
+        self.archive_member_hashes: Dict[zipfile.ZipFile, Dict[str, Tuple[str, int]]] = {}
+
+    def add_files(self, members: Iterable[Tuple[Path, str]]) -> Tuple[int, List[str]]:
+        """
+        Compress and add files in the given order
+
+        A file that cannot be opened is skipped and reported. A read error in the
+        middle of a file aborts the archive, since its header may already be written.
+
+        Args:
+            members: (source file, member name) pairs
+
+        Returns:
+            Tuple of (files added, error messages for skipped files)
+
+        Raises:
+            ArchiveError: If cancelled or a file fails part-way through
+        """
+        return self.add_files_fan_out((file_path, [(self.zf, arcname)]) for file_path, arcname in members)
+
+    def add_files_fan_out(self, members: Iterable[Tuple[Path, List[Tuple[zipfile.ZipFile, str]]]]
+                          ) -> Tuple[int, List[str]]:
+        """
+        Compress files once each and add them to one or more archives
+
+        Every file is read and deflated once; its compressed chunks are written
+        to each (archive, member name) target. Files are skipped and aborted
+        as in add_files().
+
+        Args:
+            members: (source file, [(open ZipFile, member name), ...]) pairs
+
+        Returns:
+            Tuple of (files added, error messages for skipped files)
+
+        Raises:
+            ArchiveError: If cancelled or a file fails part-way through
+        """
+        pending: Deque[Tuple[_MemberState, Future, bool, bool]] = deque()
+        added = 0
+        errors: List[str] = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ZipDeflate") as executor:
+            try:
+                for file_path, targets in members:
+                    if not targets:
+                        continue
+                    try:
+                        member_targets = []
+                        for zf, arcname in targets:
+                            zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                            zinfo.compress_type = zipfile.ZIP_DEFLATED
+                            member_targets.append(_MemberTarget(zf=zf, zinfo=zinfo))
+                        source = open(file_path, 'rb')
+                    except OSError as e:
+                        logger.warning(f"Skipping {file_path}: {e}")
+                        errors.append(f"Failed to add {file_path.name}: {e}")
+                        continue
+
+                    member = _MemberState(targets=member_targets,
+                                          hasher=hashlib.sha256() if self.hash_members else None)
+                    with source:
+                        self._submit_member(executor, pending, member, source, file_path)
+                    added += 1
+
+                while pending:
+                    self._write_next(pending)
+            except BaseException:
+                for _, future, _, _ in pending:
+                    future.cancel()
+                raise
+
+        return added, errors
+
+    def _submit_member(self, executor: ThreadPoolExecutor, pending: Deque, member: _MemberState,
+                       source, file_path: Path):
+        """Read a file chunk by chunk and queue the chunks for compression"""
+        zdict = b''
+        first = True
+        while True:
+            if self.cancelled_check and self.cancelled_check():
+                raise ArchiveError("ZIP operation cancelled by user")
+
+            try:
+                chunk = source.read(self.CHUNK_SIZE)
+            except OSError as e:
+                raise ArchiveError(
+                    f"Read error in {file_path} while compressing: {e}",
+                    archive_path=str(file_path),
+                    user_message=f"Error reading file {file_path.name}. File may be corrupted or unavailable."
+                )
+
+            last = len(chunk) < self.CHUNK_SIZE
+            member.crc = zlib.crc32(chunk, member.crc)
+            member.file_size += len(chunk)
+            if member.hasher:
+                member.hasher.update(chunk)
+            if self.bytes_callback and chunk:
+                self.bytes_callback(len(chunk))
+
+            pending.append((member, executor.submit(_deflate_chunk, chunk, zdict, self.compress_level, last),
+                            first, last))
+            while len(pending) > self.max_in_flight:
+                self._write_next(pending)
+
+            if last:
+                return
+            first = False
+            zdict = chunk[-DEFLATE_WINDOW:]
+
+    def _write_next(self, pending: Deque):
+        """Write the oldest compressed chunk, opening or closing its member as needed"""
+        member, future, first, last = pending.popleft()
+        if first:
+            self._begin_member(member)
+
+        data = future.result()
+        for target in member.targets:
+            target.zf.fp.write(data)
+        member.compress_size += len(data)
+
+        if last:
+            self._end_member(member)
+
+    def _begin_member(self, member: _MemberState):
+        """Write a provisional local header to every target (mirrors ZipFile._open_to_write)"""
+        for target in member.targets:
+            zf = target.zf
+            zinfo = target.zinfo
+            zinfo.flag_bits = 0
+            zinfo.CRC = 0
+            zinfo.compress_size = 0
+            if not zf._seekable:
+                zinfo.flag_bits |= zipfile._MASK_USE_DATA_DESCRIPTOR
+            # Same headroom rule zipfile uses; file_size is the stat size at this point
+            target.zip64 = zf._allowZip64 and zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+
+            if zf._seekable:
+                zf.fp.seek(zf.start_dir)
+            zinfo.header_offset = zf.fp.tell()
+            zf._writecheck(zinfo)
+            zf._didModify = True
+            zf.fp.write(zinfo.FileHeader(target.zip64))
+
+    def _end_member(self, member: _MemberState):
+        """Record CRC and sizes (patched header or data descriptor) and register the member"""
+        digest = member.hasher.hexdigest() if member.hasher else None
+        for target in member.targets:
+            zf = target.zf
+            zinfo = target.zinfo
+            zinfo.CRC = member.crc
+            zinfo.file_size = member.file_size
+            zinfo.compress_size = member.compress_size
+
+            if not target.zip64 and max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT:
+                raise ArchiveError(
+                    f"{zinfo.filename} grew past 4GB while being archived",
+                    archive_path=zinfo.filename,
+                    user_message="A file changed size while the archive was being created."
+                )
+
+            if zinfo.flag_bits & zipfile._MASK_USE_DATA_DESCRIPTOR:
+                fmt = '<LLQQ' if target.zip64 else '<LLLL'
+                zf.fp.write(struct.pack(fmt, zipfile._DD_SIGNATURE, zinfo.CRC,
+                                        zinfo.compress_size, zinfo.file_size))
+                zf.start_dir = zf.fp.tell()
+            else:
+                end_of_data = zf.fp.tell()
+                zf.fp.seek(zinfo.header_offset)
+                zf.fp.write(zinfo.FileHeader(target.zip64))
+                zf.fp.seek(end_of_data)
+                zf.start_dir = end_of_data
+
+            zf.filelist.append(zinfo)
+            zf.NameToInfo[zinfo.filename] = zinfo
+            if digest:
+                hashes = self.member_hashes if zf is self.zf else self.archive_member_hashes.setdefault(zf, {})
+                hashes[zinfo.filename] = (digest, member.file_size)
@@ -399,6 +399,11 @@ class ArchiveOperationResult(Result[List[Path]]):
     compression_level: int = 0
     processing_time: float = 0.0
     
+    # Filled when a hash manifest is requested, keyed by archive path
+    archive_hashes: Dict[str, str] = field(default_factory=dict)  # SHA-256 of the archive file
+    member_hashes: Dict[str, Dict[str, str]] = field(default_factory=dict)  # member name -> SHA-256
+    manifest_paths: List[Path] = field(default_factory=list)
+    
     @property
     def compression_ratio(self) -> float:
         """Calculate compression ratio as percentage"""
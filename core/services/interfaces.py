@@ -255,7 +255,9 @@ class IMediaAnalysisService(IService):
         self, 
         files: List[Path],
         settings: Any,  # MediaAnalysisSettings
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        cancel_check: Optional[callable] = None,
+        partial_result_callback: Optional[callable] = None
     ) -> Result[Any]:  # Result[MediaAnalysisResult]
         """
         Analyze media files and extract metadata
@@ -264,6 +266,8 @@ class IMediaAnalysisService(IService):
             files: List of media file paths to analyze
             settings: Analysis settings and field preferences
             progress_callback: Optional callback for progress updates
+            cancel_check: Optional callable returning True when the caller cancels
+            partial_result_callback: Optional callback receiving running result counts
             
         Returns:
             Result containing MediaAnalysisResult or error
@@ -403,6 +407,11 @@ class IMediaAnalysisService(IService):
             Result containing KML path or error
         """
         pass
+    
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Stop external extraction processes kept alive between calls"""
+        pass
 
 
 class IResourceManagementService(IService):
@@ -20,12 +20,15 @@ class SettingsManager:
         
         # Performance settings
         'COPY_BUFFER_SIZE': 'performance.copy_buffer_size',
+        'HASH_CACHE_MAX_MB': 'performance.hash_cache_max_mb',
+        'METADATA_CACHE_MAX_MB': 'performance.metadata_cache_max_mb',
         
         # Archive settings
         'ZIP_COMPRESSION_LEVEL': 'archive.compression_level',
         'ZIP_ENABLED': 'archive.zip_enabled',
         'ZIP_LEVEL': 'archive.zip_level',
         'ARCHIVE_METHOD': 'archive.method',  # 'native_7zip', 'buffered_python', 'auto'
+        'ZIP_HASH_MANIFEST': 'archive.hash_manifest',
         
         # User settings
         'TECHNICIAN_NAME': 'user.technician_name',
@@ -74,10 +77,13 @@ class SettingsManager:
             self.KEYS['CALCULATE_HASHES']: True,
             self.KEYS['HASH_ALGORITHM']: 'sha256',
             self.KEYS['COPY_BUFFER_SIZE']: 1048576,  # 1MB default
+            self.KEYS['HASH_CACHE_MAX_MB']: 256,
+            self.KEYS['METADATA_CACHE_MAX_MB']: 256,
             self.KEYS['ZIP_COMPRESSION_LEVEL']: 6,
             self.KEYS['ZIP_ENABLED']: 'enabled',
             self.KEYS['ZIP_LEVEL']: 'root',
             self.KEYS['ARCHIVE_METHOD']: 'native_7zip',  # Default to high-performance 7zip
+            self.KEYS['ZIP_HASH_MANIFEST']: False,
             self.KEYS['TIME_OFFSET_PDF']: True,
             self.KEYS['UPLOAD_LOG_PDF']: True,
             self.KEYS['HASH_CSV']: True,
@@ -176,6 +182,24 @@ class SettingsManager:
         # Clamp between 8KB and 10MB
         return min(max(size, 8192), 10485760)
     
+    @property
+    def hash_cache_max_size_mb(self) -> int:
+        """Size limit of the persistent hash cache in MB (0 = unlimited)"""
+        try:
+            size = int(self.get('HASH_CACHE_MAX_MB', 256))
+        except (TypeError, ValueError):
+            return 256
+        return max(size, 0)
+    
+    @property
+    def metadata_cache_max_size_mb(self) -> int:
+        """Size limit of the persistent media metadata cache in MB (0 = unlimited)"""
+        try:
+            size = int(self.get('METADATA_CACHE_MAX_MB', 256))
+        except (TypeError, ValueError):
+            return 256
+        return max(size, 0)
+    
     @property
     def technician_name(self) -> str:
         """Technician name for reports"""
@@ -224,6 +248,15 @@ class SettingsManager:
         else:
             raise ValueError(f"Invalid archive method: {value}. Must be 'native_7zip', 'buffered_python', or 'auto'")
     
+    @property
+    def zip_hash_manifest(self) -> bool:
+        """Whether to save a SHA-256 manifest alongside each archive"""
+        value = self.get('ZIP_HASH_MANIFEST', False)
+        # Handle QSettings string-to-bool conversion
+        if isinstance(value, str):
+            return value.lower() in ('true', '1', 'yes', 'on')
+        return bool(value)
+    
     @property
     def generate_time_offset_pdf(self) -> bool:
         """Whether to generate time offset PDF"""
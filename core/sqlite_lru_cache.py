@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+SQLite LRU Cache - Shared machinery for the persistent on-disk caches
+
+HashCache and MetadataCache keep their entries in a SQLite database in the
+application settings directory. This base class owns everything they have in
+common: the shared connection and its lock, the PRAGMAs, size-based LRU
+eviction, clearing/closing, and the process-wide shared instance.
+
+Subclasses define the schema and how keys and values are encoded. Their table
+must have a `path` column holding key(file_path) and a `last_used` column
+holding time.time() of the last lookup or store.
+
+Cache hits do not write to the database. The entries they touch are collected
+in memory and their last_used values are written in one batch on the next
+store, size check, flush() or close() (or every TOUCH_FLUSH_INTERVAL hits),
+so a re-run over a million unchanged files is not a million write
+transactions. Workers flush when a run ends, and the shared instances are
+closed at interpreter exit.
+"""
+
+import atexit
+import os
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional, Tuple, Union
+
+from core.logger import logger
+
+
+class SQLiteLRUCache:
+    """
+    SQLite-backed cache with size-based least-recently-used eviction
+
+    Thread-safe: a single connection is shared between worker threads and guarded
+    by a lock, so one instance can serve a whole worker pool.
+    """
+
+    DEFAULT_MAX_SIZE_BYTES = 256 * 1024 * 1024   # 256MB
+    EVICTION_FRACTION = 0.10                     # Drop oldest 10% when over limit
+    SIZE_CHECK_INTERVAL = 500                    # Check size every N stores
+    TOUCH_FLUSH_INTERVAL = 10000                 # Write pending last_used updates every N hits
+
+    # Defined by subclasses
+    NAME = "Cache"                # Used in log messages
+    TABLE = ""                    # Table holding the entries
+    KEY_COLUMNS = ("path",)       # Columns identifying one entry
+    DB_FILENAME = ""              # Database file in the settings directory
+    MAX_SIZE_SETTING = ""         # SettingsManager attribute with the limit in MB
+    _SCHEMA = ""
+
+    def __init__(self, db_path: Optional[Path] = None,
+                 max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        """
+        Open (or create) the cache database
+
+        Args:
+            db_path: Location of the SQLite database (None = default settings directory)
+            max_size_bytes: Size limit that triggers LRU eviction (0 = unlimited)
+        """
+        self.db_path = Path(db_path) if db_path else self.default_db_path()
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._stores_since_check = 0
+        self._touched: Dict[Tuple, float] = {}   # Entry key -> last_used not yet written
+        self._closed = False
+        self._lock = Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        # auto_vacuum must be configured before the first table is created
+        self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._conn.commit()
+
+        logger.debug(f"{type(self).__name__} opened: {self.db_path} (limit={max_size_bytes} bytes)")
+
+    @classmethod
+    def default_db_path(cls) -> Path:
+        """Default cache location alongside logs and batch recovery files"""
+        return Path.home() / '.folder_structure_utility' / cls.DB_FILENAME
+
+    @staticmethod
+    def key(file_path: Union[str, Path]) -> str:
+        """Normalize a path into a cache key without touching the filesystem"""
+        return os.path.normcase(os.path.abspath(str(file_path)))
+
+    def invalidate(self, file_path: Path):
+        """Remove all cache entries for a file"""
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.TABLE} WHERE path = ?", (self.key(file_path),))
+            self._conn.commit()
+
+    def clear(self):
+        """Remove every cache entry"""
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute(f"DELETE FROM {self.TABLE}")
+            self._conn.commit()
+            self._vacuum_locked()
+        logger.info(f"{self.NAME} cleared")
+
+    def size_bytes(self) -> int:
+        """Bytes currently used by live pages of the database"""
+        with self._lock:
+            return self._size_bytes_locked()
+
+    def enforce_size_limit(self):
+        """Evict least recently used entries until the database is under its limit"""
+        with self._lock:
+            self._enforce_size_limit_locked()
+
+    def flush(self):
+        """Write pending last_used updates from cache hits"""
+        with self._lock:
+            self._flush_touched_locked()
+
+    def _touch_locked(self, *entry_key):
+        """Record a cache hit; last_used is written later in a batch"""
+        self._touched[entry_key] = time.time()
+        if len(self._touched) >= self.TOUCH_FLUSH_INTERVAL:
+            self._flush_touched_locked()
+
+    def _flush_touched_locked(self):
+        if not self._touched:
+            return
+        where = " AND ".join(f"{column} = ?" for column in self.KEY_COLUMNS)
+        self._conn.executemany(
+            f"UPDATE {self.TABLE} SET last_used = MAX(last_used, ?) WHERE {where}",
+            [(last_used, *entry_key) for entry_key, last_used in self._touched.items()]
+        )
+        self._conn.commit()
+        self._touched.clear()
+
+    def _stored_locked(self):
+        """Count a store, enforcing the size limit every SIZE_CHECK_INTERVAL stores"""
+        self._flush_touched_locked()
+        self._stores_since_check += 1
+        if self._stores_since_check >= self.SIZE_CHECK_INTERVAL:
+            self._stores_since_check = 0
+            self._enforce_size_limit_locked()
+
+    def _size_bytes_locked(self) -> int:
+        page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return (page_count - freelist) * page_size
+
+    def _enforce_size_limit_locked(self):
+        self._flush_touched_locked()
+        if self.max_size_bytes <= 0:
+            return
+
+        evicted = 0
+        while self._size_bytes_locked() > self.max_size_bytes:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+            if total == 0:
+                break
+            batch = max(1, int(total * self.EVICTION_FRACTION))
+            self._conn.execute(
+                f"DELETE FROM {self.TABLE} WHERE rowid IN ("
+                f"SELECT rowid FROM {self.TABLE} ORDER BY last_used ASC LIMIT ?)",
+                (batch,)
+            )
+            self._conn.commit()
+            evicted += batch
+
+        if evicted:
+            self._vacuum_locked()
+            logger.info(f"{self.NAME} evicted {evicted} least recently used entries")
+
+    def _vacuum_locked(self):
+        """Return free pages to the filesystem and shrink the database file"""
+        # incremental_vacuum frees one page per step, so it must be run to completion
+        self._conn.execute("PRAGMA incremental_vacuum").fetchall()
+        # The main file is only truncated when the WAL is checkpointed into it
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+    def close(self):
+        """Write pending last_used updates and close the database connection"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush_touched_locked()
+            self._conn.close()
+        # A closed shared instance is replaced on the next get_shared()
+        with SQLiteLRUCache._shared_lock:
+            if type(self).__dict__.get('_shared_instance') is self:
+                type(self)._shared_instance = None
+
+    # Process-wide instance per subclass
+    _shared_instance = None
+    _shared_lock = Lock()
+
+    @classmethod
+    def get_shared(cls):
+        """
+        Get the process-wide cache of this class, opening it on first use
+
+        The size limit is read from SettingsManager (MAX_SIZE_SETTING, in MB).
+
+        Returns:
+            Shared instance, or None if the database could not be opened
+        """
+        with SQLiteLRUCache._shared_lock:
+            if cls.__dict__.get('_shared_instance') is None:
+                try:
+                    from core.settings_manager import settings
+                    max_size_mb = getattr(settings, cls.MAX_SIZE_SETTING)
+                    cls._shared_instance = cls(max_size_bytes=max_size_mb * 1024 * 1024)
+                    # Pending last_used updates from cache hits are written on close
+                    atexit.register(cls._shared_instance.close)
+                except Exception as e:
+                    logger.warning(f"{cls.NAME} unavailable, continuing without cache: {e}")
+                    return None
+            return cls._shared_instance
@@ -147,6 +147,11 @@ class ExifToolWorker(BaseWorkerThread):
                     user_message="An error occurred during ExifTool analysis."
                 )
             )
+        
+        finally:
+            # Don't leave -stay_open ExifTool processes running between analyses
+            if self.service:
+                self.service.shutdown()
     
     def _build_completion_message(self, results: ExifToolAnalysisResult) -> str:
         """
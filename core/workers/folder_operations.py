@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import List, Tuple, Optional, Dict, Any
 
 from core.buffered_file_ops import BufferedFileOperations, PerformanceMetrics
+from core.copy_journal import CopyJournal
 from core.workers.base_worker import FileWorkerThread
 from core.result_types import FileOperationResult, Result
 from core.exceptions import FileOperationError, ValidationError, ErrorSeverity
@@ -413,13 +414,21 @@ class FolderStructureThread(FileWorkerThread):
         self.logger.debug(f"  folder_items: {len(folder_items)}")
         self.logger.debug(f"  empty_dirs: {len(empty_dirs)}")
 
+        journal = None
         try:
+            # Checkpoint journal - a re-run after a crash or cancel skips verified files
+            try:
+                journal = CopyJournal.for_destination(self.destination)
+            except OSError as e:
+                self.logger.warning(f"Copy journal unavailable, copying without checkpoints: {e}")
+
             # Initialize buffered file operations
             self.buffered_ops = BufferedFileOperations(
                 progress_callback=self._handle_progress_update,
                 metrics_callback=self._handle_metrics_update,
                 cancelled_check=lambda: self.is_cancelled(),
-                pause_check=lambda: self.check_pause()
+                pause_check=lambda: self.check_pause(),
+                journal=journal
             )
             
             # Create empty directories first
@@ -649,11 +658,14 @@ class FolderStructureThread(FileWorkerThread):
 
                     items_for_processing.append(('file', source_file, relative_path))
 
-                # Use intelligent move/copy operation (respects user settings)
+                # Use intelligent move/copy operation (respects user settings).
+                # Copies to solid-state destinations verify on background workers.
                 operation_result = self.buffered_ops.move_files_preserving_structure(
                     items_for_processing,
                     self.destination,
-                    calculate_hash=self.calculate_hash
+                    calculate_hash=self.calculate_hash,
+                    deferred_verification=self.calculate_hash and
+                        self.buffered_ops.prefers_deferred_verification(self.destination)
                 )
 
                 # Handle Result object from move_files_preserving_structure
@@ -741,6 +753,8 @@ class FolderStructureThread(FileWorkerThread):
                     'total_failures': len(hash_failures)
                 })
             
+            if journal and result.success and not self.is_cancelled():
+                journal.discard()
             return result
             
         except Exception as e:
@@ -751,6 +765,9 @@ class FolderStructureThread(FileWorkerThread):
             )
             self.handle_error(error, {'stage': 'structure_copy'})
             return FileOperationResult(success=False, error=error, value=results)
+        finally:
+            if journal:
+                journal.close()
     
     def _handle_progress_update(self, percentage: int, message: str):
         """
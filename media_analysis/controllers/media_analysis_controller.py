@@ -381,6 +381,10 @@ class MediaAnalysisController(BaseController):
         if self.resources:
             self.resources.cleanup_all()
         
+        # Stop persistent ExifTool processes
+        if self._media_service is not None:
+            self._media_service.shutdown()
+        
         # Clear references
         self.current_worker = None
         self._current_worker_id = None
\ No newline at end of file
@@ -126,7 +126,10 @@ class MediaAnalysisSettings:
     # Processing options
     skip_non_media: bool = True
     timeout_seconds: float = 5.0
-    max_workers: int = 8
+    max_workers: int = 8  # Upper bound; the pool is sized for the source storage
+    adaptive_workers: bool = True  # Size the FFprobe pool from storage detection
+    use_metadata_cache: bool = True  # Serve unchanged files from the persistent metadata cache
+    keep_raw_json: bool = False  # Keep raw FFprobe JSON on each MediaMetadata (debugging only)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary for persistence"""
@@ -166,7 +169,10 @@ class MediaAnalysisSettings:
             "file_reference_format": self.file_reference_format.value,
             "skip_non_media": self.skip_non_media,
             "timeout_seconds": self.timeout_seconds,
-            "max_workers": self.max_workers
+            "max_workers": self.max_workers,
+            "adaptive_workers": self.adaptive_workers,
+            "use_metadata_cache": self.use_metadata_cache,
+            "keep_raw_json": self.keep_raw_json
         }
     
     @classmethod
@@ -231,6 +237,9 @@ class MediaAnalysisSettings:
         settings.skip_non_media = data.get("skip_non_media", True)
         settings.timeout_seconds = data.get("timeout_seconds", 5.0)
         settings.max_workers = data.get("max_workers", 8)
+        settings.adaptive_workers = data.get("adaptive_workers", True)
+        settings.use_metadata_cache = data.get("use_metadata_cache", True)
+        settings.keep_raw_json = data.get("keep_raw_json", False)
         
         return settings
 
@@ -7,7 +7,7 @@ Implements IMediaAnalysisService interface with full SOA compliance
 import time
 import csv
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple, FrozenSet
 from collections import defaultdict
 
 from core.services.interfaces import IMediaAnalysisService
@@ -16,6 +16,7 @@ from core.models import FormData
 from .media_analysis_models import (
     MediaAnalysisSettings, MediaAnalysisResult, MediaMetadata
 )
+from .metadata_cache import MetadataCache, get_metadata_cache
 from core.result_types import Result
 from core.exceptions import (
     ValidationError, MediaAnalysisError, FFProbeNotFoundError,
@@ -32,10 +33,20 @@ from ..exiftool.exiftool_models import (
 )
 from core.logger import logger
 
+# Storage-aware pool sizing shared with the hashing tabs
+try:
+    from copy_hash_verify.core.storage_detector import StorageDetector, StorageInfo, DriveType
+    from copy_hash_verify.utils.thread_calculator import ThreadCalculator
+    STORAGE_DETECTION_AVAILABLE = True
+except ImportError:
+    STORAGE_DETECTION_AVAILABLE = False
+
 
 class MediaAnalysisService(BaseService, IMediaAnalysisService):
     """Service for media analysis operations"""
     
+    PARTIAL_RESULT_INTERVAL = 0.5  # Seconds between partial result snapshots
+    
     def __init__(self):
         """Initialize media analysis service"""
         super().__init__("MediaAnalysisService")
@@ -50,6 +61,12 @@ class MediaAnalysisService(BaseService, IMediaAnalysisService):
         self.exiftool_wrapper = None
         self.exiftool_normalizer = ExifToolNormalizer()
         
+        # Persistent raw-output cache, opened on first use
+        self.metadata_cache: Optional[MetadataCache] = None
+        
+        # Storage detection results per drive, so each drive is only probed once
+        self._storage_info: Dict[str, 'StorageInfo'] = {}
+        
         # Initialize FFprobe wrapper if binary is available
         if self.ffprobe_manager.is_available():
             try:
@@ -161,15 +178,25 @@ class MediaAnalysisService(BaseService, IMediaAnalysisService):
         self,
         files: List[Path],
         settings: MediaAnalysisSettings,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        partial_result_callback: Optional[Callable[[MediaAnalysisResult], None]] = None
     ) -> Result[MediaAnalysisResult]:
         """
         Analyze media files and extract metadata
         
+        Results are normalized as each probe completes and their raw FFprobe
+        output is released straight away, so at most one raw payload per worker
+        is alive at any time.
+        
         Args:
             files: List of media file paths to analyze
             settings: Analysis settings and field preferences
             progress_callback: Optional callback for progress updates
+            cancel_check: Optional callable returning True to stop after running probes finish
+            partial_result_callback: Optional callback receiving running MediaAnalysisResult
+                snapshots (throttled to PARTIAL_RESULT_INTERVAL). Snapshots carry the counts
+                and timing only; metadata_list is filled in the final result.
             
         Returns:
             Result containing MediaAnalysisResult or error
@@ -193,22 +220,12 @@ class MediaAnalysisService(BaseService, IMediaAnalysisService):
             self._log_operation("analyze_media_files", f"Starting analysis of {len(files)} files")
             start_time = time.time()
             
-            # Extract metadata in parallel using FFprobe wrapper with optimized commands
-            raw_results = self.ffprobe_wrapper.extract_batch(
-                files,
-                settings=settings,  # Pass settings for optimized extraction
-                max_workers=settings.max_workers,
-                progress_callback=progress_callback
-            )
-            
-            # Process and normalize results
+            # Process and normalize results as each file completes
             metadata_list = []
             errors = []
-            successful = 0
-            failed = 0
-            skipped = 0
+            counts = {'successful': 0, 'failed': 0, 'skipped': 0}
             
-            for file_path, extraction_result in raw_results.items():
+            def handle_result(file_path: Path, extraction_result: Result):
                 if extraction_result.success:
                     try:
                         raw_data = extraction_result.value
@@ -235,13 +252,17 @@ class MediaAnalysisService(BaseService, IMediaAnalysisService):
                         # No need to filter fields - we only extracted what was requested!
                         # The command builder already optimized the extraction
                         
+                        # Drop the raw payload (and any frame arrays) once normalized
+                        if not getattr(settings, 'keep_raw_json', False):
+                            normalized.raw_json = None
+                        
                         metadata_list.append(normalized)
-                        successful += 1
+                        counts['successful'] += 1
                         
                     except Exception as e:
                         logger.warning(f"Failed to normalize metadata for {file_path.name}: {e}")
                         errors.append(f"{file_path.name}: Failed to process metadata")
-                        failed += 1
+                        counts['failed'] += 1
                 else:
                     # Check if it's a non-media file (expected) or actual error
                     error_msg = str(extraction_result.error)
@@ -249,13 +270,84 @@ class MediaAnalysisService(BaseService, IMediaAnalysisService):
                         if not settings.skip_non_media:
                             # Include non-media files as skipped
                             errors.append(f"{file_path.name}: Not a media file")
-                        skipped += 1
+                        counts['skipped'] += 1
                         logger.debug(f"Skipped non-media file: {file_path.name}")
                     else:
                         # Actual error
                         errors.append(f"{file_path.name}: {extraction_result.error.user_message}")
-                        failed += 1
+                        counts['failed'] += 1
                         logger.warning(f"Extraction error for {file_path.name}: {extraction_result.error}")
+                
+                emit_partial()
+            
+            last_partial = [time.time()]
+            
+            def emit_partial():
+                """Send the running totals, at most every PARTIAL_RESULT_INTERVAL"""
+                now = time.time()
+                if not partial_result_callback or now - last_partial[0] < self.PARTIAL_RESULT_INTERVAL:
+                    return
+                last_partial[0] = now
+                elapsed = now - start_time
+                partial = MediaAnalysisResult(
+                    total_files=len(files),
+                    successful=counts['successful'],
+                    failed=counts['failed'],
+                    skipped=counts['skipped'],
+                    metadata_list=[],
+                    processing_time=elapsed,
+                    errors=errors[:100]
+                )
+                partial.files_per_second = sum(counts.values()) / elapsed if elapsed > 0 else 0.0
+                partial_result_callback(partial)
+            
+            # Serve unchanged files from the metadata cache
+            cache = self._get_metadata_cache(getattr(settings, 'use_metadata_cache', True))
+            to_extract = files
+            if cache:
+                signature, entries = self.ffprobe_wrapper.command_builder.get_cache_signature(
+                    self.ffprobe_wrapper.binary_path, settings)
+                _, to_extract, stats = self._lookup_cached_metadata(
+                    cache, 'ffprobe', signature, entries, files,
+                    lambda raw: self.ffprobe_wrapper.command_builder.filter_to_selection(raw, entries),
+                    on_hit=lambda file_path, raw: handle_result(file_path, Result.success(raw))
+                )
+            
+            hits = len(files) - len(to_extract)
+            batch_progress = progress_callback
+            if progress_callback and hits:
+                progress_callback(hits, len(files))
+                batch_progress = lambda completed, total: progress_callback(completed + hits, len(files))
+            
+            def on_extracted(file_path: Path, extraction_result: Result):
+                if cache and extraction_result.success and file_path in stats:
+                    cache.store(file_path, 'ffprobe', signature, entries, stats[file_path],
+                                self._strip_extraction_fields(extraction_result.value))
+                handle_result(file_path, extraction_result)
+            
+            # Extract metadata in parallel using FFprobe wrapper with optimized commands,
+            # sized for the storage the files live on
+            self.ffprobe_wrapper.extract_batch(
+                to_extract,
+                settings=settings,  # Pass settings for optimized extraction
+                max_workers=self._resolve_ffprobe_workers(to_extract, settings),
+                progress_callback=batch_progress,
+                cancel_check=cancel_check,
+                result_callback=on_extracted,
+                collect_results=False  # Each raw result is released once normalized
+            )
+            
+            if cancel_check and cancel_check():
+                return Result.error(
+                    MediaAnalysisError(
+                        f"Media analysis cancelled after {len(metadata_list)} of {len(files)} files",
+                        user_message="Media analysis was cancelled."
+                    )
+                )
+            
+            successful = counts['successful']
+            failed = counts['failed']
+            skipped = counts['skipped']
             
             processing_time = time.time() - start_time
             
@@ -282,6 +374,8 @@ class MediaAnalysisService(BaseService, IMediaAnalysisService):
             )
             self._handle_error(error)
             return Result.error(error)
+        finally:
+            self._flush_metadata_cache()
     
     def generate_analysis_report(
         self,
@@ -723,6 +817,19 @@ class MediaAnalysisService(BaseService, IMediaAnalysisService):
         """
         return self.ffprobe_manager.get_status_info()
     
+    def shutdown(self):
+        """
+        Stop the persistent ExifTool processes and close the metadata cache
+        
+        Safe to call at any time: the next ExifTool analysis starts new ones
+        and the next cached analysis reopens the cache.
+        """
+        if self.exiftool_wrapper:
+            self.exiftool_wrapper.close()
+        if self.metadata_cache:
+            self.metadata_cache.close()
+            self.metadata_cache = None
+    
     # ========== ExifTool Methods ==========
     
     def analyze_with_exiftool(
@@ -765,12 +872,42 @@ class MediaAnalysisService(BaseService, IMediaAnalysisService):
             logger.info(f"MEDIA SERVICE - extract_thumbnails setting: {getattr(settings, 'extract_thumbnails', False)}")
             start_time = time.time()
             
+            # Serve unchanged files from the metadata cache
+            cache = self._get_metadata_cache(getattr(settings, 'use_metadata_cache', True))
+            cached = {}
+            to_extract = files
+            if cache:
+                builder = self.exiftool_wrapper.command_builder
+                signature, tags = builder.get_cache_signature(self.exiftool_wrapper.binary_path, settings)
+                cached, to_extract, stats = self._lookup_cached_metadata(
+                    cache, 'exiftool', signature, tags, files,
+                    lambda raw: builder.filter_to_selection(raw, tags)
+                )
+            
+            batch_progress = progress_callback
+            if progress_callback and cached:
+                share = len(to_extract) / len(files)
+                done = 100.0 * len(cached) / len(files)
+                progress_callback(done, f"Loaded {len(cached)}/{len(files)} files from metadata cache")
+                batch_progress = lambda progress, message: progress_callback(done + progress * share, message)
+            
             # Extract metadata using ExifTool
-            raw_metadata_list, errors = self.exiftool_wrapper.extract_batch(
-                files,
-                settings,
-                progress_callback=progress_callback
-            )
+            raw_metadata_list, errors = [], []
+            if to_extract:
+                raw_metadata_list, errors = self.exiftool_wrapper.extract_batch(
+                    to_extract,
+                    settings,
+                    progress_callback=batch_progress
+                )
+            
+            if cache:
+                pending = {MetadataCache.key(path): path for path in to_extract}
+                for raw in raw_metadata_list:
+                    path = pending.get(MetadataCache.key(raw.get('SourceFile', '')))
+                    if path is not None and path in stats:
+                        cache.store(path, 'exiftool', signature, tags, stats[path],
+                                    self._strip_extraction_fields(raw))
+                raw_metadata_list = list(cached.values()) + raw_metadata_list
             
             # Normalize metadata
             metadata_list = []
@@ -853,6 +990,126 @@ class MediaAnalysisService(BaseService, IMediaAnalysisService):
             )
             self._handle_error(error)
             return Result.error(error)
+        finally:
+            self._flush_metadata_cache()
+    
+    def _resolve_ffprobe_workers(self, files: List[Path], settings: MediaAnalysisSettings) -> int:
+        """
+        Size the FFprobe pool for the storage holding the files
+        
+        ThreadCalculator's hash rules give the CPU-aware count; seek-bound devices
+        (HDD, USB HDD, network shares) are further capped at StorageDetector's
+        per-drive recommendation because every probe is a random header read.
+        settings.max_workers stays the upper bound.
+        
+        Args:
+            files: Files about to be probed
+            settings: Analysis settings (max_workers, adaptive_workers)
+            
+        Returns:
+            Worker count to use
+        """
+        max_workers = max(1, settings.max_workers)
+        if not files or not STORAGE_DETECTION_AVAILABLE or not getattr(settings, 'adaptive_workers', True):
+            return max_workers
+        
+        try:
+            sample = files[0].parent
+            drive = sample.anchor or str(sample)
+            info = self._storage_info.get(drive)
+            if info is None:
+                info = StorageDetector().analyze_path(sample)
+                self._storage_info[drive] = info
+            
+            threads = ThreadCalculator().calculate_optimal_threads(
+                source_info=info,
+                dest_info=None,
+                file_count=len(files),
+                operation_type="hash"
+            )
+            if info.drive_type in (DriveType.HDD, DriveType.EXTERNAL_HDD, DriveType.NETWORK):
+                threads = min(threads, StorageDetector.THREAD_RECOMMENDATIONS[info.drive_type])
+            
+            workers = max(1, min(threads, max_workers))
+            logger.info(f"FFprobe workers: {workers} for {info.drive_type.value} storage "
+                       f"(max {max_workers}, {info.detection_method})")
+            return workers
+        except Exception as e:
+            logger.warning(f"Storage detection failed, using {max_workers} FFprobe workers: {e}")
+            return max_workers
+    
+    def _get_metadata_cache(self, enabled: bool = True) -> Optional[MetadataCache]:
+        """Metadata cache for this service (None when disabled or unavailable)"""
+        if not enabled:
+            return None
+        if self.metadata_cache is None:
+            self.metadata_cache = get_metadata_cache()
+        return self.metadata_cache
+    
+    def _flush_metadata_cache(self):
+        """Write last_used of this run's cache hits (they are batched in memory)"""
+        if self.metadata_cache:
+            try:
+                self.metadata_cache.flush()
+            except Exception as e:
+                logger.warning(f"Could not update metadata cache usage: {e}")
+    
+    def _lookup_cached_metadata(
+        self,
+        cache: MetadataCache,
+        tool: str,
+        signature: str,
+        fields: FrozenSet[str],
+        files: List[Path],
+        filter_to_selection: Callable[[Dict[str, Any]], Dict[str, Any]],
+        on_hit: Optional[Callable[[Path, Dict[str, Any]], None]] = None
+    ) -> Tuple[Dict[Path, Dict[str, Any]], List[Path], Dict[Path, Any]]:
+        """
+        Split files into cache hits and files that still need extracting
+        
+        Args:
+            cache: Metadata cache to consult
+            tool: Extraction tool name
+            signature: Command options signature from the command builder
+            fields: Fields the command requests
+            files: Files to analyze
+            filter_to_selection: Reduces a cached superset to `fields`
+            on_hit: If given, each hit is passed here as it is read instead of being collected
+            
+        Returns:
+            Tuple of (raw output by path for hits, paths to extract, stat by path for misses)
+        """
+        hits = {}
+        hit_count = 0
+        misses = []
+        stats = {}
+        for file_path in files:
+            try:
+                stat_result = file_path.stat()
+            except OSError:
+                misses.append(file_path)  # Let the extractor report the problem
+                continue
+            
+            entry = cache.lookup(file_path, tool, signature, fields, stat_result)
+            if entry is None:
+                misses.append(file_path)
+                stats[file_path] = stat_result
+            else:
+                payload = entry.payload if entry.fields == fields else filter_to_selection(entry.payload)
+                hit_count += 1
+                if on_hit:
+                    on_hit(file_path, payload)
+                else:
+                    hits[file_path] = payload
+        
+        if hit_count:
+            logger.info(f"Metadata cache: {hit_count}/{len(files)} files served from cache ({tool})")
+        return hits, misses, stats
+    
+    @staticmethod
+    def _strip_extraction_fields(raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Raw tool output without per-run metrics such as _extraction_time"""
+        return {key: value for key, value in raw.items() if not key.startswith('_')}
     
     def get_exiftool_status(self) -> Dict[str, Any]:
         """
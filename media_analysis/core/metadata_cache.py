@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Metadata Cache - Persistent store of raw FFprobe / ExifTool output
+
+Re-analysing the same evidence folder (a second run, a different report, a
+changed field selection) used to re-launch FFprobe and ExifTool for every file.
+This cache keeps the raw JSON each tool returned in a SQLite database next to
+the hash cache, zlib-compressed, so unchanged files are answered without
+spawning a process.
+
+Entries are keyed by absolute path, tool and the command's option signature
+(every argument that is not a field selection). Each entry also records the set
+of fields its command requested, and is only honoured while the file's size and
+mtime are unchanged. A request whose fields are a subset of a cached entry's
+fields is a hit: the caller filters the cached superset down to what it asked
+for.
+
+Eviction is size-based, least recently used first (see SQLiteLRUCache).
+"""
+
+import json
+import os
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, FrozenSet, Iterable, Optional
+
+from core.logger import logger
+from core.sqlite_lru_cache import SQLiteLRUCache
+
+
+@dataclass(frozen=True)
+class CachedMetadata:
+    """Raw tool output served from the cache"""
+    payload: Any
+    fields: FrozenSet[str]  # Fields the cached command requested (superset of the lookup)
+
+
+class MetadataCache(SQLiteLRUCache):
+    """
+    SQLite-backed persistent cache of raw metadata extraction output
+
+    Thread-safe: one connection is shared between worker threads and guarded by
+    a lock, so one instance can serve the whole extraction pool.
+    """
+
+    SIZE_CHECK_INTERVAL = 200                    # Check size every N stores
+    COMPRESSION_LEVEL = 6
+
+    NAME = "Metadata cache"
+    TABLE = "metadata"
+    KEY_COLUMNS = ("path", "tool", "signature")
+    DB_FILENAME = "metadata_cache.sqlite3"
+    MAX_SIZE_SETTING = "metadata_cache_max_size_mb"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS metadata (
+            path TEXT NOT NULL,
+            tool TEXT NOT NULL,
+            signature TEXT NOT NULL,
+            fields TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            payload BLOB NOT NULL,
+            last_used REAL NOT NULL,
+            PRIMARY KEY (path, tool, signature)
+        );
+        CREATE INDEX IF NOT EXISTS idx_metadata_last_used ON metadata(last_used);
+    """
+
+    def lookup(self, file_path: Path, tool: str, signature: str,
+               fields: Iterable[str], stat_result: os.stat_result) -> Optional[CachedMetadata]:
+        """
+        Return cached output covering the requested fields if the file is unchanged
+
+        Args:
+            file_path: File being analyzed
+            tool: Extraction tool ('ffprobe' or 'exiftool')
+            signature: Command options that shape the output, excluding field selection
+            fields: Fields the caller is about to request
+            stat_result: Current stat() of the file
+
+        Returns:
+            CachedMetadata whose fields are a superset of `fields`, or None on miss
+        """
+        key = self.key(file_path)
+        wanted = frozenset(fields)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fields, size, mtime_ns, payload FROM metadata "
+                "WHERE path = ? AND tool = ? AND signature = ?",
+                (key, tool, signature)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            cached_fields, size, mtime_ns, blob = row
+            if (size, mtime_ns) != (stat_result.st_size, stat_result.st_mtime_ns):
+                # File changed since it was analyzed - entry is stale
+                self._conn.execute(
+                    "DELETE FROM metadata WHERE path = ? AND tool = ? AND signature = ?",
+                    (key, tool, signature)
+                )
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            cached_fields = frozenset(json.loads(cached_fields))
+            if not wanted <= cached_fields:
+                self.misses += 1
+                return None
+
+            try:
+                payload = json.loads(zlib.decompress(blob))
+            except (zlib.error, ValueError) as e:
+                logger.warning(f"Discarding unreadable metadata cache entry for {key}: {e}")
+                self._conn.execute(
+                    "DELETE FROM metadata WHERE path = ? AND tool = ? AND signature = ?",
+                    (key, tool, signature)
+                )
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._touch_locked(key, tool, signature)
+            self.hits += 1
+            return CachedMetadata(payload=payload, fields=cached_fields)
+
+    def store(self, file_path: Path, tool: str, signature: str,
+              fields: Iterable[str], stat_result: os.stat_result, payload: Any):
+        """
+        Record freshly extracted tool output
+
+        Replaces any entry for the same file, tool and signature.
+
+        Args:
+            file_path: File that was analyzed
+            tool: Extraction tool ('ffprobe' or 'exiftool')
+            signature: Command options that shape the output, excluding field selection
+            fields: Fields the command requested
+            stat_result: stat() of the file taken before extraction started
+            payload: Parsed JSON output of the tool
+        """
+        blob = zlib.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'),
+                             self.COMPRESSION_LEVEL)
+        field_list = json.dumps(sorted(set(fields)))
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metadata "
+                "(path, tool, signature, fields, size, mtime_ns, payload, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.key(file_path), tool, signature, field_list, stat_result.st_size,
+                 stat_result.st_mtime_ns, blob, time.time())
+            )
+            self._conn.commit()
+            self._stored_locked()
+
+
+def get_metadata_cache() -> Optional[MetadataCache]:
+    """
+    Get the process-wide metadata cache, opening it on first use
+
+    The size limit is read from SettingsManager ('performance.metadata_cache_max_mb').
+
+    Returns:
+        Shared MetadataCache, or None if the database could not be opened
+    """
+    return MetadataCache.get_shared()
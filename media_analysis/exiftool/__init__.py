@@ -7,6 +7,7 @@ Provides GPS extraction, device identification, and temporal analysis
 from .exiftool_binary_manager import ExifToolBinaryManager
 from .exiftool_command_builder import ExifToolForensicCommandBuilder
 from .exiftool_wrapper import ExifToolWrapper
+from .exiftool_pool import ExifToolPool
 from .exiftool_normalizer import ExifToolNormalizer
 from .exiftool_models import (
     GPSData,
@@ -21,6 +22,7 @@ __all__ = [
     'ExifToolBinaryManager',
     'ExifToolForensicCommandBuilder', 
     'ExifToolWrapper',
+    'ExifToolPool',
     'ExifToolNormalizer',
     'GPSData',
     'ExifToolMetadata',
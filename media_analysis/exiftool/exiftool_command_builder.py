@@ -5,8 +5,9 @@ Dynamically builds optimized commands based on user settings
 Following successful FFProbeCommandBuilder pattern
 """
 
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import List, Dict, Any, Set, Optional, Tuple
+from typing import List, Dict, Any, Set, Optional, Tuple, FrozenSet
 from dataclasses import dataclass
 from core.logger import logger
 
@@ -108,6 +109,18 @@ class ExifToolForensicCommandBuilder:
         ]
     }
     
+    # Embedded image tags requested when thumbnails are extracted
+    THUMBNAIL_TAGS = [
+        '-ThumbnailImage',     # JPEG thumbnail (most common)
+        '-PreviewImage',       # Larger preview image
+        '-JpgFromRaw',         # JPEG extracted from RAW
+    ]
+    
+    # Shortcut tags that expand to several output keys
+    TAG_ALIASES = {
+        'alldates': ['DateTimeOriginal', 'CreateDate', 'ModifyDate'],
+    }
+    
     # Command optimization cache
     def __init__(self):
         """Initialize command builder with caching"""
@@ -194,6 +207,61 @@ class ExifToolForensicCommandBuilder:
             str(file_path)
         ]
     
+    def get_cache_signature(
+        self,
+        binary_path: Path,
+        settings: 'ExifToolSettings'
+    ) -> Tuple[str, FrozenSet[str]]:
+        """
+        Split the base command for these settings into output options and tag requests
+        
+        Used by the metadata cache: output of a command whose tags are a superset of
+        another's (with the same options) can be filtered down to answer it.
+        
+        Args:
+            binary_path: Path to ExifTool binary
+            settings: ExifTool settings with field selections
+            
+        Returns:
+            Tuple of (options signature, requested tag arguments)
+        """
+        known_tags = set(self.THUMBNAIL_TAGS)
+        for tags in self.FORENSIC_FIELDS.values():
+            known_tags.update(tags)
+        
+        cmd = self._build_base_command(binary_path, settings)[1:]
+        options = [arg for arg in cmd if arg not in known_tags]
+        tags = frozenset(arg for arg in cmd if arg in known_tags)
+        return ' '.join(options), tags
+    
+    def filter_to_selection(self, raw: Dict[str, Any], tags: FrozenSet[str]) -> Dict[str, Any]:
+        """
+        Reduce one file's ExifTool output to the keys a narrower command would print
+        
+        Without -G, JSON keys are bare tag names, so each '-Group:Tag*' argument is
+        matched against keys by its tag-name pattern ('-GPS:all' keeps GPS* keys).
+        
+        Args:
+            raw: Parsed ExifTool JSON object produced with a superset of `tags`
+            tags: Tag arguments from get_cache_signature()
+            
+        Returns:
+            New dict with SourceFile and the keys matched by `tags`
+        """
+        patterns = []
+        for tag in tags:
+            group, _, name = tag.lstrip('-').rpartition(':')
+            if name.lower() == 'all':
+                patterns.append(f"{group}*")
+            else:
+                patterns.extend(self.TAG_ALIASES.get(name.lower(), [name]))
+        patterns = [p.lower() for p in patterns]
+        
+        return {
+            key: value for key, value in raw.items()
+            if key == 'SourceFile' or any(fnmatchcase(key.lower(), p) for p in patterns)
+        }
+    
     def _build_base_command(
         self,
         binary_path: Path,
@@ -260,12 +328,8 @@ class ExifToolForensicCommandBuilder:
         if extract_thumbnails:
             logger.info("THUMBNAIL EXTRACTION ENABLED - Adding thumbnail tags to command")
             # Extract specific thumbnail fields as base64
-            cmd.extend([
-                '-ThumbnailImage',     # JPEG thumbnail (most common)
-                '-PreviewImage',       # Larger preview image
-                '-JpgFromRaw',        # JPEG extracted from RAW
-                '-b'                  # Binary output as base64 in JSON
-            ])
+            cmd.extend(self.THUMBNAIL_TAGS)
+            cmd.append('-b')  # Binary output as base64 in JSON
         elif getattr(settings, 'extract_binary', False):
             # Extract ALL binary data
             cmd.append('-b')
@@ -323,6 +323,7 @@ class ExifToolSettings:
     batch_size: int = 50
     max_workers: int = 4
     timeout_per_file: float = 10.0
+    use_metadata_cache: bool = True  # Serve unchanged files from the persistent metadata cache
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -341,7 +342,8 @@ class ExifToolSettings:
             'obfuscate_gps': self.obfuscate_gps,
             'batch_size': self.batch_size,
             'max_workers': self.max_workers,
-            'timeout_per_file': self.timeout_per_file
+            'timeout_per_file': self.timeout_per_file,
+            'use_metadata_cache': self.use_metadata_cache
         }
     
     @classmethod
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Persistent ExifTool processes using -stay_open
+Avoids paying Perl/ExifTool startup for every batch and every single-file call
+"""
+
+import queue
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from core.logger import logger
+
+
+class ExifToolProcess:
+    """
+    One long-lived `exiftool -stay_open True -@ -` process
+
+    Arguments are written to stdin one per line and terminated with
+    `-execute{N}`. ExifTool answers on stdout followed by a `{readyN}` line;
+    `-echo4 {readyN}` puts the same marker on stderr so both streams can be
+    framed per command. Both pipes are drained by reader threads so that a
+    chatty stderr can never block stdout, and so reads can time out.
+    """
+
+    def __init__(self, binary_path: Path):
+        """
+        Args:
+            binary_path: Path to ExifTool binary
+        """
+        self.binary_path = binary_path
+        self.process: Optional[subprocess.Popen] = None
+        self._stdout_lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._stderr_lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._sequence = 0
+        self.commands_executed = 0
+
+    def start(self):
+        """Launch the process and its pipe readers"""
+        self._stdout_lines = queue.Queue()
+        self._stderr_lines = queue.Queue()
+        self.process = subprocess.Popen(
+            [str(self.binary_path), '-stay_open', 'True', '-@', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            startupinfo=self._get_subprocess_startupinfo()
+        )
+        for stream, lines in ((self.process.stdout, self._stdout_lines),
+                              (self.process.stderr, self._stderr_lines)):
+            threading.Thread(target=self._drain, args=(stream, lines), daemon=True).start()
+        logger.debug(f"Started persistent ExifTool process (pid {self.process.pid})")
+
+    def is_alive(self) -> bool:
+        """Whether the process is running"""
+        return self.process is not None and self.process.poll() is None
+
+    def execute(self, args: List[str], timeout: float) -> Tuple[str, str]:
+        """
+        Run one ExifTool command in the persistent process
+
+        Args:
+            args: ExifTool arguments (command-builder output without the binary)
+            timeout: Seconds to wait for the {ready} marker
+
+        Returns:
+            Tuple of (stdout, stderr) for this command
+
+        Raises:
+            subprocess.TimeoutExpired: If ExifTool does not answer in time
+            BrokenPipeError: If the process has exited
+        """
+        self._sequence += 1
+        marker = f"{{ready{self._sequence}}}"
+        lines = list(args) + ['-charset', 'filename=utf8', '-echo4', marker, f'-execute{self._sequence}']
+
+        self.process.stdin.write('\n'.join(lines) + '\n')
+        self.process.stdin.flush()
+
+        deadline = time.monotonic() + timeout
+        stdout = self._read_until(self._stdout_lines, marker, deadline, args, timeout)
+        stderr = self._read_until(self._stderr_lines, marker, deadline, args, timeout)
+        self.commands_executed += 1
+        return stdout, stderr
+
+    def close(self, timeout: float = 2.0):
+        """Ask ExifTool to exit, killing it if it does not"""
+        if self.process is None:
+            return
+        try:
+            if self.process.poll() is None:
+                self.process.stdin.write('-stay_open\nFalse\n')
+                self.process.stdin.flush()
+                self.process.wait(timeout=timeout)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.process.kill()
+            try:
+                self.process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                pass
+        finally:
+            for stream in (self.process.stdin, self.process.stdout, self.process.stderr):
+                try:
+                    stream.close()
+                except (OSError, ValueError):
+                    pass
+            self.process = None
+
+    def _read_until(self, lines: queue.Queue, marker: str, deadline: float,
+                    args: List[str], timeout: float) -> str:
+        """Collect lines from a pipe until the command's ready marker"""
+        collected = []
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                line = lines.get(timeout=max(remaining, 0.001))
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(args, timeout)
+            if line is None:
+                raise BrokenPipeError("ExifTool process exited")
+            if line.rstrip('\r\n') == marker:
+                return ''.join(collected)
+            collected.append(line)
+
+    @staticmethod
+    def _drain(stream, lines: queue.Queue):
+        """Reader thread: move pipe lines into a queue, None marks EOF"""
+        try:
+            for line in iter(stream.readline, ''):
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        lines.put(None)
+
+    @staticmethod
+    def _get_subprocess_startupinfo():
+        """Hide the console window on Windows"""
+        if hasattr(subprocess, 'STARTUPINFO'):
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = subprocess.SW_HIDE
+            return startupinfo
+        return None
+
+
+class ExifToolPool:
+    """
+    Fixed set of persistent ExifTool processes shared by all extraction calls
+
+    A caller borrows a process for one command. Dead processes are restarted
+    when borrowed, and a process that times out or breaks mid-command is
+    replaced before it is handed out again.
+    """
+
+    def __init__(self, binary_path: Path, size: int = 4):
+        """
+        Args:
+            binary_path: Path to ExifTool binary
+            size: Number of processes (usually settings.max_workers)
+        """
+        self.binary_path = binary_path
+        self.size = 0
+        self._idle: "queue.Queue[ExifToolProcess]" = queue.Queue()
+        self._all: List[ExifToolProcess] = []
+        self._lock = threading.Lock()
+        self.restarts = 0
+        self.closed = False
+        self.resize(size)
+
+    def resize(self, size: int):
+        """Grow the pool to at least `size` processes (processes start on first use)"""
+        with self._lock:
+            while self.size < max(size, 1):
+                process = ExifToolProcess(self.binary_path)
+                self._all.append(process)
+                self._idle.put(process)
+                self.size += 1
+
+    def execute(self, args: List[str], timeout: float) -> Tuple[str, str]:
+        """
+        Run ExifTool arguments on an idle process
+
+        Args:
+            args: ExifTool arguments without the binary path
+            timeout: Seconds to wait for the answer
+
+        Returns:
+            Tuple of (stdout, stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: If the command timed out (process is restarted)
+            OSError: If ExifTool cannot be started or dies mid-command
+        """
+        if self.closed:
+            raise RuntimeError("ExifTool pool is closed")
+
+        process = self._idle.get()
+        try:
+            if not process.is_alive():
+                if process.process is not None:
+                    logger.warning("Persistent ExifTool process died, restarting")
+                    self.restarts += 1
+                    process.close()
+                process.start()
+            return process.execute(args, timeout)
+        except (subprocess.TimeoutExpired, OSError):
+            # Output of an interrupted command would leak into the next one
+            process.close(timeout=0.5)
+            self.restarts += 1
+            raise
+        finally:
+            self._idle.put(process)
+
+    @property
+    def commands_executed(self) -> int:
+        """Commands answered by all processes so far"""
+        return sum(process.commands_executed for process in self._all)
+
+    def close(self):
+        """Stop all processes"""
+        self.closed = True
+        with self._lock:
+            for process in self._all:
+                process.close()
@@ -2,6 +2,7 @@
 """
 ExifTool Wrapper for batch metadata extraction
 Handles subprocess execution with parallelization and timeout protection
+Commands run on a pool of persistent -stay_open ExifTool processes when possible
 """
 
 import json
@@ -10,10 +11,11 @@ import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
-from threading import Event
+from threading import Event, Lock
 
 from .exiftool_models import ExifToolMetadata, ExifToolSettings
 from .exiftool_command_builder import ExifToolForensicCommandBuilder
+from .exiftool_pool import ExifToolPool
 from core.logger import logger
 from core.exceptions import MediaExtractionError
 
@@ -24,16 +26,21 @@ class ExifToolWrapper:
     Follows FFProbeWrapper patterns for consistency
     """
     
-    def __init__(self, binary_path: Path):
+    def __init__(self, binary_path: Path, persistent: bool = True):
         """
         Initialize wrapper with ExifTool binary
         
         Args:
             binary_path: Path to validated ExifTool binary
+            persistent: Reuse long-lived -stay_open processes instead of one
+                subprocess per command (falls back automatically if they fail)
         """
         self.binary_path = binary_path
         self.command_builder = ExifToolForensicCommandBuilder()
         self.cancel_event = Event()
+        self.persistent = persistent
+        self._pool: Optional[ExifToolPool] = None
+        self._pool_lock = Lock()
         
         logger.info(f"ExifToolWrapper initialized with binary: {binary_path}")
     
@@ -78,6 +85,9 @@ class ExifToolWrapper:
         total_batches = len(batch_commands)
         logger.info(f"Processing {total_files} files in {total_batches} batches")
         
+        # One persistent process per worker thread
+        self._get_pool(settings.max_workers)
+        
         # Process batches in parallel
         with ThreadPoolExecutor(max_workers=settings.max_workers) as executor:
             # Submit all batches
@@ -165,17 +175,12 @@ class ExifToolWrapper:
         )
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=settings.timeout_per_file
-            )
+            ok, stdout, stderr = self._run_command(cmd, settings.timeout_per_file)
             
-            if result.returncode == 0:
+            if ok:
                 # Parse JSON output
                 try:
-                    metadata_list = json.loads(result.stdout)
+                    metadata_list = json.loads(stdout)
                     if metadata_list and isinstance(metadata_list, list):
                         return metadata_list[0], None
                     return None, "No metadata extracted"
@@ -183,9 +188,9 @@ class ExifToolWrapper:
                     return None, f"JSON parse error: {str(e)}"
             else:
                 # Check if it's just a non-media file
-                if "No matching files" in result.stderr or "Unknown file type" in result.stderr:
+                if "No matching files" in stderr or "Unknown file type" in stderr:
                     return None, "Not a media file"
-                return None, f"ExifTool error: {result.stderr}"
+                return None, f"ExifTool error: {stderr}"
                 
         except subprocess.TimeoutExpired:
             return None, f"Timeout after {settings.timeout_per_file}s"
@@ -208,15 +213,10 @@ class ExifToolWrapper:
         )
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=5  # Quick timeout for simple extraction
-            )
+            ok, stdout, _ = self._run_command(cmd, 5)  # Quick timeout for simple extraction
             
-            if result.returncode == 0:
-                metadata_list = json.loads(result.stdout)
+            if ok:
+                metadata_list = json.loads(stdout)
                 if metadata_list and isinstance(metadata_list, list):
                     data = metadata_list[0]
                     return {
@@ -255,20 +255,18 @@ class ExifToolWrapper:
             logger.debug(f"EXECUTING EXIFTOOL COMMAND: {' '.join(cmd[:20])}..." if len(cmd) > 20 else ' '.join(cmd))
             
             # Execute command
-            result = subprocess.run(
+            ok, stdout, stderr = self._run_command(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+                timeout,
                 cwd=str(Path(batch_files[0]).parent) if batch_files else None
             )
             
             execution_time = time.time() - start_time
             
-            if result.returncode == 0:
+            if ok:
                 # Parse JSON output
                 try:
-                    metadata_list = json.loads(result.stdout)
+                    metadata_list = json.loads(stdout)
                     
                     # Match metadata to files
                     file_map = {f.name: f for f in batch_files}
@@ -298,7 +296,7 @@ class ExifToolWrapper:
                         errors.append(f"Failed: {f.name}")
             else:
                 # Command failed
-                error_msg = result.stderr or "Unknown error"
+                error_msg = stderr or "Unknown error"
                 errors.append(f"Batch command failed: {error_msg}")
                 for f in batch_files:
                     errors.append(f"Failed: {f.name}")
@@ -314,6 +312,69 @@ class ExifToolWrapper:
         
         return results, errors
     
+    def _get_pool(self, size: int) -> Optional[ExifToolPool]:
+        """Persistent process pool with at least `size` processes (None if disabled)"""
+        with self._pool_lock:
+            if not self.persistent:
+                return None
+            if self._pool is None:
+                self._pool = ExifToolPool(self.binary_path, size)
+            else:
+                self._pool.resize(size)
+            return self._pool
+    
+    def _run_command(
+        self,
+        cmd: List[str],
+        timeout: float,
+        cwd: Optional[str] = None
+    ) -> Tuple[bool, str, str]:
+        """
+        Run a command-builder command on a persistent process or as a subprocess
+        
+        The builder's command line minus the binary is the argument stream for
+        a -stay_open process. ExifTool has no per-command exit code in that
+        mode, so a command succeeds when it produced output. If persistent
+        ExifTool cannot be started, the wrapper switches to one subprocess per
+        command for the rest of its life.
+        
+        Args:
+            cmd: Full command from ExifToolForensicCommandBuilder
+            timeout: Seconds before subprocess.TimeoutExpired is raised
+            cwd: Working directory for the one-shot subprocess
+            
+        Returns:
+            Tuple of (success, stdout, stderr)
+        """
+        pool = self._get_pool(1)
+        if pool:
+            try:
+                stdout, stderr = pool.execute(cmd[1:], timeout)
+                return bool(stdout.strip()), stdout, stderr
+            except OSError as e:
+                if not pool.commands_executed:
+                    logger.warning(f"Persistent ExifTool unavailable ({e}), using one process per command")
+                    self.persistent = False
+                    self.close()
+                else:
+                    logger.warning(f"Persistent ExifTool failed ({e}), retrying command as a subprocess")
+        
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            cwd=cwd
+        )
+        return result.returncode == 0, result.stdout, result.stderr
+    
+    def close(self):
+        """Stop the persistent ExifTool processes (a later extraction starts new ones)"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool:
+            pool.close()
+    
     def validate_extraction(self, metadata: Dict[str, Any]) -> bool:
         """
         Validate extracted metadata has minimum required fields
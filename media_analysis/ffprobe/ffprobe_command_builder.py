@@ -6,7 +6,7 @@ Following the pattern established by ForensicCommandBuilder
 """
 
 from pathlib import Path
-from typing import List, Dict, Any, Set, Tuple
+from typing import List, Dict, Any, Set, Tuple, FrozenSet
 from core.logger import logger
 
 
@@ -216,6 +216,63 @@ class FFProbeCommandBuilder:
         
         return cmd
     
+    def get_cache_signature(
+        self,
+        binary_path: Path,
+        settings: Any
+    ) -> Tuple[str, FrozenSet[str]]:
+        """
+        Split the command for these settings into output options and selected entries
+        
+        Used by the metadata cache: output of a command whose entries are a superset
+        of another's (with the same options) can be filtered down to answer it.
+        
+        Args:
+            binary_path: Path to ffprobe binary
+            settings: User's selected metadata fields
+            
+        Returns:
+            Tuple of (options signature, entries such as 'format=duration' / 'stream=width')
+        """
+        cmd = self.build_command(binary_path, Path('-'), settings)[1:-1]
+        options = []
+        entries = set()
+        i = 0
+        while i < len(cmd):
+            if cmd[i] == '-show_entries' and cmd[i + 1].split('=', 1)[0] in ('format', 'stream'):
+                section, names = cmd[i + 1].split('=', 1)
+                entries.update(f"{section}={name}" for name in names.split(','))
+                i += 2
+                continue
+            options.append(cmd[i])
+            i += 1
+        return ' '.join(options), frozenset(entries)
+    
+    @staticmethod
+    def filter_to_selection(raw: Dict[str, Any], entries: FrozenSet[str]) -> Dict[str, Any]:
+        """
+        Reduce FFprobe output to the entries a narrower command would have printed
+        
+        Args:
+            raw: Parsed FFprobe JSON produced with a superset of `entries`
+            entries: Entries from get_cache_signature()
+            
+        Returns:
+            New dict containing only the requested format/stream entries
+        """
+        format_keys = {e.split('=', 1)[1] for e in entries if e.startswith('format=')}
+        stream_keys = {e.split('=', 1)[1] for e in entries if e.startswith('stream=')}
+        
+        filtered = {k: v for k, v in raw.items() if k not in ('format', 'streams')}
+        if format_keys and 'format' in raw:
+            filtered['format'] = {k: v for k, v in raw['format'].items() if k in format_keys}
+        if stream_keys and 'streams' in raw:
+            filtered['streams'] = [
+                {k: v for k, v in stream.items() if k in stream_keys}
+                for stream in raw['streams']
+            ]
+        return filtered
+    
     def _collect_required_fields(
         self, 
         settings: Any
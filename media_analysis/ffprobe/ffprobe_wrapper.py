@@ -9,7 +9,7 @@ import json
 import time
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from core.result_types import Result
 from core.exceptions import MediaExtractionError, FFProbeNotFoundError
@@ -20,6 +20,9 @@ from .ffprobe_command_builder import FFProbeCommandBuilder
 class FFProbeWrapper:
     """Wrapper for FFprobe subprocess operations"""
     
+    SUBMIT_WINDOW_PER_WORKER = 2   # Files queued per worker thread at any time
+    CANCEL_POLL_INTERVAL = 0.25    # Seconds between cancel checks while probes run
+    
     def __init__(self, binary_path: Path, timeout: float = 5.0):
         """
         Initialize FFprobe wrapper
@@ -144,19 +147,32 @@ class FFProbeWrapper:
         file_paths: List[Path],
         settings: Any = None,
         max_workers: int = 8,
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        result_callback: Optional[Callable[[Path, Result[Dict]], None]] = None,
+        collect_results: bool = True
     ) -> Dict[Path, Result[Dict]]:
         """
         Extract metadata from multiple files in parallel using optimized commands
         
+        Files are submitted in a bounded window (SUBMIT_WINDOW_PER_WORKER per
+        worker) rather than all at once, so cancellation takes effect after the
+        probes already running finish instead of after the whole batch.
+        
         Args:
             file_paths: List of file paths to analyze
             settings: MediaAnalysisSettings for field selection (uses defaults if None)
             max_workers: Maximum number of parallel workers
             progress_callback: Callback for progress updates (completed, total)
+            cancel_check: Returns True when the caller wants to stop; no new
+                files are started after that and queued ones are dropped
+            result_callback: Called with (path, result) as each file completes
+            collect_results: Keep every result for the return value; pass False when
+                result_callback consumes them so each raw result can be freed at once
             
         Returns:
-            Dictionary mapping file paths to extraction results
+            Dictionary mapping file paths to extraction results (only files that
+            were probed when cancelled; empty when collect_results is False)
         """
         results = {}
         total_files = len(file_paths)
@@ -170,48 +186,73 @@ class FFProbeWrapper:
             settings = MediaAnalysisSettings()
         
         # Limit workers to reasonable number
-        actual_workers = min(max_workers, total_files, 32)
+        actual_workers = max(1, min(max_workers, total_files, 32))
+        window = actual_workers * self.SUBMIT_WINDOW_PER_WORKER
         
         logger.info(f"Batch extraction of {total_files} files with {actual_workers} workers (optimized)")
         start_time = time.time()
         
+        pending_paths = iter(file_paths)
+        in_flight = {}
+        completed = 0
+        cancelled = False
+        
         with ThreadPoolExecutor(max_workers=actual_workers) as executor:
-            # Submit all extraction tasks with settings
-            future_to_path = {
-                executor.submit(self.extract_metadata, path, settings): path
-                for path in file_paths
-            }
-            
-            # Process results as they complete
-            completed = 0
-            for future in as_completed(future_to_path):
-                path = future_to_path[future]
+            while True:
+                if not cancelled and cancel_check and cancel_check():
+                    cancelled = True
+                    # Drop queued work; probes already running finish on their own timeout
+                    for future in [f for f in in_flight if f.cancel()]:
+                        del in_flight[future]
+                    logger.info(f"Batch extraction cancelled after {completed}/{total_files} files")
                 
-                try:
-                    # Get the result (already a Result object)
-                    results[path] = future.result()
-                except Exception as e:
-                    # Wrap unexpected exceptions
-                    results[path] = Result.error(MediaExtractionError(
-                        f"Thread execution error for {path.name}: {e}",
-                        file_path=str(path),
-                        user_message=f"Failed to process {path.name}"
-                    ))
+                # Keep the window full
+                while not cancelled and len(in_flight) < window:
+                    path = next(pending_paths, None)
+                    if path is None:
+                        break
+                    in_flight[executor.submit(self.extract_metadata, path, settings)] = path
                 
-                completed += 1
+                if not in_flight:
+                    break
                 
-                # Report progress
-                if progress_callback:
+                done, _ = wait(in_flight, timeout=self.CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    path = in_flight.pop(future)
+                    
                     try:
-                        progress_callback(completed, total_files)
+                        # Get the result (already a Result object)
+                        result = future.result()
                     except Exception as e:
-                        logger.warning(f"Progress callback error: {e}")
-                
-                # Log progress periodically
-                if completed % 10 == 0 or completed == total_files:
-                    elapsed = time.time() - start_time
-                    rate = completed / elapsed if elapsed > 0 else 0
-                    logger.debug(f"Processed {completed}/{total_files} files ({rate:.1f} files/sec)")
+                        # Wrap unexpected exceptions
+                        result = Result.error(MediaExtractionError(
+                            f"Thread execution error for {path.name}: {e}",
+                            file_path=str(path),
+                            user_message=f"Failed to process {path.name}"
+                        ))
+                    if collect_results:
+                        results[path] = result
+                    completed += 1
+                    
+                    if result_callback:
+                        try:
+                            result_callback(path, result)
+                        except Exception as e:
+                            logger.warning(f"Result callback error for {path.name}: {e}")
+                    
+                    # Report progress
+                    if progress_callback:
+                        try:
+                            progress_callback(completed, total_files)
+                        except Exception as e:
+                            logger.warning(f"Progress callback error: {e}")
+                    
+                    # Log progress periodically
+                    if completed % 10 == 0 or completed == total_files:
+                        elapsed = time.time() - start_time
+                        rate = completed / elapsed if elapsed > 0 else 0
+                        logger.debug(f"Processed {completed}/{total_files} files ({rate:.1f} files/sec)")
         
         elapsed_time = time.time() - start_time
         logger.info(f"Batch extraction completed: {completed} files in {elapsed_time:.1f} seconds")
@@ -1067,6 +1067,7 @@ class MediaAnalysisTab(QWidget):
             # Connect worker signals
             self.current_worker.result_ready.connect(self._on_analysis_complete)
             self.current_worker.progress_update.connect(self._on_progress_update)
+            self.current_worker.partial_result.connect(self._update_ffprobe_stats)
 
             # Start worker
             self.current_worker.start()
@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import List, Optional, Any
 import time
 
+from PySide6.QtCore import Signal
+
 from core.workers.base_worker import BaseWorkerThread
 from ..core.media_analysis_models import MediaAnalysisSettings, MediaAnalysisResult
 from core.models import FormData
@@ -22,6 +24,9 @@ class MediaAnalysisWorker(BaseWorkerThread):
     Processes media files and extracts metadata using the media service
     """
     
+    # Running MediaAnalysisResult counts while the analysis is in progress
+    partial_result = Signal(object)
+    
     def __init__(
         self,
         files: List[Path],
@@ -89,9 +94,15 @@ class MediaAnalysisWorker(BaseWorkerThread):
             result = self.service.analyze_media_files(
                 self.files,
                 self.settings,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                cancel_check=self.is_cancelled,
+                partial_result_callback=self.partial_result.emit
             )
             
+            # Service stops early when cancelled
+            if self.is_cancelled():
+                raise InterruptedError("Operation cancelled")
+            
             # Check if analysis was successful
             if not result.success:
                 return result
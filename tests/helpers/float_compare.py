@@ -0,0 +1,20 @@
+"""
+Float-tolerant equality for comparing columnar and GPSPoint results.
+
+Columnar GPS tracks store some columns as float32, so values restored from
+them differ from the GPSPoint originals in the last few digits.
+"""
+
+import math
+from typing import Any
+
+
+def close(a: Any, b: Any) -> bool:
+    """Equality allowing float32 rounding, recursing into dicts, lists and tuples"""
+    if isinstance(a, float) and isinstance(b, float):
+        return math.isclose(a, b, rel_tol=1e-6, abs_tol=1e-9)
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(close(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(close(x, y) for x, y in zip(a, b))
+    return a == b
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for hashing archives and members while the ZIP is written
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from core.archive_manifest import manifest_path_for
+from core.buffered_zip_ops import BufferedZipOperations
+from core.native_7zip.controller import Native7ZipController
+from core.parallel_deflate import ParallelDeflateWriter
+from core.result_types import ArchiveOperationResult
+from copy_hash_verify.core.unified_hash_calculator import UnifiedHashCalculator
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class TestArchiveHashManifest:
+    """Test suite for hash-while-archiving manifests"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def evidence(self, temp_dir):
+        """Small and streamed (>= 1MB) files in nested folders"""
+        source = temp_dir / "evidence"
+        (source / "cam1").mkdir(parents=True)
+        (source / "cam1" / "clip.mp4").write_bytes(os.urandom(ParallelDeflateWriter.CHUNK_SIZE + 12345))
+        (source / "cam1" / "export.log").write_bytes(b"frame ok\n" * 5000)
+        (source / "notes.txt").write_bytes(b"")
+        return source
+
+    @pytest.mark.parametrize("compression, workers", [
+        (zipfile.ZIP_STORED, None),
+        (zipfile.ZIP_DEFLATED, 1),
+        (zipfile.ZIP_DEFLATED, 4),
+    ])
+    def test_manifest_matches_archive_and_sources(self, temp_dir, evidence, compression, workers):
+        """Archive and member hashes equal independent hashes of the final files"""
+        output = temp_dir / "case.zip"
+        result = BufferedZipOperations(compression_workers=workers).create_archive_buffered(
+            evidence, output, compression, hash_manifest=True)
+
+        assert result.success, result.error
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert len(zf.infolist()) == 3
+
+        manifest = json.loads(manifest_path_for(output).read_text())
+        assert result.manifest_paths == [manifest_path_for(output)]
+        assert manifest['archive']['sha256'] == _sha256(output) == result.archive_hashes[str(output)]
+        assert manifest['archive']['size'] == output.stat().st_size
+        expected = {f.relative_to(evidence).as_posix(): _sha256(f) for f in evidence.rglob('*') if f.is_file()}
+        assert {e['file_path']: e['hashes']['sha256'] for e in manifest['files']} == expected
+        assert result.member_hashes[str(output)] == expected
+
+    def test_without_manifest_nothing_extra_is_written(self, temp_dir, evidence):
+        """The default path still writes a seekable archive and no manifest"""
+        output = temp_dir / "plain.zip"
+        result = BufferedZipOperations().create_archive_buffered(evidence, output)
+
+        assert result.success
+        assert not manifest_path_for(output).exists()
+        assert result.archive_hashes == {} and result.manifest_paths == []
+        with zipfile.ZipFile(output) as zf:
+            assert all(not info.flag_bits & 0x08 for info in zf.infolist())
+
+    def test_single_pass_writes_manifest_per_archive(self, temp_dir, evidence):
+        """Multi-level archiving hashes each source file once for every archive"""
+        jobs = [(evidence, temp_dir / "all.zip"), (evidence / "cam1", temp_dir / "cam1.zip")]
+        result = BufferedZipOperations().create_archives_single_pass(jobs, hash_manifest=True)
+
+        assert result.success
+        for _, output in jobs:
+            assert result.archive_hashes[str(output)] == _sha256(output)
+            assert manifest_path_for(output).exists()
+        assert result.member_hashes[str(temp_dir / "cam1.zip")]["clip.mp4"] == \
+            result.member_hashes[str(temp_dir / "all.zip")]["cam1/clip.mp4"]
+
+    def test_extracted_archive_verifies_against_manifest(self, temp_dir, evidence):
+        """The manifest is readable by the stored-manifest verifier"""
+        output = temp_dir / "case.zip"
+        assert BufferedZipOperations().create_archive_buffered(evidence, output, hash_manifest=True).success
+        extracted = temp_dir / "extracted"
+        with zipfile.ZipFile(output) as zf:
+            zf.extractall(extracted)
+        shutil.rmtree(evidence)
+
+        result = UnifiedHashCalculator(enable_parallel=False).verify_against_hash_manifest(
+            manifest_path_for(output), [extracted])
+
+        assert result.success
+        assert len(result.value) == 3
+        assert all(v.match for v in result.value.values())
+
+    @pytest.mark.parametrize("concurrent", [True, False])
+    def test_native_sources_hashed_after_7za_unless_solid_state(self, temp_dir, evidence, monkeypatch, concurrent):
+        """7-Zip sources are re-read alongside 7za only on SSD/NVMe"""
+        controller = Native7ZipController()
+        monkeypatch.setattr(controller, '_hash_sources_concurrently', lambda source_path: concurrent)
+        output = temp_dir / "case.zip"
+        shutil.make_archive(str(output.with_suffix('')), 'zip', evidence)  # Stands in for 7za's output
+
+        member_hashes = controller._start_source_hashing(evidence)
+        assert (controller._hash_thread is not None) == concurrent
+        result = controller._finish_manifest(
+            ArchiveOperationResult.create_successful(created_archives=[output]), evidence, output, member_hashes)
+
+        assert result.success
+        assert result.archive_hashes[str(output)] == _sha256(output)
+        assert result.member_hashes[str(output)] == {
+            f.relative_to(evidence).as_posix(): _sha256(f) for f in evidence.rglob('*') if f.is_file()}
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the resumable copy checkpoint journal
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.buffered_file_ops import BufferedFileOperations
+from core.copy_journal import CopyJournal
+from core.workers.folder_operations import FolderStructureThread
+
+MB = 1024 * 1024
+
+
+class TestCopyJournal:
+    """Test suite for CopyJournal and its BufferedFileOperations integration"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def source_dir(self, temp_dir):
+        """Create a few small source files"""
+        source_dir = temp_dir / "source"
+        source_dir.mkdir()
+        for i in range(3):
+            (source_dir / f"file_{i}.bin").write_bytes(os.urandom(10_000 + i))
+        return source_dir
+
+    def _items(self, source_dir):
+        return [('file', p, Path(p.name)) for p in sorted(source_dir.iterdir())]
+
+    def test_second_run_skips_verified_files(self, temp_dir, source_dir):
+        """Files verified by a previous run are skipped with their journal hashes"""
+        journal_path = temp_dir / "journal.jsonl"
+        dest = temp_dir / "dest"
+
+        first = BufferedFileOperations(journal=CopyJournal(journal_path))
+        assert first._copy_files_internal(self._items(source_dir), dest, True).success
+        first.journal.close()
+
+        second = BufferedFileOperations(journal=CopyJournal(journal_path))
+        assert second.journal.completed_count == 3
+        result = second._copy_files_internal(self._items(source_dir), dest, True)
+
+        assert result.success
+        assert second.metrics.resumed_files == 3
+        assert second.metrics.copy_methods == {'journal': 3}
+        for path in source_dir.iterdir():
+            entry = result.value[path.name]
+            assert entry['resumed']
+            assert entry['verified']
+            assert entry['source_hash'] == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_changed_source_is_copied_again(self, temp_dir, source_dir):
+        """A different source fingerprint invalidates the completed entry"""
+        journal_path = temp_dir / "journal.jsonl"
+        dest = temp_dir / "dest"
+        first = BufferedFileOperations(journal=CopyJournal(journal_path))
+        first._copy_files_internal(self._items(source_dir), dest, True)
+        first.journal.close()
+
+        changed = source_dir / "file_0.bin"
+        changed.write_bytes(os.urandom(20_000))
+
+        second = BufferedFileOperations(journal=CopyJournal(journal_path))
+        result = second._copy_files_internal(self._items(source_dir), dest, True)
+
+        assert result.success
+        assert second.metrics.resumed_files == 2
+        assert not result.value['file_0.bin']['resumed']
+        assert (dest / "file_0.bin").read_bytes() == changed.read_bytes()
+
+    def test_large_file_resumes_from_checkpoint(self, temp_dir):
+        """A large file continues after the checkpointed prefix with a correct hash"""
+        source = temp_dir / "image.dd"
+        dest = temp_dir / "dest" / "image.dd"
+        data = os.urandom(4 * MB + 17)
+        source.write_bytes(data)
+        dest.parent.mkdir()
+        # Interrupted run: 2MB fsynced, some unsynced garbage written after it
+        dest.write_bytes(data[:2 * MB] + b"\x00" * 1000)
+
+        journal = CopyJournal(temp_dir / "journal.jsonl")
+        journal.record_partial(source, dest, 2 * MB)
+
+        ops = BufferedFileOperations(journal=journal)
+        ops.LARGE_FILE_THRESHOLD = 1 * MB
+        result = ops.copy_file_buffered(source, dest)
+
+        assert result.success
+        assert result.value['resumed_from'] == 2 * MB
+        assert result.value['bytes_copied'] == len(data)
+        assert result.value['source_hash'] == hashlib.sha256(data).hexdigest()
+        assert result.value['verified']
+        assert dest.read_bytes() == data
+        assert journal.completed_entry(source, dest) is not None
+
+    def test_large_copy_writes_checkpoints(self, temp_dir):
+        """Pipelined copies append partial checkpoints before the completed record"""
+        source = temp_dir / "image.dd"
+        source.write_bytes(os.urandom(3 * MB))
+        journal_path = temp_dir / "journal.jsonl"
+
+        ops = BufferedFileOperations(journal=CopyJournal(journal_path))
+        ops.LARGE_FILE_THRESHOLD = 1 * MB
+        ops.JOURNAL_CHECKPOINT_BYTES = 1 * MB
+        assert ops.copy_file_buffered(source, temp_dir / "copy.dd").success
+        ops.journal.close()
+
+        records = [json.loads(line) for line in journal_path.read_text().splitlines()]
+        assert [r['type'] for r in records][-1] == 'complete'
+        assert any(r['type'] == 'partial' for r in records)
+
+    def test_unwritable_journal_location_copies_without_checkpoints(self, temp_dir, source_dir, monkeypatch):
+        """A journal that cannot be opened does not stop the copy"""
+        def unavailable(destination):
+            raise PermissionError("home folder is read-only")
+
+        monkeypatch.setattr(CopyJournal, 'for_destination', unavailable)
+        # Same-drive jobs may be moved instead, which never uses the journal
+        monkeypatch.setattr(BufferedFileOperations, '_is_same_filesystem', lambda self, source, dest: False)
+        dest = temp_dir / "dest"
+        dest.mkdir()
+        names = sorted(p.name for p in source_dir.iterdir())
+        worker = FolderStructureThread(self._items(source_dir), dest, calculate_hash=True, is_same_drive=False)
+
+        result = worker.execute()
+
+        assert result.success
+        assert sorted(p.name for p in dest.iterdir()) == names
+        assert sorted(p.name for p in source_dir.iterdir()) == names
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for deferred destination verification in BufferedFileOperations
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.buffered_file_ops import BufferedFileOperations
+from core.exceptions import HashVerificationError
+
+
+class TestDeferredVerification:
+    """Test suite for multi-file copies with background destination re-hashing"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def items(self, temp_dir):
+        """Create a source tree and return (type, path, relative_path) items"""
+        source = temp_dir / "source"
+        items = []
+        for i in range(8):
+            file_path = source / f"clip_{i:02d}.bin"
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Mix of small (direct) and medium (streamed) files
+            file_path.write_bytes(os.urandom(30_000 if i % 2 else 1_500_000))
+            items.append(('file', file_path, file_path.relative_to(source)))
+        return items
+
+    def test_deferred_verification_hashes_every_file(self, temp_dir, items):
+        """Every destination is re-hashed before success is reported"""
+        file_ops = BufferedFileOperations(max_workers_override=1, deferred_verification=True)
+
+        result = file_ops._copy_files_internal(items, temp_dir / "dest", calculate_hash=True)
+
+        assert result.success, result.error
+        assert file_ops.metrics.deferred_verifications == len(items)
+        assert result.value['_performance_stats']['deferred_verifications'] == len(items)
+
+        for _, source_path, relative_path in items:
+            data = result.value[str(relative_path)]
+            expected = hashlib.sha256(source_path.read_bytes()).hexdigest()
+            assert data['source_hash'] == expected
+            assert data['dest_hash'] == expected
+            assert data['verified'] is True
+
+    def test_mismatch_marks_specific_file(self, temp_dir, items, monkeypatch):
+        """A destination mismatch fails the operation and flags only that file"""
+        file_ops = BufferedFileOperations(max_workers_override=1, deferred_verification=True)
+        corrupted = str(items[3][2])
+        original = file_ops._calculate_hash_streaming
+
+        def tampered_hash(file_path, buffer_size):
+            if Path(file_path).name == corrupted:
+                return "0" * 64
+            return original(file_path, buffer_size)
+
+        monkeypatch.setattr(file_ops, '_calculate_hash_streaming', tampered_hash)
+
+        result = file_ops._copy_files_internal(items, temp_dir / "dest", calculate_hash=True)
+
+        assert not result.success
+        assert isinstance(result.error, HashVerificationError)
+        assert result.error.context["actual_hash"] == "0" * 64
+        assert result.value[corrupted]['verified'] is False
+        others = [key for key in result.value if key != corrupted]
+        assert all(result.value[key]['verified'] is True for key in others)
+
+    def test_worker_pool_defers_verification(self, temp_dir, items):
+        """Parallel copies hand re-hashes to the verification pool and still check every file"""
+        file_ops = BufferedFileOperations(max_workers_override=3, deferred_verification=True)
+
+        result = file_ops._copy_files_internal(items, temp_dir / "dest", calculate_hash=True)
+
+        assert result.success, result.error
+        assert result.value['_performance_stats']['threads_used'] == 3
+        assert file_ops.metrics.deferred_verifications == len(items)
+        for _, source_path, relative_path in items:
+            data = result.value[str(relative_path)]
+            assert data['dest_hash'] == hashlib.sha256(source_path.read_bytes()).hexdigest()
+            assert data['verified'] is True
+
+    def test_move_files_preserving_structure_option(self, temp_dir, items, monkeypatch):
+        """The per-call option overrides the instance setting on the copy path"""
+        file_ops = BufferedFileOperations(max_workers_override=2)
+        monkeypatch.setattr(type(file_ops.settings), 'same_drive_behavior', 'auto_copy', raising=False)
+
+        result = file_ops.move_files_preserving_structure(
+            items, temp_dir / "dest", calculate_hash=True, deferred_verification=True)
+
+        assert result.success, result.error
+        assert file_ops.metrics.deferred_verifications == len(items)
+
+    def test_disabled_by_default(self, temp_dir, items):
+        """Without the option destinations are verified inline as before"""
+        file_ops = BufferedFileOperations(max_workers_override=1)
+
+        result = file_ops._copy_files_internal(items, temp_dir / "dest", calculate_hash=True)
+
+        assert result.success
+        assert file_ops.metrics.deferred_verifications == 0
+        assert all(data['verified'] for key, data in result.value.items() if key != '_performance_stats')
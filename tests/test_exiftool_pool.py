@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for persistent -stay_open ExifTool processes
+
+A small script speaking ExifTool's -stay_open protocol stands in for the
+Windows exiftool.exe bundled in media_analysis/bin.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.workers.exiftool_worker import ExifToolWorker
+from media_analysis.core.media_analysis_service import MediaAnalysisService
+from media_analysis.exiftool.exiftool_models import ExifToolSettings
+from media_analysis.exiftool.exiftool_wrapper import ExifToolWrapper
+
+
+FAKE_EXIFTOOL = r'''
+import json, os, sys
+
+log = os.environ.get("FAKE_EXIFTOOL_LOG")
+if log:
+    with open(log, "a") as f:
+        f.write(f"{os.getpid()} {' '.join(sys.argv[1:3])}\n")
+
+def run(args):
+    files = [a for a in args if os.path.isfile(a)]
+    if any(os.path.basename(f) == "crash.jpg" for f in files) and "-stay_open" in sys.argv:
+        os._exit(3)
+    for a in args:
+        if not a.startswith("-") and not os.path.isfile(a) and a.endswith(".jpg"):
+            sys.stderr.write(f"Error: File not found - {a}\n")
+    if files:
+        sys.stdout.write(json.dumps([{"SourceFile": f, "FileType": "JPEG", "GPSLatitude": 1.0} for f in files]) + "\n")
+    return 0 if files else 1
+
+if sys.argv[1:3] == ["-stay_open", "True"]:
+    if os.environ.get("FAKE_EXIFTOOL_NO_STAY_OPEN"):
+        sys.exit(1)
+    args = []
+    for line in sys.stdin:
+        line = line.rstrip("\r\n")
+        if line.startswith("-execute"):
+            n = line[len("-execute"):]
+            echo = args[args.index("-echo4") + 1] if "-echo4" in args else None
+            run(args)
+            sys.stdout.write("{ready%s}\n" % n)
+            sys.stdout.flush()
+            if echo:
+                sys.stderr.write(echo + "\n")
+                sys.stderr.flush()
+            args = []
+        elif args[-1:] == ["-stay_open"] and line == "False":
+            break
+        else:
+            args.append(line)
+else:
+    sys.exit(run(sys.argv[1:]))
+'''
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake ExifTool is a POSIX script")
+class TestExifToolPool:
+    """Test suite for the persistent ExifTool engine"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def fake_exiftool(self, temp_dir, monkeypatch):
+        """Executable that behaves like exiftool, logging each process start"""
+        binary = temp_dir / "exiftool"
+        binary.write_text(f"#!{sys.executable}\n" + FAKE_EXIFTOOL)
+        binary.chmod(0o755)
+        log = temp_dir / "starts.log"
+        monkeypatch.setenv("FAKE_EXIFTOOL_LOG", str(log))
+        return binary, log
+
+    @pytest.fixture
+    def photos(self, temp_dir):
+        """Twelve small image files"""
+        folder = temp_dir / "photos"
+        folder.mkdir()
+        paths = []
+        for i in range(12):
+            path = folder / f"IMG_{i:04d}.jpg"
+            path.write_bytes(b"\xff\xd8\xff" + os.urandom(64))
+            paths.append(path)
+        return paths
+
+    def _starts(self, log: Path):
+        return log.read_text().splitlines() if log.exists() else []
+
+    def test_batches_reuse_max_workers_processes(self, fake_exiftool, photos):
+        """Six batches run on at most max_workers long-lived processes"""
+        binary, log = fake_exiftool
+        wrapper = ExifToolWrapper(binary)
+        settings = ExifToolSettings(batch_size=2, max_workers=2)
+        try:
+            results, errors = wrapper.extract_batch(photos, settings)
+            results_again, _ = wrapper.extract_batch(photos, settings)
+        finally:
+            wrapper.close()
+
+        assert errors == []
+        assert sorted(r['SourceFile'] for r in results) == sorted(str(p) for p in photos)
+        assert len(results_again) == len(photos)
+        starts = self._starts(log)
+        assert 1 <= len(starts) <= 2
+        assert all(line.endswith("-stay_open True") for line in starts)
+
+    def test_single_and_simple_calls_share_process(self, fake_exiftool, photos, temp_dir):
+        """Per-file calls reuse the persistent process and keep error reporting"""
+        binary, log = fake_exiftool
+        wrapper = ExifToolWrapper(binary)
+        try:
+            metadata, error = wrapper.extract_single(photos[0], ExifToolSettings())
+            info = wrapper.get_simple_info(photos[1])
+            missing, missing_error = wrapper.extract_single(temp_dir / "gone.jpg", ExifToolSettings())
+        finally:
+            wrapper.close()
+
+        assert error is None and metadata['SourceFile'] == str(photos[0])
+        assert info == {'has_gps': True, 'file_type': 'JPEG', 'mime_type': None}
+        assert missing is None and "File not found" in missing_error
+        assert len(self._starts(log)) == 1
+
+    def test_dead_process_is_restarted(self, fake_exiftool, photos, temp_dir):
+        """A process that dies mid-command is replaced and the command still completes"""
+        binary, log = fake_exiftool
+        crash = temp_dir / "crash.jpg"
+        crash.write_bytes(b"\xff\xd8")
+        wrapper = ExifToolWrapper(binary)
+        try:
+            assert wrapper.extract_single(photos[0], ExifToolSettings())[1] is None
+            metadata, error = wrapper.extract_single(crash, ExifToolSettings())
+            after, after_error = wrapper.extract_single(photos[1], ExifToolSettings())
+        finally:
+            wrapper.close()
+
+        assert error is None and metadata['SourceFile'] == str(crash)  # Retried as a subprocess
+        assert after_error is None and after['SourceFile'] == str(photos[1])
+        assert [line.endswith("-stay_open True") for line in self._starts(log)].count(True) == 2
+
+    def test_falls_back_without_stay_open(self, fake_exiftool, photos, monkeypatch):
+        """If persistent mode cannot start, every command runs as its own subprocess"""
+        binary, log = fake_exiftool
+        monkeypatch.setenv("FAKE_EXIFTOOL_NO_STAY_OPEN", "1")
+        wrapper = ExifToolWrapper(binary)
+
+        results, errors = wrapper.extract_batch(photos, ExifToolSettings(batch_size=6, max_workers=1))
+
+        assert errors == []
+        assert len(results) == len(photos)
+        assert wrapper.persistent is False
+
+    def test_worker_teardown_stops_processes(self, fake_exiftool, photos):
+        """Each ExifTool worker run leaves no -stay_open process behind"""
+        binary, log = fake_exiftool
+        service = MediaAnalysisService()
+        service.exiftool_wrapper = ExifToolWrapper(binary)
+        settings = ExifToolSettings(batch_size=4, max_workers=2, use_metadata_cache=False)
+
+        first = ExifToolWorker(photos, settings, service).execute()
+        pool = service.exiftool_wrapper._pool
+        second = ExifToolWorker(photos, settings, service).execute()
+
+        assert first.success and second.success
+        assert pool is None and service.exiftool_wrapper._pool is None
+        assert 2 <= len(self._starts(log)) <= 4
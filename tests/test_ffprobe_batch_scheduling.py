@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for windowed, cancellable and storage-sized FFprobe batches
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from copy_hash_verify.core.storage_detector import StorageInfo, DriveType, BusType
+from copy_hash_verify.utils.thread_calculator import ThreadCalculator
+from media_analysis.core.media_analysis_models import MediaAnalysisSettings, MediaMetadata
+from media_analysis.core.media_analysis_service import MediaAnalysisService
+from media_analysis.ffprobe.ffprobe_wrapper import FFProbeWrapper
+
+
+FAKE_FFPROBE = r'''
+import json, os, sys, time
+
+with open(os.environ["FAKE_TOOL_LOG"], "a") as f:
+    f.write(sys.argv[-1] + "\n")
+time.sleep(0.05)
+print(json.dumps({"format": {"format_name": "mov,mp4", "duration": "3.0"},
+                  "streams": [{"index": 0, "codec_type": "video", "width": 640, "height": 480}]}))
+'''
+
+
+def _storage(drive_type: DriveType) -> StorageInfo:
+    return StorageInfo(
+        drive_type=drive_type, bus_type=BusType.UNKNOWN, is_ssd=None, is_removable=False,
+        confidence=1.0, detection_method="test", drive_letter="", performance_class=1
+    )
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake ffprobe is a POSIX script")
+class TestFFProbeBatchScheduling:
+    """Test suite for FFProbeWrapper.extract_batch scheduling and service streaming"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def wrapper(self, temp_dir, monkeypatch):
+        """FFProbeWrapper around a slow fake ffprobe that logs each file it probes"""
+        binary = temp_dir / "ffprobe"
+        binary.write_text(f"#!{sys.executable}\n" + FAKE_FFPROBE)
+        binary.chmod(0o755)
+        monkeypatch.setenv("FAKE_TOOL_LOG", str(temp_dir / "runs.log"))
+        return FFProbeWrapper(binary)
+
+    @pytest.fixture
+    def media_files(self, temp_dir):
+        """Twenty small files to probe"""
+        folder = temp_dir / "media"
+        folder.mkdir()
+        paths = []
+        for i in range(20):
+            path = folder / f"clip_{i:02d}.mp4"
+            path.write_bytes(b"\x00" * 64)
+            paths.append(path)
+        return paths
+
+    def _runs(self, temp_dir: Path):
+        log = temp_dir / "runs.log"
+        return log.read_text().splitlines() if log.exists() else []
+
+    def _service(self, wrapper: FFProbeWrapper, media_files) -> MediaAnalysisService:
+        service = MediaAnalysisService()
+        service.ffprobe_wrapper = wrapper
+        service._storage_info[media_files[0].parent.anchor] = _storage(DriveType.SSD)
+        return service
+
+    def test_cancel_stops_new_probes(self, temp_dir, wrapper, media_files):
+        """After cancellation only the files already in flight are probed"""
+        streamed = []
+        results = wrapper.extract_batch(
+            media_files,
+            MediaAnalysisSettings(),
+            max_workers=2,
+            cancel_check=lambda: len(streamed) >= 1,
+            result_callback=lambda path, result: streamed.append(path)
+        )
+
+        window = 2 * FFProbeWrapper.SUBMIT_WINDOW_PER_WORKER
+        assert 1 <= len(results) <= 1 + window
+        assert list(results) == streamed
+        assert sorted(self._runs(temp_dir)) == sorted(str(p) for p in results)
+
+    def test_results_stream_in_completion_order(self, wrapper, media_files):
+        """Every file is reported through the callback exactly once, with progress"""
+        streamed = []
+        progress = []
+        results = wrapper.extract_batch(
+            media_files,
+            MediaAnalysisSettings(),
+            max_workers=3,
+            progress_callback=lambda done, total: progress.append((done, total)),
+            result_callback=lambda path, result: streamed.append((path, result.success))
+        )
+
+        assert len(results) == len(streamed) == len(media_files)
+        assert all(ok for _, ok in streamed)
+        assert progress[-1] == (len(media_files), len(media_files))
+
+    def test_service_normalizes_results_and_reports_cancel(self, temp_dir, wrapper, media_files):
+        """Every file is normalized to MediaMetadata; cancel returns an error"""
+        settings = MediaAnalysisSettings(use_metadata_cache=False)
+        service = self._service(wrapper, media_files)
+
+        result = service.analyze_media_files(media_files, settings)
+        assert result.success and result.value.successful == len(media_files)
+        assert all(isinstance(m, MediaMetadata) for m in result.value.metadata_list)
+        assert {m.file_path for m in result.value.metadata_list} == set(media_files)
+
+        completed = []
+        cancelled = service.analyze_media_files(
+            media_files, settings,
+            progress_callback=lambda done, total: completed.append(done),
+            cancel_check=lambda: len(completed) >= 2
+        )
+        assert not cancelled.success
+        assert "cancelled" in cancelled.error.user_message
+        assert max(completed) < len(media_files)
+
+    def test_pool_sized_for_storage(self, wrapper, media_files):
+        """Seek-bound storage gets few workers; max_workers stays the ceiling"""
+        service = self._service(wrapper, media_files)
+        drive = media_files[0].parent.anchor
+        settings = MediaAnalysisSettings(max_workers=6)
+
+        def workers_for(drive_type: DriveType, settings=settings) -> int:
+            service._storage_info[drive] = _storage(drive_type)
+            return service._resolve_ffprobe_workers(media_files, settings)
+
+        nvme = ThreadCalculator().calculate_optimal_threads(
+            source_info=_storage(DriveType.NVME), file_count=len(media_files), operation_type="hash")
+
+        assert workers_for(DriveType.EXTERNAL_HDD) == 1
+        assert workers_for(DriveType.HDD) == 1
+        assert 1 <= workers_for(DriveType.NETWORK) <= 2
+        assert workers_for(DriveType.NVME) == min(nvme, 6)
+        assert workers_for(DriveType.EXTERNAL_HDD, MediaAnalysisSettings(max_workers=6, adaptive_workers=False)) == 6
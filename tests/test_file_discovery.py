@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for streaming scandir file discovery
+"""
+
+import hashlib
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.file_discovery import FileDiscovery
+from core.hash_operations import HashOperations
+from copy_hash_verify.core.unified_hash_calculator import UnifiedHashCalculator
+
+
+class TestFileDiscovery:
+    """Test suite for FileDiscovery and its hash engine integration"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def evidence(self, temp_dir):
+        """Create a nested evidence folder"""
+        root = temp_dir / "evidence"
+        files = {
+            "DCIM/clip_001.mp4": b"a" * 1000,
+            "DCIM/clip_002.mp4": b"b" * 2000,
+            "DCIM/Thumbs.db": b"t" * 10,
+            "DCIM/cache/preview.tmp": b"p" * 50,
+            "notes.txt": b"n" * 300,
+        }
+        for relative, data in files.items():
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        return root
+
+    def test_matches_rglob_with_running_totals(self, evidence):
+        """Every file is found once and totals track the bytes yielded"""
+        discovery = FileDiscovery()
+        found = list(discovery.iter_files([evidence]))
+
+        expected = sorted(p for p in evidence.rglob('*') if p.is_file())
+        assert sorted(f.path for f in found) == expected
+        assert discovery.files_found == len(expected)
+        assert discovery.bytes_found == sum(p.stat().st_size for p in expected)
+        assert discovery.complete
+        assert Path("evidence", "DCIM", "clip_001.mp4") in {f.relative_path for f in found}
+
+    def test_include_and_exclude_patterns(self, evidence):
+        """Include globs select files, exclude globs drop files and prune folders"""
+        mp4_only = FileDiscovery(include_patterns=['*.mp4'])
+        assert sorted(f.path.name for f in mp4_only.iter_files([evidence])) == ['clip_001.mp4', 'clip_002.mp4']
+
+        discovery = FileDiscovery(exclude_patterns=['Thumbs.db', 'DCIM/cache'])
+        names = sorted(f.path.name for f in discovery.iter_files([evidence]))
+        assert names == ['clip_001.mp4', 'clip_002.mp4', 'notes.txt']
+
+    def test_totals_grow_while_streaming(self, evidence):
+        """Files are yielded before the walk has finished"""
+        discovery = FileDiscovery()
+        iterator = discovery.iter_files([evidence])
+
+        first = next(iterator)
+        assert discovery.files_found == 1
+        assert discovery.bytes_found == first.size
+        assert not discovery.complete
+
+    def test_calculator_streams_with_filters(self, evidence):
+        """UnifiedHashCalculator hashes only filtered files and ends with exact totals"""
+        calculator = UnifiedHashCalculator(enable_parallel=False, include_patterns=['*.mp4', '*.txt'])
+        result = calculator.hash_files([evidence])
+
+        assert result.success
+        assert len(result.value) == 3
+        assert calculator.metrics.total_files == 3
+        assert calculator.metrics.total_bytes == 3300
+        assert calculator.metrics.discovery_complete
+        for path, hash_result in result.value.items():
+            assert hash_result.hash_value == hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+    def test_hash_operations_relative_paths(self, evidence):
+        """HashOperations keeps relative paths from the common base"""
+        operations = HashOperations(exclude_patterns=['*.tmp', 'Thumbs.db'])
+        discovered = operations.discover_files([evidence])
+
+        assert {str(rel.as_posix()) for _, rel in discovered} == {
+            "evidence/DCIM/clip_001.mp4", "evidence/DCIM/clip_002.mp4", "evidence/notes.txt"
+        }
+        assert operations.discovered_bytes == 3300
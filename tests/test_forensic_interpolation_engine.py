@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the array-based forensic interpolation engine
+
+The GPSPoint implementation of interpolate_path is the reference: a columnar
+vehicle must come out with exactly the same points.
+"""
+
+import copy
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")  # GPSTrack is numpy-backed; numpy is optional for vehicle tracking
+
+from tests.helpers.float_compare import close
+from vehicle_tracking.models.gps_track import GPSTrack, FLAG_GAP, FLAG_INTERPOLATED
+from vehicle_tracking.models.vehicle_tracking_models import GPSPoint, VehicleData, VehicleTrackingSettings
+from vehicle_tracking.services.forensic_interpolation import interpolate_track, is_uniform_cadence
+from vehicle_tracking.services.forensic_speed_calculator import ForensicSpeedCalculator
+from vehicle_tracking.services.projection_service import make_local_metric_projection
+from vehicle_tracking.services.vehicle_tracking_service import VehicleTrackingService
+from vehicle_tracking.services.wire_format import to_wire_format
+
+
+class TestForensicInterpolationEngine:
+    """Test suite for interpolate_track and the columnar interpolate_path"""
+
+    @pytest.fixture
+    def points(self):
+        """Irregular track with stops, gaps, conflicts, missing altitudes and wrapping headings"""
+        steps = [1, 2.5, 3, 0, 7, 12, 45, 1, 1, 3, 0.3, 0]
+        timestamp = datetime(2024, 6, 1, 8, 0, 0, 250000)
+        points = []
+        for i in range(400):
+            timestamp += timedelta(seconds=steps[i % len(steps)])
+            repeat = i % 9 == 0 and points
+            points.append(GPSPoint(
+                latitude=points[-1].latitude if repeat else 43.6 + i * 1e-4,
+                longitude=points[-1].longitude if repeat else -79.4 + i * 1e-4,
+                timestamp=timestamp,
+                altitude=None if i % 7 == 0 else 100.0 + i,
+                heading=None if i % 11 == 0 else (350 + i * 7) % 360
+            ))
+        return points
+
+    def _interpolate(self, points, columnar: bool, interval: float = 0.5) -> VehicleData:
+        vehicle = VehicleData(vehicle_id="car", source_file=Path("car.csv"))
+        if columnar:
+            vehicle.set_track(GPSTrack.from_points(copy.deepcopy(points)))
+        else:
+            vehicle.gps_points = copy.deepcopy(points)
+            vehicle.get_time_range()
+        settings = VehicleTrackingSettings(interpolation_interval_seconds=interval)
+        result = VehicleTrackingService().interpolate_path(vehicle, settings)
+        assert result.success
+        return result.value
+
+    def test_columnar_path_matches_point_path(self, points):
+        """Every observed, interpolated and gap-marker row agrees, as does the wire payload"""
+        expected = self._interpolate(points, columnar=False)
+        vehicle = self._interpolate(points, columnar=True)
+
+        assert vehicle.track is not None
+        assert len(vehicle.gps_points) == len(expected.gps_points) > 2 * len(points)
+        for want, got in zip(expected.gps_points, vehicle.gps_points):
+            assert close(want.__dict__, got.__dict__)
+
+        want, got = to_wire_format(expected), to_wire_format(vehicle)
+        assert close(want['meta'], got['meta'])
+        assert close(want['points'], got['points'])
+        assert got['meta']['gap_points'] > 0 and got['meta']['conflict_points'] > 0
+
+    def test_single_inverse_projection(self, points):
+        """All samples go back to WGS84 in one transformer call"""
+        track = GPSTrack.from_points(points)
+        to_metric, to_wgs84 = make_local_metric_projection(points[len(points) // 2])
+        arrays = ForensicSpeedCalculator().calculate_segment_arrays(track, to_metric)
+        calls = []
+
+        def counting_to_wgs84(x, y):
+            calls.append(len(x))
+            return to_wgs84(x, y)
+
+        result = interpolate_track(track, arrays, 1.0, counting_to_wgs84)
+
+        assert calls == [result.has_flag(FLAG_INTERPOLATED).sum()]
+        assert result.has_flag(FLAG_GAP).sum() == (arrays.time_seconds > 30).sum()
+        assert (result.timestamp_ns[1:] >= result.timestamp_ns[:-1]).all()
+
+    def test_uniform_cadence_passthrough(self):
+        """Already-gridded tracks are returned untouched"""
+        start = datetime(2024, 6, 1, 8, 0, 0)
+        points = [GPSPoint(43.6 + i * 1e-4, -79.4, start + timedelta(seconds=i * 0.5)) for i in range(50)]
+        track = GPSTrack.from_points(points)
+        service = VehicleTrackingService()
+
+        assert is_uniform_cadence(track, 0.5) and service._is_uniform_cadence(points, 0.5)
+        assert not is_uniform_cadence(track, 1.0) and not service._is_uniform_cadence(points, 1.0)
+
+        vehicle = VehicleData(vehicle_id="car", source_file=Path("car.csv"))
+        vehicle.set_track(track)
+        result = service.interpolate_path(vehicle, VehicleTrackingSettings(interpolation_interval_seconds=0.5))
+        assert result.value.track is track
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for batch segment speed calculation and lazy GPSSegment lists
+
+The per-pair _create_segment path is the reference for every batch result.
+"""
+
+import copy
+import math
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from vehicle_tracking.models.vehicle_tracking_models import GPSPoint, VehicleData
+from vehicle_tracking.services.forensic_speed_calculator import ForensicSpeedCalculator, SegmentList
+from vehicle_tracking.services.projection_service import make_local_metric_projection
+from vehicle_tracking.services.vehicle_tracking_service import VehicleTrackingService
+from vehicle_tracking.services.wire_format import to_wire_format
+
+
+class TestForensicSegmentBatch:
+    """Test suite for ForensicSpeedCalculator batch mode"""
+
+    @pytest.fixture
+    def points(self):
+        """Track with normal, stop, gap, coalesced and conflicting segments"""
+        base = datetime(2024, 6, 1, 12, 0, 0)
+        offsets = [0, 1, 2, 4, 12, 20, 20, 20, 60, 61, 62]
+        points = []
+        for i, offset in enumerate(offsets):
+            latitude = 43.6 + i * 1e-4
+            if offset == 20 and i == 6:
+                latitude = points[-1].latitude
+            points.append(GPSPoint(latitude, -79.4 if i != 6 else points[-1].longitude,
+                                   base + timedelta(seconds=offset)))
+        points[4].latitude = points[3].latitude + 1e-6  # Stop: under 5 m in 8 s
+        points[4].longitude = -79.4
+        return points
+
+    @pytest.fixture
+    def projection(self, points):
+        return make_local_metric_projection(points[len(points) // 2])
+
+    def test_batch_matches_per_pair_segments(self, points, projection):
+        """Every SegmentSpeed and segment ID agrees with _create_segment"""
+        to_metric, to_wgs84 = projection
+        calculator = ForensicSpeedCalculator()
+        reference_points = copy.deepcopy(points)
+        reference = [calculator._create_segment(reference_points[i], reference_points[i + 1],
+                                                to_metric, to_wgs84, segment_index=i)
+                     for i in range(len(points) - 1)]
+
+        segments = calculator.calculate_segment_speeds(points, to_metric, to_wgs84)
+
+        assert isinstance(segments, SegmentList) and len(segments) == len(reference)
+        for want, got in zip(reference, segments):
+            want_speed, got_speed = want.segment_speed, got.segment_speed
+            assert got_speed.gap_type == want_speed.gap_type
+            assert got_speed.certainty == want_speed.certainty
+            assert got_speed.time_seconds == want_speed.time_seconds
+            assert math.isclose(got_speed.distance_m, want_speed.distance_m, rel_tol=1e-9)
+            if want_speed.speed_kmh is None:
+                assert got_speed.speed_kmh is None
+            else:
+                assert math.isclose(got_speed.speed_kmh, want_speed.speed_kmh, rel_tol=1e-9, abs_tol=1e-12)
+        assert {s.segment_speed.gap_type for s in segments} == \
+               {'normal', 'stop', 'gap', 'stop/coalesced', 'temporal_conflict'}
+        assert [p.segment_id for p in points] == [p.segment_id for p in reference_points]
+
+    def test_points_projected_in_one_call(self, points, projection):
+        """The forward transformer runs once for the whole track"""
+        to_metric, to_wgs84 = projection
+        calls = []
+
+        def counting_to_metric(lon, lat):
+            calls.append(len(lon))
+            return to_metric(lon, lat)
+
+        ForensicSpeedCalculator().calculate_segment_speeds(points, counting_to_metric, to_wgs84)
+
+        assert calls == [len(points)]
+
+    def test_segments_built_only_on_access(self, points):
+        """Speeds, statistics and wire output never build GPSSegment objects"""
+        vehicle = VehicleData(vehicle_id="car", source_file=Path("car.csv"))
+        vehicle.gps_points = points
+        vehicle.get_time_range()
+
+        vehicle = VehicleTrackingService().calculate_speeds(vehicle).value
+        wire = to_wire_format(vehicle)
+        segments = vehicle.segments
+
+        assert segments.materialized_count == 0
+        assert vehicle.total_distance_km > 0 and points[1].speed_certainty == 'high'
+
+        first = segments[0]
+        assert segments[0] is first and first.start_point is points[0]
+        assert segments[-1].end_point is vehicle.gps_points[-1]
+        assert len(segments[2:5]) == 3
+        assert segments.materialized_count == 5
+
+        counted = {
+            'conflict': sum(s.is_conflict for s in segments),
+            'gap': sum(s.is_gap for s in segments),
+            'stop': sum(s.is_stop for s in segments),
+        }
+        counted['normal'] = len(segments) - sum(counted.values())
+        assert wire['meta']['segment_types'] == counted
+        assert counted['conflict'] == counted['gap'] == 1 and counted['stop'] >= 1
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for columnar GPS tracks
+
+Every array path is checked against the original GPSPoint-list code on the
+same input, so the columnar store can be swapped in without changing results.
+"""
+
+import copy
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")  # GPSTrack is numpy-backed; numpy is optional for vehicle tracking
+
+from tests.helpers.float_compare import close
+from vehicle_tracking.models.gps_track import GPSTrack, GPSPointView, FLAG_ANOMALY
+from vehicle_tracking.models.vehicle_tracking_models import GPSPoint, VehicleData, VehicleTrackingSettings
+from vehicle_tracking.services.data_preprocessing import prepare_for_forensic_analysis
+from vehicle_tracking.services.vehicle_analysis_service import VehicleAnalysisService
+from vehicle_tracking.services.vehicle_tracking_service import VehicleTrackingService
+from vehicle_tracking.services.wire_format import to_wire_format
+
+
+class TestGPSTrack:
+    """Test suite for GPSTrack and its array-based pipeline"""
+
+    @pytest.fixture
+    def points(self):
+        """Irregular track across a DST change with stops, duplicates, gaps and a conflict"""
+        base = datetime(2024, 3, 10, 1, 30, 0, 250000)
+        steps = [1, 2, 3, 0, 7, 12, 45, 1, 1, 3]
+        points = []
+        timestamp = base
+        for i in range(600):
+            timestamp += timedelta(seconds=steps[i % len(steps)])
+            latitude = points[-1].latitude if i % 9 == 0 and points else 43.6 + i * 1e-4
+            point = GPSPoint(latitude, -79.4 + i * 1e-4, timestamp,
+                             speed_kmh=None if i % 4 else 50.0, altitude=100.0 + i, heading=90.0)
+            points.append(point)
+            if i % 50 == 0:
+                points.append(copy.deepcopy(point))
+        points.append(GPSPoint(0.0, 0.0, timestamp + timedelta(seconds=1)))
+        points.append(GPSPoint(44.5, -79.4, timestamp + timedelta(seconds=2)))
+        return points
+
+    def _vehicle(self, points, columnar: bool) -> VehicleData:
+        vehicle = VehicleData(vehicle_id="car", source_file=Path("car.csv"))
+        if columnar:
+            vehicle.set_track(GPSTrack.from_points(copy.deepcopy(points)))
+        else:
+            vehicle.gps_points = copy.deepcopy(points)
+            vehicle.get_time_range()
+        return vehicle
+
+    def test_view_round_trips_points(self, points):
+        """GPSPointView behaves like the original list of points"""
+        track = GPSTrack.from_points(points)
+        view = track.points()
+
+        assert isinstance(view, GPSPointView) and len(view) == len(points)
+        assert track.nbytes == len(points) * track.data.itemsize <= len(points) * 64
+        for original, restored in zip(points, view):
+            assert close(original.__dict__, restored.__dict__)
+        assert view[-1] == points[-1]
+        assert view[5:8] == points[5:8]
+
+        view[0].latitude = 0.0  # Detached copy
+        assert track.latitude[0] == points[0].latitude
+
+    def test_preprocessing_matches_list_pipeline(self, points):
+        """Validation, sort/dedup, coalescing and anomaly marking agree with the list code"""
+        expected = prepare_for_forensic_analysis(copy.deepcopy(points))
+        track = prepare_for_forensic_analysis(GPSTrack.from_points(copy.deepcopy(points)))
+
+        assert isinstance(track, GPSTrack)
+        assert len(track) == len(expected) < len(points)
+        for want, got in zip(expected, track.points()):
+            assert close(want.__dict__, got.__dict__)
+        assert track.has_flag(FLAG_ANOMALY).sum() == sum(p.is_anomaly for p in expected)
+
+    @pytest.mark.skipif(os.name == 'nt', reason="time.tzset is POSIX only")
+    def test_speeds_and_wire_format_match_list_pipeline(self, points, monkeypatch):
+        """Segment speeds and wire payloads agree, including local-time epoch conversion"""
+        monkeypatch.setenv("TZ", "America/Toronto")
+        time.tzset()
+        try:
+            service = VehicleTrackingService()
+            expected = service.calculate_speeds(self._vehicle(points, columnar=False)).value
+            columnar = service.calculate_speeds(self._vehicle(points, columnar=True)).value
+
+            assert columnar.track is not None
+            assert close(expected.average_speed_kmh, columnar.average_speed_kmh)
+            assert close(expected.total_distance_km, columnar.total_distance_km)
+            assert [s.segment_speed.gap_type for s in expected.segments] == \
+                   [s.segment_speed.gap_type for s in columnar.segments]
+
+            want, got = to_wire_format(expected), to_wire_format(columnar)
+            assert close(want['meta'], got['meta'])
+            assert len(want['points']) == len(got['points'])
+            assert all(close(a, b) for a, b in zip(want['points'], got['points']))
+        finally:
+            monkeypatch.delenv("TZ")
+            time.tzset()
+
+    def test_timestamp_jumps_match_list_pipeline(self, points):
+        """Jumps found from the timestamp column match the pairwise point scan"""
+        service = VehicleAnalysisService()
+        expected = service.detect_timestamp_jumps(self._vehicle(points, columnar=False), 30.0).value
+        columnar = service.detect_timestamp_jumps(self._vehicle(points, columnar=True), 30.0).value
+
+        assert expected.total_events > 0
+        assert [(j.start_time, j.gap_seconds, j.last_location, j.next_location)
+                for j in columnar.timestamp_jumps] == \
+               [(j.start_time, j.gap_seconds, j.last_location, j.next_location)
+                for j in expected.timestamp_jumps]
+
+    def test_interpolation_and_animation_keep_track_columnar(self, points):
+        """Downstream steps accept columnar vehicles and leave them columnar"""
+        service = VehicleTrackingService()
+        settings = VehicleTrackingSettings()
+        results = []
+        for columnar in (False, True):
+            vehicle = service.calculate_speeds(self._vehicle(points, columnar)).value
+            vehicle = service.interpolate_path(vehicle, settings).value
+            animation = service.prepare_animation_data([vehicle], settings).value
+            results.append((vehicle, animation))
+
+        (expected, expected_animation), (vehicle, animation) = results
+        assert vehicle.track is not None
+        assert vehicle.point_count == expected.point_count
+        assert vehicle.get_bounds() == expected.get_bounds()
+        assert animation.timeline_start == expected_animation.timeline_start
+        assert len(animation.feature_collection['features']) == \
+               len(expected_animation.feature_collection['features'])
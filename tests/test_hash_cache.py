@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the persistent hash cache used by UnifiedHashCalculator
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+import core.sqlite_lru_cache as sqlite_lru_cache
+import copy_hash_verify.core.workers.hash_worker as hash_worker
+from copy_hash_verify.core.hash_cache import HashCache
+from copy_hash_verify.core.workers.hash_worker import HashWorker
+from copy_hash_verify.core.unified_hash_calculator import UnifiedHashCalculator
+
+
+class TestHashCache:
+    """Test suite for HashCache and its calculator integration"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def cache(self, temp_dir):
+        """Create a HashCache in the temp directory"""
+        cache = HashCache(temp_dir / "cache.sqlite3")
+        yield cache
+        cache.close()
+
+    @staticmethod
+    def _file_size(cache) -> int:
+        """Bytes the cache occupies on disk (database plus write-ahead log)"""
+        wal = Path(f"{cache.db_path}-wal")
+        return cache.db_path.stat().st_size + (wal.stat().st_size if wal.exists() else 0)
+
+    def test_lookup_hit_after_store(self, temp_dir, cache):
+        """Stored digest is returned while the file is unchanged"""
+        test_file = temp_dir / "evidence.bin"
+        test_file.write_bytes(b"evidence" * 100)
+        stat_result = test_file.stat()
+
+        cache.store(test_file, 'sha256', stat_result, 'abc123')
+
+        assert cache.lookup(test_file, 'sha256', test_file.stat()) == 'abc123'
+        assert cache.lookup(test_file, 'md5', test_file.stat()) is None
+
+    def test_hits_update_last_used_in_one_batch(self, temp_dir, cache):
+        """Cache hits are not written to the database until the next flush"""
+        test_file = temp_dir / "evidence.bin"
+        test_file.write_bytes(b"evidence")
+        cache.store(test_file, 'sha256', test_file.stat(), 'abc123')
+
+        def last_used():
+            with sqlite3.connect(str(cache.db_path)) as reader:
+                return reader.execute("SELECT last_used FROM file_hashes").fetchone()[0]
+
+        stored = last_used()
+        for _ in range(100):
+            assert cache.lookup(test_file, 'sha256', test_file.stat()) == 'abc123'
+        assert last_used() == stored
+
+        cache.flush()
+        assert last_used() > stored
+
+    def test_hits_only_run_persists_last_used(self, temp_dir, monkeypatch):
+        """A run served entirely from cache records its hits before it ends"""
+        test_file = temp_dir / "evidence.bin"
+        test_file.write_bytes(b"evidence")
+        db_path = temp_dir / "session.sqlite3"
+        first = HashCache(db_path)
+        first.store(test_file, 'sha256', test_file.stat(), hashlib.sha256(b"evidence").hexdigest())
+        first.close()
+        with sqlite3.connect(str(db_path)) as reader:
+            stored = reader.execute("SELECT last_used FROM file_hashes").fetchone()[0]
+
+        # Second session: only hits, and the shared cache is not closed by the worker
+        cache = HashCache(db_path)
+        monkeypatch.setattr(hash_worker, 'get_hash_cache', lambda: cache)
+        worker = HashWorker([test_file], enable_parallel=False, use_hash_cache=True)
+        worker.run()
+        assert worker.calculator.metrics.cache_hits == 1
+
+        with sqlite3.connect(str(db_path)) as reader:
+            assert reader.execute("SELECT last_used FROM file_hashes").fetchone()[0] > stored
+        cache.close()
+
+    def test_shared_cache_closed_at_exit(self, temp_dir, monkeypatch):
+        """The process-wide cache writes pending hits when the interpreter exits"""
+        registered = []
+        monkeypatch.setattr(sqlite_lru_cache.atexit, 'register', registered.append)
+        monkeypatch.setattr(HashCache, 'default_db_path', classmethod(lambda cls: temp_dir / "shared.sqlite3"))
+        monkeypatch.setattr(HashCache, '_shared_instance', None)
+
+        shared = HashCache.get_shared()
+
+        assert registered == [shared.close]
+        shared.close()
+        shared.close()  # Safe to call again from the exit hook
+
+    def test_modified_file_invalidates_entry(self, temp_dir, cache):
+        """Size or mtime change makes the cached entry stale"""
+        test_file = temp_dir / "evidence.bin"
+        test_file.write_bytes(b"original")
+        cache.store(test_file, 'sha256', test_file.stat(), 'abc123')
+
+        test_file.write_bytes(b"modified content")
+
+        assert cache.lookup(test_file, 'sha256', test_file.stat()) is None
+        # Stale entry is purged
+        assert cache.lookup(test_file, 'sha256', test_file.stat()) is None
+        assert cache.misses == 2
+
+    def test_calculator_serves_unchanged_files_from_cache(self, temp_dir, cache):
+        """Second run resolves every file from cache with identical digests"""
+        data_dir = temp_dir / "data"
+        data_dir.mkdir()
+        for i in range(4):
+            (data_dir / f"file_{i}.bin").write_bytes(os.urandom(2048 * (i + 1)))
+
+        first = UnifiedHashCalculator(hash_cache=cache, enable_parallel=False)
+        first_result = first.hash_files([data_dir])
+        assert first_result.success
+        assert first.metrics.cache_hits == 0
+
+        second = UnifiedHashCalculator(hash_cache=cache, enable_parallel=False)
+        second_result = second.hash_files([data_dir])
+        assert second_result.success
+        assert second.metrics.cache_hits == 4
+
+        for path, hash_result in second_result.value.items():
+            assert hash_result.from_cache
+            expected = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+            assert hash_result.hash_value == expected
+
+    def test_force_reread_bypasses_cache(self, temp_dir, cache):
+        """Force re-read mode reads every file even when entries are valid"""
+        test_file = temp_dir / "evidence.bin"
+        test_file.write_bytes(b"evidence")
+        cache.store(test_file, 'sha256', test_file.stat(), 'not-the-real-hash')
+
+        calculator = UnifiedHashCalculator(hash_cache=cache, force_reread=True, enable_parallel=False)
+        result = calculator.calculate_hash(test_file)
+
+        assert result.success
+        assert not result.value.from_cache
+        assert result.value.hash_value == hashlib.sha256(b"evidence").hexdigest()
+        # Fresh digest refreshes the cache
+        assert cache.lookup(test_file, 'sha256', test_file.stat()) == result.value.hash_value
+
+    def test_size_limit_evicts_entries(self, temp_dir, cache):
+        """Exceeding the size limit evicts least recently used entries"""
+        test_file = temp_dir / "evidence.bin"
+        test_file.write_bytes(b"evidence")
+        for i in range(2000):
+            cache.store(temp_dir / f"file_{i}.bin", 'sha256', test_file.stat(), 'a' * 64)
+
+        before = cache.size_bytes()
+        file_size_before = self._file_size(cache)
+        cache.max_size_bytes = before // 2
+        cache.enforce_size_limit()
+
+        assert cache.size_bytes() <= before // 2
+        # Freed pages are returned to the filesystem
+        assert self._file_size(cache) < file_size_before
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for verifying a target against a stored hash manifest
+"""
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.hash_reports import HashReportGenerator
+from copy_hash_verify.core.hash_manifest import HashManifest
+from copy_hash_verify.core.unified_hash_calculator import UnifiedHashCalculator
+
+
+class TestHashManifestVerification:
+    """Test suite for manifest-based verification"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def evidence(self, temp_dir):
+        """Create a source folder with nested files"""
+        source = temp_dir / "evidence"
+        (source / "DCIM").mkdir(parents=True)
+        (source / "DCIM" / "clip_001.mp4").write_bytes(os.urandom(5000))
+        (source / "DCIM" / "clip_002.mp4").write_bytes(os.urandom(7000))
+        (source / "notes.txt").write_bytes(b"case notes")
+        return source
+
+    def _write_report(self, evidence, report_path):
+        """Hash the source and save the standard single-hash CSV report"""
+        calculator = UnifiedHashCalculator(algorithm=['sha256', 'md5'], enable_parallel=False)
+        results = calculator.hash_files([evidence]).value
+        assert HashReportGenerator().generate_single_hash_csv(
+            list(results.values()), report_path, ['sha256', 'md5'])
+
+    def test_verifies_copy_without_source(self, temp_dir, evidence):
+        """A later verification needs only the report and the target"""
+        report = temp_dir / "hashes.csv"
+        self._write_report(evidence, report)
+        target = temp_dir / "working_copy"
+        shutil.copytree(evidence, target)
+        shutil.rmtree(evidence)  # Source drive returned
+
+        result = UnifiedHashCalculator(enable_parallel=False).verify_against_hash_manifest(report, [target])
+
+        assert result.success
+        assert result.metadata['manifest_entries'] == 3
+        assert len(result.value) == 3
+        assert all(v.match for v in result.value.values())
+        assert all(v.source_result.hashes.keys() == {'sha256', 'md5'} for v in result.value.values())
+
+    def test_reports_mismatch_and_missing_files(self, temp_dir, evidence):
+        """Changed and missing target files are reported against the manifest"""
+        report = temp_dir / "hashes.csv"
+        self._write_report(evidence, report)
+        target = temp_dir / "working_copy"
+        shutil.copytree(evidence, target)
+        (target / "DCIM" / "clip_001.mp4").write_bytes(b"tampered")
+        (target / "DCIM" / "clip_002.mp4").unlink()
+
+        result = UnifiedHashCalculator(enable_parallel=False).verify_against_hash_manifest(report, [target])
+
+        assert result.success
+        by_type = sorted(v.comparison_type for v in result.value.values())
+        assert by_type == ['exact_match', 'hash_mismatch', 'missing_target']
+
+    def test_file_filters_apply_to_manifest_and_target(self, temp_dir, evidence):
+        """Entries excluded by the patterns are not reported as missing from the target"""
+        report = temp_dir / "hashes.csv"
+        self._write_report(evidence, report)
+
+        calculator = UnifiedHashCalculator(enable_parallel=False, include_patterns=['*.mp4'])
+        result = calculator.verify_against_hash_manifest(report, [evidence])
+
+        assert result.success
+        assert result.metadata['manifest_entries'] == 2
+        assert sorted(v.comparison_type for v in result.value.values()) == ['exact_match', 'exact_match']
+
+    def test_excluded_folder_is_pruned_from_manifest(self, temp_dir):
+        """Folder excludes and relative globs match manifest entries like discovery does"""
+        source = temp_dir / "src"
+        (source / "keep").mkdir(parents=True)
+        (source / "cache").mkdir()
+        (source / "keep" / "a.txt").write_bytes(b"keep me")
+        (source / "keep" / "b.tmp").write_bytes(b"scratch")
+        (source / "cache" / "b.txt").write_bytes(b"cached")
+        report = temp_dir / "hashes.csv"
+        self._write_report(source, report)
+
+        calculator = UnifiedHashCalculator(enable_parallel=False,
+                                           exclude_patterns=['cache', 'keep/*.tmp'])
+        result = calculator.verify_against_hash_manifest(report, [source])
+
+        assert result.success
+        assert result.metadata['manifest_entries'] == 1
+        assert [v.comparison_type for v in result.value.values()] == ['exact_match']
+        assert Path(next(iter(result.value))).name == 'a.txt'
+
+    def test_forensic_csv_uses_source_columns(self, temp_dir):
+        """Verification-style CSVs contribute their source-side hashes"""
+        manifest_path = temp_dir / "forensic.csv"
+        with open(manifest_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Filename', 'Source Path', 'Destination Path',
+                             'Source Hash (SHA256)', 'Destination Hash (SHA256)', 'Verification Status'])
+            writer.writerow(['a.bin', 'C:\\Evidence\\a.bin', 'D:\\Copy\\a.bin', 'AA' * 32, 'bb' * 32, 'FAILED'])
+
+        manifest = HashManifest(manifest_path)
+        entries = list(manifest.iter_entries())
+
+        assert manifest.algorithms == ['sha256']
+        assert entries[0].hashes == {'sha256': 'aa' * 32}
+        assert entries[0].file_path.endswith('a.bin')
+
+    def test_json_manifest_and_unreadable_manifest(self, temp_dir, evidence):
+        """JSON manifests are accepted; manifests without hashes are an error"""
+        calculator = UnifiedHashCalculator(enable_parallel=False)
+        records = [{'file_path': path, 'hashes': hr.hashes, 'file_size': hr.file_size}
+                   for path, hr in calculator.hash_files([evidence]).value.items()]
+        manifest_path = temp_dir / "hashes.json"
+        manifest_path.write_text(json.dumps({'files': records}))
+
+        result = calculator.verify_against_hash_manifest(manifest_path, [evidence])
+        assert result.success
+        assert all(v.match for v in result.value.values())
+
+        empty = temp_dir / "empty.csv"
+        empty.write_text("# nothing here\n")
+        assert not calculator.verify_against_hash_manifest(empty, [evidence]).success
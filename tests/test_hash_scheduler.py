@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the largest-first parallel hash scheduler in UnifiedHashCalculator
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from threading import Lock
+
+import pytest
+
+from copy_hash_verify.core.unified_hash_calculator import UnifiedHashCalculator
+
+
+class TestHashScheduler:
+    """Test suite for size-aware parallel hashing"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def data_dir(self, temp_dir):
+        """Create files of very different sizes"""
+        data_dir = temp_dir / "data"
+        data_dir.mkdir()
+        sizes = [1_000, 8_000_000, 2_000, 500_000, 3_000, 4_000, 2_000_000, 5_000]
+        for i, size in enumerate(sizes):
+            (data_dir / f"file_{i}.bin").write_bytes(os.urandom(size))
+        return data_dir
+
+    def test_largest_files_start_first(self, data_dir, monkeypatch):
+        """Files are submitted in descending size order"""
+        calculator = UnifiedHashCalculator(max_workers_override=2)
+        started = []
+        started_lock = Lock()
+        original = calculator.calculate_hash
+
+        def recording_hash(file_path, relative_path=None):
+            with started_lock:
+                started.append(file_path.stat().st_size)
+            return original(file_path, relative_path)
+
+        monkeypatch.setattr(calculator, 'calculate_hash', recording_hash)
+        result = calculator.hash_files([data_dir])
+
+        assert result.success
+        assert len(result.value) == 8
+        # Two workers may start their first files in either order
+        assert max(started) in started[:2]
+        assert min(started) in started[-2:]
+
+    def test_results_and_metrics_contract(self, data_dir):
+        """Digests, counts and byte totals match the sequential contract"""
+        calculator = UnifiedHashCalculator(max_workers_override=4)
+        result = calculator.hash_files([data_dir])
+
+        assert result.success
+        total_bytes = sum(p.stat().st_size for p in data_dir.iterdir())
+        assert calculator.metrics.processed_files == 8
+        assert calculator.metrics.total_bytes == total_bytes
+        assert calculator.metrics.processed_bytes == total_bytes
+        for path, hash_result in result.value.items():
+            assert hash_result.hash_value == hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+    def test_progress_is_byte_weighted(self, data_dir):
+        """Progress follows bytes hashed, not files completed"""
+        progress = []
+        calculator = UnifiedHashCalculator(
+            max_workers_override=2,
+            progress_callback=lambda pct, msg: progress.append(pct)
+        )
+        result = calculator.hash_files([data_dir])
+
+        assert result.success
+        assert progress[-1] == 100
+        assert progress == sorted(progress)
+
+        calculator.metrics.total_bytes = 1000
+        calculator._bytes_hashed = 250
+        assert calculator._live_progress_percent() == 25
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the persistent FFprobe / ExifTool metadata cache
+
+Small scripts standing in for ffprobe and exiftool print only the entries
+they are asked for and log every invocation, so the tests can tell which
+files were really extracted.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from media_analysis.core.media_analysis_models import MediaAnalysisSettings
+from media_analysis.core.media_analysis_service import MediaAnalysisService
+from media_analysis.core.metadata_cache import MetadataCache
+from media_analysis.exiftool.exiftool_models import ExifToolSettings
+from media_analysis.exiftool.exiftool_wrapper import ExifToolWrapper
+from media_analysis.ffprobe.ffprobe_wrapper import FFProbeWrapper
+
+
+FAKE_FFPROBE = r'''
+import json, os, sys
+
+FORMAT = {"format_name": "mov,mp4", "format_long_name": "QuickTime / MOV", "duration": "12.5",
+          "size": "4096", "bit_rate": "2000", "tags": {"creation_time": "2024-05-01T10:00:00Z"}}
+STREAMS = [{"index": 0, "codec_type": "video", "codec_name": "h264", "width": 1920, "height": 1080,
+            "avg_frame_rate": "30/1", "duration": "12.5"},
+           {"index": 1, "codec_type": "audio", "codec_name": "aac", "sample_rate": "48000",
+            "channels": 2, "channel_layout": "stereo"}]
+
+args = sys.argv[1:]
+with open(os.environ["FAKE_TOOL_LOG"], "a") as f:
+    f.write(args[-1] + "\n")
+out = {}
+for i, arg in enumerate(args):
+    if arg == "-show_entries":
+        section, names = args[i + 1].split("=", 1)
+        names = names.split(",")
+        if section == "format":
+            out["format"] = {k: v for k, v in FORMAT.items() if k in names}
+        elif section == "stream":
+            out["streams"] = [{k: v for k, v in s.items() if k in names} for s in STREAMS]
+print(json.dumps(out))
+'''
+
+FAKE_EXIFTOOL = r'''
+import json, os, sys
+
+args = sys.argv[1:]
+files = [a for a in args if os.path.isfile(a)]
+with open(os.environ["FAKE_TOOL_LOG"], "a") as f:
+    f.writelines(path + "\n" for path in files)
+out = []
+for path in files:
+    item = {"SourceFile": path}
+    if "-GPS:all" in args:
+        item.update(GPSLatitude=43.65, GPSLongitude=-79.38)
+    if "-Make" in args:
+        item.update(Make="Apple", Model="iPhone 15")
+    if "-FileType" in args:
+        item.update(FileType="JPEG", MIMEType="image/jpeg")
+    out.append(item)
+print(json.dumps(out))
+'''
+
+
+class TestMetadataCache:
+    """Test suite for MetadataCache and its MediaAnalysisService integration"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def cache(self, temp_dir):
+        """Create a MetadataCache in the temp directory"""
+        cache = MetadataCache(temp_dir / "metadata.sqlite3")
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    def media_files(self, temp_dir):
+        """Four small files to analyze"""
+        folder = temp_dir / "media"
+        folder.mkdir()
+        paths = []
+        for i in range(4):
+            path = folder / f"clip_{i}.mp4"
+            path.write_bytes(os.urandom(256))
+            paths.append(path)
+        return paths
+
+    @pytest.fixture
+    def tool_log(self, temp_dir, monkeypatch):
+        """File listing every path a fake tool was run on"""
+        log = temp_dir / "runs.log"
+        monkeypatch.setenv("FAKE_TOOL_LOG", str(log))
+        return log
+
+    def _script(self, temp_dir: Path, name: str, source: str) -> Path:
+        binary = temp_dir / name
+        binary.write_text(f"#!{sys.executable}\n" + source)
+        binary.chmod(0o755)
+        return binary
+
+    def _runs(self, log: Path):
+        return log.read_text().splitlines() if log.exists() else []
+
+    def _service(self, cache: MetadataCache) -> MediaAnalysisService:
+        service = MediaAnalysisService()
+        service.metadata_cache = cache
+        return service
+
+    @staticmethod
+    def _file_size(cache) -> int:
+        """Bytes the cache occupies on disk (database plus write-ahead log)"""
+        wal = Path(f"{cache.db_path}-wal")
+        return cache.db_path.stat().st_size + (wal.stat().st_size if wal.exists() else 0)
+
+    def test_lookup_requires_unchanged_file_and_field_superset(self, temp_dir, cache):
+        """Entries answer subsets of their fields and go stale when the file changes"""
+        video = temp_dir / "video.mp4"
+        video.write_bytes(b"original")
+        payload = {"format": {"duration": "1.0", "size": "8"}}
+        cache.store(video, 'ffprobe', 'sig', {'format=duration', 'format=size'}, video.stat(), payload)
+
+        entry = cache.lookup(video, 'ffprobe', 'sig', {'format=duration'}, video.stat())
+        assert entry.payload == payload
+        assert entry.fields == frozenset({'format=duration', 'format=size'})
+        assert cache.lookup(video, 'ffprobe', 'sig', {'format=bit_rate'}, video.stat()) is None
+        assert cache.lookup(video, 'ffprobe', 'other', {'format=size'}, video.stat()) is None
+        assert cache.lookup(video, 'exiftool', 'sig', {'format=size'}, video.stat()) is None
+
+        video.write_bytes(b"modified content")
+        assert cache.lookup(video, 'ffprobe', 'sig', {'format=duration'}, video.stat()) is None
+
+    @pytest.mark.skipif(os.name == 'nt', reason="fake ffprobe is a POSIX script")
+    def test_ffprobe_rerun_and_subset_served_from_cache(self, temp_dir, cache, media_files, tool_log):
+        """Unchanged files are not re-probed, and a narrower selection is filtered from the superset"""
+        service = self._service(cache)
+        service.ffprobe_wrapper = FFProbeWrapper(self._script(temp_dir, "ffprobe", FAKE_FFPROBE))
+
+        first = service.analyze_media_files(media_files, MediaAnalysisSettings()).value
+        second = service.analyze_media_files(media_files, MediaAnalysisSettings())
+        narrow = MediaAnalysisSettings(keep_raw_json=True)
+        narrow.audio_fields.enabled = False
+        narrow.video_fields.fields = {"resolution": True}
+        subset = service.analyze_media_files(media_files, narrow).value
+
+        assert len(self._runs(tool_log)) == len(media_files)
+        assert second.success and second.value.successful == len(media_files)
+        by_path = {m.file_path: m for m in first.metadata_list}
+        for metadata in second.value.metadata_list:
+            assert metadata.resolution == by_path[metadata.file_path].resolution == (1920, 1080)
+            assert metadata.audio_codec == 'AAC'
+        for metadata in subset.metadata_list:
+            assert metadata.resolution == (1920, 1080)
+            assert metadata.raw_json['streams'][0] == {'index': 0, 'codec_type': 'video', 'duration': '12.5',
+                                                       'width': 1920, 'height': 1080}
+            assert 'sample_rate' not in metadata.raw_json['streams'][1]
+
+    @pytest.mark.skipif(os.name == 'nt', reason="fake ffprobe is a POSIX script")
+    def test_cached_run_records_its_hits(self, temp_dir, cache, media_files, tool_log):
+        """A run served entirely from cache writes last_used before it returns"""
+        service = self._service(cache)
+        service.ffprobe_wrapper = FFProbeWrapper(self._script(temp_dir, "ffprobe", FAKE_FFPROBE))
+        assert service.analyze_media_files(media_files, MediaAnalysisSettings()).success
+
+        def last_used():
+            with sqlite3.connect(str(cache.db_path)) as reader:
+                return dict(reader.execute("SELECT path, last_used FROM metadata").fetchall())
+
+        stored = last_used()
+        assert service.analyze_media_files(media_files, MediaAnalysisSettings()).success
+        assert len(self._runs(tool_log)) == len(media_files)
+        assert all(used > stored[path] for path, used in last_used().items())
+
+        service.shutdown()
+        assert service.metadata_cache is None
+
+    @pytest.mark.skipif(os.name == 'nt', reason="fake ffprobe is a POSIX script")
+    def test_modified_file_is_extracted_again(self, temp_dir, cache, media_files, tool_log):
+        """Only the changed file goes back to ffprobe"""
+        service = self._service(cache)
+        service.ffprobe_wrapper = FFProbeWrapper(self._script(temp_dir, "ffprobe", FAKE_FFPROBE))
+        settings = MediaAnalysisSettings()
+
+        service.analyze_media_files(media_files, settings)
+        media_files[2].write_bytes(os.urandom(512))
+        result = service.analyze_media_files(media_files, settings)
+
+        assert result.value.successful == len(media_files)
+        assert self._runs(tool_log)[len(media_files):] == [str(media_files[2])]
+
+    @pytest.mark.skipif(os.name == 'nt', reason="fake exiftool is a POSIX script")
+    def test_exiftool_subset_served_from_cache(self, temp_dir, cache, media_files, tool_log):
+        """Disabling a field group reuses cached output without the disabled tags"""
+        service = self._service(cache)
+        service.exiftool_wrapper = ExifToolWrapper(
+            self._script(temp_dir, "exiftool", FAKE_EXIFTOOL), persistent=False)
+
+        full = service.analyze_with_exiftool(media_files, ExifToolSettings(batch_size=2)).value
+        narrow = service.analyze_with_exiftool(
+            media_files, ExifToolSettings(batch_size=2, device_enabled=False)).value
+
+        assert sorted(self._runs(tool_log)) == sorted(str(p) for p in media_files)
+        assert full.successful == narrow.successful == len(media_files)
+        assert len(narrow.gps_locations) == len(media_files)
+        assert all(m.device_info is not None for m in full.metadata_list)
+        assert all(m.device_info is None for m in narrow.metadata_list)
+
+    def test_size_limit_evicts_least_recently_used(self, temp_dir):
+        """Entries touched by a lookup survive eviction longer than untouched ones"""
+        cache = MetadataCache(temp_dir / "small.sqlite3", max_size_bytes=64 * 1024)
+        try:
+            files = []
+            for i in range(60):
+                path = temp_dir / f"file_{i}.mp4"
+                path.write_bytes(b"x")
+                files.append(path)
+                cache.store(path, 'ffprobe', 'sig', {'format=size'}, path.stat(),
+                            {"blob": os.urandom(1500).hex()})
+            assert cache.lookup(files[0], 'ffprobe', 'sig', {'format=size'}, files[0].stat())
+            file_size_before = self._file_size(cache)
+
+            cache.enforce_size_limit()
+
+            assert cache.size_bytes() <= 64 * 1024
+            # Freed pages are returned to the filesystem
+            assert self._file_size(cache) < file_size_before
+            assert cache.lookup(files[0], 'ffprobe', 'sig', {'format=size'}, files[0].stat())
+            assert cache.lookup(files[1], 'ffprobe', 'sig', {'format=size'}, files[1].stat()) is None
+        finally:
+            cache.close()
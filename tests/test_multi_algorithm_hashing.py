@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for single-pass multi-algorithm hashing, reporting and verification
+"""
+
+import csv
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from copy_hash_verify.core.unified_hash_calculator import UnifiedHashCalculator, HashResult
+from core.hash_operations import HashOperations, compare_digests
+from core.hash_reports import HashReportGenerator
+
+
+class TestMultiAlgorithmHashing:
+    """Test suite for hashing with several algorithms in one read"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def evidence_file(self, temp_dir):
+        """Create a test file"""
+        path = temp_dir / "evidence.bin"
+        path.write_bytes(os.urandom(300_000))
+        return path
+
+    def test_calculator_returns_all_digests(self, evidence_file):
+        """Every requested algorithm is calculated and the first is primary"""
+        calculator = UnifiedHashCalculator(algorithm=['sha256', 'md5'], enable_parallel=False)
+
+        result = calculator.calculate_hash(evidence_file)
+
+        assert result.success
+        data = evidence_file.read_bytes()
+        assert result.value.hashes == {
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'md5': hashlib.md5(data).hexdigest()
+        }
+        assert result.value.hash_value == result.value.hashes['sha256']
+        assert result.value.algorithm == 'sha256'
+
+    def test_hash_operations_returns_all_digests(self, evidence_file):
+        """Legacy HashOperations engine supports algorithm lists as well"""
+        hash_ops = HashOperations(['md5', 'sha256', 'md5'])
+
+        result = hash_ops.hash_file(evidence_file, Path(evidence_file.name))
+
+        assert hash_ops.algorithms == ['md5', 'sha256']
+        assert result.hash_value == hashlib.md5(evidence_file.read_bytes()).hexdigest()
+        assert set(result.hashes) == {'md5', 'sha256'}
+
+    def test_unsupported_algorithm_rejected(self):
+        """Unsupported or empty algorithm lists raise ValueError"""
+        with pytest.raises(ValueError):
+            UnifiedHashCalculator(algorithm=['sha256', 'crc32'])
+        with pytest.raises(ValueError):
+            UnifiedHashCalculator(algorithm=[])
+
+    def test_compare_digests_uses_shared_algorithms(self):
+        """Matching uses every algorithm both sides have"""
+        source = {'sha256': 'aa', 'md5': 'BB'}
+
+        assert compare_digests(source, {'md5': 'bb'}) == (True, ['md5'])
+        assert compare_digests(source, {'md5': 'cc', 'sha256': 'aa'}) == (False, ['sha256', 'md5'])
+        assert compare_digests(source, {'sha1': 'dd'}) == (False, [])
+
+    def test_verification_matches_on_shared_algorithm(self, temp_dir, evidence_file):
+        """A target hashed only with MD5 verifies against a SHA-256+MD5 source"""
+        calculator = UnifiedHashCalculator(algorithm=['sha256', 'md5'], enable_parallel=False)
+        source = calculator.calculate_hash(evidence_file).value
+
+        target_path = temp_dir / "target" / "evidence.bin"
+        target = HashResult(
+            file_path=target_path,
+            relative_path=target_path,
+            algorithm='md5',
+            hash_value=source.hashes['md5'],
+            file_size=source.file_size,
+            duration=0.0
+        )
+
+        results = calculator._compare_hashes({str(evidence_file): source}, {str(target_path): target})
+
+        assert results[str(evidence_file)].match
+        assert results[str(evidence_file)].comparison_type == 'exact_match'
+
+    def test_report_writes_one_column_per_algorithm(self, temp_dir, evidence_file):
+        """Single hash CSV has a hash column for each algorithm"""
+        calculator = UnifiedHashCalculator(algorithm=['sha256', 'md5'], enable_parallel=False)
+        result = calculator.calculate_hash(evidence_file).value
+        output = temp_dir / "report.csv"
+
+        assert HashReportGenerator().generate_single_hash_csv(
+            [result], output, ['sha256', 'md5'], include_metadata=False
+        )
+
+        with open(output, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]['Hash (SHA256)'] == result.hashes['sha256']
+        assert rows[0]['Hash (MD5)'] == result.hashes['md5']
+
+    def test_single_algorithm_report_unchanged(self, temp_dir, evidence_file):
+        """Single-algorithm runs keep the original column layout"""
+        result = UnifiedHashCalculator(enable_parallel=False).calculate_hash(evidence_file).value
+        output = temp_dir / "report.csv"
+
+        HashReportGenerator().generate_single_hash_csv([result], output, 'sha256', include_metadata=False)
+
+        with open(output, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f))
+        assert header == ['File Path', 'Relative Path', 'File Size (bytes)', 'Hash (SHA256)',
+                          'Processing Time (s)', 'Speed (MB/s)', 'Status', 'Error Message']
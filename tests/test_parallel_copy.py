@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the bounded worker-pool copy mode in BufferedFileOperations
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.buffered_file_ops import BufferedFileOperations
+
+
+class TestParallelCopy:
+    """Test suite for parallel multi-file copies"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def items(self, temp_dir):
+        """Create a source tree and return (type, path, relative_path) items"""
+        source = temp_dir / "source"
+        items = []
+        for i in range(24):
+            file_path = source / f"camera_{i % 4}" / f"clip_{i:02d}.bin"
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Mix of small (direct) and medium (streamed) files
+            file_path.write_bytes(os.urandom(40_000 if i % 3 else 1_200_000))
+            items.append(('file', file_path, file_path.relative_to(source)))
+        return items
+
+    def test_parallel_copy_hashes_and_order(self, temp_dir, items):
+        """Every file is copied, verified and reported in input order"""
+        file_ops = BufferedFileOperations(max_workers_override=4)
+
+        result = file_ops._copy_files_internal(items, temp_dir / "dest", calculate_hash=True)
+
+        assert result.success, result.error
+        assert result.files_processed == len(items)
+        assert result.value['_performance_stats']['threads_used'] == 4
+
+        keys = [k for k in result.value if k != '_performance_stats']
+        assert keys == [str(rel) for _, _, rel in items]
+
+        for _, source_path, relative_path in items:
+            data = result.value[str(relative_path)]
+            expected = hashlib.sha256(source_path.read_bytes()).hexdigest()
+            assert data['source_hash'] == expected
+            assert data['dest_hash'] == expected
+            assert (temp_dir / "dest" / relative_path).read_bytes() == source_path.read_bytes()
+
+    def test_parallel_copy_fails_fast(self, temp_dir, items):
+        """A failing file fails the whole operation like the sequential path"""
+        missing = temp_dir / "source" / "missing.bin"
+        items.insert(5, ('file', missing, Path("missing.bin")))
+
+        file_ops = BufferedFileOperations(max_workers_override=4)
+        result = file_ops._copy_files_internal(items, temp_dir / "dest", calculate_hash=True)
+
+        assert not result.success
+        assert "missing.bin" in str(result.error)
+
+    def test_parallel_copy_cancellation(self, temp_dir, items):
+        """Cancellation stops the pool and reports a cancelled error"""
+        calls = {'count': 0}
+
+        def cancelled_check():
+            calls['count'] += 1
+            return calls['count'] > 2
+
+        file_ops = BufferedFileOperations(cancelled_check=cancelled_check, max_workers_override=4)
+        result = file_ops._copy_files_internal(items, temp_dir / "dest", calculate_hash=True)
+
+        assert not result.success
+        assert "cancelled" in str(result.error).lower()
+
+    def test_single_worker_override_stays_sequential(self, temp_dir, items):
+        """max_workers_override=1 keeps the original sequential path"""
+        file_ops = BufferedFileOperations(max_workers_override=1)
+
+        result = file_ops._copy_files_internal(items, temp_dir / "dest", calculate_hash=True)
+
+        assert result.success
+        assert result.value['_performance_stats']['threads_used'] == 1
+        assert file_ops.metrics.copy_workers == 1
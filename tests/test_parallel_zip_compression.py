@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for multi-core DEFLATE in BufferedZipOperations
+"""
+
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from core.buffered_zip_ops import BufferedZipOperations
+from core.parallel_deflate import ParallelDeflateWriter
+
+
+class TestParallelZipCompression:
+    """Test suite for deterministic parallel ZIP_DEFLATED archives"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def evidence(self, temp_dir):
+        """Mixed compressible, incompressible, empty and multi-chunk files"""
+        source = temp_dir / "evidence"
+        (source / "logs").mkdir(parents=True)
+        text = b"2024-01-01 10:00:00 camera 3 motion detected\n" * 60_000  # ~2.7MB, several chunks
+        (source / "logs" / "events.log").write_bytes(text)
+        (source / "video.mp4").write_bytes(os.urandom(ParallelDeflateWriter.CHUNK_SIZE * 2))  # Exact multiple
+        (source / "empty.txt").write_bytes(b"")
+        (source / "notes.txt").write_bytes(b"short note")
+        return source
+
+    def _archive(self, source, output, workers):
+        ops = BufferedZipOperations(compression_workers=workers)
+        result = ops.create_archive_buffered(source, output, zipfile.ZIP_DEFLATED)
+        assert result.success, result.error
+        return ops
+
+    def test_archive_is_valid_and_complete(self, temp_dir, evidence):
+        """Every member decompresses to the original bytes with a correct CRC"""
+        output = temp_dir / "out.zip"
+        ops = self._archive(evidence, output, workers=4)
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            for info in zf.infolist():
+                assert info.compress_type == zipfile.ZIP_DEFLATED
+                assert zf.read(info) == (evidence / info.filename).read_bytes()
+            assert len(zf.infolist()) == 4
+
+        log_info = zipfile.ZipFile(output).getinfo("logs/events.log")
+        assert log_info.compress_size < log_info.file_size // 10
+        assert ops.metrics.files_processed == 4
+        assert ops.metrics.bytes_processed == ops.metrics.total_bytes
+
+    def test_output_is_byte_identical_across_runs_and_workers(self, temp_dir, evidence):
+        """Archive bytes do not depend on scheduling or the number of threads"""
+        digests = set()
+        for i, workers in enumerate((2, 8, 3, 8)):
+            output = temp_dir / f"run_{i}.zip"
+            self._archive(evidence, output, workers)
+            digests.add(output.read_bytes())
+
+        assert len(digests) == 1
+
+    def test_single_worker_uses_zipfile(self, temp_dir, evidence):
+        """compression_workers=1 keeps the existing single-core path"""
+        ops = BufferedZipOperations(compression_workers=1)
+        assert not ops._use_parallel_deflate(zipfile.ZIP_DEFLATED)
+        assert not BufferedZipOperations(compression_workers=4)._use_parallel_deflate(zipfile.ZIP_STORED)
+
+        output = temp_dir / "single.zip"
+        self._archive(evidence, output, workers=1)
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+
+    def test_missing_zipfile_internals_fall_back(self, temp_dir, evidence, monkeypatch):
+        """A Python without the private zipfile names gets a valid single-core archive"""
+        monkeypatch.delattr(zipfile, '_DD_SIGNATURE')
+        ops = BufferedZipOperations(compression_workers=4)
+        assert not ops._use_parallel_deflate(zipfile.ZIP_DEFLATED)
+
+        output = temp_dir / "fallback.zip"
+        self._archive(evidence, output, workers=4)
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert len(zf.infolist()) == 4
+
+    def test_cancellation_returns_error(self, temp_dir, evidence):
+        """Cancelling mid-archive stops reading and reports an error"""
+        ops = BufferedZipOperations(compression_workers=4, cancelled_check=lambda: True)
+
+        result = ops.create_archive_buffered(evidence, temp_dir / "cancelled.zip", zipfile.ZIP_DEFLATED)
+
+        assert not result.success
+        assert "cancelled" in str(result.error).lower()
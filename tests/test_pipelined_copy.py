@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the pipelined read/hash/write copy used for large files
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from core.buffered_file_ops import BufferedFileOperations
+
+
+class TestPipelinedCopy:
+    """Test suite for _pipelined_copy_with_hash"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def source(self, temp_dir):
+        """Create a source file larger than the lowered large-file threshold"""
+        path = temp_dir / "large.bin"
+        path.write_bytes(os.urandom(5 * 1024 * 1024 + 777))
+        return path
+
+    @pytest.fixture
+    def file_ops(self):
+        """BufferedFileOperations with a small large-file threshold"""
+        file_ops = BufferedFileOperations()
+        file_ops.LARGE_FILE_THRESHOLD = 2 * 1024 * 1024
+        return file_ops
+
+    def test_pipelined_copy_hashes_match(self, temp_dir, source, file_ops):
+        """Pipelined copy produces identical data and verified hashes"""
+        dest = temp_dir / "dest.bin"
+
+        result = file_ops.copy_file_buffered(source, dest, buffer_size=64 * 1024, calculate_hash=True)
+
+        assert result.success, result.error
+        expected = hashlib.sha256(source.read_bytes()).hexdigest()
+        assert result.value['pipelined'] is True
+        assert result.value['source_hash'] == expected
+        assert result.value['dest_hash'] == expected
+        assert dest.read_bytes() == source.read_bytes()
+        assert file_ops.metrics.pipelined_files == 1
+
+    def test_destination_hashed_from_disk(self, temp_dir, source, file_ops):
+        """Destination hash still comes from a separate read of the written file"""
+        dest = temp_dir / "dest.bin"
+
+        with patch.object(file_ops, '_calculate_hash_streaming', return_value="0" * 64) as mock_hash:
+            result = file_ops.copy_file_buffered(source, dest, buffer_size=64 * 1024, calculate_hash=True)
+
+        mock_hash.assert_called_once_with(dest, 64 * 1024)
+        assert not result.success
+        assert "Hash verification failed" in str(result.error)
+
+    def test_pipelined_copy_cancellation(self, temp_dir, source, file_ops):
+        """Cancelling mid-file stops all pipeline stages and fails the copy"""
+        calls = {'count': 0}
+
+        def pause_check():
+            calls['count'] += 1
+            if calls['count'] == 5:
+                file_ops.cancel_event.set()
+
+        file_ops.pause_check = pause_check
+        result = file_ops.copy_file_buffered(source, temp_dir / "dest.bin",
+                                             buffer_size=64 * 1024, calculate_hash=True)
+
+        assert not result.success
+        assert "cancelled" in str(result.error).lower()
+
+    def test_reader_error_is_reported(self, temp_dir, source, file_ops):
+        """An I/O error in the reader thread fails the copy instead of hanging"""
+        dest = temp_dir / "dest.bin"
+        real_open = open
+
+        class FailingReader:
+            def __init__(self, handle):
+                self._handle = handle
+                self._reads = 0
+
+            def readinto(self, buffer):
+                self._reads += 1
+                if self._reads == 3:
+                    raise OSError("simulated read error")
+                return self._handle.readinto(buffer)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                self._handle.close()
+
+        def fake_open(path, mode='r', *args, **kwargs):
+            handle = real_open(path, mode, *args, **kwargs)
+            if Path(path) == source and 'r' in mode:
+                return FailingReader(handle)
+            return handle
+
+        with patch('builtins.open', side_effect=fake_open):
+            result = file_ops.copy_file_buffered(source, dest, buffer_size=64 * 1024, calculate_hash=True)
+
+        assert not result.success
+        assert "simulated read error" in str(result.error)
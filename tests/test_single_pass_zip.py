@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for single-pass multi-level ZIP creation
+"""
+
+import builtins
+import os
+import tempfile
+import zipfile
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+import core.buffered_zip_ops as buffered_zip_ops
+import core.parallel_deflate as parallel_deflate
+from core.buffered_zip_ops import BufferedZipOperations
+from utils.zip_utils import ArchiveMethod, ZipSettings, ZipUtility
+
+
+def _zip_contents(path: Path) -> dict:
+    with zipfile.ZipFile(path) as zf:
+        return {info.filename: zf.read(info) for info in zf.infolist()}
+
+
+class TestSinglePassZip:
+    """Test suite for reading evidence once across archive levels"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def job_root(self, temp_dir):
+        """Create an occurrence/location/datetime folder structure"""
+        root = temp_dir / "PR123"
+        for location in ("Loc_A", "Loc_B"):
+            for stamp in ("2024-01-01_1000", "2024-01-02_1100"):
+                folder = root / location / stamp
+                folder.mkdir(parents=True)
+                (folder / "video.mp4").write_bytes(os.urandom(300_000))
+                (folder / "export.log").write_bytes(b"log " * 100)
+        return root
+
+    def _settings(self, single_pass: bool) -> ZipSettings:
+        return ZipSettings(create_at_root=True, create_at_location=True, create_at_datetime=True,
+                           archive_method=ArchiveMethod.BUFFERED_PYTHON, single_pass=single_pass)
+
+    def test_matches_per_level_archives(self, temp_dir, job_root):
+        """Every archive has the same members and bytes as creating it on its own"""
+        utility = ZipUtility(archive_method=ArchiveMethod.BUFFERED_PYTHON)
+        single = utility.create_multi_level_archives(job_root, self._settings(single_pass=True))
+        single_contents = {path: _zip_contents(path) for path in single}
+        for path in set(single):
+            path.unlink()
+
+        sequential = utility.create_multi_level_archives(job_root, self._settings(single_pass=False))
+
+        assert single == sequential
+        assert len(single) == 1 + 2 + 4  # Both locations share one output path
+        for path in sequential:
+            assert single_contents[path] == _zip_contents(path)
+
+    def test_each_source_file_read_once(self, job_root, monkeypatch):
+        """Source files are opened once for all levels"""
+        opened = Counter()
+        real_open = builtins.open
+
+        def counting_open(path, mode='r', *args, **kwargs):
+            if 'r' in mode and Path(path).suffix in ('.mp4', '.log'):
+                opened[Path(path).name + str(Path(path).parent)] += 1
+            return real_open(path, mode, *args, **kwargs)
+
+        monkeypatch.setattr(buffered_zip_ops, 'open', counting_open, raising=False)
+        ops = BufferedZipOperations()
+        jobs = [(job_root, job_root.parent / "root.zip")] + [
+            (location, job_root.parent / f"{location.name}.zip") for location in job_root.iterdir()
+        ]
+        result = ops.create_archives_single_pass(jobs)
+
+        assert result.success
+        assert len(result.value) == 3
+        assert len(opened) == 8
+        assert set(opened.values()) == {1}
+        assert ops.metrics.bytes_processed == sum(f.stat().st_size for f in job_root.rglob('*') if f.is_file())
+
+    def test_same_output_path_keeps_last_job(self, temp_dir, job_root):
+        """Two levels writing to one path behave like sequential overwrite"""
+        output = temp_dir / "out.zip"
+        location = job_root / "Loc_A"
+        result = BufferedZipOperations().create_archives_single_pass([(job_root, output), (location, output)])
+
+        assert result.success
+        assert result.value == [output]
+        assert sorted(_zip_contents(output)) == sorted(
+            str(f.relative_to(location)) for f in location.rglob('*') if f.is_file())
+
+    def test_deflated_levels_compress_each_chunk_once(self, temp_dir, job_root, monkeypatch):
+        """DEFLATED single-pass deflates each chunk once on the thread pool for all archives"""
+        calls = Counter()
+        real_deflate = parallel_deflate._deflate_chunk
+
+        def counting_deflate(data, *args):
+            calls[len(data)] += 1
+            return real_deflate(data, *args)
+
+        monkeypatch.setattr(parallel_deflate, '_deflate_chunk', counting_deflate)
+        ops = BufferedZipOperations(compression_workers=4)
+        jobs = [(job_root, temp_dir / "root.zip")] + [
+            (location, temp_dir / f"{location.name}.zip") for location in job_root.iterdir()
+        ]
+        result = ops.create_archives_single_pass(jobs, zipfile.ZIP_DEFLATED, hash_manifest=True)
+
+        assert result.success
+        assert sum(calls.values()) == 8  # One chunk per source file, not one per archive
+        for source, output in jobs:
+            with zipfile.ZipFile(output) as zf:
+                assert zf.testzip() is None
+                assert {info.compress_type for info in zf.infolist()} == {zipfile.ZIP_DEFLATED}
+            expected = {str(f.relative_to(source)): f.read_bytes() for f in source.rglob('*') if f.is_file()}
+            assert _zip_contents(output) == expected
+            assert len(result.member_hashes[str(output)]) == len(expected)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for normalize-as-you-go media analysis
+
+The fake ffprobe returns a large frame array for GOP analysis so that the
+memory held by raw results is easy to measure.
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from copy_hash_verify.core.storage_detector import StorageInfo, DriveType, BusType
+from media_analysis.core.media_analysis_models import MediaAnalysisSettings
+from media_analysis.core.media_analysis_service import MediaAnalysisService
+from media_analysis.ffprobe.ffprobe_wrapper import FFProbeWrapper
+
+
+FRAMES_PER_FILE = 3000
+
+FAKE_FFPROBE = r'''
+import json, sys
+
+out = {"format": {"format_name": "mov,mp4", "duration": "100.0"},
+       "streams": [{"index": 0, "codec_type": "video", "width": 1280, "height": 720}]}
+if any(arg.startswith("frame=") for arg in sys.argv):
+    out["frames"] = [{"pict_type": "I" if i % 30 == 0 else "P", "key_frame": int(i % 30 == 0),
+                      "coded_picture_number": i, "pkt_pts_time": f"{i / 30:.6f}"}
+                     for i in range(FRAMES_PER_FILE)]
+print(json.dumps(out))
+'''.replace("FRAMES_PER_FILE", str(FRAMES_PER_FILE))
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake ffprobe is a POSIX script")
+class TestStreamingMediaAnalysis:
+    """Test suite for the streaming analyze_media_files pipeline"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def service(self, temp_dir):
+        """Service wired to the fake ffprobe, on a known storage type"""
+        binary = temp_dir / "ffprobe"
+        binary.write_text(f"#!{sys.executable}\n" + FAKE_FFPROBE)
+        binary.chmod(0o755)
+        service = MediaAnalysisService()
+        service.ffprobe_wrapper = FFProbeWrapper(binary)
+        service._storage_info[Path(temp_dir).anchor] = StorageInfo(
+            drive_type=DriveType.SSD, bus_type=BusType.SATA, is_ssd=True, is_removable=False,
+            confidence=1.0, detection_method="test", drive_letter="", performance_class=4
+        )
+        return service
+
+    @pytest.fixture
+    def media_files(self, temp_dir):
+        """Thirty small files to probe"""
+        folder = temp_dir / "media"
+        folder.mkdir()
+        paths = []
+        for i in range(30):
+            path = folder / f"clip_{i:02d}.mp4"
+            path.write_bytes(b"\x00" * 64)
+            paths.append(path)
+        return paths
+
+    def _gop_settings(self, **kwargs) -> MediaAnalysisSettings:
+        settings = MediaAnalysisSettings(max_workers=2, use_metadata_cache=False, **kwargs)
+        settings.frame_analysis_fields.enabled = True
+        settings.frame_analysis_fields.fields = {"gop_structure": True, "i_frame_count": True}
+        return settings
+
+    def _raw_payload_size(self, service, media_file) -> int:
+        """Bytes allocated by one parsed fake ffprobe result"""
+        tracemalloc.start()
+        try:
+            raw = service.ffprobe_wrapper.extract_metadata(media_file, self._gop_settings()).value
+            size = tracemalloc.get_traced_memory()[0]
+            assert len(raw['frames']) == FRAMES_PER_FILE
+        finally:
+            tracemalloc.stop()
+        return size
+
+    def test_frames_are_summarized_and_raw_dropped(self, service, media_files):
+        """GOP statistics survive normalization; raw JSON and frames do not"""
+        result = service.analyze_media_files(media_files, self._gop_settings())
+
+        assert result.success and result.value.successful == len(media_files)
+        for metadata in result.value.metadata_list:
+            assert metadata.i_frame_count == FRAMES_PER_FILE // 30
+            assert metadata.raw_json is None
+
+        kept = service.analyze_media_files(media_files[:2], self._gop_settings(keep_raw_json=True))
+        assert all(m.raw_json['format']['duration'] == "100.0" for m in kept.value.metadata_list)
+
+    def test_peak_memory_bounded_by_workers_not_files(self, service, media_files):
+        """Only the results in flight are alive at once"""
+        one_result = self._raw_payload_size(service, media_files[0])
+
+        tracemalloc.start()
+        try:
+            result = service.analyze_media_files(media_files, self._gop_settings())
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert result.value.successful == len(media_files)
+        window = 2 * FFProbeWrapper.SUBMIT_WINDOW_PER_WORKER
+        assert peak < (window + 4) * one_result < len(media_files) * one_result
+
+    def test_partial_results_are_emitted_progressively(self, service, media_files):
+        """Running count snapshots grow towards the final result"""
+        service.PARTIAL_RESULT_INTERVAL = 0
+        snapshots = []
+
+        result = service.analyze_media_files(
+            media_files, MediaAnalysisSettings(max_workers=2, use_metadata_cache=False),
+            partial_result_callback=snapshots.append
+        )
+
+        assert result.success
+        assert len(snapshots) == len(media_files)
+        done = [s.successful + s.failed + s.skipped for s in snapshots]
+        assert done == sorted(done) and done[-1] == len(media_files)
+        assert all(s.total_files == len(media_files) for s in snapshots)
+        assert all(s.metadata_list == [] for s in snapshots)
+        assert len(result.value.metadata_list) == len(media_files)
+
+    def test_extract_batch_without_collecting(self, service, media_files):
+        """Results are only delivered through the callback when collection is off"""
+        streamed = []
+        results = service.ffprobe_wrapper.extract_batch(
+            media_files, MediaAnalysisSettings(), max_workers=2,
+            result_callback=lambda path, result: streamed.append(path),
+            collect_results=False
+        )
+
+        assert results == {}
+        assert sorted(streamed) == sorted(media_files)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for chunked tree digests in UnifiedHashCalculator
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.hash_reports import HashReportGenerator
+from copy_hash_verify.core.tree_hash import (ChunkManifest, TreeHasher, combine_chunk_digests,
+                                             chunk_manifest_path, save_chunk_manifests)
+from copy_hash_verify.core.unified_hash_calculator import UnifiedHashCalculator
+
+CHUNK_SIZE = 64 * 1024
+
+
+class TestTreeHash:
+    """Test suite for tree hash mode and chunk manifests"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def image(self, temp_dir):
+        """Create a multi-chunk image file"""
+        path = temp_dir / "image.dd"
+        path.write_bytes(os.urandom(CHUNK_SIZE * 10 + 123))
+        return path
+
+    def test_manifest_matches_definition(self, image):
+        """Chunk digests are per-chunk SHA-256 and the root combines them"""
+        manifest = TreeHasher(chunk_size=CHUNK_SIZE, max_workers=4).hash_file(image)
+
+        data = image.read_bytes()
+        expected_chunks = [hashlib.sha256(data[i:i + CHUNK_SIZE]).hexdigest()
+                           for i in range(0, len(data), CHUNK_SIZE)]
+        assert manifest.chunk_digests == expected_chunks
+        assert manifest.root_digest == combine_chunk_digests('sha256', expected_chunks)
+        assert manifest.file_size == len(data)
+
+    def test_calculator_labels_tree_digest(self, image):
+        """Tree mode reports the root under its own label, default mode stays whole-file"""
+        tree = UnifiedHashCalculator(tree_hash=True, tree_chunk_size=CHUNK_SIZE)
+        tree_result = tree.hash_files([image])
+        assert tree_result.success
+        hash_result = tree_result.value[str(image)]
+        assert hash_result.algorithm == 'sha256-tree'
+        assert hash_result.hashes == {'sha256-tree': hash_result.tree_manifest.root_digest}
+
+        whole = UnifiedHashCalculator().calculate_hash(image)
+        assert whole.value.hash_value == hashlib.sha256(image.read_bytes()).hexdigest()
+        assert whole.value.tree_manifest is None
+
+    def test_verification_pinpoints_byte_ranges(self, temp_dir, image):
+        """A mismatch reports the differing chunk range instead of only the digest"""
+        source = temp_dir / "source"
+        target = temp_dir / "target"
+        source.mkdir()
+        target.mkdir()
+        data = bytearray(image.read_bytes())
+        (source / "image.dd").write_bytes(data)
+        data[CHUNK_SIZE * 3 + 10] ^= 0xFF
+        (target / "image.dd").write_bytes(data)
+
+        calculator = UnifiedHashCalculator(tree_hash=True, tree_chunk_size=CHUNK_SIZE, enable_parallel=False)
+        result = calculator.verify_hashes([source], [target])
+
+        assert result.success
+        verification = next(iter(result.value.values()))
+        assert not verification.match
+        assert verification.differing_ranges == [(CHUNK_SIZE * 3, CHUNK_SIZE * 4)]
+
+    def test_verify_against_saved_manifest(self, temp_dir, image):
+        """A saved manifest can be reloaded to check the file later"""
+        manifest_path = temp_dir / "image.manifest.json"
+        TreeHasher(chunk_size=CHUNK_SIZE).hash_file(image).save(manifest_path)
+        assert ChunkManifest.load(manifest_path).chunk_size == CHUNK_SIZE
+
+        calculator = UnifiedHashCalculator()
+        assert calculator.verify_against_manifest(image, manifest_path).value.match
+
+        with open(image, 'r+b') as f:
+            f.seek(CHUNK_SIZE * 10 + 5)
+            original = f.read(1)[0]
+            f.seek(CHUNK_SIZE * 10 + 5)
+            f.write(bytes([original ^ 0xFF]))
+        result = calculator.verify_against_manifest(image, manifest_path)
+
+        assert result.success
+        assert not result.value.match
+        assert result.value.differing_ranges == [(CHUNK_SIZE * 10, CHUNK_SIZE * 10 + 123)]
+
+    def test_tree_report_verifies_with_chunk_manifests(self, temp_dir, image):
+        """A tree-mode report and its chunk manifests locate changes in a later copy"""
+        source = temp_dir / "source"
+        source.mkdir()
+        (source / "image.dd").write_bytes(image.read_bytes())
+        results = UnifiedHashCalculator(tree_hash=True, tree_chunk_size=CHUNK_SIZE).hash_files([source]).value
+        report = temp_dir / "hashes.csv"
+        assert HashReportGenerator().generate_single_hash_csv(list(results.values()), report, ['sha256-tree'])
+        save_chunk_manifests([r.tree_manifest for r in results.values()], chunk_manifest_path(report))
+        assert chunk_manifest_path(report).name == "hashes.chunks.json"
+
+        target = temp_dir / "target"
+        target.mkdir()
+        data = bytearray(image.read_bytes())
+        data[CHUNK_SIZE * 7 + 1] ^= 0xFF
+        (target / "image.dd").write_bytes(data)
+
+        result = UnifiedHashCalculator().verify_against_hash_manifest(report, [target])
+
+        assert result.success
+        verification = next(iter(result.value.values()))
+        assert verification.comparison_type == 'hash_mismatch'
+        assert verification.differing_ranges == [(CHUNK_SIZE * 7, CHUNK_SIZE * 8)]
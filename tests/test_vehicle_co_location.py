@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for spatio-temporal co-location detection
+
+Small scenarios check event merging; random fixes check the grid search
+against a brute-force comparison of every pair.
+"""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+import vehicle_tracking.services.vehicle_analysis_service as vehicle_analysis_service
+from vehicle_tracking.models.vehicle_tracking_models import GPSPoint, VehicleData, VehicleTrackingSettings
+from vehicle_tracking.services.vehicle_analysis_service import VehicleAnalysisError, VehicleAnalysisService
+from vehicle_tracking.services.vehicle_tracking_service import VehicleTrackingService
+
+try:
+    import numpy as np
+    from vehicle_tracking.models.gps_track import GPSTrack
+    from vehicle_tracking.services.co_location import find_hits
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+START = datetime(2024, 6, 1, 9, 0, 0)
+MEETING = (43.6500, -79.3800)
+
+
+def _vehicle(vehicle_id: str, fixes) -> VehicleData:
+    """Vehicle from (seconds after START, latitude, longitude) tuples"""
+    vehicle = VehicleData(vehicle_id=vehicle_id, source_file=Path(f"{vehicle_id}.csv"))
+    vehicle.gps_points = [GPSPoint(lat, lon, START + timedelta(seconds=s)) for s, lat, lon in fixes]
+    vehicle.get_time_range()
+    return vehicle
+
+
+def _drive(start_s: int, end_s: int, origin, destination, step_s: int = 5):
+    """Straight-line fixes from origin to destination"""
+    count = (end_s - start_s) // step_s
+    return [(start_s + i * step_s,
+             origin[0] + (destination[0] - origin[0]) * i / count,
+             origin[1] + (destination[1] - origin[1]) * i / count) for i in range(count + 1)]
+
+
+def _park(start_s: int, end_s: int, location, step_s: int = 5, jitter: float = 5e-5):
+    return [(s, location[0] + jitter * ((s // step_s) % 3 - 1), location[1]) for s in range(start_s, end_s, step_s)]
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+class TestVehicleCoLocation:
+    """Test suite for VehicleAnalysisService.analyze_co_location"""
+
+    @pytest.fixture
+    def service(self):
+        return VehicleAnalysisService()
+
+    def test_meeting_becomes_one_event(self, service):
+        """Two vehicles parked together for ten minutes give one event; a distant vehicle none"""
+        first = _vehicle("car_a", _drive(0, 600, (43.60, -79.40), MEETING) + _park(605, 1200, MEETING) +
+                         _drive(1205, 1800, MEETING, (43.70, -79.30)))
+        second = _vehicle("car_b", _drive(0, 600, (43.68, -79.45), MEETING) + _park(605, 1200, MEETING) +
+                          _drive(1205, 1800, MEETING, (43.62, -79.50)))
+        distant = _vehicle("car_c", _park(0, 1800, (44.0, -79.0)))
+
+        result = service.analyze_co_location([first, second, distant], radius_meters=50, time_window_seconds=60)
+
+        assert result.success
+        assert result.value.total_events == 1
+        event = result.value.co_locations[0]
+        assert event.vehicle_ids == ["car_a", "car_b"]
+        assert event.radius_meters == 50
+        assert START + timedelta(seconds=590) <= event.timestamp <= START + timedelta(seconds=605)
+        assert 590 <= event.duration_seconds <= 630
+        assert abs(event.location[0] - MEETING[0]) < 1e-3 and abs(event.location[1] - MEETING[1]) < 1e-3
+
+    def test_time_window_and_interval_splitting(self, service):
+        """Passing the same spot minutes apart only counts inside the window; visits split into events"""
+        first = _vehicle("car_a", _park(0, 60, MEETING) + _park(3600, 3660, MEETING))
+        second = _vehicle("car_b", _park(200, 260, MEETING) + _park(3600, 3660, MEETING))
+
+        narrow = service.analyze_co_location([first, second], radius_meters=30, time_window_seconds=60).value
+        wide = service.analyze_co_location([first, second], radius_meters=30, time_window_seconds=300).value
+
+        assert [e.timestamp for e in narrow.co_locations] == [START + timedelta(seconds=3600)]
+        assert [e.timestamp for e in wide.co_locations] == [START, START + timedelta(seconds=3600)]
+
+    def test_columnar_and_interpolated_vehicles(self, service):
+        """Columnar vehicles work, and interpolated samples do not create co-locations"""
+        tracking = VehicleTrackingService()
+        # car_a passes car_b at t=62.5 s, between observed fixes 12.5 s either side
+        first = _vehicle("car_a", [(i * 25, 43.600 + i * 0.003, -79.40) for i in range(5)])
+        second = _vehicle("car_b", _park(60, 66, (43.6075, -79.40), step_s=1, jitter=0))
+        first = tracking.interpolate_path(first, VehicleTrackingSettings()).value
+        columnar = VehicleData(vehicle_id="car_b", source_file=Path("car_b.csv"))
+        columnar.set_track(GPSTrack.from_points(second.gps_points))
+
+        result = service.analyze_co_location([first, columnar], radius_meters=50, time_window_seconds=5)
+        wider = service.analyze_co_location([first, columnar], radius_meters=200, time_window_seconds=15)
+
+        assert len(first.gps_points) == 101
+        assert result.success and result.value.total_events == 0
+        assert wider.value.total_events == 1
+        assert not service.analyze_co_location([first], 50, 10).success
+
+    @pytest.mark.skipif(os.name == 'nt', reason="time.tzset is POSIX only")
+    def test_mixed_timestamp_bases(self, service, monkeypatch):
+        """A UTC vehicle and a wall-clock vehicle are compared at the same instants"""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            local = _vehicle("car_a", _park(0, 600, MEETING))
+            utc = _vehicle("car_b", _park(0, 600, MEETING))
+            for point in utc.gps_points:
+                point.timestamp = point.timestamp.astimezone(timezone.utc)
+            start = START.astimezone(timezone.utc)
+
+            result = service.analyze_co_location([local, utc], radius_meters=50, time_window_seconds=60)
+            with pytest.raises(ValueError):
+                GPSTrack.concatenate([GPSTrack.from_points(local.gps_points),
+                                      GPSTrack.from_points(utc.gps_points)])
+        finally:
+            monkeypatch.delenv("TZ")
+            time.tzset()
+
+        assert result.success and result.value.total_events == 1
+        assert result.value.co_locations[0].timestamp == start
+
+    def test_grid_search_matches_brute_force(self):
+        """Every (fix, other vehicle) hit is found, and nothing else"""
+        rng = np.random.default_rng(7)
+        count, radius, window = 1500, 60.0, 120.0
+        owner = rng.integers(0, 4, count)
+        x, y = rng.uniform(0, 1500, count), rng.uniform(0, 1500, count)
+        timestamp_ns = (rng.uniform(0, 3600, count) * 1e9).astype(np.int64)
+
+        hit_fix, hit_other = find_hits(owner, x, y, timestamp_ns, radius, window)
+
+        close = (((x[:, None] - x[None]) ** 2 + (y[:, None] - y[None]) ** 2 <= radius ** 2) &
+                 (np.abs(timestamp_ns[:, None] - timestamp_ns[None]) <= int(window * 1e9)) &
+                 (owner[:, None] != owner[None]))
+        i, j = np.nonzero(close)
+        assert set(zip(hit_fix.tolist(), hit_other.tolist())) == set(zip(i.tolist(), owner[j].tolist()))
+        assert len(hit_fix) > 100
+
+
+class TestVehicleCoLocationWithoutNumpy:
+    """analyze_co_location when numpy is unavailable"""
+
+    def test_co_location_without_numpy_is_an_error(self, monkeypatch):
+        """Without numpy the analysis fails cleanly instead of raising"""
+        monkeypatch.setattr(vehicle_analysis_service, 'HAS_NUMPY', False)
+        first = _vehicle("car_a", _park(0, 60, MEETING))
+        second = _vehicle("car_b", _park(0, 60, MEETING))
+
+        result = VehicleAnalysisService().analyze_co_location([first, second], radius_meters=50,
+                                                              time_window_seconds=60)
+
+        assert not result.success
+        assert isinstance(result.error, VehicleAnalysisError)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the vectorized pandas CSV ingest in VehicleTrackingService
+
+The native csv-module parser is the reference: the pandas path must accept
+and reject exactly the same rows.
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from vehicle_tracking.models.vehicle_tracking_models import VehicleTrackingSettings
+from vehicle_tracking.services.vehicle_tracking_service import VehicleTrackingService, HAS_PANDAS
+
+
+MESSY_CSV = """Latitude, Longitude ,Time,Speed,heading
+43.6,-79.4,2024-11-09 15:26,50,90
+,-79.4,2024-11-09 15:27,50,90
+43.61,-79.41,2024-11-09 15:28:30,,x
+43.62,-79.42,not a time,1,1
+43.63,-79.43,11/09/2024 15:30,,
+43.64,-79.44,2024-11-09 15:31,7.5,
+"""
+
+
+@pytest.mark.skipif(not HAS_PANDAS, reason="pandas not installed")
+class TestVehicleCsvIngest:
+    """Test suite for VehicleTrackingService._parse_csv_pandas"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def service(self):
+        return VehicleTrackingService()
+
+    def _write(self, temp_dir: Path, name: str, text: str) -> Path:
+        path = temp_dir / name
+        path.write_text(text, encoding='utf-8')
+        return path
+
+    def _fields(self, vehicle):
+        return [(p.latitude, p.longitude, p.timestamp, p.speed_kmh, p.altitude, p.heading)
+                for p in vehicle.gps_points]
+
+    def test_matches_native_parser_on_messy_file(self, service, temp_dir):
+        """Blank/invalid cells drop rows, mixed timestamp formats still parse"""
+        path = self._write(temp_dir, "messy.csv", MESSY_CSV)
+        settings = VehicleTrackingSettings()
+
+        parsed = service._parse_csv_pandas(path, "messy", settings)
+        reference = service._parse_csv_native(path, "messy", settings)
+
+        assert parsed.success and reference.success
+        assert parsed.value.track is not None
+        assert self._fields(parsed.value) == self._fields(reference.value)
+        assert len(parsed.value.gps_points) == 4
+        assert parsed.value.start_time == reference.value.get_time_range()[0]
+
+    def test_tab_delimited_utc_timestamps(self, service, temp_dir):
+        """Tab-separated files and trailing-Z timestamps load like the native parser"""
+        path = self._write(temp_dir, "tabs.csv",
+                           "lat\tlon\ttimestamp\n43.6\t-79.4\t2024-01-01T10:00:00Z\n"
+                           "43.7\t-79.4\t2024-01-01T10:00:05Z\n")
+        settings = VehicleTrackingSettings()
+
+        parsed = service._parse_csv_pandas(path, "tabs", settings)
+        reference = service._parse_csv_native(path, "tabs", settings)
+
+        assert self._fields(parsed.value) == self._fields(reference.value)
+
+    @pytest.mark.skipif(os.name == 'nt', reason="time.tzset is POSIX only")
+    @pytest.mark.parametrize("stamps", [
+        ["2024-01-01T10:00:00-05:00", "2024-01-01T10:00:05-05:00", "2024-07-01T10:00:10+02:00"],
+        ["2024-01-01T10:00:00Z", "2024-01-01T10:00:05Z", "2024-07-01T10:00:10Z"],
+    ], ids=["offset", "zulu"])
+    def test_timezone_parity_outside_utc(self, service, temp_dir, monkeypatch, stamps):
+        """Offset and Z timestamps give the same instants as the native parser; bad coordinates drop"""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            rows = [f"{43.6 + i * 1e-4},-79.4,{stamp}" for i, stamp in enumerate(stamps)]
+            rows += [f"91.0,-79.4,{stamps[0]}", f"43.6,-180.5,{stamps[0]}", f"nan,-79.4,{stamps[0]}"]
+            path = self._write(temp_dir, "tz.csv", "lat,lon,time\n" + "\n".join(rows) + "\n")
+            settings = VehicleTrackingSettings()
+
+            parsed = service._parse_csv_pandas(path, "tz", settings).value
+            reference = service._parse_csv_native(path, "tz", settings).value
+
+            assert len(parsed.gps_points) == len(reference.gps_points) == 3
+            assert self._fields(parsed) == self._fields(reference)
+            expected = [p.timestamp.timestamp() for p in reference.gps_points]
+            assert parsed.track.epoch_seconds().tolist() == expected
+        finally:
+            monkeypatch.delenv("TZ")
+            time.tzset()
+
+    def test_chunks_stream_and_row_limit(self, service, temp_dir):
+        """Small chunks give the same track, and max_points_per_vehicle caps rows read"""
+        rows = [f"{43.6 + i * 1e-4},-79.4,2024-01-01 10:{i // 60:02d}:{i % 60:02d}" for i in range(250)]
+        path = self._write(temp_dir, "long.csv", "lat,lon,time\n" + "\n".join(rows) + "\n")
+
+        progress = []
+        chunked = service._parse_csv_pandas(
+            path, "long", VehicleTrackingSettings(chunk_size=32),
+            progress_callback=lambda pct, msg: progress.append(msg))
+        whole = service._parse_csv_pandas(path, "long", VehicleTrackingSettings(chunk_size=10000))
+        limited = service._parse_csv_pandas(
+            path, "long", VehicleTrackingSettings(chunk_size=32, max_points_per_vehicle=100))
+
+        assert len(progress) == 8
+        assert chunked.value.track.data.tobytes() == whole.value.track.data.tobytes()
+        assert limited.value.point_count == 100
+
+    def test_list_output_and_missing_columns(self, service, temp_dir):
+        """use_columnar_tracks=False yields GPSPoint lists; missing columns are a clean error"""
+        path = self._write(temp_dir, "messy.csv", MESSY_CSV)
+        listed = service._parse_csv_pandas(path, "messy", VehicleTrackingSettings(use_columnar_tracks=False))
+        assert isinstance(listed.value.gps_points, list) and len(listed.value.gps_points) == 4
+
+        bad = self._write(temp_dir, "bad.csv", "x,y,z\n1,2,3\n")
+        result = service.parse_csv_file(bad, VehicleTrackingSettings())
+        assert not result.success
+        assert "latitude, longitude, and timestamp" in result.error.user_message
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for relative-path matching in UnifiedHashCalculator._compare_hashes
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from copy_hash_verify.core.unified_hash_calculator import UnifiedHashCalculator, HashResult
+
+
+def _result(path: str, digest: str = 'a' * 64) -> HashResult:
+    return HashResult(file_path=Path(path), relative_path=Path(path), algorithm='sha256',
+                      hash_value=digest, file_size=1, duration=0.0)
+
+
+class TestVerificationJoin:
+    """Test suite for the string-based verification join"""
+
+    @pytest.fixture
+    def calculator(self):
+        """Calculator without storage detection side effects"""
+        return UnifiedHashCalculator(enable_parallel=False)
+
+    def test_common_root_respects_component_boundaries(self, calculator):
+        """'/case/ab' is not below '/case/a' even though the strings share a prefix"""
+        root = calculator._find_common_root(['/case/a/one.bin', '/case/ab/two.bin'])
+        assert root == Path('/case')
+        assert calculator._find_common_root(['/case/a/one.bin', '/case/a/sub/two.bin']) == Path('/case/a')
+        assert calculator._find_common_root([]) == Path('.')
+
+    def test_duplicate_names_match_by_structure(self, calculator):
+        """Same file name in different folders joins on the full relative path"""
+        source = {
+            '/src/cam1/clip.mp4': _result('/src/cam1/clip.mp4', 'a' * 64),
+            '/src/cam2/clip.mp4': _result('/src/cam2/clip.mp4', 'b' * 64),
+        }
+        target = {
+            '/dst/copy/cam2/clip.mp4': _result('/dst/copy/cam2/clip.mp4', 'b' * 64),
+            '/dst/copy/cam1/clip.mp4': _result('/dst/copy/cam1/clip.mp4', 'a' * 64),
+            '/dst/copy/cam3/extra.mp4': _result('/dst/copy/cam3/extra.mp4'),
+        }
+
+        results = calculator._compare_hashes(source, target)
+
+        assert results['/src/cam1/clip.mp4'].target_result.file_path == Path('/dst/copy/cam1/clip.mp4')
+        assert results['/src/cam2/clip.mp4'].match
+        assert results['/dst/copy/cam3/extra.mp4'].comparison_type == 'missing_source'
+        assert list(results) == ['/src/cam1/clip.mp4', '/src/cam2/clip.mp4', '/dst/copy/cam3/extra.mp4']
+
+    def test_large_join_is_fast(self, calculator):
+        """50k entries per side are matched without per-entry Path work"""
+        source = {}
+        target = {}
+        for i in range(50_000):
+            relative = f"folder_{i % 300}/sub_{i % 7}/file_{i}.bin"
+            source[f"/evidence/{relative}"] = _result(f"/evidence/{relative}")
+            target[f"/copy/run/{relative}"] = _result(f"/copy/run/{relative}")
+
+        start = time.time()
+        results = calculator._compare_hashes(source, target)
+
+        assert len(results) == 50_000
+        assert all(v.match for v in results.values())
+        assert time.time() - start < 10
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the stat-only size triage before hash verification
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from copy_hash_verify.core.unified_hash_calculator import UnifiedHashCalculator
+
+
+class TestVerificationTriage:
+    """Test suite for size triage in verify_hashes()"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def trees(self, temp_dir):
+        """Source and a target with one of each kind of difference"""
+        source = temp_dir / "source"
+        (source / "sub").mkdir(parents=True)
+        for name in ("same.bin", "sub/tampered.bin", "sub/truncated.bin", "only_source.bin"):
+            (source / name).write_bytes(os.urandom(4096))
+
+        target = temp_dir / "target"
+        shutil.copytree(source, target)
+        (target / "only_source.bin").unlink()
+        (target / "only_target.bin").write_bytes(b"extra")
+        (target / "sub" / "truncated.bin").write_bytes((source / "sub" / "truncated.bin").read_bytes()[:100])
+        data = bytearray((source / "sub" / "tampered.bin").read_bytes())
+        data[0] ^= 0xFF
+        (target / "sub" / "tampered.bin").write_bytes(bytes(data))
+        return source, target
+
+    def _by_name(self, result):
+        return {Path(path).name: vr for path, vr in result.value.items()}
+
+    def test_triage_skips_size_mismatches(self, trees):
+        """Missing and size-mismatched files are decided without hashing"""
+        source, target = trees
+        hashed = []
+        calculator = UnifiedHashCalculator(enable_parallel=False, size_triage=True, hash_size_mismatches=False)
+        original = calculator.calculate_hash
+        calculator.calculate_hash = lambda path, rel=None: hashed.append(path.name) or original(path, rel)
+
+        result = calculator.verify_hashes([source], [target])
+
+        assert result.success
+        results = self._by_name(result)
+        assert results['same.bin'].comparison_type == 'exact_match'
+        assert results['tampered.bin'].comparison_type == 'hash_mismatch'
+        assert results['truncated.bin'].comparison_type == 'size_mismatch'
+        assert results['only_source.bin'].comparison_type == 'missing_target'
+        assert results['only_target.bin'].comparison_type == 'missing_source'
+        assert sorted(hashed) == ['same.bin', 'same.bin', 'tampered.bin', 'tampered.bin']
+        assert result.metadata['triage']['pairs_to_hash'] == 2
+
+    def test_triage_still_hashes_size_mismatches_by_default(self, trees):
+        """Without the skip option, size-mismatched pairs get a normal hash comparison"""
+        source, target = trees
+        calculator = UnifiedHashCalculator(enable_parallel=False, size_triage=True)
+
+        result = calculator.verify_hashes([source], [target])
+
+        results = self._by_name(result)
+        assert results['truncated.bin'].comparison_type == 'hash_mismatch'
+        assert calculator.triage_summary['size_mismatch'] == 1
+        assert calculator.triage_summary['missing_source'] == 1
+
+    def test_triage_matches_full_verification(self, trees):
+        """Pass/fail per file is the same with and without triage"""
+        source, target = trees
+        full = UnifiedHashCalculator(enable_parallel=False).verify_hashes([source], [target])
+        triaged = UnifiedHashCalculator(size_triage=True).verify_hashes([source], [target])
+
+        assert {p: v.match for p, v in full.value.items()} == {p: v.match for p, v in triaged.value.items()}
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for kernel-assisted copies and readinto() streaming in BufferedFileOperations
+"""
+
+import errno
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from core.buffered_file_ops import BufferedFileOperations, KERNEL_COPY_AVAILABLE
+
+
+class TestCopyStrategies:
+    """Test suite for copy method selection"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def source(self, temp_dir):
+        """Create a medium-sized source file (streamed path)"""
+        path = temp_dir / "source.bin"
+        path.write_bytes(os.urandom(3 * 1024 * 1024 + 123))
+        return path
+
+    def test_hashed_copy_streams_buffered(self, temp_dir, source):
+        """Hashed copies stream through the reusable readinto() buffer and still verify"""
+        file_ops = BufferedFileOperations()
+        dest = temp_dir / "dest.bin"
+
+        result = file_ops.copy_file_buffered(source, dest, buffer_size=256 * 1024, calculate_hash=True)
+
+        assert result.success, result.error
+        expected = hashlib.sha256(source.read_bytes()).hexdigest()
+        assert result.value['method'] == 'buffered'
+        assert result.value['source_hash'] == expected
+        assert result.value['dest_hash'] == expected
+        assert dest.read_bytes() == source.read_bytes()
+        assert file_ops.metrics.copy_methods == {'buffered': 1}
+
+    @pytest.mark.skipif(not KERNEL_COPY_AVAILABLE, reason="Kernel copy requires Linux")
+    def test_unhashed_copy_uses_kernel(self, temp_dir, source):
+        """Copies without hashing go through copy_file_range/sendfile"""
+        file_ops = BufferedFileOperations()
+        dest = temp_dir / "dest.bin"
+
+        result = file_ops.copy_file_buffered(source, dest, calculate_hash=False)
+
+        assert result.success, result.error
+        assert result.value['method'] in ('copy_file_range', 'sendfile')
+        assert result.value['bytes_copied'] == source.stat().st_size
+        assert dest.read_bytes() == source.read_bytes()
+        assert file_ops.metrics.copy_methods == {result.value['method']: 1}
+
+    @pytest.mark.skipif(not (KERNEL_COPY_AVAILABLE and hasattr(os, 'copy_file_range')
+                             and hasattr(os, 'sendfile')),
+                        reason="Needs copy_file_range and sendfile")
+    def test_copy_file_range_falls_back_to_sendfile(self, temp_dir, source):
+        """Unsupported copy_file_range (e.g. EXDEV) falls back to sendfile"""
+        file_ops = BufferedFileOperations()
+        dest = temp_dir / "dest.bin"
+
+        with patch.object(os, 'copy_file_range', side_effect=OSError(errno.EXDEV, "cross-device")):
+            result = file_ops.copy_file_buffered(source, dest, calculate_hash=False)
+
+        assert result.success, result.error
+        assert result.value['method'] == 'sendfile'
+        assert dest.read_bytes() == source.read_bytes()
+
+    @pytest.mark.skipif(not KERNEL_COPY_AVAILABLE, reason="Kernel copy requires Linux")
+    def test_unsupported_kernel_copy_falls_back_to_user_space(self, temp_dir, source):
+        """When neither syscall works the user-space stream copy is used"""
+        file_ops = BufferedFileOperations()
+        dest = temp_dir / "dest.bin"
+        unsupported = OSError(errno.EINVAL, "not supported")
+
+        with patch.object(os, 'copy_file_range', side_effect=unsupported, create=True), \
+             patch.object(os, 'sendfile', side_effect=unsupported, create=True):
+            result = file_ops.copy_file_buffered(source, dest, calculate_hash=False)
+
+        assert result.success, result.error
+        assert result.value['method'] == 'buffered'
+        assert dest.read_bytes() == source.read_bytes()
+
+    def test_default_buffer_size_uses_setting_in_bytes(self, temp_dir, source):
+        """The copy_buffer_size setting is already in bytes and stays within 8KB-10MB"""
+        file_ops = BufferedFileOperations()
+
+        result = file_ops.copy_file_buffered(source, temp_dir / "dest.bin", calculate_hash=True)
+
+        assert result.success, result.error
+        assert result.value['buffer_size'] == file_ops.settings.copy_buffer_size
+        assert 8192 <= result.value['buffer_size'] <= 10485760
@@ -8,7 +8,7 @@ import zipfile
 from core.settings_manager import SettingsManager
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QGroupBox, QComboBox, QLabel,
-    QRadioButton, QDialogButtonBox, QButtonGroup, QHBoxLayout
+    QRadioButton, QDialogButtonBox, QButtonGroup, QHBoxLayout, QCheckBox
 )
 from PySide6.QtCore import Qt
 from utils.zip_utils import ArchiveMethod
@@ -102,6 +102,13 @@ class ZipSettingsDialog(QDialog):
         ])
         comp_layout.addWidget(self.comp_combo)
         
+        self.hash_manifest_check = QCheckBox("Save SHA-256 manifest with each archive")
+        self.hash_manifest_check.setToolTip(
+            "Hashes the archive and every file in it while the archive is written "
+            "and saves <archive>.sha256.json next to it"
+        )
+        comp_layout.addWidget(self.hash_manifest_check)
+        
         comp_group.setLayout(comp_layout)
         layout.addWidget(comp_group)
         
@@ -176,6 +183,7 @@ class ZipSettingsDialog(QDialog):
         # Compression level
         comp_value = self.settings.get('ZIP_COMPRESSION', 0)
         self.comp_combo.setCurrentIndex(comp_value)
+        self.hash_manifest_check.setChecked(self.settings.zip_hash_manifest)
         
         # Archive method - load from settings
         archive_method = self.settings.archive_method
@@ -244,6 +252,7 @@ class ZipSettingsDialog(QDialog):
         
         self.settings.set('ZIP_COMPRESSION', comp_index)
         self.settings.set('ZIP_COMPRESSION_LEVEL', comp_level)
+        self.settings.set('ZIP_HASH_MANIFEST', self.hash_manifest_check.isChecked())
         
         # Archive method - save to settings
         archive_method = self._get_selected_archive_method()
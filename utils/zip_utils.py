@@ -41,6 +41,8 @@ class ZipSettings:
     create_at_datetime: bool = False
     output_path: Optional[Path] = None
     archive_method: ArchiveMethod = ArchiveMethod.NATIVE_7ZIP  # Default to 7zip
+    single_pass: bool = True  # Buffered multi-level: read each file once for all archive levels
+    hash_manifest: bool = False  # Save a SHA-256 manifest (archive + members) next to each archive
     
 
 class ZipUtility:
@@ -159,7 +161,8 @@ class ZipUtility:
             result = self.native_controller.create_archive(
                 source_path, 
                 native_output, 
-                "store" if settings.compression_level == zipfile.ZIP_STORED else "fast"
+                "store" if settings.compression_level == zipfile.ZIP_STORED else "fast",
+                hash_manifest=settings.hash_manifest
             )
             
             if result.success:
@@ -186,7 +189,8 @@ class ZipUtility:
             result = self.buffered_ops.create_archive_buffered(
                 source_path, 
                 output_path, 
-                settings.compression_level
+                settings.compression_level,
+                hash_manifest=settings.hash_manifest
             )
             
             if result.success:
@@ -311,41 +315,56 @@ class ZipUtility:
                     # All methods now create .zip files
                     return f"{name}_Complete.zip"
                 
+            # Collect (folder, archive) jobs for every requested level
+            jobs = []
+            
             # Create at root level
             if settings.create_at_root and root_path.exists():
                 output = settings.output_path or root_path.parent
-                archive_name = create_descriptive_archive_name()
-                archive_path = output / archive_name
-                if self.create_archive(root_path, archive_path, settings):
-                    created_archives.append(archive_path)
+                jobs.append((root_path, output / create_descriptive_archive_name()))
                     
             # Create at location level (second level folders)
             if settings.create_at_location:
                 for location_folder in root_path.iterdir():
-                    if location_folder.is_dir() and not self.cancelled:
+                    if location_folder.is_dir():
                         output = settings.output_path or location_folder.parent
-                        archive_name = create_descriptive_archive_name()
-                        archive_path = output / archive_name
-                        if self.create_archive(location_folder, archive_path, settings):
-                            created_archives.append(archive_path)
+                        jobs.append((location_folder, output / create_descriptive_archive_name()))
                             
             # Create at datetime level (third level folders)
             if settings.create_at_datetime:
                 for location_folder in root_path.iterdir():
                     if location_folder.is_dir():
                         for datetime_folder in location_folder.iterdir():
-                            if datetime_folder.is_dir() and not self.cancelled:
+                            if datetime_folder.is_dir():
                                 output = settings.output_path or datetime_folder.parent
-                                archive_name = create_descriptive_archive_name()
-                                archive_path = output / archive_name
-                                if self.create_archive(datetime_folder, archive_path, settings):
-                                    created_archives.append(archive_path)
+                                jobs.append((datetime_folder, output / create_descriptive_archive_name()))
+            
+            # Nested levels share their files: buffered ZIP reads each file once for all of them
+            if len(jobs) > 1 and settings.single_pass and self._use_single_pass(settings):
+                result = self.buffered_ops.create_archives_single_pass(
+                    jobs, settings.compression_level, hash_manifest=settings.hash_manifest)
+                if result.success:
+                    # Same list as sequential creation (a shared output path is listed per job)
+                    return [archive_path for _, archive_path in jobs if archive_path in result.value]
+                logger.warning(f"Single-pass archiving failed: {result.error}, creating archives one by one")
+            
+            for source_folder, archive_path in jobs:
+                if self.cancelled:
+                    break
+                if self.create_archive(source_folder, archive_path, settings):
+                    created_archives.append(archive_path)
                                     
         except Exception as e:
             self._report_progress(0, f"Error creating archives: {str(e)}")
             
         return created_archives
         
+    def _use_single_pass(self, settings: ZipSettings) -> bool:
+        """Whether multi-level archives go through the buffered single-pass writer"""
+        if settings.archive_method == ArchiveMethod.BUFFERED_PYTHON and self.active_method != "buffered_python":
+            self._initialize_controllers()
+        return self.active_method == "buffered_python" and self.buffered_ops is not None
+        
     def _report_progress(self, percentage: int, message: str):
         """Report progress if callback is available"""
         if self.progress_callback:
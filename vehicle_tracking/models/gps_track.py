@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Columnar GPS Track Storage
+
+Holds a vehicle's GPS fixes as one NumPy structured array instead of a list of
+GPSPoint dataclasses. A 2M-row infotainment log fits in about 100MB this way,
+and preprocessing, speed calculation and wire conversion can work on whole
+columns at once.
+
+Legacy code that iterates or indexes `VehicleData.gps_points` keeps working:
+a GPSPointView yields freshly built GPSPoint objects on demand. Those objects
+are detached copies - attribute changes made to them are not written back to
+the track (metadata dicts are shared by reference).
+"""
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .vehicle_tracking_models import GPSPoint
+
+
+# Bit-packed point flags
+FLAG_OBSERVED = 0x01
+FLAG_INTERPOLATED = 0x02
+FLAG_GAP = 0x04
+FLAG_ANOMALY = 0x08
+
+# Speed certainty codes, index = code (matches SpeedCertainty values)
+CERTAINTY_LABELS = ('high', 'medium', 'low', 'unknown')
+NO_CERTAINTY = -1
+NO_SEGMENT = -1
+
+TRACK_DTYPE = np.dtype([
+    ('latitude', np.float64),
+    ('longitude', np.float64),
+    ('timestamp_ns', np.int64),           # Epoch nanoseconds (wall clock unless timestamps_utc)
+    ('speed_kmh', np.float32),            # NaN = not recorded
+    ('altitude', np.float32),
+    ('heading', np.float32),
+    ('accuracy', np.float32),
+    ('calculated_speed_kmh', np.float32),
+    ('segment_speed_kmh', np.float32),
+    ('segment_id', np.int32),             # NO_SEGMENT = None
+    ('certainty', np.int8),               # NO_CERTAINTY = None
+    ('flags', np.uint8),
+])
+
+_OPTIONAL_FLOATS = ('speed_kmh', 'altitude', 'heading', 'accuracy',
+                    'calculated_speed_kmh', 'segment_speed_kmh')
+
+_EPOCH = datetime(1970, 1, 1)
+_NS_PER_S = 1_000_000_000
+_ITER_CHUNK = 4096
+
+
+def certainty_code(label: Optional[str]) -> int:
+    """Map a certainty label ('high', ...) to its array code"""
+    return CERTAINTY_LABELS.index(label) if label in CERTAINTY_LABELS else NO_CERTAINTY
+
+
+class GPSTrack:
+    """
+    Columnar store of GPS fixes for one vehicle
+
+    Columns are fields of a TRACK_DTYPE structured array (`data`). Optional
+    float columns use NaN for "not set", segment_id and certainty use -1.
+    Per-point metadata is sparse: a dict keyed by row index.
+
+    Timestamps are int64 nanoseconds. Naive datetimes (the usual case for
+    infotainment exports) are stored as wall-clock time; aware datetimes are
+    converted to UTC and `timestamps_utc` is set.
+    """
+
+    def __init__(self, data: Optional[np.ndarray] = None,
+                 metadata: Optional[Dict[int, Dict[str, Any]]] = None,
+                 timestamps_utc: bool = False):
+        """
+        Wrap an existing structured array
+
+        Args:
+            data: Array of TRACK_DTYPE (None = empty track)
+            metadata: Sparse per-row metadata keyed by row index
+            timestamps_utc: True if timestamp_ns is UTC rather than wall clock
+        """
+        self.data = data if data is not None else np.zeros(0, dtype=TRACK_DTYPE)
+        self.metadata = metadata if metadata is not None else {}
+        self.timestamps_utc = timestamps_utc
+
+    @classmethod
+    def allocate(cls, count: int, timestamps_utc: bool = False) -> 'GPSTrack':
+        """Create a track of `count` rows with every optional column unset"""
+        data = np.zeros(count, dtype=TRACK_DTYPE)
+        for name in _OPTIONAL_FLOATS:
+            data[name] = np.nan
+        data['segment_id'] = NO_SEGMENT
+        data['certainty'] = NO_CERTAINTY
+        data['flags'] = FLAG_OBSERVED
+        return cls(data, timestamps_utc=timestamps_utc)
+
+    @classmethod
+    def from_columns(cls, latitude, longitude, timestamp_ns,
+                     speed_kmh=None, altitude=None, heading=None,
+                     timestamps_utc: bool = False) -> 'GPSTrack':
+        """
+        Build a track from column arrays of equal length
+
+        Args:
+            latitude: Latitudes in degrees
+            longitude: Longitudes in degrees
+            timestamp_ns: Epoch nanoseconds (int64 or datetime64)
+            speed_kmh: Recorded speeds (NaN = missing), optional
+            altitude: Altitudes in meters (NaN = missing), optional
+            heading: Headings in degrees (NaN = missing), optional
+            timestamps_utc: True if timestamp_ns is UTC rather than wall clock
+
+        Returns:
+            New GPSTrack
+        """
+        track = cls.allocate(len(latitude), timestamps_utc)
+        track.data['latitude'] = latitude
+        track.data['longitude'] = longitude
+        track.data['timestamp_ns'] = np.asarray(timestamp_ns).astype('datetime64[ns]').astype(np.int64)
+        for name, column in (('speed_kmh', speed_kmh), ('altitude', altitude), ('heading', heading)):
+            if column is not None:
+                track.data[name] = column
+        return track
+
+    @classmethod
+    def from_points(cls, points: Iterable[GPSPoint]) -> 'GPSTrack':
+        """
+        Convert GPSPoint objects into a columnar track
+
+        Args:
+            points: GPS points (distance/time_from_previous are not kept)
+
+        Returns:
+            New GPSTrack holding the same values
+        """
+        points = points if isinstance(points, list) else list(points)
+        track = cls.allocate(len(points))
+        if not points:
+            return track
+
+        track.timestamps_utc = points[0].timestamp.tzinfo is not None
+        if track.timestamps_utc:
+            stamps = [p.timestamp.astimezone(timezone.utc).replace(tzinfo=None) for p in points]
+        else:
+            stamps = [p.timestamp for p in points]
+
+        data = track.data
+        data['latitude'] = [p.latitude for p in points]
+        data['longitude'] = [p.longitude for p in points]
+        data['timestamp_ns'] = np.array(stamps, dtype='datetime64[ns]').astype(np.int64)
+        for name in _OPTIONAL_FLOATS:
+            data[name] = [np.nan if getattr(p, name) is None else getattr(p, name) for p in points]
+        data['segment_id'] = [NO_SEGMENT if p.segment_id is None else p.segment_id for p in points]
+        data['certainty'] = [certainty_code(p.speed_certainty) for p in points]
+        data['flags'] = [
+            (FLAG_OBSERVED if p.is_observed else 0) | (FLAG_INTERPOLATED if p.is_interpolated else 0) |
+            (FLAG_GAP if p.is_gap else 0) | (FLAG_ANOMALY if p.is_anomaly else 0)
+            for p in points
+        ]
+        track.metadata = {i: p.metadata for i, p in enumerate(points) if p.metadata}
+        return track
+
+    @classmethod
+    def concatenate(cls, tracks: List['GPSTrack']) -> 'GPSTrack':
+        """
+        Join tracks end to end
+
+        Raises:
+            ValueError: If the tracks mix UTC and wall-clock timestamps (see to_utc)
+        """
+        if not tracks:
+            return cls()
+        if len({t.timestamps_utc for t in tracks}) > 1:
+            raise ValueError("Cannot concatenate tracks with UTC and wall-clock timestamps")
+        metadata = {}
+        offset = 0
+        for track in tracks:
+            metadata.update({offset + i: md for i, md in track.metadata.items()})
+            offset += len(track)
+        return cls(np.concatenate([t.data for t in tracks]), metadata, tracks[0].timestamps_utc)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column data"""
+        return self.data.nbytes
+
+    # Column shortcuts
+    @property
+    def latitude(self) -> np.ndarray:
+        return self.data['latitude']
+
+    @property
+    def longitude(self) -> np.ndarray:
+        return self.data['longitude']
+
+    @property
+    def timestamp_ns(self) -> np.ndarray:
+        return self.data['timestamp_ns']
+
+    @property
+    def flags(self) -> np.ndarray:
+        return self.data['flags']
+
+    def has_flag(self, flag: int) -> np.ndarray:
+        """Boolean mask of rows with `flag` set"""
+        return (self.data['flags'] & flag) != 0
+
+    def set_flag(self, flag: int, mask, value: bool = True):
+        """Set or clear `flag` on the rows selected by `mask`"""
+        if value:
+            self.data['flags'][mask] |= flag
+        else:
+            self.data['flags'][mask] &= ~np.uint8(flag)
+
+    def point_metadata(self, index: int) -> Dict[str, Any]:
+        """Metadata dict for a row, created on first use"""
+        return self.metadata.setdefault(int(index), {})
+
+    def take(self, index) -> 'GPSTrack':
+        """
+        New track holding the selected rows, in the given order
+
+        Args:
+            index: Integer index array or boolean mask
+
+        Returns:
+            GPSTrack with metadata re-keyed to the new row positions
+        """
+        index = np.asarray(index)
+        if index.dtype == bool:
+            index = np.flatnonzero(index)
+        metadata = {}
+        if self.metadata:
+            keys = np.fromiter(self.metadata.keys(), dtype=np.int64, count=len(self.metadata))
+            for new in np.flatnonzero(np.isin(index, keys)).tolist():
+                metadata[new] = self.metadata[int(index[new])]
+        return GPSTrack(self.data[index], metadata, self.timestamps_utc)
+
+    def copy(self) -> 'GPSTrack':
+        """Independent copy of the columns (metadata dicts are copied one level deep)"""
+        return GPSTrack(self.data.copy(), {i: dict(md) for i, md in self.metadata.items()},
+                        self.timestamps_utc)
+
+    def datetimes(self, start: int = 0, stop: Optional[int] = None) -> List[datetime]:
+        """Timestamps of rows [start, stop) as datetime objects"""
+        stamps = self.data['timestamp_ns'][start:stop].view('datetime64[ns]').astype('datetime64[us]').tolist()
+        if self.timestamps_utc:
+            return [ts.replace(tzinfo=timezone.utc) for ts in stamps]
+        return stamps
+
+    def epoch_seconds(self) -> np.ndarray:
+        """
+        POSIX timestamps as float seconds, equal to datetime.timestamp()
+
+        Wall-clock timestamps are interpreted in the local timezone, exactly
+        as datetime.timestamp() treats naive datetimes.
+        """
+        ns = self.data['timestamp_ns']
+        seconds = ns // _NS_PER_S
+        micros = (ns % _NS_PER_S) // 1000
+        if self.timestamps_utc:
+            return (seconds * 1_000_000 + micros) / 1e6
+        return (seconds - _local_offsets(seconds)) + micros / 1e6
+
+    def epoch_ms(self) -> np.ndarray:
+        """Epoch milliseconds as int64, equal to int(datetime.timestamp() * 1000)"""
+        return (self.epoch_seconds() * 1000).astype(np.int64)
+
+    @staticmethod
+    def wall_ns_from_epoch_ms(epoch_ms) -> np.ndarray:
+        """Local wall-clock nanoseconds for epoch milliseconds, like datetime.fromtimestamp()"""
+        epoch_ms = np.asarray(epoch_ms, dtype=np.int64)
+        seconds = epoch_ms // 1000
+        hours = seconds // 3600
+        unique_hours, inverse = np.unique(hours, return_inverse=True)
+        offsets = np.array([
+            int((datetime.fromtimestamp(h * 3600) - _EPOCH).total_seconds()) - h * 3600
+            for h in unique_hours.tolist()
+        ], dtype=np.int64)
+        return (epoch_ms + offsets[inverse] * 1000) * 1_000_000
+
+    def to_utc(self) -> 'GPSTrack':
+        """
+        Same instants with UTC timestamps
+
+        Wall-clock timestamps are read in the local timezone, as epoch_seconds()
+        does. A track that is already UTC is returned as is.
+        """
+        if self.timestamps_utc:
+            return self
+        track = self.copy()
+        ns = track.data['timestamp_ns']
+        ns -= _local_offsets(ns // _NS_PER_S) * _NS_PER_S
+        track.timestamps_utc = True
+        return track
+
+    def point(self, index: int) -> GPSPoint:
+        """Build a detached GPSPoint for one row"""
+        return self._points(index, index + 1)[0] if index >= 0 else self.point(len(self) + index)
+
+    def points(self) -> 'GPSPointView':
+        """Sequence view yielding GPSPoint objects for legacy callers"""
+        return GPSPointView(self)
+
+    def to_points(self) -> List[GPSPoint]:
+        """Materialize every row as a GPSPoint"""
+        return self._points(0, len(self))
+
+    def _points(self, start: int, stop: int) -> List[GPSPoint]:
+        rows = self.data[start:stop]
+        columns = [[None if v != v else v for v in rows[name].astype(np.float64).tolist()]
+                   for name in _OPTIONAL_FLOATS]
+        segment_ids = [None if v == NO_SEGMENT else v for v in rows['segment_id'].tolist()]
+        certainties = [None if v == NO_CERTAINTY else CERTAINTY_LABELS[v] for v in rows['certainty'].tolist()]
+        metadata = self.metadata
+
+        points = []
+        for offset, (lat, lon, timestamp, flag, segment_id, certainty,
+                     speed, altitude, heading, accuracy, calculated, segment_speed) in enumerate(zip(
+                rows['latitude'].tolist(), rows['longitude'].tolist(), self.datetimes(start, stop),
+                rows['flags'].tolist(), segment_ids, certainties, *columns)):
+            points.append(GPSPoint(
+                latitude=lat,
+                longitude=lon,
+                timestamp=timestamp,
+                speed_kmh=speed,
+                altitude=altitude,
+                heading=heading,
+                accuracy=accuracy,
+                calculated_speed_kmh=calculated,
+                is_interpolated=bool(flag & FLAG_INTERPOLATED),
+                is_anomaly=bool(flag & FLAG_ANOMALY),
+                metadata=metadata.get(start + offset),
+                segment_speed_kmh=segment_speed,
+                speed_certainty=certainty,
+                segment_id=segment_id,
+                is_observed=bool(flag & FLAG_OBSERVED),
+                is_gap=bool(flag & FLAG_GAP)
+            ))
+        return points
+
+
+class GPSPointView(Sequence):
+    """
+    Read-only sequence of GPSPoint objects backed by a GPSTrack
+
+    Assign one to `VehicleData.gps_points` so legacy code can keep iterating
+    points while array-aware code reaches the columns through `.track`.
+    """
+
+    def __init__(self, track: GPSTrack):
+        self.track = track
+
+    def __len__(self) -> int:
+        return len(self.track)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[GPSPoint, List[GPSPoint]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self.track))
+            if step == 1:
+                return self.track._points(start, max(start, stop))
+            return [self.track.point(i) for i in range(start, stop, step)]
+        if index < -len(self.track) or index >= len(self.track):
+            raise IndexError("GPS point index out of range")
+        return self.track.point(index)
+
+    def __iter__(self) -> Iterator[GPSPoint]:
+        for start in range(0, len(self.track), _ITER_CHUNK):
+            yield from self.track._points(start, min(start + _ITER_CHUNK, len(self.track)))
+
+    def __bool__(self) -> bool:
+        return len(self.track) > 0
+
+    def __repr__(self) -> str:
+        return f"GPSPointView({len(self.track)} points)"
+
+
+def _local_offsets(wall_seconds: np.ndarray) -> np.ndarray:
+    """
+    UTC offset (seconds) of the local timezone for each wall-clock second
+
+    Offsets only change on hour boundaries in practice, so mktime is asked
+    once per distinct hour rather than once per point.
+    """
+    if len(wall_seconds) == 0:
+        return np.zeros(0, dtype=np.int64)
+    hours = wall_seconds // 3600
+    unique_hours, inverse = np.unique(hours, return_inverse=True)
+    offsets = np.array([
+        h * 3600 - int((_EPOCH + timedelta(hours=h)).timestamp())
+        for h in unique_hours.tolist()
+    ], dtype=np.int64)
+    return offsets[inverse]
@@ -9,9 +9,12 @@ Follows existing FSA patterns with dataclasses and comprehensive type hints.
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, TYPE_CHECKING
 from enum import Enum
 
+if TYPE_CHECKING:
+    from .gps_track import GPSTrack
+
 
 class InterpolationMethod(Enum):
     """Interpolation methods for GPS path smoothing"""
@@ -148,6 +151,23 @@ class VehicleData:
     segments: Optional[List['GPSSegment']] = None
     speed_anomalies: Optional[List[Dict[str, Any]]] = None
     
+    @property
+    def track(self) -> Optional['GPSTrack']:
+        """Columnar track behind gps_points, or None when points are a plain list"""
+        return getattr(self.gps_points, 'track', None)
+
+    def set_track(self, track: 'GPSTrack'):
+        """
+        Store GPS data as a columnar track
+
+        gps_points becomes a read-only GPSPointView over the track, so legacy
+        code can still iterate points.
+        """
+        self.gps_points = track.points()
+        self.start_time = None
+        self.end_time = None
+        self.get_time_range()
+
     def get_time_range(self) -> Tuple[datetime, datetime]:
         """Get the time range of this vehicle's data"""
         if not self.gps_points:
@@ -156,6 +176,13 @@ class VehicleData:
         if self.start_time and self.end_time:
             return self.start_time, self.end_time
         
+        track = self.track
+        if track is not None:
+            first, last = track.timestamp_ns.argmin(), track.timestamp_ns.argmax()
+            self.start_time = track.datetimes(first, first + 1)[0]
+            self.end_time = track.datetimes(last, last + 1)[0]
+            return self.start_time, self.end_time
+
         # Calculate from points
         self.start_time = min(p.timestamp for p in self.gps_points)
         self.end_time = max(p.timestamp for p in self.gps_points)
@@ -166,6 +193,11 @@ class VehicleData:
         if not self.gps_points:
             return None
         
+        track = self.track
+        if track is not None:
+            return (float(track.latitude.min()), float(track.longitude.min()),
+                    float(track.latitude.max()), float(track.longitude.max()))
+
         lats = [p.latitude for p in self.gps_points]
         lons = [p.longitude for p in self.gps_points]
         
@@ -204,6 +236,7 @@ class VehicleTrackingSettings:
     
     # Performance settings
     chunk_size: int = 10000  # For processing large CSV files
+    use_columnar_tracks: bool = True  # Hold GPS data as NumPy columns (needs numpy)
     max_points_per_vehicle: int = 100000  # Limit for browser performance
     decimation_threshold: int = 50000  # Simplify path if over this
     
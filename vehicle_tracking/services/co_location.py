@@ -0,0 +1,243 @@
+"""
+Spatio-temporal co-location detection for vehicle tracking.
+
+Every observed fix of every vehicle is projected into one local metric plane
+and binned into a grid of `radius_meters` cells, so any fix within the radius
+lies in the same or an adjacent cell. Inside each (cell, vehicle) bucket the
+fixes are sorted by time, which puts another vehicle's fixes within
+`time_window_seconds` one binary search away. Candidates are checked nearest
+in time first and a fix stops searching at its first hit, so the work grows
+with the number of fixes rather than with every pair of vehicles and fixes.
+
+Hits are merged per vehicle pair into CoLocationEvent intervals: consecutive
+hits no more than one time window apart belong to the same event.
+"""
+
+from datetime import timezone
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from ..models.gps_track import GPSTrack, FLAG_OBSERVED, FLAG_INTERPOLATED, FLAG_GAP
+from ..models.vehicle_tracking_models import VehicleData, CoLocationEvent
+
+# Neighbouring cells, own cell first (most hits are found there)
+_NEIGHBOURS = [(0, 0)] + [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+
+def collect_fixes(vehicles: List[VehicleData]) -> Tuple[np.ndarray, GPSTrack]:
+    """
+    Gather the observed fixes of all vehicles into one track
+
+    Interpolated samples and gap markers are left out: co-location is only
+    reported from recorded positions. If some vehicles have UTC timestamps
+    and others wall-clock time, every track is converted to UTC first.
+
+    Args:
+        vehicles: Vehicles to analyze
+
+    Returns:
+        Tuple of (vehicle index per fix, combined GPSTrack)
+    """
+    tracks = []
+    for vehicle in vehicles:
+        track = vehicle.track
+        if track is None:
+            track = GPSTrack.from_points(vehicle.gps_points)
+        keep = track.has_flag(FLAG_OBSERVED) & ~track.has_flag(FLAG_INTERPOLATED | FLAG_GAP)
+        tracks.append(GPSTrack(track.data[keep], timestamps_utc=track.timestamps_utc))
+
+    if len({t.timestamps_utc for t in tracks}) > 1:
+        tracks = [t.to_utc() for t in tracks]
+
+    owner = np.repeat(np.arange(len(tracks)), [len(t) for t in tracks])
+    return owner, GPSTrack.concatenate(tracks)
+
+
+def find_hits(
+    owner: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    timestamp_ns: np.ndarray,
+    radius_meters: float,
+    time_window_seconds: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find every fix that has a fix of another vehicle within radius and window
+
+    Args:
+        owner: Vehicle index of each fix
+        x, y: Metric coordinates of each fix
+        timestamp_ns: Fix times in nanoseconds
+        radius_meters: Maximum distance between fixes
+        time_window_seconds: Maximum time difference between fixes
+
+    Returns:
+        Tuple of (fix index, other vehicle index), one entry per distinct hit
+    """
+    vehicle_count = int(owner.max()) + 1 if len(owner) else 0
+    if vehicle_count < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    # Grid cells, padded so neighbour keys never wrap into another column
+    ix = np.floor(x / radius_meters).astype(np.int64)
+    iy = np.floor(y / radius_meters).astype(np.int64)
+    ix -= ix.min() - 1
+    iy -= iy.min() - 1
+    stride = int(iy.max()) + 2
+    cell = ix * stride + iy
+
+    # Times as ranks, so (bucket, time) fits in one sortable int64 key
+    window_ns = int(round(time_window_seconds * 1e9))
+    times = np.unique(timestamp_ns)
+    rank = np.searchsorted(times, timestamp_ns)
+    rank_lo = np.searchsorted(times, timestamp_ns - window_ns, 'left')
+    rank_hi = np.searchsorted(times, timestamp_ns + window_ns, 'right')
+    rank_count = len(times)
+
+    # Sort fixes by (cell, vehicle, time)
+    bucket = cell * vehicle_count + owner
+    order = np.lexsort((rank, bucket))
+    buckets, bucket_of = np.unique(bucket[order], return_inverse=True)
+    key = bucket_of * rank_count + rank[order]
+    sorted_x, sorted_y = x[order], y[order]
+    bucket_cell = buckets // vehicle_count
+    bucket_owner = buckets % vehicle_count
+
+    radius_sq = radius_meters * radius_meters
+    found = np.zeros(0, dtype=np.int64)
+    fixes = np.arange(len(owner))
+
+    for dx, dy in _NEIGHBOURS:
+        target = cell + dx * stride + dy
+        first = np.searchsorted(bucket_cell, target, 'left')
+        count = np.searchsorted(bucket_cell, target, 'right') - first
+
+        # One query per (fix, other vehicle's bucket in the neighbouring cell)
+        query = np.repeat(fixes, count)
+        target_bucket = np.repeat(first, count) + np.arange(len(query)) - np.repeat(np.cumsum(count) - count, count)
+        other = bucket_owner[target_bucket]
+        pending = (other != owner[query]) & ~np.isin(query * vehicle_count + other, found)
+        query, target_bucket, other = query[pending], target_bucket[pending], other[pending]
+
+        base = target_bucket * rank_count
+        lo = np.searchsorted(key, base + rank_lo[query], 'left')
+        hi = np.searchsorted(key, base + rank_hi[query], 'left')
+        center = np.clip(np.searchsorted(key, base + rank[query], 'left'), lo, hi)
+
+        # Walk outwards from the nearest time until a hit or the window runs out
+        step = 0
+        while len(query):
+            hit = np.zeros(len(query), dtype=bool)
+            alive = np.zeros(len(query), dtype=bool)
+            for index in (center + step, center - 1 - step):
+                valid = (index >= lo) & (index < hi)
+                alive |= valid
+                candidate = np.where(valid, index, 0)
+                distance_sq = (sorted_x[candidate] - x[query]) ** 2 + (sorted_y[candidate] - y[query]) ** 2
+                hit |= valid & (distance_sq <= radius_sq)
+
+            found = np.concatenate([found, query[hit] * vehicle_count + other[hit]])
+            keep = alive & ~hit
+            query, other, lo, hi, center = query[keep], other[keep], lo[keep], hi[keep], center[keep]
+            step += 1
+
+    found = np.unique(found)
+    return found // vehicle_count, found % vehicle_count
+
+
+def merge_events(
+    vehicles: List[VehicleData],
+    owner: np.ndarray,
+    fixes: GPSTrack,
+    hit_fix: np.ndarray,
+    hit_other: np.ndarray,
+    radius_meters: float,
+    time_window_seconds: float
+) -> List[CoLocationEvent]:
+    """
+    Merge hits into one CoLocationEvent per vehicle pair and contiguous interval
+
+    Args:
+        vehicles: Analyzed vehicles (owner indexes into this list)
+        owner: Vehicle index of each fix
+        fixes: Combined fixes from collect_fixes
+        hit_fix: Fix index of each hit
+        hit_other: Other vehicle of each hit
+        radius_meters: Co-location radius (copied to the events)
+        time_window_seconds: Hits further apart than this start a new event
+
+    Returns:
+        Events sorted by start time
+    """
+    if not len(hit_fix):
+        return []
+
+    vehicle_count = len(vehicles)
+    first = np.minimum(owner[hit_fix], hit_other)
+    second = np.maximum(owner[hit_fix], hit_other)
+    pair = first * vehicle_count + second
+    stamps = fixes.timestamp_ns[hit_fix]
+
+    order = np.lexsort((stamps, pair))
+    pair, stamps, hit_fix = pair[order], stamps[order], hit_fix[order]
+    window_ns = int(round(time_window_seconds * 1e9))
+    breaks = np.ones(len(pair), dtype=bool)
+    breaks[1:] = (pair[1:] != pair[:-1]) | (np.diff(stamps) > window_ns)
+    event = np.cumsum(breaks) - 1
+    starts = np.flatnonzero(breaks)
+    ends = np.append(starts[1:], len(pair)) - 1
+
+    hits_per_event = np.bincount(event)
+    latitude = np.bincount(event, fixes.latitude[hit_fix]) / hits_per_event
+    longitude = np.bincount(event, fixes.longitude[hit_fix]) / hits_per_event
+    start_times = stamps[starts].view('datetime64[ns]').astype('datetime64[us]').tolist()
+    durations = (stamps[ends] - stamps[starts]) / 1e9
+
+    events = []
+    for i in np.argsort(stamps[starts], kind='stable').tolist():
+        start_time = start_times[i]
+        if fixes.timestamps_utc:
+            start_time = start_time.replace(tzinfo=timezone.utc)
+        first_vehicle, second_vehicle = divmod(int(pair[starts[i]]), vehicle_count)
+        events.append(CoLocationEvent(
+            vehicle_ids=[vehicles[first_vehicle].vehicle_id, vehicles[second_vehicle].vehicle_id],
+            location=(float(latitude[i]), float(longitude[i])),
+            timestamp=start_time,
+            duration_seconds=float(durations[i]),
+            radius_meters=radius_meters
+        ))
+    return events
+
+
+def find_co_locations(
+    vehicles: List[VehicleData],
+    radius_meters: float,
+    time_window_seconds: float,
+    make_projection: Callable
+) -> List[CoLocationEvent]:
+    """
+    Detect co-location events between vehicles
+
+    Args:
+        vehicles: Vehicles to analyze
+        radius_meters: Maximum distance between fixes
+        time_window_seconds: Maximum time difference between fixes
+        make_projection: make_local_metric_projection (called once with the
+            median fix as centre)
+
+    Returns:
+        Co-location events sorted by start time
+    """
+    owner, fixes = collect_fixes(vehicles)
+    if len(np.unique(owner)) < 2:
+        return []
+
+    center = fixes.point(int(np.argsort(fixes.latitude)[len(fixes) // 2]))
+    to_metric, _ = make_projection(center)
+    x, y = to_metric(fixes.longitude, fixes.latitude)
+
+    hit_fix, hit_other = find_hits(owner, np.asarray(x), np.asarray(y), fixes.timestamp_ns,
+                                   radius_meters, time_window_seconds)
+    return merge_events(vehicles, owner, fixes, hit_fix, hit_other,
+                        radius_meters, time_window_seconds)
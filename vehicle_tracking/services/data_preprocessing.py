@@ -3,16 +3,35 @@ Data preprocessing for forensic vehicle tracking.
 
 This module handles preprocessing of GPS data before forensic analysis,
 including coalescing same-location duplicates and data cleaning.
+
+Every step accepts either a list of GPSPoint objects or a columnar GPSTrack;
+tracks are processed with array operations and only touch Python objects for
+the (sparse) points that receive metadata.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 from dataclasses import dataclass
 
 from ..models.vehicle_tracking_models import GPSPoint
 
+# Columnar tracks need numpy (optional)
+try:
+    import numpy as np
+    from ..models.gps_track import GPSTrack, FLAG_ANOMALY, FLAG_OBSERVED
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+EARTH_RADIUS_KM = 6371.0
+G_FORCE_MS2 = 9.81
+
+
+def _is_track(points) -> bool:
+    return HAS_NUMPY and isinstance(points, GPSTrack)
 
-def coalesce_same_location_duplicates(points: List[GPSPoint]) -> List[GPSPoint]:
+
+def coalesce_same_location_duplicates(points: Union[List[GPSPoint], 'GPSTrack']) -> Union[List[GPSPoint], 'GPSTrack']:
     """
     Coalesce identical fixes at the same time/place into single anchors.
 
@@ -25,10 +44,10 @@ def coalesce_same_location_duplicates(points: List[GPSPoint]) -> List[GPSPoint]:
         confirm the vehicle was stationary.
 
     Args:
-        points: List of GPS points to process
+        points: List of GPS points (or GPSTrack) to process
 
     Returns:
-        List of GPS points with duplicates coalesced and metadata updated
+        GPS points with duplicates coalesced and metadata updated
 
     Example:
         If we have 3 identical points at time T:
@@ -37,6 +56,8 @@ def coalesce_same_location_duplicates(points: List[GPSPoint]) -> List[GPSPoint]:
     """
     if not points:
         return points
+    if _is_track(points):
+        return _coalesce_track(points)
 
     coalesced = []
     i = 0
@@ -75,10 +96,10 @@ def coalesce_same_location_duplicates(points: List[GPSPoint]) -> List[GPSPoint]:
 
 
 def detect_and_mark_anomalies(
-    points: List[GPSPoint],
+    points: Union[List[GPSPoint], 'GPSTrack'],
     max_speed_kmh: float = 250.0,
     max_acceleration_g: float = 1.5
-) -> List[GPSPoint]:
+) -> Union[List[GPSPoint], 'GPSTrack']:
     """
     Detect and mark anomalous GPS points for forensic analysis.
 
@@ -88,7 +109,7 @@ def detect_and_mark_anomalies(
     - GPS multipath errors
 
     Args:
-        points: List of GPS points to analyze
+        points: List of GPS points (or GPSTrack) to analyze
         max_speed_kmh: Maximum believable speed in km/h
         max_acceleration_g: Maximum acceleration in g-forces
 
@@ -101,10 +122,8 @@ def detect_and_mark_anomalies(
     """
     if len(points) < 2:
         return points
-
-    # Constants
-    EARTH_RADIUS_KM = 6371.0
-    G_FORCE_MS2 = 9.81
+    if _is_track(points):
+        return _mark_track_anomalies(points, max_speed_kmh, max_acceleration_g)
 
     for i in range(len(points) - 1):
         current = points[i]
@@ -168,19 +187,19 @@ def detect_and_mark_anomalies(
 
 
 def clean_and_validate_gps_data(
-    points: List[GPSPoint],
+    points: Union[List[GPSPoint], 'GPSTrack'],
     min_latitude: float = -90.0,
     max_latitude: float = 90.0,
     min_longitude: float = -180.0,
     max_longitude: float = 180.0
-) -> List[GPSPoint]:
+) -> Union[List[GPSPoint], 'GPSTrack']:
     """
     Clean and validate GPS data for forensic processing.
 
     Performs basic validation but preserves all data with flags.
 
     Args:
-        points: List of GPS points to validate
+        points: List of GPS points (or GPSTrack) to validate
         min_latitude: Minimum valid latitude
         max_latitude: Maximum valid latitude
         min_longitude: Minimum valid longitude
@@ -193,6 +212,9 @@ def clean_and_validate_gps_data(
         Invalid points are MARKED, not removed, to maintain
         forensic chain of custody.
     """
+    if _is_track(points):
+        return _validate_track(points, min_latitude, max_latitude, min_longitude, max_longitude)
+
     validated = []
 
     for point in points:
@@ -227,14 +249,14 @@ def clean_and_validate_gps_data(
 
 
 def sort_and_deduplicate_points(
-    points: List[GPSPoint],
+    points: Union[List[GPSPoint], 'GPSTrack'],
     preserve_metadata: bool = True
-) -> List[GPSPoint]:
+) -> Union[List[GPSPoint], 'GPSTrack']:
     """
     Sort points by timestamp and remove exact duplicates.
 
     Args:
-        points: List of GPS points to process
+        points: List of GPS points (or GPSTrack) to process
         preserve_metadata: If True, preserve metadata from duplicates
 
     Returns:
@@ -247,6 +269,8 @@ def sort_and_deduplicate_points(
     """
     if not points:
         return points
+    if _is_track(points):
+        return _sort_and_deduplicate_track(points, preserve_metadata)
 
     # Sort by timestamp
     sorted_points = sorted(points, key=lambda p: p.timestamp)
@@ -281,9 +305,9 @@ def sort_and_deduplicate_points(
 
 
 def prepare_for_forensic_analysis(
-    points: List[GPSPoint],
+    points: Union[List[GPSPoint], 'GPSTrack'],
     settings: Optional[Dict[str, Any]] = None
-) -> List[GPSPoint]:
+) -> Union[List[GPSPoint], 'GPSTrack']:
     """
     Complete preprocessing pipeline for forensic GPS analysis.
 
@@ -294,7 +318,7 @@ def prepare_for_forensic_analysis(
     4. Detect and mark anomalies
 
     Args:
-        points: Raw GPS points
+        points: Raw GPS points (list or GPSTrack)
         settings: Optional preprocessing settings
 
     Returns:
@@ -319,4 +343,152 @@ def prepare_for_forensic_analysis(
     max_accel = settings.get('max_acceleration_g', 1.5)
     points = detect_and_mark_anomalies(points, max_speed, max_accel)
 
-    return points
\ No newline at end of file
+    return points
+
+
+# ---------------------------------------------------------------------------
+# Columnar (GPSTrack) implementations - same results as the list versions above
+# ---------------------------------------------------------------------------
+
+def _coalesce_track(track: 'GPSTrack') -> 'GPSTrack':
+    """Coalesce consecutive identical fixes in a GPSTrack"""
+    ts, lat, lon = track.timestamp_ns, track.latitude, track.longitude
+    same_as_previous = (ts[1:] == ts[:-1]) & (lat[1:] == lat[:-1]) & (lon[1:] == lon[:-1])
+    if not same_as_previous.any():
+        return track
+
+    starts = np.flatnonzero(np.concatenate(([True], ~same_as_previous)))
+    counts = np.diff(np.append(starts, len(track)))
+    coalesced = track.take(starts)
+    repeated = counts > 1
+
+    for row in np.flatnonzero(repeated).tolist():
+        metadata = coalesced.point_metadata(row)
+        metadata['coalesced_count'] = int(counts[row])
+        metadata['gap_type'] = 'stop/coalesced'
+        metadata['coalesce_note'] = (
+            f"Coalesced {int(counts[row])} identical samples at "
+            f"{coalesced.datetimes(row, row + 1)[0].isoformat()}"
+        )
+    coalesced.set_flag(FLAG_OBSERVED, repeated)
+    return coalesced
+
+
+def _mark_track_anomalies(track: 'GPSTrack', max_speed_kmh: float,
+                          max_acceleration_g: float) -> 'GPSTrack':
+    """Flag excessive speeds and accelerations in a GPSTrack (in place)"""
+    time_diff = np.diff(track.timestamp_ns) / 1e9
+    valid = time_diff > 0
+
+    lat = np.radians(track.latitude)
+    lon = np.radians(track.longitude)
+    dlat = lat[1:] - lat[:-1]
+    dlon = lon[1:] - lon[:-1]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
+    distance_km = EARTH_RADIUS_KM * (2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)))
+    speed_kmh = np.where(valid, (distance_km / np.where(valid, time_diff, 1.0)) * 3600, 0.0)
+
+    # Speed the current point carried into each step: the previous valid step's
+    # speed, or whatever the point already held
+    calculated = track.data['calculated_speed_kmh'].astype(np.float64)
+    previous_speed = calculated[:-1].copy()
+    previous_speed[1:] = np.where(valid[:-1], speed_kmh[:-1], calculated[1:-1])
+
+    speed_anomaly = valid & (speed_kmh > max_speed_kmh)
+
+    accel_checked = valid & ~np.isnan(previous_speed) & (previous_speed != 0)
+    accel_checked[0] = False
+    with np.errstate(invalid='ignore'):
+        acceleration_g = np.abs(((speed_kmh - previous_speed) / 3.6) / np.where(valid, time_diff, 1.0)) / G_FORCE_MS2
+    accel_anomaly = accel_checked & (acceleration_g > max_acceleration_g)
+
+    flagged = np.zeros(len(track), dtype=bool)
+    flagged[:-1] |= speed_anomaly
+    flagged[1:] |= speed_anomaly
+    track.set_flag(FLAG_ANOMALY, flagged)
+    track.data['calculated_speed_kmh'][1:][valid] = speed_kmh[valid]
+
+    for i in np.flatnonzero(speed_anomaly | accel_anomaly).tolist():
+        if speed_anomaly[i]:
+            speed = float(speed_kmh[i])
+            metadata = track.point_metadata(i)
+            metadata['anomaly_type'] = 'excessive_speed'
+            metadata['calculated_speed_kmh'] = speed
+            metadata['threshold_kmh'] = max_speed_kmh
+            metadata['severity'] = 'high' if speed > max_speed_kmh * 1.5 else 'medium'
+
+            next_metadata = track.point_metadata(i + 1)
+            next_metadata['anomaly_type'] = 'excessive_speed'
+            next_metadata['calculated_speed_kmh'] = speed
+
+        if accel_anomaly[i]:
+            metadata = track.point_metadata(i)
+            metadata['acceleration_anomaly'] = True
+            metadata['acceleration_g'] = float(acceleration_g[i])
+            metadata['max_acceleration_g'] = max_acceleration_g
+
+    return track
+
+
+def _validate_track(track: 'GPSTrack', min_latitude: float, max_latitude: float,
+                    min_longitude: float, max_longitude: float) -> 'GPSTrack':
+    """Flag out-of-range and Null Island fixes in a GPSTrack (in place)"""
+    lat, lon = track.latitude, track.longitude
+    bad_lat = ~((lat >= min_latitude) & (lat <= max_latitude))
+    bad_lon = ~((lon >= min_longitude) & (lon <= max_longitude))
+    null_island = (lat == 0.0) & (lon == 0.0)
+    invalid = bad_lat | bad_lon | null_island
+
+    for i in np.flatnonzero(invalid).tolist():
+        errors = []
+        if bad_lat[i]:
+            errors.append(f"Invalid latitude: {float(lat[i])}")
+        if bad_lon[i]:
+            errors.append(f"Invalid longitude: {float(lon[i])}")
+        if null_island[i]:
+            errors.append("Null Island (0,0) - likely GPS error")
+        metadata = track.point_metadata(i)
+        metadata['validation_failed'] = True
+        metadata['validation_errors'] = errors
+
+    track.set_flag(FLAG_ANOMALY, invalid)
+    return track
+
+
+def _sort_and_deduplicate_track(track: 'GPSTrack', preserve_metadata: bool) -> 'GPSTrack':
+    """Stable-sort a GPSTrack by time and drop exact duplicate fixes"""
+    timestamps = track.timestamp_ns
+    if len(track) > 1 and (np.diff(timestamps) < 0).any():
+        track = track.take(np.argsort(timestamps, kind='stable'))
+        timestamps = track.timestamp_ns
+
+    data = track.data
+    keys = [data['timestamp_ns'], data['latitude'], data['longitude']]
+    for name in ('speed_kmh', 'altitude', 'heading'):
+        missing = np.isnan(data[name])
+        keys += [missing, np.where(missing, 0, data[name])]
+
+    # Stable lexsort keeps the earliest row of each identical group first
+    order = np.lexsort(keys[::-1])
+    same_as_previous = np.ones(len(track) - 1, dtype=bool)
+    for key in keys:
+        ordered = key[order]
+        same_as_previous &= ordered[1:] == ordered[:-1]
+    if not same_as_previous.any():
+        return track
+
+    first_of_group = np.concatenate(([True], ~same_as_previous))
+    keep = np.zeros(len(track), dtype=bool)
+    keep[order[first_of_group]] = True
+
+    if preserve_metadata and track.metadata:
+        kept_rows = np.flatnonzero(keep)
+        for row in np.sort(order[~first_of_group]).tolist():
+            if row not in track.metadata:
+                continue
+            # Merged into the most recently kept point, as the list version does
+            previous = np.searchsorted(kept_rows, row) - 1
+            if previous >= 0 and timestamps[kept_rows[previous]] == timestamps[row]:
+                track.point_metadata(kept_rows[previous]).update(track.metadata[row])
+
+    return track.take(keep)
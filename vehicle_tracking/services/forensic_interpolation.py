@@ -0,0 +1,175 @@
+"""
+Array-based forensic interpolation for columnar GPS tracks.
+
+Produces the same points as VehicleTrackingService.interpolate_path does for
+GPSPoint lists - grid-quantized samples at constant segment speed, gap
+markers for UNKNOWN segments, no samples across temporal conflicts - but
+computes every sample of every segment as one set of arrays and converts
+them back to WGS84 with a single inverse projection call.
+
+The result is a GPSTrack, so to_wire_format can consume it column-wise.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+from ..models.gps_track import (
+    GPSTrack, CERTAINTY_LABELS, FLAG_OBSERVED, FLAG_INTERPOLATED, FLAG_GAP
+)
+from .forensic_speed_calculator import SegmentArrays, GAP_TYPES
+
+# Samples closer than this to the segment end are not emitted (microseconds)
+END_EPSILON_US = 1
+
+_UNKNOWN = CERTAINTY_LABELS.index('unknown')
+_LOW = CERTAINTY_LABELS.index('low')
+_GAP = GAP_TYPES.index('gap')
+_CONFLICT = GAP_TYPES.index('temporal_conflict')
+
+
+def _microseconds(seconds: np.ndarray) -> np.ndarray:
+    """Round float seconds to whole microseconds the way timedelta(seconds=...) does"""
+    whole = np.floor(seconds)
+    return (whole * 1_000_000 + np.round((seconds - whole) * 1e6)).astype(np.int64)
+
+
+def _timestamps_us(track: GPSTrack) -> np.ndarray:
+    """Timestamps truncated to microseconds, matching GPSTrack.datetimes()"""
+    return track.timestamp_ns // 1000
+
+
+def is_uniform_cadence(track: GPSTrack, interval_seconds: float, tol: float = 1e-3) -> bool:
+    """
+    Check if a track is already sampled every `interval_seconds` with no missing points
+
+    Args:
+        track: GPS track to check
+        interval_seconds: Expected time interval in seconds
+        tol: Tolerance in seconds
+
+    Returns:
+        True if every point lies on the grid started by the first point
+    """
+    if len(track) < 2:
+        return True
+    stamps = _timestamps_us(track)
+    expected = _microseconds(np.arange(1, len(track)) * interval_seconds)
+    error = (stamps[1:] - stamps[0] - expected) / 1e6
+    return bool((np.abs(error) <= tol).all())
+
+
+def _interpolate_heading(start: np.ndarray, end: np.ndarray, ratio: np.ndarray) -> np.ndarray:
+    """Circular heading interpolation along the shortest arc (NaN if either end is NaN)"""
+    h1 = start % 360
+    h2 = end % 360
+    diff = h2 - h1
+    diff = np.where(diff > 180, diff - 360, np.where(diff < -180, diff + 360, diff))
+    result = h1 + diff * ratio
+    return np.where(result < 0, result + 360, np.where(result >= 360, result - 360, result))
+
+
+def interpolate_track(
+    track: GPSTrack,
+    arrays: SegmentArrays,
+    interval_seconds: float,
+    to_wgs84: Callable
+) -> GPSTrack:
+    """
+    Interpolate a pre-processed track onto a regular time grid
+
+    Args:
+        track: Coalesced GPSTrack (segment i joins rows i and i + 1)
+        arrays: SegmentArrays for the track, including projected x/y
+        interval_seconds: Sample interval in seconds
+        to_wgs84: Inverse metric transformer (accepts arrays)
+
+    Returns:
+        New GPSTrack with observed, interpolated and gap-marker rows in time order
+    """
+    observed = track.copy()
+    data = observed.data
+    count = len(arrays)
+    segments = np.arange(count)
+
+    is_gap = arrays.gap_type == _GAP
+    is_conflict = arrays.gap_type == _CONFLICT
+    is_interpolated = ~(is_gap | is_conflict)
+
+    # Observed rows: the first point, then the end point of every non-gap segment
+    data['flags'][0] = (data['flags'][0] | FLAG_OBSERVED) & ~np.uint8(FLAG_INTERPOLATED)
+    ends = segments[is_interpolated]
+    data['segment_speed_kmh'][ends + 1] = arrays.speed_kmh[ends]
+    data['certainty'][ends + 1] = arrays.certainty[ends]
+    data['segment_id'][ends + 1] = ends
+    data['flags'][ends + 1] = (data['flags'][ends + 1] | FLAG_OBSERVED) & ~np.uint8(FLAG_INTERPOLATED)
+
+    # Temporal conflicts: no speed for the starting point, renderer shows a dashed line
+    conflicts = segments[is_conflict]
+    data['segment_speed_kmh'][conflicts] = np.nan
+    data['certainty'][conflicts] = _LOW
+    data['segment_id'][conflicts] = conflicts
+    for index in conflicts.tolist():
+        observed.point_metadata(index)['conflict'] = 'temporal_conflict'
+
+    # Grid samples: k * interval after the segment start, strictly before its end
+    stamps = _timestamps_us(track)
+    duration_us = np.diff(stamps)
+    interval_us = interval_seconds * 1e6
+    candidates = np.where(is_interpolated, np.ceil(duration_us / interval_us).astype(np.int64) + 1, 0)
+    candidates = np.maximum(candidates, 0)
+    sample_segment = np.repeat(segments, candidates)
+    group_start = np.repeat(np.cumsum(candidates) - candidates, candidates)
+    k = np.arange(len(sample_segment)) - group_start + 1
+    offset_us = _microseconds(k * interval_seconds)
+    keep = offset_us < duration_us[sample_segment] - END_EPSILON_US
+    sample_segment, offset_us = sample_segment[keep], offset_us[keep]
+    samples = np.bincount(sample_segment, minlength=count)
+
+    # Output layout: row 0, then per segment [gap marker] or [samples..., end point]
+    block = np.where(is_gap, 1, samples + ~is_gap)
+    block_start = 1 + np.cumsum(block) - block
+    result = GPSTrack.allocate(1 + int(block.sum()), track.timestamps_utc)
+    out = result.data
+
+    positions = np.full(len(track), -1, dtype=np.int64)
+    positions[0] = 0
+    positions[ends + 1] = block_start[ends] + samples[ends]
+    positions[conflicts + 1] = block_start[conflicts]
+    kept = np.flatnonzero(positions >= 0)
+    out[positions[kept]] = data[kept]
+    result.metadata = {int(positions[i]): md for i, md in observed.metadata.items() if positions[i] >= 0}
+
+    gaps = segments[is_gap]
+    markers = block_start[gaps]
+    for column in ('latitude', 'longitude', 'timestamp_ns'):
+        out[column][markers] = data[column][gaps]
+    out['segment_speed_kmh'][markers] = 0
+    out['certainty'][markers] = _UNKNOWN
+    out['segment_id'][markers] = gaps
+    out['flags'][markers] = FLAG_GAP
+    for marker, gap_seconds in zip(markers.tolist(), arrays.time_seconds[gaps].tolist()):
+        result.metadata[marker] = {'gap_seconds': gap_seconds}
+
+    if len(sample_segment):
+        rows = block_start[sample_segment] + np.arange(len(sample_segment)) - \
+            np.repeat(np.cumsum(samples) - samples, samples)
+        start, end = sample_segment, sample_segment + 1
+        ratio = (offset_us / 1e6) / (duration_us[sample_segment] / 1e6)
+
+        x0, y0 = arrays.x[start], arrays.y[start]
+        lon, lat = to_wgs84(x0 + (arrays.x[end] - x0) * ratio, y0 + (arrays.y[end] - y0) * ratio)
+        out['latitude'][rows] = lat
+        out['longitude'][rows] = lon
+        out['timestamp_ns'][rows] = (stamps[start] + offset_us) * 1000
+        out['segment_speed_kmh'][rows] = arrays.speed_kmh[sample_segment]
+        out['certainty'][rows] = arrays.certainty[sample_segment]
+        out['segment_id'][rows] = sample_segment
+        out['flags'][rows] = FLAG_INTERPOLATED
+
+        altitude = data['altitude'].astype(np.float64)
+        out['altitude'][rows] = altitude[start] + (altitude[end] - altitude[start]) * ratio
+        heading = data['heading'].astype(np.float64)
+        out['heading'][rows] = _interpolate_heading(heading[start], heading[end], ratio)
+
+    return result
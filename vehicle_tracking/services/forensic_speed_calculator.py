@@ -6,13 +6,104 @@ ensuring all speed values are directly based on observed GPS points.
 """
 
 import math
-from typing import List, Optional, Tuple, Dict, Any, Callable
+from collections.abc import Sequence
+from typing import List, Optional, Tuple, Dict, Any, Callable, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from ..models.vehicle_tracking_models import GPSPoint
 from ..models.forensic_models import SpeedCertainty, SegmentSpeed, GPSSegment
 
+# Columnar tracks need numpy (optional)
+try:
+    import numpy as np
+    from ..models.gps_track import GPSTrack
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Segment gap types, index = code in SegmentArrays.gap_type
+GAP_TYPES = ('normal', 'stop', 'stop/coalesced', 'temporal_conflict', 'gap')
+_CERTAINTIES = [SpeedCertainty(label) for label in ('high', 'medium', 'low', 'unknown')]
+
+
+@dataclass
+class SegmentArrays:
+    """
+    Columnar segment results for a GPSTrack
+
+    Element i describes the segment from point i to point i + 1.
+    """
+    distance_m: 'np.ndarray'
+    time_seconds: 'np.ndarray'
+    speed_kmh: 'np.ndarray'      # NaN = no speed (gap or temporal conflict)
+    certainty: 'np.ndarray'      # int8 index into CERTAINTY_LABELS
+    gap_type: 'np.ndarray'       # int8 index into GAP_TYPES
+    x: Optional['np.ndarray'] = None   # Projected point coordinates (meters)
+    y: Optional['np.ndarray'] = None
+
+    def __len__(self) -> int:
+        return len(self.distance_m)
+
+    def segment_speed(self, index: int) -> SegmentSpeed:
+        """SegmentSpeed for one segment"""
+        speed = float(self.speed_kmh[index])
+        return SegmentSpeed(
+            speed_kmh=None if speed != speed else speed,
+            certainty=_CERTAINTIES[self.certainty[index]],
+            distance_m=float(self.distance_m[index]),
+            time_seconds=float(self.time_seconds[index]),
+            gap_type=GAP_TYPES[self.gap_type[index]]
+        )
+
+    def gap_type_counts(self) -> Dict[str, int]:
+        """Number of segments of each gap type"""
+        counts = np.bincount(self.gap_type, minlength=len(GAP_TYPES))
+        return {name: int(count) for name, count in zip(GAP_TYPES, counts)}
+
+
+class SegmentList(Sequence):
+    """
+    GPSSegments backed by SegmentArrays, built only when accessed
+
+    Statistics and wire output read the arrays directly; a GPSSegment (and
+    its SegmentSpeed) is created the first time the UI or a report indexes
+    or iterates it, then reused.
+    """
+
+    def __init__(self, points: Sequence, arrays: SegmentArrays):
+        """
+        Args:
+            points: The track's points (segment i joins points[i] and points[i + 1])
+            arrays: Result of calculate_segment_arrays
+        """
+        self.points = points
+        self.arrays = arrays
+        self._segments: Dict[int, GPSSegment] = {}
+
+    def __len__(self) -> int:
+        return len(self.arrays)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+
+        segment = self._segments.get(index)
+        if segment is None:
+            segment = GPSSegment(start_point=self.points[index], end_point=self.points[index + 1],
+                                 segment_speed=self.arrays.segment_speed(index))
+            self._segments[index] = segment
+        return segment
+
+    @property
+    def materialized_count(self) -> int:
+        """Number of GPSSegment objects created so far"""
+        return len(self._segments)
+
 
 class ForensicSpeedCalculator:
     """
@@ -44,22 +135,24 @@ class ForensicSpeedCalculator:
 
     def calculate_segment_speeds(
         self,
-        points: List[GPSPoint],
+        points: Union[List[GPSPoint], 'GPSTrack'],
         to_metric: Callable,  # MANDATORY - no Optional
         to_wgs84: Callable   # MANDATORY - no Optional
-    ) -> List[GPSSegment]:
+    ) -> Sequence:
         """
         Calculate speeds using MANDATORY metric projection.
 
         No fallback to Haversine - metric projection required for forensic accuracy.
+        With numpy available all points are projected in one batch and the
+        result is a SegmentList whose GPSSegments are built on access.
 
         Args:
-            points: List of GPS points (must be pre-processed/coalesced)
+            points: GPS points or GPSTrack (must be pre-processed/coalesced)
             to_metric: Transformer function to convert WGS84 to metric coordinates
             to_wgs84: Transformer function to convert metric to WGS84 (for verification)
 
         Returns:
-            List of GPSSegments with forensic speed calculations
+            Sequence of GPSSegments with forensic speed calculations
 
         Raises:
             ValueError: If metric projection is not provided
@@ -67,6 +160,13 @@ class ForensicSpeedCalculator:
         if not to_metric or not to_wgs84:
             raise ValueError("Metric projection is mandatory for forensic speed calculation")
 
+        if HAS_NUMPY:
+            arrays = self.calculate_segment_arrays(points, to_metric)
+            self.assign_segment_ids(points)
+            if isinstance(points, GPSTrack):
+                return SegmentList(points.points(), arrays)
+            return SegmentList(points, arrays)
+
         segments = []
 
         for i in range(len(points) - 1):
@@ -79,6 +179,86 @@ class ForensicSpeedCalculator:
 
         return segments
 
+    def calculate_segment_arrays(
+        self,
+        points: Union[List[GPSPoint], 'GPSTrack'],
+        to_metric: Callable
+    ) -> SegmentArrays:
+        """
+        Calculate every segment with array operations
+
+        Same rules as _create_segment, but all points are projected in one
+        transformer call and classification is done column-wise.
+
+        Args:
+            points: Pre-processed GPS points or GPSTrack
+            to_metric: Metric projection transformer (accepts arrays)
+
+        Returns:
+            SegmentArrays with one entry per consecutive point pair
+        """
+        if isinstance(points, GPSTrack):
+            latitude, longitude = points.latitude, points.longitude
+            time_diff = np.diff(points.timestamp_ns) / 1e9
+        else:
+            count = len(points)
+            latitude = np.fromiter((p.latitude for p in points), np.float64, count)
+            longitude = np.fromiter((p.longitude for p in points), np.float64, count)
+            time_diff = np.fromiter(
+                ((b.timestamp - a.timestamp).total_seconds() for a, b in zip(points, points[1:])),
+                np.float64, max(count - 1, 0)
+            )
+
+        x, y = to_metric(longitude, latitude)
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        distance_m = np.hypot(np.diff(x), np.diff(y))
+
+        same_location = (latitude[1:] == latitude[:-1]) & (longitude[1:] == longitude[:-1])
+        simultaneous = time_diff == 0
+
+        certainty = np.select(
+            [time_diff <= self.high_threshold, time_diff <= self.medium_threshold,
+             time_diff <= self.max_gap_threshold],
+            [0, 1, 2], default=3
+        ).astype(np.int8)
+        gap_type = np.where(certainty == 3, GAP_TYPES.index('gap'), GAP_TYPES.index('normal')).astype(np.int8)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            speed_kmh = np.where(certainty == 3, np.nan, (distance_m / time_diff) * 3.6)
+
+        stop = (certainty != 3) & (distance_m < 5.0) & (time_diff > 5.0)
+        gap_type[stop] = GAP_TYPES.index('stop')
+        speed_kmh[stop] = 0.0
+
+        # Duplicate timestamps: confirmed stop if same place, otherwise a conflict
+        coalesced = simultaneous & same_location
+        conflict = simultaneous & ~same_location
+        gap_type[coalesced] = GAP_TYPES.index('stop/coalesced')
+        speed_kmh[coalesced] = 0.0
+        certainty[coalesced] = 0
+        gap_type[conflict] = GAP_TYPES.index('temporal_conflict')
+        speed_kmh[conflict] = np.nan
+        certainty[conflict] = 2
+
+        return SegmentArrays(distance_m, time_diff, speed_kmh, certainty, gap_type, x, y)
+
+    def assign_segment_ids(self, points: Union[List[GPSPoint], 'GPSTrack']):
+        """
+        Set segment IDs as _create_segment does: each point gets the segment
+        it starts, and the last point the segment it ends.
+
+        Args:
+            points: GPS points or GPSTrack (updated in place)
+        """
+        last = len(points) - 2
+        if last < 0:
+            return
+        if isinstance(points, GPSTrack):
+            points.data['segment_id'] = np.minimum(np.arange(len(points)), last)
+            return
+        for i, point in enumerate(points):
+            point.segment_id = min(i, last)
+
     def _create_segment(
         self,
         start: GPSPoint,
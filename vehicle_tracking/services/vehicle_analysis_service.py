@@ -3,13 +3,14 @@
 Vehicle Analysis Service - Analytics for vehicle tracking
 
 Provides co-location detection, timestamp analysis, idling detection, and route similarity.
-Initially stubbed for future implementation.
+Route similarity is still stubbed for future implementation.
 """
 
 from typing import List, Dict, Any, Optional, Callable, Set, Tuple
 from datetime import datetime, timedelta
 from math import radians, sin, cos, sqrt, atan2
 import logging
+import time
 
 from core.services.base_service import BaseService
 from core.services.interfaces import IService
@@ -19,9 +20,17 @@ from core.exceptions import ValidationError
 # Import vehicle tracking models
 from vehicle_tracking.models.vehicle_tracking_models import (
     VehicleData, VehicleAnalysisResult, AnalysisType,
-    CoLocationEvent, TimestampJump, IdlingPeriod, GPSPoint
+    TimestampJump, IdlingPeriod, GPSPoint
 )
 
+# Co-location engine needs numpy (optional)
+try:
+    import numpy as np
+    from vehicle_tracking.services.co_location import find_co_locations
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,16 +74,19 @@ class VehicleAnalysisService(BaseService, IVehicleAnalysisService):
     ) -> Result[VehicleAnalysisResult]:
         """
         Detect when vehicles were at the same location
-        
-        This is a STUB implementation that returns sample data.
-        Full spatial-temporal analysis to be implemented.
-        
+
+        Two vehicles are co-located when observed fixes of both lie within
+        radius_meters of each other and within time_window_seconds of each
+        other. Fixes are indexed in a time-sorted metric grid, so runtime grows
+        roughly linearly with the number of fixes. Hits are merged into one
+        event per vehicle pair and contiguous interval.
+
         Args:
             vehicles: List of vehicles to analyze
             radius_meters: Co-location radius in meters
             time_window_seconds: Time window for co-location
             progress_callback: Optional progress callback
-            
+
         Returns:
             Result containing co-location analysis
         """
@@ -90,38 +102,37 @@ class VehicleAnalysisService(BaseService, IVehicleAnalysisService):
                         user_message="Co-location analysis requires at least 2 vehicles"
                     )
                 )
-            
+
+            if radius_meters <= 0 or time_window_seconds < 0:
+                return Result.error(
+                    ValidationError(
+                        {'radius_meters': radius_meters, 'time_window_seconds': time_window_seconds},
+                        user_message="Co-location radius must be positive and time window non-negative"
+                    )
+                )
+
+            if not HAS_NUMPY:
+                return Result.error(VehicleAnalysisError("Co-location analysis requires numpy"))
+
+            started = time.perf_counter()
+
             # Create analysis result
             result = VehicleAnalysisResult(
                 vehicle_id="all_vehicles",
                 analysis_type=AnalysisType.CO_LOCATION,
                 timestamp=datetime.now()
             )
-            
-            # STUB: Generate sample co-location events
-            # In real implementation, this would:
-            # 1. Build spatial index of all GPS points
-            # 2. Find points within radius_meters
-            # 3. Check temporal proximity
-            # 4. Group into co-location events
-            
-            if len(vehicles) >= 2 and progress_callback:
-                progress_callback(50, "Analyzing spatial-temporal proximity...")
-            
-            # Sample event for demonstration
-            if len(vehicles) >= 2:
-                # Pretend we found vehicles together
-                sample_event = CoLocationEvent(
-                    vehicle_ids=[v.vehicle_id for v in vehicles[:2]],
-                    location=(vehicles[0].gps_points[0].latitude, 
-                             vehicles[0].gps_points[0].longitude) if vehicles[0].gps_points else (0, 0),
-                    timestamp=vehicles[0].start_time or datetime.now(),
-                    duration_seconds=180.0,
-                    radius_meters=radius_meters
-                )
-                result.co_locations.append(sample_event)
-                result.total_events = 1
-            
+
+            if progress_callback:
+                progress_callback(10, "Indexing GPS fixes...")
+
+            from vehicle_tracking.services.projection_service import make_local_metric_projection
+            result.co_locations = find_co_locations(
+                vehicles, radius_meters, time_window_seconds, make_local_metric_projection
+            )
+            result.total_events = len(result.co_locations)
+            result.analysis_duration_seconds = time.perf_counter() - started
+
             if progress_callback:
                 progress_callback(100, f"Found {result.total_events} co-location events")
             
@@ -173,10 +184,7 @@ class VehicleAnalysisService(BaseService, IVehicleAnalysisService):
             )
             
             # Find timestamp jumps
-            for i in range(1, len(vehicle.gps_points)):
-                prev_point = vehicle.gps_points[i-1]
-                curr_point = vehicle.gps_points[i]
-                
+            for prev_point, curr_point in self._gap_candidates(vehicle, threshold_seconds):
                 time_diff = (curr_point.timestamp - prev_point.timestamp).total_seconds()
                 
                 if time_diff >= threshold_seconds:
@@ -209,6 +217,23 @@ class VehicleAnalysisService(BaseService, IVehicleAnalysisService):
             self._handle_error(error)
             return Result.error(error)
     
+    def _gap_candidates(self, vehicle: VehicleData, threshold_seconds: float):
+        """
+        Consecutive point pairs that may be separated by a timestamp jump
+
+        Columnar tracks are screened with one np.diff over the timestamp column,
+        so GPSPoint objects are only built on either side of a gap.
+        """
+        track = vehicle.track
+        if track is not None:
+            gaps_ns = np.diff(track.timestamp_ns)
+            for i in (np.flatnonzero(gaps_ns >= threshold_seconds * 1e9) + 1).tolist():
+                yield track.point(i - 1), track.point(i)
+            return
+
+        points = vehicle.gps_points
+        yield from zip(points, points[1:])
+    
     def detect_idling(
         self,
         vehicle: VehicleData,
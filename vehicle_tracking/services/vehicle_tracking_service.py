@@ -8,7 +8,8 @@ Follows FSA service patterns with Result-based error handling.
 
 import csv
 import io
-from datetime import datetime, timedelta
+import warnings
+from datetime import datetime, timedelta, timezone
 from math import radians, sin, cos, sqrt, atan2, floor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, Callable
@@ -28,6 +29,10 @@ from vehicle_tracking.models.vehicle_tracking_models import (
 # Try to import pandas for better CSV handling (optional)
 try:
     import pandas as pd
+    try:
+        from pandas.tseries.api import guess_datetime_format
+    except ImportError:
+        guess_datetime_format = None
     HAS_PANDAS = True
 except ImportError:
     HAS_PANDAS = False
@@ -35,6 +40,7 @@ except ImportError:
 # Try to import numpy for vectorized operations (optional)
 try:
     import numpy as np
+    from vehicle_tracking.models.gps_track import GPSTrack, CERTAINTY_LABELS
     HAS_NUMPY = True
 except ImportError:
     HAS_NUMPY = False
@@ -45,6 +51,10 @@ from pyproj import Transformer
 
 logger = logging.getLogger(__name__)
 
+# Coordinate bounds for accepting CSV rows (degrees)
+MAX_LATITUDE = 90.0
+MAX_LONGITUDE = 180.0
+
 
 class VehicleTrackingError(FSAError):
     """Vehicle tracking specific errors"""
@@ -121,12 +131,16 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
             vehicle_id = file_path.stem
             
             # Parse CSV based on available libraries
-            if HAS_PANDAS:
+            if HAS_PANDAS and HAS_NUMPY:
                 result = self._parse_csv_pandas(file_path, vehicle_id, settings, progress_callback)
             else:
                 result = self._parse_csv_native(file_path, vehicle_id, settings, progress_callback)
             
             if result.success and result.value:
+                # Hold the points as NumPy columns rather than GPSPoint objects
+                if HAS_NUMPY and settings.use_columnar_tracks and result.value.track is None:
+                    result.value.set_track(GPSTrack.from_points(result.value.gps_points))
+
                 # Cache the parsed data
                 self._vehicle_cache[vehicle_id] = result.value
                 self._log_operation("parse_csv_file", f"Successfully parsed {result.value.point_count} points")
@@ -148,60 +162,85 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
         settings: VehicleTrackingSettings,
         progress_callback: Optional[Callable[[float, str], None]] = None
     ) -> Result[VehicleData]:
-        """Parse CSV using pandas (faster for large files)"""
+        """
+        Parse CSV using pandas (faster for large files)
+
+        Columns are mapped once from the header, then each chunk is converted
+        column-wise (numeric coercion, one to_datetime call with an inferred
+        format) into a GPSTrack as it is read. Rows with missing or invalid
+        coordinates/timestamps are dropped by mask.
+        """
         try:
-            # Read CSV in chunks for large files
-            chunks = []
+            delimiter = self._sniff_delimiter(file_path)
+            header = pd.read_csv(file_path, sep=delimiter, nrows=0, encoding='utf-8-sig')
+            original_names = {str(col).strip(): col for col in header.columns}
+
+            # Map columns
+            column_mapping = self._detect_columns(list(original_names))
+            if not column_mapping:
+                return Result.error(
+                    VehicleTrackingError(
+                        f"Required columns not found in CSV",
+                        user_message="CSV must have latitude, longitude, and timestamp columns"
+                    )
+                )
+            columns = {field: original_names[name] for field, name in column_mapping.items()}
+
+            reader = pd.read_csv(
+                file_path,
+                sep=delimiter,
+                encoding='utf-8-sig',
+                usecols=list(columns.values()),
+                dtype={columns['timestamp']: str},
+                chunksize=settings.chunk_size,
+                nrows=settings.max_points_per_vehicle
+            )
+
+            tracks = []
             total_rows = 0
-            
-            for chunk_num, chunk in enumerate(pd.read_csv(file_path, chunksize=settings.chunk_size)):
-                chunks.append(chunk)
+            timestamp_basis = None
+            for chunk_num, chunk in enumerate(reader):
                 total_rows += len(chunk)
-                
+                if timestamp_basis is None:
+                    timestamp_basis = self._guess_timestamp_basis(chunk[columns['timestamp']])
+                timestamp_format, timestamps_utc = timestamp_basis or (None, False)
+                tracks.append(self._chunk_to_track(chunk, columns, timestamp_format, timestamps_utc))
+
                 if progress_callback:
                     progress_callback(
                         min(90, (chunk_num + 1) * 10),
                         f"Reading chunk {chunk_num + 1}, {total_rows:,} rows"
                     )
-                
-                # Limit points if configured
-                if total_rows >= settings.max_points_per_vehicle:
-                    logger.warning(f"Limiting {vehicle_id} to {settings.max_points_per_vehicle} points")
-                    break
-            
-            # Combine chunks
-            df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
-            
-            if df.empty:
+
+            if total_rows == 0:
                 return Result.error(
                     VehicleTrackingError(
                         f"No data in CSV file",
                         user_message="CSV file is empty or has no valid data"
                     )
                 )
-            
-            # Map columns
-            column_mapping = self._detect_columns(df.columns)
-            if not column_mapping:
+            if total_rows >= settings.max_points_per_vehicle:
+                logger.warning(f"Limiting {vehicle_id} to {settings.max_points_per_vehicle} points")
+
+            track = GPSTrack.concatenate(tracks)
+            if len(track) == 0:
                 return Result.error(
                     VehicleTrackingError(
-                        f"Required columns not found in CSV",
-                        user_message="CSV must have latitude, longitude, and timestamp columns"
+                        "No valid GPS points found",
+                        user_message="No valid GPS data found in CSV"
                     )
                 )
-            
+
             # Create VehicleData
             vehicle_data = VehicleData(
                 vehicle_id=vehicle_id,
                 source_file=file_path
             )
-            
-            # Parse each row
-            for idx, row in df.iterrows():
-                gps_point = self._create_gps_point(row, column_mapping)
-                if gps_point:
-                    vehicle_data.gps_points.append(gps_point)
-            
+            if settings.use_columnar_tracks:
+                vehicle_data.set_track(track)
+            else:
+                vehicle_data.gps_points = track.to_points()
+
             # Calculate statistics
             vehicle_data.start_time, vehicle_data.end_time = vehicle_data.get_time_range()
             vehicle_data.is_processed = True
@@ -215,6 +254,99 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
                     user_message=f"Error processing CSV with pandas: {str(e)}"
                 )
             )
+
+    def _sniff_delimiter(self, file_path: Path) -> str:
+        """Pick the CSV delimiter from a sample, preferring tabs like the native parser"""
+        with open(file_path, 'r', encoding='utf-8-sig') as csvfile:
+            sample = csvfile.read(1024)
+        if '\t' in sample:
+            return '\t'
+        try:
+            return csv.Sniffer().sniff(sample).delimiter
+        except csv.Error:
+            return ','
+
+    def _guess_timestamp_basis(self, timestamps: 'pd.Series') -> Optional[Tuple[Optional[str], bool]]:
+        """
+        Inspect the first non-empty timestamp of a file
+
+        The track's timestamp basis follows that timestamp the way
+        GPSTrack.from_points follows the first point: UTC if _parse_timestamp
+        returns it timezone-aware, naive wall-clock time otherwise.
+
+        Returns:
+            (strptime format or None if it cannot be inferred, timestamps_utc),
+            or None if the column has no timestamps yet
+        """
+        values = timestamps.dropna().str.strip()
+        values = values[values != '']
+        if values.empty:
+            return None
+        first = self._parse_timestamp(values.iloc[0])
+        timestamp_format = guess_datetime_format(values.iloc[0]) if guess_datetime_format else None
+        return timestamp_format, first is not None and first.tzinfo is not None
+
+    def _chunk_to_track(
+        self,
+        chunk: 'pd.DataFrame',
+        columns: Dict[str, str],
+        timestamp_format: Optional[str],
+        timestamps_utc: bool = False
+    ) -> 'GPSTrack':
+        """
+        Convert one CSV chunk to a GPSTrack column-wise
+
+        Rows whose timestamp does not match the inferred format fall back to
+        _parse_timestamp individually, so mixed-format files still load.
+        Rows are kept under the same rules as _create_gps_point.
+
+        Args:
+            chunk: DataFrame chunk from read_csv
+            columns: Field name -> CSV column name
+            timestamp_format: strptime format for the timestamp column (None = let pandas parse)
+            timestamps_utc: Store timestamps as UTC (see _guess_timestamp_basis)
+
+        Returns:
+            GPSTrack of the chunk's valid rows
+        """
+        latitude = pd.to_numeric(chunk[columns['latitude']], errors='coerce').to_numpy(np.float64)
+        longitude = pd.to_numeric(chunk[columns['longitude']], errors='coerce').to_numpy(np.float64)
+
+        raw_timestamps = chunk[columns['timestamp']].str.strip()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)  # "Could not infer format" for odd data
+            parsed = pd.to_datetime(raw_timestamps, format=timestamp_format, errors='coerce', cache=True,
+                                    utc=bool(timestamp_format and '%z' in timestamp_format))
+        if getattr(parsed.dt, 'tz', None) is not None:
+            # Offsets become UTC. In a naive track this leaves the digits of a
+            # '...Z' timestamp as wall-clock time, which is how strptime reads them.
+            parsed = parsed.dt.tz_convert(None)
+        timestamp_ns = parsed.to_numpy('datetime64[ns]').astype(np.int64, copy=True)
+        has_timestamp = parsed.notna().to_numpy(copy=True)
+
+        unparsed = np.flatnonzero(~has_timestamp & raw_timestamps.fillna('').ne('').to_numpy())
+        for row in unparsed.tolist():
+            timestamp = self._parse_timestamp(raw_timestamps.iat[row])
+            if timestamp:
+                if timestamps_utc or timestamp.tzinfo is not None:
+                    timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+                timestamp_ns[row] = np.datetime64(timestamp, 'ns').astype(np.int64)
+                has_timestamp[row] = True
+
+        optional = {}
+        for field in ('speed', 'altitude', 'heading'):
+            if field in columns:
+                optional[field] = pd.to_numeric(chunk[columns[field]], errors='coerce').to_numpy(np.float64)
+
+        # Out-of-range comparisons are False for NaN too
+        valid = (np.abs(latitude) <= MAX_LATITUDE) & (np.abs(longitude) <= MAX_LONGITUDE) & has_timestamp
+        return GPSTrack.from_columns(
+            latitude[valid], longitude[valid], timestamp_ns[valid],
+            speed_kmh=optional['speed'][valid] if 'speed' in optional else None,
+            altitude=optional['altitude'][valid] if 'altitude' in optional else None,
+            heading=optional['heading'][valid] if 'heading' in optional else None,
+            timestamps_utc=timestamps_utc
+        )
     
     def _parse_csv_native(
         self, 
@@ -343,6 +475,8 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
 
             lat = float(lat_str)
             lon = float(lon_str)
+            if not (abs(lat) <= MAX_LATITUDE and abs(lon) <= MAX_LONGITUDE):
+                return None
 
             # Parse timestamp
             timestamp_str = row.get(column_mapping['timestamp'], '').strip()
@@ -453,6 +587,9 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
                 self._log_operation("calculate_speeds", "Not enough GPS points to calculate speeds")
                 return Result.success(vehicle_data)
 
+            if vehicle_data.track is not None:
+                return self._calculate_track_speeds(vehicle_data)
+
             # PREPROCESSING: Coalesce same-location duplicates
             from ..services.data_preprocessing import coalesce_same_location_duplicates
             points = coalesce_same_location_duplicates(points)
@@ -468,42 +605,49 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
                 raise ValueError("Metric projection is mandatory for forensic speed calculation")
 
             # Calculate segment speeds
-            from ..services.forensic_speed_calculator import ForensicSpeedCalculator
+            from ..services.forensic_speed_calculator import ForensicSpeedCalculator, SegmentList
 
             # Get settings from main settings if available
-            settings = {}
-            if hasattr(self, 'settings'):
-                settings = self.settings.__dict__ if hasattr(self.settings, '__dict__') else {}
-
-            calculator = ForensicSpeedCalculator(settings)
+            calculator = ForensicSpeedCalculator(self._speed_calculator_settings())
             segments = calculator.calculate_segment_speeds(points, to_metric, to_wgs84)
 
-            # Apply speeds to points
-            for i, segment in enumerate(segments):
-                if segment.segment_speed.speed_kmh is not None:
-                    segment.start_point.segment_speed_kmh = segment.segment_speed.speed_kmh
-                    segment.start_point.speed_certainty = segment.segment_speed.certainty.value
-                    segment.end_point.segment_speed_kmh = segment.segment_speed.speed_kmh
-                    segment.end_point.speed_certainty = segment.segment_speed.certainty.value
-
-            # Calculate statistics
-            valid_speeds = [s.segment_speed.speed_kmh for s in segments
-                           if s.segment_speed.speed_kmh is not None]
-
-            if valid_speeds:
-                vehicle_data.average_speed_kmh = sum(valid_speeds) / len(valid_speeds)
-                vehicle_data.max_speed_kmh = max(valid_speeds)
-                # Min speed excluding zeros
-                non_zero_speeds = [s for s in valid_speeds if s > 0]
-                if non_zero_speeds:
-                    vehicle_data.min_speed_kmh = min(non_zero_speeds)
-                else:
-                    vehicle_data.min_speed_kmh = 0
-
-            # Calculate total distance from segments
-            vehicle_data.total_distance_km = sum(
-                s.segment_speed.distance_m / 1000 for s in segments
-            )
+            if isinstance(segments, SegmentList):
+                # Batch results: apply speeds without building GPSSegment objects
+                arrays = segments.arrays
+                for i in np.flatnonzero(~np.isnan(arrays.speed_kmh)):
+                    speed_kmh = float(arrays.speed_kmh[i])
+                    certainty = CERTAINTY_LABELS[arrays.certainty[i]]
+                    for point in (points[i], points[i + 1]):
+                        point.segment_speed_kmh = speed_kmh
+                        point.speed_certainty = certainty
+                self._apply_segment_statistics(vehicle_data, arrays)
+            else:
+                # Apply speeds to points
+                for i, segment in enumerate(segments):
+                    if segment.segment_speed.speed_kmh is not None:
+                        segment.start_point.segment_speed_kmh = segment.segment_speed.speed_kmh
+                        segment.start_point.speed_certainty = segment.segment_speed.certainty.value
+                        segment.end_point.segment_speed_kmh = segment.segment_speed.speed_kmh
+                        segment.end_point.speed_certainty = segment.segment_speed.certainty.value
+
+                # Calculate statistics
+                valid_speeds = [s.segment_speed.speed_kmh for s in segments
+                               if s.segment_speed.speed_kmh is not None]
+
+                if valid_speeds:
+                    vehicle_data.average_speed_kmh = sum(valid_speeds) / len(valid_speeds)
+                    vehicle_data.max_speed_kmh = max(valid_speeds)
+                    # Min speed excluding zeros
+                    non_zero_speeds = [s for s in valid_speeds if s > 0]
+                    if non_zero_speeds:
+                        vehicle_data.min_speed_kmh = min(non_zero_speeds)
+                    else:
+                        vehicle_data.min_speed_kmh = 0
+
+                # Calculate total distance from segments
+                vehicle_data.total_distance_km = sum(
+                    s.segment_speed.distance_m / 1000 for s in segments
+                )
 
             if vehicle_data.start_time and vehicle_data.end_time:
                 vehicle_data.duration_seconds = (
@@ -526,6 +670,90 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
             self._handle_error(error)
             return Result.error(error)
 
+    def _speed_calculator_settings(self) -> Dict[str, Any]:
+        """Settings dict for ForensicSpeedCalculator"""
+        if hasattr(self, 'settings'):
+            return self.settings.__dict__ if hasattr(self.settings, '__dict__') else {}
+        return {}
+
+    def _calculate_track_speeds(self, vehicle_data: VehicleData) -> Result[VehicleData]:
+        """
+        calculate_speeds for columnar vehicles
+
+        Same results as the GPSPoint path, computed on the track's columns.
+        """
+        from ..services.data_preprocessing import coalesce_same_location_duplicates
+        from ..services.projection_service import make_local_metric_projection
+        from ..services.forensic_speed_calculator import ForensicSpeedCalculator
+
+        track = coalesce_same_location_duplicates(vehicle_data.track)
+        if track is not vehicle_data.track:
+            vehicle_data.set_track(track)
+
+        to_metric, to_wgs84 = make_local_metric_projection(track.point(len(track) // 2))
+        if not to_metric or not to_wgs84:
+            raise ValueError("Metric projection is mandatory for forensic speed calculation")
+
+        calculator = ForensicSpeedCalculator(self._speed_calculator_settings())
+        segments = calculator.calculate_segment_speeds(track, to_metric, to_wgs84)
+        arrays = segments.arrays
+
+        # Each point takes the speed of the segment it starts, else the one it ends
+        has_speed = ~np.isnan(arrays.speed_kmh)
+        for column, values in (('segment_speed_kmh', arrays.speed_kmh), ('certainty', arrays.certainty)):
+            track.data[column][1:][has_speed] = values[has_speed]
+            track.data[column][:-1][has_speed] = values[has_speed]
+        self._apply_segment_statistics(vehicle_data, arrays)
+
+        if vehicle_data.start_time and vehicle_data.end_time:
+            vehicle_data.duration_seconds = (
+                vehicle_data.end_time - vehicle_data.start_time
+            ).total_seconds()
+
+        vehicle_data.segments = segments
+        vehicle_data.has_segment_speeds = True
+
+        self._log_operation("calculate_speeds",
+                          f"Calculated {len(arrays)} forensic segment speeds")
+
+        return Result.success(vehicle_data)
+
+    def _apply_segment_statistics(self, vehicle_data: VehicleData, arrays) -> None:
+        """
+        Set speed and distance statistics from SegmentArrays
+
+        Args:
+            vehicle_data: Vehicle to update
+            arrays: SegmentArrays from ForensicSpeedCalculator
+        """
+        valid_speeds = arrays.speed_kmh[~np.isnan(arrays.speed_kmh)]
+        if len(valid_speeds):
+            vehicle_data.average_speed_kmh = float(valid_speeds.mean())
+            vehicle_data.max_speed_kmh = float(valid_speeds.max())
+            # Min speed excluding zeros
+            non_zero_speeds = valid_speeds[valid_speeds > 0]
+            vehicle_data.min_speed_kmh = float(non_zero_speeds.min()) if len(non_zero_speeds) else 0
+
+        vehicle_data.total_distance_km = float(arrays.distance_m.sum() / 1000)
+
+    def _segment_rows(self, segments) -> List[Tuple[Optional[float], str, str, float]]:
+        """
+        (speed_kmh, certainty, gap_type, time_seconds) for each segment
+
+        Read straight from the arrays of a SegmentList, so iterating does
+        not build GPSSegment objects.
+        """
+        arrays = getattr(segments, 'arrays', None)
+        if arrays is None:
+            return [(s.segment_speed.speed_kmh, s.segment_speed.certainty.value,
+                     s.segment_speed.gap_type, s.segment_speed.time_seconds) for s in segments]
+
+        from ..services.forensic_speed_calculator import GAP_TYPES
+        speeds = [None if speed != speed else speed for speed in arrays.speed_kmh.tolist()]
+        certainties = [CERTAINTY_LABELS[code] for code in arrays.certainty.tolist()]
+        gap_types = [GAP_TYPES[code] for code in arrays.gap_type.tolist()]
+        return list(zip(speeds, certainties, gap_types, arrays.time_seconds.tolist()))
+
     def _interpolate_heading(self, heading1: float, heading2: float, ratio: float) -> float:
         """
         Circular interpolation for compass headings (0-360 degrees)
@@ -684,6 +912,9 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
             if len(points) < 2:
                 return Result.success(vehicle_data)
 
+            if vehicle_data.track is not None:
+                return self._interpolate_track_path(vehicle_data, settings, progress_callback)
+
             # PREPROCESSING: Coalesce same-location duplicates
             from ..services.data_preprocessing import coalesce_same_location_duplicates
             points = coalesce_same_location_duplicates(points)
@@ -706,11 +937,15 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
 
             # Calculate segment speeds with same projection
             from ..services.forensic_speed_calculator import ForensicSpeedCalculator
-            from ..models.forensic_models import SpeedCertainty
 
             calculator = ForensicSpeedCalculator(settings.__dict__)
             segments = calculator.calculate_segment_speeds(points, to_metric, to_wgs84)
 
+            # Batch results carry the projected points, so only the inverse
+            # projection is needed per interpolated sample
+            arrays = getattr(segments, 'arrays', None)
+            metric_xy = (arrays.x.tolist(), arrays.y.tolist()) if arrays is not None else None
+
             interpolated = []
             interpolated.append(points[0])
 
@@ -719,12 +954,13 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
             points[0].is_interpolated = False
 
             # Process each segment
-            for seg_idx, segment in enumerate(segments):
-                seg_start = segment.start_point
-                seg_end = segment.end_point
+            for seg_idx, (speed_kmh, certainty, gap_type, time_seconds) in enumerate(
+                    self._segment_rows(segments)):
+                seg_start = points[seg_idx]
+                seg_end = points[seg_idx + 1]
 
                 # Skip UNKNOWN segments (gaps too large)
-                if segment.segment_speed.certainty == SpeedCertainty.UNKNOWN:
+                if certainty == "unknown":
                     # Add gap marker
                     gap_marker = GPSPoint(
                         latitude=seg_start.latitude,
@@ -735,17 +971,17 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
                         segment_id=seg_idx,
                         is_gap=True,
                         is_observed=False,
-                        metadata={'gap_seconds': segment.segment_speed.time_seconds}
+                        metadata={'gap_seconds': time_seconds}
                     )
                     interpolated.append(gap_marker)
 
                     # Log the gap
                     self._log_operation("gap_detection",
-                        f"Gap of {segment.segment_speed.time_seconds:.1f}s detected, not interpolating")
+                        f"Gap of {time_seconds:.1f}s detected, not interpolating")
                     continue
 
                 # Handle temporal conflicts - NO interpolation
-                if segment.segment_speed.gap_type == "temporal_conflict":
+                if gap_type == "temporal_conflict":
                     # DO NOT interpolate temporal conflicts
                     # Just mark the segment endpoints, renderer will show dashed line
                     seg_start.segment_speed_kmh = None  # No speed
@@ -772,17 +1008,24 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
                     time_ratio = (t_emit - seg_start.timestamp).total_seconds() / seg_duration
 
                     # Interpolate position (keep metric projection)
-                    lat, lon = self._interpolate_in_metric(
-                        seg_start, seg_end, time_ratio, to_metric, to_wgs84
-                    )
+                    if metric_xy is not None:
+                        xs, ys = metric_xy
+                        lon, lat = to_wgs84(
+                            xs[seg_idx] + (xs[seg_idx + 1] - xs[seg_idx]) * time_ratio,
+                            ys[seg_idx] + (ys[seg_idx + 1] - ys[seg_idx]) * time_ratio
+                        )
+                    else:
+                        lat, lon = self._interpolate_in_metric(
+                            seg_start, seg_end, time_ratio, to_metric, to_wgs84
+                        )
 
                     # Create interpolated point with CONSTANT segment speed
                     interp_point = GPSPoint(
                         latitude=lat,
                         longitude=lon,
                         timestamp=t_emit,
-                        segment_speed_kmh=segment.segment_speed.speed_kmh,  # CONSTANT!
-                        speed_certainty=segment.segment_speed.certainty.value,
+                        segment_speed_kmh=speed_kmh,  # CONSTANT!
+                        speed_certainty=certainty,
                         segment_id=seg_idx,
                         is_interpolated=True,
                         is_observed=False
@@ -805,8 +1048,8 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
                     t_emit = seg_start.timestamp + timedelta(seconds=k * dt)
 
                 # Add segment end point (observed)
-                seg_end.segment_speed_kmh = segment.segment_speed.speed_kmh
-                seg_end.speed_certainty = segment.segment_speed.certainty.value
+                seg_end.segment_speed_kmh = speed_kmh
+                seg_end.speed_certainty = certainty
                 seg_end.segment_id = seg_idx
                 seg_end.is_observed = True
                 seg_end.is_interpolated = False
@@ -835,6 +1078,62 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
             self._handle_error(error)
             return Result.error(error)
     
+    def _interpolate_track_path(
+        self,
+        vehicle_data: VehicleData,
+        settings: VehicleTrackingSettings,
+        progress_callback: Optional[Callable[[float, str], None]] = None
+    ) -> Result[VehicleData]:
+        """
+        interpolate_path for columnar vehicles
+
+        Same points as the GPSPoint path, produced by the array interpolation
+        engine; the vehicle stays columnar.
+        """
+        from ..services.data_preprocessing import coalesce_same_location_duplicates
+        from ..services.projection_service import make_local_metric_projection
+        from ..services.forensic_speed_calculator import ForensicSpeedCalculator, GAP_TYPES
+        from ..services.forensic_interpolation import interpolate_track, is_uniform_cadence
+
+        track = coalesce_same_location_duplicates(vehicle_data.track)
+        if track is not vehicle_data.track:
+            vehicle_data.set_track(track)
+
+        # Check uniform cadence passthrough
+        dt = settings.interpolation_interval_seconds
+        if is_uniform_cadence(track, dt):
+            self._log_operation("passthrough", "Data already uniform, no interpolation needed")
+            return Result.success(vehicle_data)
+
+        to_metric, to_wgs84 = make_local_metric_projection(track.point(len(track) // 2))
+        if not to_metric or not to_wgs84:
+            raise ValueError("Metric projection is mandatory for forensic processing")
+
+        calculator = ForensicSpeedCalculator(settings.__dict__)
+        segments = calculator.calculate_segment_speeds(track, to_metric, to_wgs84)
+        arrays = segments.arrays
+
+        for gap_seconds in arrays.time_seconds[arrays.gap_type == GAP_TYPES.index('gap')].tolist():
+            self._log_operation("gap_detection",
+                f"Gap of {gap_seconds:.1f}s detected, not interpolating")
+        conflict_count = int((arrays.gap_type == GAP_TYPES.index('temporal_conflict')).sum())
+        if conflict_count:
+            self._log_operation("temporal_conflict",
+                f"{conflict_count} temporal conflicts: same timestamp, different locations. "
+                f"No speed calculated.")
+
+        vehicle_data.set_track(interpolate_track(track, arrays, dt, to_wgs84))
+        vehicle_data.has_segment_speeds = True
+        vehicle_data.segments = segments
+
+        self._log_operation("forensic_interpolation",
+            f"Created {vehicle_data.point_count} points with {len(segments)} segments")
+
+        if progress_callback:
+            progress_callback(100, "Forensic interpolation complete")
+
+        return Result.success(vehicle_data)
+
     def prepare_animation_data(
         self,
         vehicles: List[VehicleData],
@@ -863,6 +1162,9 @@ class VehicleTrackingService(BaseService, IVehicleTrackingService):
 
             # IMPORTANT: Validate and ensure all GPS points have proper datetime objects
             for vehicle in vehicles:
+                if vehicle.track is not None:
+                    continue  # Columnar timestamps are always valid datetimes
+
                 valid_points = []
                 for point in vehicle.gps_points:
                     # Ensure timestamp is a datetime object, not a string
@@ -15,6 +15,17 @@ import logging
 from ..models.vehicle_tracking_models import VehicleData, GPSPoint
 from ..models.forensic_models import GPSSegment
 
+# Columnar tracks need numpy (optional)
+try:
+    import numpy as np
+    from ..models.gps_track import (
+        GPSTrack, CERTAINTY_LABELS, NO_CERTAINTY, NO_SEGMENT,
+        FLAG_OBSERVED, FLAG_INTERPOLATED, FLAG_GAP, FLAG_ANOMALY
+    )
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 def to_wire_format(vehicle_data: VehicleData) -> Dict[str, Any]:
     """
@@ -27,12 +38,22 @@ def to_wire_format(vehicle_data: VehicleData) -> Dict[str, Any]:
     - Metadata about cadence and interval
     - Explicit unit declarations
 
+    Columnar vehicles (VehicleData.track) are converted column-wise without
+    building GPSPoint objects.
+
     Args:
         vehicle_data: Vehicle data to convert
 
     Returns:
         Dictionary with wire format data ready for JSON serialization
     """
+    track = vehicle_data.track if HAS_NUMPY else None
+    if track is not None:
+        points, cadence, dt_ms, counts = _track_wire_points(track)
+        observed_count, interpolated_count, gap_count, conflict_count = counts
+        return _wire_payload(vehicle_data, points, cadence, dt_ms, observed_count,
+                             interpolated_count, gap_count, conflict_count)
+
     points = []
 
     # Detect cadence type
@@ -115,6 +136,21 @@ def to_wire_format(vehicle_data: VehicleData) -> Dict[str, Any]:
 
         points.append(wire_point)
 
+    return _wire_payload(vehicle_data, points, cadence, dt_ms, observed_count,
+                         interpolated_count, gap_count, conflict_count)
+
+
+def _wire_payload(
+    vehicle_data: VehicleData,
+    points: List[Dict[str, Any]],
+    cadence: str,
+    dt_ms: int,
+    observed_count: int,
+    interpolated_count: int,
+    gap_count: int,
+    conflict_count: int
+) -> Dict[str, Any]:
+    """Wrap converted points with the unit-declaring meta block"""
     # Build metadata with explicit unit declarations
     meta = {
         "dt_ms": dt_ms,  # Average interval in milliseconds
@@ -144,16 +180,25 @@ def to_wire_format(vehicle_data: VehicleData) -> Dict[str, Any]:
             'stop': 0
         }
 
-        for segment in vehicle_data.segments:
-            gap_type = segment.segment_speed.gap_type
+        arrays = getattr(vehicle_data.segments, 'arrays', None)
+        if arrays is not None:
+            # Lazy SegmentList: count from the arrays without building segments
+            gap_types = arrays.gap_type_counts()
+        else:
+            gap_types = {}
+            for segment in vehicle_data.segments:
+                gap_type = segment.segment_speed.gap_type
+                gap_types[gap_type] = gap_types.get(gap_type, 0) + 1
+
+        for gap_type, count in gap_types.items():
             if gap_type == 'temporal_conflict':
-                segment_types['conflict'] += 1
+                segment_types['conflict'] += count
             elif gap_type == 'gap':
-                segment_types['gap'] += 1
+                segment_types['gap'] += count
             elif gap_type in ['stop', 'stop/coalesced']:
-                segment_types['stop'] += 1
+                segment_types['stop'] += count
             else:
-                segment_types['normal'] += 1
+                segment_types['normal'] += count
 
         meta["segment_types"] = segment_types
 
@@ -172,6 +217,74 @@ def to_wire_format(vehicle_data: VehicleData) -> Dict[str, Any]:
     }
 
 
+def _track_wire_points(track: 'GPSTrack'):
+    """
+    Convert a GPSTrack to wire points column-wise
+
+    Returns:
+        Tuple of (points, cadence, dt_ms, (observed, interpolated, gap, conflict) counts)
+    """
+    if len(track) > 1:
+        intervals = np.diff(track.timestamp_ns) / 1e9 * 1000  # Convert to ms
+        avg_interval = float(intervals.mean())
+        variance = float(((intervals - avg_interval) ** 2).mean())
+        cadence = "uniform" if variance < 10 else "mixed"  # 10ms variance threshold
+        dt_ms = int(round(avg_interval))
+    else:
+        cadence = "raw"
+        dt_ms = 0
+
+    data = track.data
+    flags = data['flags']
+    observed = (flags & FLAG_OBSERVED) != 0
+    interpolated = (flags & FLAG_INTERPOLATED) != 0
+    gaps = (flags & FLAG_GAP) != 0
+    metadata = track.metadata
+    conflict_count = sum(1 for md in metadata.values() if md and md.get('conflict') == 'temporal_conflict')
+    counts = (int((observed & ~interpolated).sum()), int(interpolated.sum()), int(gaps.sum()), conflict_count)
+
+    def nullable(column):
+        return [None if v != v else v for v in data[column].astype(np.float64).tolist()]
+
+    speeds = nullable('segment_speed_kmh')
+    altitudes = nullable('altitude')
+    headings = nullable('heading')
+    certainties = [None if c == NO_CERTAINTY else CERTAINTY_LABELS[c] for c in data['certainty'].tolist()]
+    segment_ids = [None if s == NO_SEGMENT else s for s in data['segment_id'].tolist()]
+    anomalies = ((flags & FLAG_ANOMALY) != 0).tolist()
+
+    points = []
+    for index, (timestamp_ms, lat, lon, speed, certainty, is_observed, is_interpolated, is_gap,
+                segment_id, altitude, heading, is_anomaly) in enumerate(zip(
+            track.epoch_ms().tolist(), data['latitude'].tolist(), data['longitude'].tolist(),
+            speeds, certainties, observed.tolist(), interpolated.tolist(), gaps.tolist(),
+            segment_ids, altitudes, headings, anomalies)):
+        wire_point = {
+            "index": index,
+            "timestamp_ms": timestamp_ms,
+            "latitude": lat,
+            "longitude": lon,
+            "speed_kmh": speed,
+            "certainty": certainty,
+            "is_observed": is_observed,
+            "is_interpolated": is_interpolated,
+            "is_gap": is_gap,
+            "segment_id": segment_id
+        }
+        point_metadata = metadata.get(index)
+        if point_metadata:
+            wire_point["metadata"] = point_metadata
+        if altitude is not None:
+            wire_point["altitude_m"] = altitude
+        if heading is not None:
+            wire_point["heading_deg"] = heading
+        if is_anomaly:
+            wire_point["is_anomaly"] = True
+        points.append(wire_point)
+
+    return points, cadence, dt_ms, counts
+
+
 def from_wire_format(payload: Dict[str, Any]) -> VehicleData:
     """
     Parse wire format back to VehicleData.